@@ -1,24 +1,28 @@
 from __future__ import absolute_import
 
+import hashlib
 import io
 import os
 import sys
 import uuid
 
 import nbformat
+import six
 from dagster_graphql.implementation.context import DagsterGraphQLContext
 from dagster_graphql.implementation.pipeline_execution_manager import (
     QueueingSubprocessExecutionManager,
     SubprocessExecutionManager,
+    WarmSubprocessExecutionManager,
 )
 from dagster_graphql.implementation.reloader import Reloader
 from dagster_graphql.schema import create_schema
 from dagster_graphql.version import __version__ as dagster_graphql_version
-from flask import Flask, jsonify, request, send_file, send_from_directory
+from flask import Flask, Response, jsonify, request, send_file, send_from_directory
 from flask_cors import CORS
 from flask_graphql import GraphQLView
 from flask_sockets import Sockets
 from graphql.execution.executors.gevent import GeventExecutor as Executor
+from graphql_server import HttpQueryError, get_graphql_params
 from nbconvert import HTMLExporter
 
 from dagster import ExecutionTargetHandle
@@ -29,21 +33,151 @@ from dagster.core.instance import DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
 
 from .format_error import format_error_with_stack_trace
+from .graphql_cache import (
+    DEFAULT_MAX_DOCUMENTS,
+    PersistedQueryBackend,
+    ResponseCache,
+    get_root_field_names,
+    query_hash,
+)
 from .subscription_server import DagsterSubscriptionServer
 from .templates.playground import TEMPLATE as PLAYGROUND_TEMPLATE
 from .version import __version__
 
 
 class DagsterGraphQLView(GraphQLView):
+    response_cache = None
+
     def __init__(self, context, **kwargs):
         super(DagsterGraphQLView, self).__init__(**kwargs)
         self.context = check.inst_param(context, 'context', DagsterGraphQLContext)
+        check.opt_inst_param(self.backend, 'backend', PersistedQueryBackend)
+        check.opt_inst_param(self.response_cache, 'response_cache', ResponseCache)
+        self._data = None
 
     def get_context(self):
         return self.context
 
     format_error = staticmethod(format_error_with_stack_trace)
 
+    def parse_body(self):
+        # Both the response cache and the underlying view need the request body, only parse it once
+        if self._data is None:
+            self._data = self._resolve_persisted_query(super(DagsterGraphQLView, self).parse_body())
+        return self._data
+
+    def _resolve_persisted_query(self, data):
+        '''Supports the persisted query protocol used by apollo clients: a request may carry the
+        sha256 hash of its query in extensions.persistedQuery instead of the full query text, as
+        long as the query has already been sent once.'''
+        if self.backend is None or not isinstance(data, dict):
+            return data
+
+        extensions = data.get('extensions') or request.args.get('extensions')
+        if isinstance(extensions, six.string_types):
+            try:
+                extensions = seven.json.loads(extensions)
+            except ValueError:
+                raise HttpQueryError(400, 'Extensions are invalid JSON.')
+
+        persisted_query = extensions.get('persistedQuery') if isinstance(extensions, dict) else None
+        if not persisted_query:
+            return data
+
+        document_hash = persisted_query.get('sha256Hash')
+        if not isinstance(document_hash, six.string_types):
+            raise HttpQueryError(400, 'Persisted query is missing its sha256Hash.')
+
+        query = data.get('query') or request.args.get('query')
+        if query:
+            if query_hash(query) != document_hash:
+                raise HttpQueryError(400, 'Provided sha256Hash does not match query.')
+            return data
+
+        query = self.backend.get_persisted_query(document_hash)
+        if query is None:
+            # Not an HTTP error in the protocol, the client retries with the full query text
+            raise HttpQueryError(200, 'PersistedQueryNotFound')
+
+        return dict(data, query=query)
+
+    def _get_operation(self):
+        '''The parsed document and params of a single operation sent as a GET or POST, or None
+        if the request is anything else (a batch, graphiql, an invalid query...).'''
+        if self.backend is None or request.method not in ('GET', 'POST'):
+            return None
+
+        if self.should_display_graphiql():
+            return None
+
+        try:
+            data = self.parse_body()
+            if not isinstance(data, dict):
+                return None
+
+            params = get_graphql_params(data, request.args)
+            if not params.query:
+                return None
+
+            return self.backend.document_from_string(self.schema, params.query), params
+        except Exception:  # pylint: disable=broad-except
+            # Let the underlying view produce the error response
+            return None
+
+    def dispatch_request(self):
+        operation = self._get_operation()
+        if operation is None:
+            return super(DagsterGraphQLView, self).dispatch_request()
+
+        document, params = operation
+        operation_type = document.get_operation_type(params.operation_name)
+
+        if operation_type == 'mutation':
+            response = super(DagsterGraphQLView, self).dispatch_request()
+            if self.response_cache is not None:
+                self.response_cache.clear()
+            return response
+
+        if operation_type != 'query':
+            return super(DagsterGraphQLView, self).dispatch_request()
+
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.is_cacheable(
+            get_root_field_names(document, params.operation_name)
+        ):
+            cache_key = (
+                query_hash(params.query),
+                params.operation_name,
+                seven.json.dumps(params.variables),
+            )
+            entry = self.response_cache.get(cache_key)
+            if entry is not None:
+                return _conditional_response(entry.body, entry.etag)
+
+        response = super(DagsterGraphQLView, self).dispatch_request()
+        if response.status_code != 200:
+            return response
+
+        body = response.get_data()
+        etag = hashlib.sha1(body).hexdigest()
+        # Responses with errors may be transient (e.g. a storage that was briefly unavailable), so
+        # they aren't cached
+        if cache_key is not None and 'errors' not in seven.json.loads(body.decode('utf-8')):
+            self.response_cache.set(cache_key, body, etag)
+
+        return _conditional_response(body, etag)
+
+
+def _conditional_response(body, etag):
+    # Queries are read-only, so honor If-None-Match on POSTs as well as GETs
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, status=200, content_type='application/json')
+
+    response.set_etag(etag)
+    return response
+
 
 def dagster_graphql_subscription_view(subscription_server, context):
     context = check.inst_param(context, 'context', DagsterGraphQLContext)
@@ -143,6 +277,54 @@ def download_view(context):
     return view
 
 
+def metrics_view(context):
+    context = check.inst_param(context, 'context', DagsterGraphQLContext)
+
+    def view():
+        metrics = context.instance.metrics
+        metrics.record_execution_manager_state(
+            num_queued_runs=context.execution_manager.get_queued_run_count(),
+            num_active_runs=context.execution_manager.get_active_run_count(),
+        )
+
+        exposition = metrics.exposition()
+        if exposition is None:
+            return (
+                'The metrics of the instance aren\'t exposed. Configure a metrics recorder that '
+                'exposes them in the metrics section of its dagster.yaml.',
+                404,
+            )
+
+        data, content_type = exposition
+        return Response(data, content_type=content_type)
+
+    return view
+
+
+def create_execution_manager(handle, instance):
+    check.inst_param(handle, 'handle', ExecutionTargetHandle)
+    check.inst_param(instance, 'instance', DagsterInstance)
+
+    execution_manager_settings = instance.dagit_settings.get('execution_manager') or {}
+
+    if execution_manager_settings.get('warm_workers'):
+        execution_manager = WarmSubprocessExecutionManager(
+            handle,
+            instance,
+            num_workers=execution_manager_settings['warm_workers'],
+            max_runs_per_worker=execution_manager_settings.get('max_runs_per_worker'),
+        )
+    else:
+        execution_manager = SubprocessExecutionManager(instance)
+
+    if execution_manager_settings.get('max_concurrent_runs'):
+        return QueueingSubprocessExecutionManager(
+            instance, execution_manager_settings['max_concurrent_runs'], delegate=execution_manager
+        )
+
+    return execution_manager
+
+
 def create_app(handle, instance, reloader=None):
     check.inst_param(handle, 'handle', ExecutionTargetHandle)
     check.inst_param(instance, 'instance', DagsterInstance)
@@ -155,13 +337,7 @@ def create_app(handle, instance, reloader=None):
     schema = create_schema()
     subscription_server = DagsterSubscriptionServer(schema=schema)
 
-    execution_manager_settings = instance.dagit_settings.get('execution_manager')
-    if execution_manager_settings and execution_manager_settings.get('max_concurrent_runs'):
-        execution_manager = QueueingSubprocessExecutionManager(
-            instance, execution_manager_settings.get('max_concurrent_runs')
-        )
-    else:
-        execution_manager = SubprocessExecutionManager(instance)
+    execution_manager = create_execution_manager(handle, instance)
 
     warn_if_compute_logs_disabled()
 
@@ -183,6 +359,8 @@ def create_app(handle, instance, reloader=None):
         repository_path = handle.data.repository_yaml
         scheduler_handle.up(python_path, repository_path)
 
+    graphql_settings = instance.dagit_settings.get('graphql') or {}
+
     app.add_url_rule(
         '/graphql',
         'graphql',
@@ -194,6 +372,12 @@ def create_app(handle, instance, reloader=None):
             graphiql_template=PLAYGROUND_TEMPLATE,
             executor=Executor(),
             context=context,
+            backend=PersistedQueryBackend(
+                max_documents=graphql_settings.get('max_persisted_queries', DEFAULT_MAX_DOCUMENTS)
+            ),
+            response_cache=ResponseCache(graphql_settings['response_cache_ttl'])
+            if graphql_settings.get('response_cache_ttl')
+            else None,
         ),
     )
     sockets.add_url_rule(
@@ -207,6 +391,8 @@ def create_app(handle, instance, reloader=None):
         download_view(context),
     )
 
+    app.add_url_rule('/metrics', 'metrics_view', metrics_view(context))
+
     # these routes are specifically for the Dagit UI and are not part of the graphql
     # API that we want other people to consume, so they're separate for now.
     # Also grabbing the magic global request args dict so that notebook_view is testable
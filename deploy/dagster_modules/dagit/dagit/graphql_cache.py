@@ -0,0 +1,161 @@
+import hashlib
+import time
+from collections import OrderedDict, namedtuple
+from functools import partial
+
+from graphql.backend.base import GraphQLBackend, GraphQLDocument
+from graphql.execution import ExecutionResult, execute
+from graphql.language import ast
+from graphql.language.parser import parse
+from graphql.validation import validate
+
+from dagster import check
+
+DEFAULT_MAX_DOCUMENTS = 1000
+
+# Root fields whose results only depend on the loaded repository and the scheduler, so serving
+# them from a cache for a few seconds is indistinguishable from a slightly slower poll
+DEFAULT_CACHEABLE_ROOT_FIELDS = frozenset(['pipelinesOrError', 'scheduler', 'usedSolids'])
+
+
+def query_hash(query):
+    '''The sha256 hex digest of a query string, as used by persisted query clients.'''
+    check.str_param(query, 'query')
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+def _execute_invalid(validation_errors, *_args, **_kwargs):
+    return ExecutionResult(errors=validation_errors, invalid=True)
+
+
+class PersistedQueryBackend(GraphQLBackend):
+    '''A GraphQL backend that parses and validates each distinct query string once.
+
+    Documents are kept in an LRU cache keyed by the sha256 hash of their query string, which also
+    serves as the registry of persisted queries: once a client has sent the full text of a query,
+    subsequent requests may send only its hash.
+    '''
+
+    def __init__(self, max_documents=DEFAULT_MAX_DOCUMENTS):
+        self._max_documents = check.int_param(max_documents, 'max_documents')
+        self._documents = OrderedDict()
+
+    def _get_cached(self, document_hash):
+        document = self._documents.pop(document_hash, None)
+        if document is not None:
+            self._documents[document_hash] = document
+        return document
+
+    def document_from_string(self, schema, document_string):
+        check.str_param(document_string, 'document_string')
+
+        document_hash = query_hash(document_string)
+        document = self._get_cached(document_hash)
+        if document is not None and document.schema is schema:
+            return document
+
+        document_ast = parse(document_string)
+        validation_errors = validate(schema, document_ast)
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=partial(_execute_invalid, validation_errors)
+            if validation_errors
+            else partial(execute, schema, document_ast),
+        )
+
+        self._documents[document_hash] = document
+        while len(self._documents) > self._max_documents:
+            self._documents.popitem(last=False)
+
+        return document
+
+    def get_persisted_query(self, document_hash):
+        '''The query string previously sent with the given sha256 hash, or None if it is unknown
+        (or has been evicted), in which case the client must resend the full query.'''
+        check.str_param(document_hash, 'document_hash')
+
+        document = self._get_cached(document_hash)
+        return document.document_string if document is not None else None
+
+
+def get_root_field_names(document, operation_name):
+    '''The names of the root fields selected by an operation, or None if they can't be determined
+    statically (e.g. the operation spreads a fragment at the root).'''
+    check.inst_param(document, 'document', GraphQLDocument)
+    check.opt_str_param(operation_name, 'operation_name')
+
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, ast.OperationDefinition)
+    ]
+    if operation_name:
+        operations = [
+            operation
+            for operation in operations
+            if operation.name and operation.name.value == operation_name
+        ]
+    if len(operations) != 1:
+        return None
+
+    names = set()
+    for selection in operations[0].selection_set.selections:
+        if not isinstance(selection, ast.Field):
+            return None
+        names.add(selection.name.value)
+
+    names.discard('__typename')
+    return names
+
+
+class CachedResponse(namedtuple('_CachedResponse', 'body etag expires_at')):
+    pass
+
+
+class ResponseCache(object):
+    '''A short-lived cache of encoded GraphQL responses for read-only queries.
+
+    Only queries whose root fields are all in cacheable_root_fields are cached. Every entry is
+    dropped as soon as a mutation is executed, so the TTL only bounds staleness with respect to
+    changes made outside of this dagit process.
+    '''
+
+    def __init__(self, ttl, cacheable_root_fields=None):
+        self.ttl = check.numeric_param(ttl, 'ttl')
+        self.cacheable_root_fields = frozenset(
+            check.opt_set_param(cacheable_root_fields, 'cacheable_root_fields', of_type=str)
+            or DEFAULT_CACHEABLE_ROOT_FIELDS
+        )
+        self._entries = {}
+
+    def is_cacheable(self, root_field_names):
+        return bool(root_field_names) and root_field_names.issubset(self.cacheable_root_fields)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at < time.time():
+            del self._entries[key]
+            return None
+
+        return entry
+
+    def set(self, key, body, etag):
+        check.str_param(etag, 'etag')
+
+        now = time.time()
+        # Entries are only ever looked up by exact key, so sweep expired ones here to keep queries
+        # with ever-changing variables from growing the cache without bound
+        for expired_key in [k for k, entry in self._entries.items() if entry.expires_at < now]:
+            del self._entries[expired_key]
+
+        entry = CachedResponse(body=body, etag=etag, expires_at=now + self.ttl)
+        self._entries[key] = entry
+        return entry
+
+    def clear(self):
+        self._entries.clear()
@@ -1,9 +1,18 @@
+import hashlib
+import json
+
 import pytest
 from dagit.app import create_app
 from dagit.cli import host_dagit_ui
+from dagster_graphql.schema import roots
 
 from dagster import ExecutionTargetHandle
-from dagster.core.instance import DagsterInstance
+from dagster.core.instance import DagsterInstance, InstanceType
+from dagster.core.metrics import MetricsRecorder
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.local_compute_log_manager import NoOpComputeLogManager
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import InMemoryRunStorage
 from dagster.seven import mock
 from dagster.utils import script_relative_path
 
@@ -78,3 +87,141 @@ def test_port_collision():
             host_dagit_ui(handle=handle, host=None, port=2343)
 
         assert 'Another process ' in str(exc_info.value)
+
+
+PIPELINES_QUERY = '{ pipelinesOrError { __typename } }'
+
+
+def _graphql_post(client, data, headers=None):
+    return client.post(
+        '/graphql', data=json.dumps(data), content_type='application/json', headers=headers
+    )
+
+
+def test_persisted_query():
+    query_hash = hashlib.sha256(PIPELINES_QUERY.encode('utf-8')).hexdigest()
+    extensions = {'persistedQuery': {'version': 1, 'sha256Hash': query_hash}}
+
+    with create_app(
+        ExecutionTargetHandle.for_repo_yaml(script_relative_path('./repository.yaml')),
+        DagsterInstance.ephemeral(),
+    ).test_client() as client:
+        res = _graphql_post(client, {'extensions': extensions})
+        assert res.status_code == 200
+        assert json.loads(res.data)['errors'][0]['message'] == 'PersistedQueryNotFound'
+
+        res = _graphql_post(
+            client,
+            {'query': PIPELINES_QUERY, 'extensions': {'persistedQuery': {'sha256Hash': 'nope'}}},
+        )
+        assert res.status_code == 400
+
+        res = _graphql_post(client, {'query': PIPELINES_QUERY, 'extensions': extensions})
+        assert res.status_code == 200
+        assert (
+            json.loads(res.data)['data']['pipelinesOrError']['__typename'] == 'PipelineConnection'
+        )
+
+        res = client.get(
+            '/graphql?extensions={}'.format(json.dumps(extensions)),
+            headers={'Accept': 'application/json'},
+        )
+        assert res.status_code == 200
+        assert (
+            json.loads(res.data)['data']['pipelinesOrError']['__typename'] == 'PipelineConnection'
+        )
+
+
+def test_query_etag():
+    with create_app(
+        ExecutionTargetHandle.for_repo_yaml(script_relative_path('./repository.yaml')),
+        DagsterInstance.ephemeral(),
+    ).test_client() as client:
+        res = _graphql_post(client, {'query': PIPELINES_QUERY})
+        assert res.status_code == 200
+        etag = res.headers['ETag']
+
+        res = _graphql_post(client, {'query': PIPELINES_QUERY}, headers={'If-None-Match': etag})
+        assert res.status_code == 304
+        assert not res.data
+
+
+def test_response_cache():
+    tempdir = DagsterInstance.temp_storage()
+    instance = DagsterInstance(
+        InstanceType.EPHEMERAL,
+        local_artifact_storage=LocalArtifactStorage(tempdir),
+        run_storage=InMemoryRunStorage(),
+        event_storage=InMemoryEventLogStorage(),
+        compute_log_manager=NoOpComputeLogManager(tempdir),
+        dagit_settings={'graphql': {'response_cache_ttl': 60.0}},
+    )
+
+    with create_app(
+        ExecutionTargetHandle.for_repo_yaml(script_relative_path('./repository.yaml')), instance
+    ).test_client() as client:
+        # Responses with errors aren't cached
+        with mock.patch(
+            'dagster_graphql.schema.roots.get_pipelines_or_error',
+            side_effect=Exception('Storage unavailable'),
+        ) as get_pipelines_or_error:
+            for _ in range(2):
+                res = _graphql_post(client, {'query': PIPELINES_QUERY})
+                assert res.status_code == 200
+                assert 'errors' in json.loads(res.data.decode('utf-8'))
+            assert get_pipelines_or_error.call_count == 2
+
+        with mock.patch(
+            'dagster_graphql.schema.roots.get_pipelines_or_error',
+            wraps=roots.get_pipelines_or_error,
+        ) as get_pipelines_or_error:
+            first = _graphql_post(client, {'query': PIPELINES_QUERY})
+            second = _graphql_post(client, {'query': PIPELINES_QUERY})
+            assert first.status_code == second.status_code == 200
+            assert first.data == second.data
+            assert first.headers['ETag'] == second.headers['ETag']
+            assert get_pipelines_or_error.call_count == 1
+
+            # Mutations drop every cached response
+            _graphql_post(
+                client, {'query': 'mutation { deletePipelineRun(runId: "foo") { __typename } }'}
+            )
+            _graphql_post(client, {'query': PIPELINES_QUERY})
+            assert get_pipelines_or_error.call_count == 2
+
+
+class ExposingMetricsRecorder(MetricsRecorder):
+    def __init__(self):
+        self.execution_manager_state = None
+
+    def record_execution_manager_state(self, num_queued_runs, num_active_runs):
+        self.execution_manager_state = (num_queued_runs, num_active_runs)
+
+    def exposition(self):
+        return b'dagster_execution_manager_queued_runs 0.0\n', 'text/plain; version=0.0.4'
+
+
+def test_metrics_view():
+    handle = ExecutionTargetHandle.for_repo_yaml(script_relative_path('./repository.yaml'))
+
+    with create_app(handle, DagsterInstance.ephemeral()).test_client() as client:
+        res = client.get('/metrics')
+    assert res.status_code == 404
+
+    tempdir = DagsterInstance.temp_storage()
+    metrics = ExposingMetricsRecorder()
+    instance = DagsterInstance(
+        InstanceType.EPHEMERAL,
+        local_artifact_storage=LocalArtifactStorage(tempdir),
+        run_storage=InMemoryRunStorage(),
+        event_storage=InMemoryEventLogStorage(),
+        compute_log_manager=NoOpComputeLogManager(tempdir),
+        metrics=metrics,
+    )
+
+    with create_app(handle, instance).test_client() as client:
+        res = client.get('/metrics')
+    assert res.status_code == 200
+    assert res.content_type == 'text/plain; version=0.0.4'
+    assert res.data == b'dagster_execution_manager_queued_runs 0.0\n'
+    assert metrics.execution_manager_state == (0, 0)
@@ -0,0 +1,239 @@
+'''Caches the topology of the Airflow DAGs compiled from pipelines.
+
+The Airflow scheduler re-parses DAG files every few seconds, and validating the environment config
+of a pipeline and building its execution plan on every parse dominates the time it takes to parse
+a DAG file for large pipelines. Only the tasks of the DAG and their dependencies are needed, so
+they are stored on disk, keyed by a fingerprint of the pipeline definition and a hash of the
+environment config, and only compiled again once either changes.
+'''
+import hashlib
+import os
+import tempfile
+from collections import namedtuple
+
+from dagster import check
+from dagster.core.definitions.pipeline import PipelineDefinition
+from dagster.core.definitions.solid import CompositeSolidDefinition
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.config import RunConfig
+from dagster.seven import json
+from dagster.utils import mkdir_p
+from dagster.version import __version__ as dagster_version
+
+from .compile import coalesce_execution_steps
+
+# Bump whenever what is fingerprinted or the format of the cached topologies changes
+CACHE_VERSION = '1'
+
+
+class DagTask(namedtuple('_DagTask', 'task_id step_keys upstream_task_ids')):
+    '''A task of the Airflow DAG compiled from a pipeline.
+
+    Args:
+        task_id (str): The id of the task, the handle of the solid whose steps it executes.
+        step_keys (List[str]): The keys of the steps the task executes.
+        upstream_task_ids (List[str]): The ids of the tasks it depends on.
+    '''
+
+    def __new__(cls, task_id, step_keys, upstream_task_ids):
+        return super(DagTask, cls).__new__(
+            cls,
+            check.str_param(task_id, 'task_id'),
+            check.list_param(step_keys, 'step_keys', of_type=str),
+            check.list_param(upstream_task_ids, 'upstream_task_ids', of_type=str),
+        )
+
+
+def compile_dag_tasks(pipeline_def, environment_dict, mode):
+    '''Compiles the tasks of the Airflow DAG of a pipeline, in topological order.'''
+    check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+    check.dict_param(environment_dict, 'environment_dict', key_type=str)
+    check.str_param(mode, 'mode')
+
+    execution_plan = create_execution_plan(
+        pipeline_def, environment_dict, run_config=RunConfig(mode=mode)
+    )
+
+    dag_tasks = []
+    for solid_handle, solid_steps in coalesce_execution_steps(execution_plan).items():
+        upstream_task_ids = []
+        for solid_step in solid_steps:
+            for step_input in solid_step.step_inputs:
+                for key in sorted(step_input.dependency_keys):
+                    prev_solid_handle = execution_plan.get_step_by_key(key).solid_handle.to_string()
+                    if (
+                        prev_solid_handle != solid_handle
+                        and prev_solid_handle not in upstream_task_ids
+                    ):
+                        upstream_task_ids.append(prev_solid_handle)
+
+        dag_tasks.append(
+            DagTask(solid_handle, [step.key for step in solid_steps], upstream_task_ids)
+        )
+
+    return dag_tasks
+
+
+def _add_hash(m, *parts):
+    m.update(json.dumps(parts, sort_keys=True, default=repr).encode('utf-8'))
+
+
+def _config_key(config_field):
+    return config_field.config_type.key if config_field else None
+
+
+def _code_hash(fn):
+    # The config mapping of a composite solid may provide the inputs of the solids it contains,
+    # which changes the dependencies of their steps
+    code = getattr(fn, '__code__', None)
+    if code is None:
+        return repr(fn)
+
+    return hashlib.sha1(code.co_code + repr(code.co_consts).encode('utf-8')).hexdigest()
+
+
+def _hash_solids(m, solids, dependency_structure):
+    for solid in sorted(solids, key=lambda solid: solid.name):
+        definition = solid.definition
+        _add_hash(m, 'solid', solid.name, definition.name, definition.metadata)
+
+        for input_def in definition.input_defs:
+            _add_hash(m, 'input', input_def.name, input_def.runtime_type.key)
+            input_handle = solid.input_handle(input_def.name)
+            if dependency_structure.has_deps(input_handle):
+                for output_handle in dependency_structure.get_deps_list(input_handle):
+                    _add_hash(m, 'dep', output_handle.solid.name, output_handle.output_def.name)
+
+        for output_def in definition.output_defs:
+            _add_hash(m, 'output', output_def.name, output_def.runtime_type.key)
+
+        if isinstance(definition, CompositeSolidDefinition):
+            for input_mapping in definition.input_mappings:
+                _add_hash(
+                    m,
+                    'input_mapping',
+                    input_mapping.definition.name,
+                    input_mapping.solid_name,
+                    input_mapping.input_name,
+                )
+            for output_mapping in definition.output_mappings:
+                _add_hash(
+                    m,
+                    'output_mapping',
+                    output_mapping.definition.name,
+                    output_mapping.solid_name,
+                    output_mapping.output_name,
+                )
+            if definition.config_mapping:
+                _add_hash(
+                    m,
+                    'config_mapping',
+                    _config_key(definition.config_mapping.config_field),
+                    _code_hash(definition.config_mapping.config_fn),
+                )
+            _hash_solids(m, definition.solids, definition.dependency_structure)
+        else:
+            _add_hash(m, 'config', _config_key(definition.config_field))
+
+        _add_hash(m, 'end_solid')
+
+
+def pipeline_fingerprint(pipeline_def, mode):
+    '''A fingerprint of everything about a pipeline definition (in a mode) that determines the
+    tasks of its DAG and the validity of its environment config: the solids, their dependencies,
+    inputs and outputs, and the config schemas of the solids and of the resources, system storage,
+    executors and loggers of the mode.
+
+    Fingerprinting the definition is much cheaper than building its environment config schema,
+    validating the config against it and building the execution plan.
+    '''
+    check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+    check.str_param(mode, 'mode')
+
+    mode_def = pipeline_def.get_mode_definition(mode)
+
+    m = hashlib.sha1()
+    _add_hash(m, CACHE_VERSION, dagster_version, pipeline_def.name, mode_def.name)
+    for name, resource_def in sorted(mode_def.resource_defs.items()):
+        _add_hash(m, 'resource', name, _config_key(resource_def.config_field))
+    for name, logger_def in sorted(mode_def.loggers.items()):
+        _add_hash(m, 'logger', name, _config_key(logger_def.config_field))
+    for system_storage_def in mode_def.system_storage_defs:
+        _add_hash(
+            m, 'storage', system_storage_def.name, _config_key(system_storage_def.config_field)
+        )
+    for executor_def in mode_def.executor_defs:
+        _add_hash(m, 'executor', executor_def.name, _config_key(executor_def.config_field))
+
+    _hash_solids(m, pipeline_def.solids, pipeline_def.dependency_structure)
+
+    return m.hexdigest()
+
+
+def _cache_path(cache_dir, pipeline_def, environment_dict, mode):
+    m = hashlib.sha1()
+    _add_hash(m, pipeline_fingerprint(pipeline_def, mode), environment_dict)
+    return os.path.join(cache_dir, '{key}.json'.format(key=m.hexdigest()))
+
+
+def _read_dag_tasks(path):
+    try:
+        with open(path, 'r') as f:
+            serialized = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if serialized.get('version') != CACHE_VERSION:
+        return None
+
+    return [
+        DagTask(task['task_id'], task['step_keys'], task['upstream_task_ids'])
+        for task in serialized['tasks']
+    ]
+
+
+def _write_dag_tasks(path, dag_tasks):
+    cache_dir = os.path.dirname(path)
+    mkdir_p(cache_dir)
+
+    fd, staging_path = tempfile.mkstemp(dir=cache_dir)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'tasks': [task._asdict() for task in dag_tasks]}, f)
+
+    # Renames are atomic, so concurrent parses never read a partially written topology
+    os.rename(staging_path, path)
+
+
+def load_dag_tasks(pipeline_def, environment_dict, mode, cache_dir=None):
+    '''Returns the tasks of the Airflow DAG of a pipeline (see compile_dag_tasks) from the cache
+    directory, compiling and caching them if they aren't cached yet.
+
+    Args:
+        pipeline_def (PipelineDefinition): The pipeline.
+        environment_dict (dict): The environment config to compile the pipeline with.
+        mode (str): The mode to compile the pipeline in.
+        cache_dir (Optional[str]): The directory caching compiled DAGs. If not given, the DAG is
+            compiled every time.
+
+    Returns:
+        List[DagTask]
+    '''
+    check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+    check.dict_param(environment_dict, 'environment_dict', key_type=str)
+    check.str_param(mode, 'mode')
+    check.opt_str_param(cache_dir, 'cache_dir')
+
+    if cache_dir is None:
+        return compile_dag_tasks(pipeline_def, environment_dict, mode)
+
+    path = _cache_path(cache_dir, pipeline_def, environment_dict, mode)
+    dag_tasks = _read_dag_tasks(path)
+    if dag_tasks is None:
+        dag_tasks = compile_dag_tasks(pipeline_def, environment_dict, mode)
+        try:
+            _write_dag_tasks(path, dag_tasks)
+        except (IOError, OSError):
+            # Caching is an optimization, so a read only cache directory doesn't fail the parse
+            pass
+
+    return dag_tasks
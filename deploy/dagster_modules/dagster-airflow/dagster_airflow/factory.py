@@ -1,14 +1,14 @@
 import datetime
+import os
 import re
 
 from airflow import DAG
 from airflow.operators import BaseOperator
 
-from dagster import ExecutionTargetHandle, RunConfig, check, seven
-from dagster.core.execution.api import create_execution_plan
+from dagster import ExecutionTargetHandle, check, seven
 from dagster.core.instance import DagsterInstance
 
-from .compile import coalesce_execution_steps
+from .cache import load_dag_tasks
 from .operators.docker_operator import DagsterDockerOperator
 from .operators.python_operator import DagsterPythonOperator
 
@@ -90,26 +90,24 @@ def _make_airflow_dag(
     if mode is None:
         mode = pipeline.get_default_mode_name()
 
-    execution_plan = create_execution_plan(
-        pipeline, environment_dict, run_config=RunConfig(mode=mode)
+    # The scheduler parses DAG files every few seconds, so the tasks of the DAG are cached in the
+    # instance rather than compiled from the execution plan of the pipeline on every parse
+    cache_dir = (
+        None if instance.is_ephemeral else os.path.join(instance.root_directory, 'airflow_dags')
     )
+    dag_tasks = load_dag_tasks(pipeline, environment_dict, mode, cache_dir=cache_dir)
 
     tasks = {}
 
-    coalesced_plan = coalesce_execution_steps(execution_plan)
-
-    for solid_handle, solid_steps in coalesced_plan.items():
-
-        step_keys = [step.key for step in solid_steps]
-
+    for dag_task in dag_tasks:
         if operator == DagsterPythonOperator:
             task = operator(
                 handle=handle,
                 pipeline_name=pipeline_name,
                 environment_dict=environment_dict,
                 mode=mode,
-                task_id=solid_handle,
-                step_keys=step_keys,
+                task_id=dag_task.task_id,
+                step_keys=dag_task.step_keys,
                 dag=dag,
                 instance_ref=instance.get_ref(),
                 **op_kwargs
@@ -119,23 +117,19 @@ def _make_airflow_dag(
                 pipeline_name=pipeline_name,
                 environment_dict=environment_dict,
                 mode=mode,
-                task_id=solid_handle,
-                step_keys=step_keys,
+                task_id=dag_task.task_id,
+                step_keys=dag_task.step_keys,
                 dag=dag,
                 instance_ref=instance.get_ref(),
                 **op_kwargs
             )
 
-        tasks[solid_handle] = task
+        tasks[dag_task.task_id] = task
 
-        for solid_step in solid_steps:
-            for step_input in solid_step.step_inputs:
-                for key in step_input.dependency_keys:
-                    prev_solid_handle = execution_plan.get_step_by_key(key).solid_handle.to_string()
-                    if solid_handle != prev_solid_handle:
-                        tasks[prev_solid_handle].set_downstream(task)
+        for upstream_task_id in dag_task.upstream_task_ids:
+            tasks[upstream_task_id].set_downstream(task)
 
-    return (dag, [tasks[solid_handle] for solid_handle in coalesced_plan.keys()])
+    return (dag, [tasks[dag_task.task_id] for dag_task in dag_tasks])
 
 
 def make_airflow_dag(
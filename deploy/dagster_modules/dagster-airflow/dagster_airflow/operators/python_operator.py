@@ -3,15 +3,14 @@ import logging
 
 from airflow.exceptions import AirflowException
 from dagster_airflow.vendor.python_operator import PythonOperator
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
-from dagster_graphql.client.query import EXECUTE_PLAN_MUTATION
 
-from dagster import check, seven
+from dagster import check
 from dagster.core.definitions.pipeline import ExecutionSelector
+from dagster.core.execution.worker import execute_steps_in_worker
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 
-from .util import check_events_for_failures, check_events_for_skips, construct_variables
+from .util import check_events_for_failures, check_events_for_skips, construct_tags
 
 
 class DagsterPythonOperator(PythonOperator):
@@ -49,12 +48,10 @@ class DagsterPythonOperator(PythonOperator):
         def python_callable(ts, dag_run, **kwargs):  # pylint: disable=unused-argument
             run_id = dag_run.run_id
 
-            # TODO: https://github.com/dagster-io/dagster/issues/1342
-            redacted = construct_variables(mode, 'REDACTED', pipeline_name, run_id, ts, step_keys)
             logging.info(
-                'Executing GraphQL query: {query}\n'.format(query=EXECUTE_PLAN_MUTATION)
-                + 'with variables:\n'
-                + seven.json.dumps(redacted, indent=2)
+                'Executing steps {step_keys} of pipeline {pipeline_name} in run {run_id}'.format(
+                    step_keys=step_keys, pipeline_name=pipeline_name, run_id=run_id
+                )
             )
             instance = DagsterInstance.from_ref(instance_ref) if instance_ref else None
             if instance:
@@ -71,10 +68,15 @@ class DagsterPythonOperator(PythonOperator):
                     )
                 )
 
-            events = execute_execute_plan_mutation(
+            events = execute_steps_in_worker(
                 handle,
-                construct_variables(mode, environment_dict, pipeline_name, run_id, ts, step_keys),
+                pipeline_name,
+                environment_dict,
+                mode,
+                run_id,
+                step_keys,
                 instance_ref=instance_ref,
+                tags=construct_tags(ts),
             )
             check_events_for_failures(events)
             check_events_for_skips(events)
@@ -43,19 +43,28 @@ def construct_variables(mode, environment_dict, pipeline_name, run_id, ts, step_
         }
     }
 
-    # If an Airflow timestamp string is provided, stash it (and the converted version) in tags
-    if ts is not None:
+    tags = construct_tags(ts)
+    if tags:
         variables['executionParams']['executionMetadata']['tags'] = [
-            {'key': 'airflow_ts', 'value': ts},
-            {
-                'key': 'execution_epoch_time',
-                'value': '%f' % convert_airflow_datestr_to_epoch_ts(ts),
-            },
+            {'key': key, 'value': value} for key, value in sorted(tags.items())
         ]
 
     return variables
 
 
+def construct_tags(ts):
+    check.opt_str_param(ts, 'ts')
+
+    # If an Airflow timestamp string is provided, stash it (and the converted version) in tags
+    if ts is None:
+        return {}
+
+    return {
+        'airflow_ts': ts,
+        'execution_epoch_time': '%f' % convert_airflow_datestr_to_epoch_ts(ts),
+    }
+
+
 def parse_raw_res(raw_res):
     res = None
     # Look upon my works, ye mighty, and despair:
@@ -0,0 +1,100 @@
+import os
+
+from dagster_airflow import cache
+from dagster_airflow.cache import compile_dag_tasks, load_dag_tasks, pipeline_fingerprint
+from dagster_examples.toys.composition import composition
+
+from dagster import InputDefinition, lambda_solid, pipeline, seven
+
+ENVIRONMENT_DICT = {'solids': {'add_four': {'inputs': {'num': {'value': 1}}}}}
+
+
+def test_compile_dag_tasks():
+    dag_tasks = compile_dag_tasks(composition, ENVIRONMENT_DICT, 'default')
+
+    assert [dag_task.task_id for dag_task in dag_tasks] == [
+        'add_four.add_two.add_one',
+        'add_four.add_two.add_one_2',
+        'add_four.add_two_2.add_one',
+        'add_four.add_two_2.add_one_2',
+        'div_four.div_two',
+        'div_four.div_two_2',
+        'int_to_float',
+    ]
+    assert {dag_task.task_id: dag_task.upstream_task_ids for dag_task in dag_tasks} == {
+        'add_four.add_two.add_one': [],
+        'add_four.add_two.add_one_2': ['add_four.add_two.add_one'],
+        'add_four.add_two_2.add_one': ['add_four.add_two.add_one_2'],
+        'add_four.add_two_2.add_one_2': ['add_four.add_two_2.add_one'],
+        'div_four.div_two': ['add_four.add_two_2.add_one_2'],
+        'div_four.div_two_2': ['div_four.div_two'],
+        'int_to_float': ['div_four.div_two_2'],
+    }
+
+
+def define_pipeline(name, num_solids):
+    @lambda_solid
+    def start():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    @pipeline(name=name)
+    def _pipeline():
+        num = start()
+        for _ in range(num_solids):
+            num = add_one(num)
+
+    return _pipeline
+
+
+def test_pipeline_fingerprint():
+    assert pipeline_fingerprint(composition, 'default') == pipeline_fingerprint(
+        composition, 'default'
+    )
+    assert pipeline_fingerprint(define_pipeline('foo', 2), 'default') == pipeline_fingerprint(
+        define_pipeline('foo', 2), 'default'
+    )
+    assert pipeline_fingerprint(define_pipeline('foo', 2), 'default') != pipeline_fingerprint(
+        define_pipeline('foo', 3), 'default'
+    )
+    assert pipeline_fingerprint(define_pipeline('foo', 2), 'default') != pipeline_fingerprint(
+        define_pipeline('bar', 2), 'default'
+    )
+
+
+def test_load_dag_tasks(monkeypatch):
+    num_compiles = {'count': 0}
+
+    def _compile_dag_tasks(*args):
+        num_compiles['count'] += 1
+        return compile_dag_tasks(*args)
+
+    monkeypatch.setattr(cache, 'compile_dag_tasks', _compile_dag_tasks)
+
+    with seven.TemporaryDirectory() as cache_dir:
+        dag_tasks = load_dag_tasks(composition, ENVIRONMENT_DICT, 'default', cache_dir=cache_dir)
+        assert dag_tasks == compile_dag_tasks(composition, ENVIRONMENT_DICT, 'default')
+        assert num_compiles['count'] == 1
+        assert len(os.listdir(cache_dir)) == 1
+
+        assert (
+            load_dag_tasks(composition, ENVIRONMENT_DICT, 'default', cache_dir=cache_dir)
+            == dag_tasks
+        )
+        assert num_compiles['count'] == 1
+
+        # Changing the environment config compiles the DAG again
+        load_dag_tasks(
+            composition,
+            {'solids': {'add_four': {'inputs': {'num': {'value': 2}}}}},
+            'default',
+            cache_dir=cache_dir,
+        )
+        assert num_compiles['count'] == 2
+        assert len(os.listdir(cache_dir)) == 2
+
+    load_dag_tasks(composition, ENVIRONMENT_DICT, 'default')
+    assert num_compiles['count'] == 3
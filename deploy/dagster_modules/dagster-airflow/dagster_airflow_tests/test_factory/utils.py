@@ -11,11 +11,13 @@ def validate_pipeline_execution(pipeline_exc_result):
         ('STEP_OUTPUT', 'multiply_the_word.compute'),
         ('OBJECT_STORE_OPERATION', 'multiply_the_word.compute'),
         ('STEP_SUCCESS', 'multiply_the_word.compute'),
+        ('STEP_PROFILE', 'multiply_the_word.compute'),
         ('STEP_START', 'count_letters.compute'),
         ('OBJECT_STORE_OPERATION', 'count_letters.compute'),
         ('STEP_INPUT', 'count_letters.compute'),
         ('STEP_OUTPUT', 'count_letters.compute'),
         ('STEP_SUCCESS', 'count_letters.compute'),
+        ('STEP_PROFILE', 'count_letters.compute'),
     }
 
     seen_events = set()
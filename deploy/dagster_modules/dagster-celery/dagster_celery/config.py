@@ -28,7 +28,8 @@ class dict_wrapper(object):
 
 
 class CeleryConfig(
-    namedtuple('CeleryConfig', 'broker backend include config_source'), ExecutorConfig,
+    namedtuple('CeleryConfig', 'broker backend include config_source step_batching'),
+    ExecutorConfig,
 ):
     '''Configuration class for the Celery execution engine.
 
@@ -38,11 +39,13 @@ class CeleryConfig(
         include (Optional[List[str]]): List of modules every worker should import.
         queues (Optional[List[Dict]]):
         config_source (Optional[Dict]): Config settings for the Celery app.
+        step_batching (Optional[str]): Execute linear chains ('chains') or levels ('levels') of
+            steps with the same queue and priority in a single task each.
 
     '''
 
     def __new__(
-        cls, broker=None, backend=None, include=None, config_source=None,
+        cls, broker=None, backend=None, include=None, config_source=None, step_batching=None,
     ):
 
         return super(CeleryConfig, cls).__new__(
@@ -53,6 +56,7 @@ class CeleryConfig(
             config_source=dict_wrapper(
                 dict(DEFAULT_CONFIG, **check.opt_dict_param(config_source, 'config_source'))
             ),
+            step_batching=check.opt_str_param(step_batching, 'step_batching'),
         )
 
     @staticmethod
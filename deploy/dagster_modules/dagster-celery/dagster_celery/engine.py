@@ -1,3 +1,4 @@
+import socket
 import sys
 import time
 from collections import defaultdict
@@ -6,15 +7,24 @@ from dagster import check
 from dagster.core.engine.engine_base import Engine
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.batch import (
+    ActiveBatchExecution,
+    build_step_batches,
+    in_process_execution_for_batch,
+)
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.core.execution.worker import StepEventLogTailer
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .config import CeleryConfig
 from .defaults import task_default_priority, task_default_queue
 from .tasks import create_task, make_app
 
-TICK_SECONDS = 1
+MIN_POLL_SECONDS = 0.01
+MAX_POLL_SECONDS = 1
+
+# How often the events of executing steps are read from the event log
+EVENT_POLL_SECONDS = 1
 
 
 class CeleryEngine(Engine):
@@ -39,79 +49,69 @@ class CeleryEngine(Engine):
 
         instance_ref_dict = pipeline_context.instance.get_ref().to_dict()
 
-        environment_dict = dict(pipeline_context.environment_dict, execution={'in_process': {}})
-
         mode = pipeline_context.mode_def.name
 
         run_id = pipeline_context.pipeline_run.run_id
 
         app = make_app(celery_config)
 
-        task_signatures = {}  # Dict[step_key, celery.Signature]
-        apply_kwargs = defaultdict(dict)  # Dict[step_key, Dict[str, Any]]
+        task_signatures = {}  # Dict[batch_key, celery.Signature]
+        apply_kwargs = defaultdict(dict)  # Dict[batch_key, Dict[str, Any]]
 
         priority_for_step = lambda step: (
             -1 * step.metadata.get('dagster-celery/priority', task_default_priority)
         )
-        priority_for_key = lambda step_key: (-1 * apply_kwargs[step_key]['priority'])
+        priority_for_key = lambda batch_key: (-1 * apply_kwargs[batch_key]['priority'])
         _warn_on_priority_misuse(pipeline_context, execution_plan)
 
-        for step_key in execution_plan.step_keys_to_execute:
-            step = execution_plan.get_step_by_key(step_key)
-            priority = step.metadata.get('dagster-celery/priority', task_default_priority)
-            queue = step.metadata.get('dagster-celery/queue', task_default_queue)
+        batches = build_step_batches(
+            execution_plan, celery_config.step_batching, batch_key_fn=_batch_key_for_step
+        )
+        for batch in batches:
+            priority = batch.first_step.metadata.get(
+                'dagster-celery/priority', task_default_priority
+            )
+            queue = batch.first_step.metadata.get('dagster-celery/queue', task_default_queue)
             task = create_task(app)
 
-            variables = {
-                'executionParams': {
-                    'selector': {'name': pipeline_name},
-                    'environmentConfigData': environment_dict,
-                    'mode': mode,
-                    'executionMetadata': {'runId': run_id},
-                    'stepKeys': [step_key],
-                }
-            }
-            task_signatures[step_key] = task.si(handle_dict, variables, instance_ref_dict)
-            apply_kwargs[step_key] = {
+            task_signatures[batch.key] = task.si(
+                handle_dict,
+                pipeline_name,
+                dict(
+                    pipeline_context.environment_dict,
+                    execution=in_process_execution_for_batch(batch),
+                ),
+                mode,
+                run_id,
+                batch.step_keys,
+                instance_ref_dict,
+                pipeline_context.pipeline_run.tags,
+            )
+            apply_kwargs[batch.key] = {
                 'priority': priority,
                 'queue': queue,
                 'routing_key': '{queue}.execute_query'.format(queue=queue),
             }
 
-        step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
-        completed_steps = set({})  # Set[step_key]
-        active_execution = execution_plan.start(sort_key_fn=priority_for_step)
-
-        while not active_execution.is_complete or step_results:
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except Exception:  # pylint: disable=broad-except
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                    for step_event in step_events:
-                        yield deserialize_json_to_dagster_namedtuple(step_event)
-                    results_to_pop.append(step_key)
-                    completed_steps.add(step_key)
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-                    active_execution.mark_complete(step_key)
+        results = _ResultCollector(app.backend)
+        tailer = StepEventLogTailer(
+            pipeline_context.instance, run_id, execution_plan.step_keys_to_execute
+        )
+        active_execution = ActiveBatchExecution(
+            execution_plan, batches, sort_key_fn=priority_for_step
+        )
 
+        while not active_execution.is_complete or results.has_pending:
             # This is a slight refinement. If we have n workers idle and schedule m > n steps for
             # execution, the first n steps will be picked up by the idle workers in the order in
             # which they are scheduled (and the following m-n steps will be executed in priority
             # order, provided that it takes longer to execute a step than to schedule it). The test
             # case has m >> n to exhibit this behavior in the absence of this sort step.
-            for step in active_execution.get_available_steps():
+            for batch in active_execution.get_available_batches():
                 try:
-                    step_results[step.key] = task_signatures[step.key].apply_async(
-                        **apply_kwargs[step.key]
+                    results.add(
+                        batch.key,
+                        task_signatures[batch.key].apply_async(**apply_kwargs[batch.key]),
                     )
                 except Exception:
                     yield DagsterEvent.engine_event(
@@ -123,7 +123,119 @@ class CeleryEngine(Engine):
                     )
                     raise
 
-            time.sleep(TICK_SECONDS)
+            # Steps are submitted as soon as the steps they depend on complete, so each level of
+            # the plan only adds the latency of the result backend
+            ready_results = results.wait_for_ready(timeout=EVENT_POLL_SECONDS)
+
+            # Workers have written every event of the ready steps by the time their results are
+            # ready, so these are read before the steps are marked complete
+            for step_event in tailer.poll():
+                yield step_event
+
+            for batch_key, result in sorted(
+                ready_results.items(), key=lambda x: priority_for_key(x[0])
+            ):
+                try:
+                    step_summaries = result.get()
+                except Exception:  # pylint: disable=broad-except
+                    # We will want to do more to handle the exception here.. maybe subclass Task
+                    # Certainly yield an engine or pipeline event
+                    step_summaries = None
+                if step_summaries is not None:
+                    for step_event in tailer.outcome_events_not_found(
+                        pipeline_context, execution_plan, step_summaries
+                    ):
+                        yield step_event
+
+                    missing_events = tailer.check_steps_complete(pipeline_context, step_summaries)
+                    if missing_events:
+                        yield missing_events
+                active_execution.mark_complete(batch_key)
+
+
+class _ResultCollector(object):
+    '''Collects the results of submitted tasks as they become ready.
+
+    Async result backends (such as rpc and redis) push the state of tasks to the engine, so waiting
+    blocks on the backend until a result arrives. Other backends don't, so their results are polled
+    with a backoff from MIN_POLL_SECONDS to MAX_POLL_SECONDS while none are ready.
+    '''
+
+    def __init__(self, backend):
+        self._backend = backend
+        self._pending = {}  # Dict[batch_key, celery.AsyncResult]
+        self._ready = []  # List[batch_key]
+        self._on_ready = None  # vine.promise, fulfilled once a pending result is ready
+        self._poll_seconds = MIN_POLL_SECONDS
+
+    @property
+    def has_pending(self):
+        return bool(self._pending)
+
+    def add(self, batch_key, result):
+        self._pending[batch_key] = result
+        if self._backend.is_async:
+            result.then(lambda _result: self._mark_ready(batch_key))
+
+    def _mark_ready(self, batch_key):
+        self._ready.append(batch_key)
+        if self._on_ready is not None and not self._on_ready.ready:
+            self._on_ready()
+
+    def _wait_async(self, timeout):
+        # deferred import, vine is a dependency of celery
+        from vine import promise
+
+        self._on_ready = promise()
+        try:
+            if not self._ready:
+                for _ in self._backend.result_consumer.drain_events_until(
+                    self._on_ready, timeout=timeout
+                ):
+                    pass
+        except socket.timeout:
+            pass
+        finally:
+            self._on_ready = None
+
+    def _poll(self, timeout):
+        start = time.time()
+        while True:
+            self._ready.extend(
+                batch_key for batch_key, result in self._pending.items() if result.ready()
+            )
+            if self._ready:
+                self._poll_seconds = MIN_POLL_SECONDS
+                return
+
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
+                return
+
+            time.sleep(min(self._poll_seconds, remaining))
+            self._poll_seconds = min(self._poll_seconds * 2, MAX_POLL_SECONDS)
+
+    def wait_for_ready(self, timeout):
+        '''Blocks until at least one of the pending results is ready, or for timeout seconds,
+        returning the ready results keyed by batch key.'''
+        if not self._pending:
+            return {}
+
+        if self._backend.is_async:
+            self._wait_async(timeout)
+        else:
+            self._poll(timeout)
+
+        ready = {batch_key: self._pending.pop(batch_key) for batch_key in set(self._ready)}
+        self._ready = []
+        return ready
+
+
+def _batch_key_for_step(step):
+    return (
+        step.metadata.get('dagster-celery/queue', task_default_queue),
+        step.metadata.get('dagster-celery/priority', task_default_priority),
+    )
 
 
 def _warn_on_priority_misuse(context, execution_plan):
@@ -1,5 +1,9 @@
 from dagster import Field, Permissive, String
-from dagster.core.definitions.executor import check_cross_process_constraints, executor
+from dagster.core.definitions.executor import (
+    check_cross_process_constraints,
+    executor,
+    step_batching_config,
+)
 
 from .config import CeleryConfig
 
@@ -28,6 +32,7 @@ from .config import CeleryConfig
         'config_source': Field(
             Permissive(), is_optional=True, description='Settings for the Celery app.'
         ),
+        'step_batching': step_batching_config(),
     },
 )
 def celery_executor(init_context):
@@ -57,9 +62,16 @@ def celery_executor(init_context):
             include?: ['my_module'], # List of modules every worker should import
             celery_settings: {
                 ... # Celery app config
-            }
+            },
+            step_batching?: 'chains', # Or 'levels'
         }
 
+    Pipelines with many small solids spend most of their time submitting tasks and loading the
+    pipeline for them. Setting ``step_batching`` executes linear chains of steps (``chains``) or the
+    steps of each level of the plan (``levels``) in a single task each, handing outputs between the
+    steps of a task in memory, so those steps must not mutate their inputs. Only steps with the
+    same ``dagster-celery/queue`` and ``dagster-celery/priority`` tags are batched together.
+
     If you'd like to configure a celery executor in addition to the
     :py:class:`~dagster.default_executors`, you should add it to the ``executor_defs`` defined on a
     :py:class:`~dagster.ModeDefinition` as follows:
@@ -1,33 +1,58 @@
 from celery import Celery
 from celery.utils.collections import force_mapping
 from dagster_celery.config import CeleryConfig
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
 from kombu import Queue
 
 from dagster import ExecutionTargetHandle, check
+from dagster.core.execution.worker import execute_steps_in_worker, summarize_step_events
 from dagster.core.instance import InstanceRef
-from dagster.core.serdes import serialize_dagster_namedtuple
 from dagster.seven import is_module_available
 
 
 def create_task(celery_app, **task_kwargs):
+    # The task keeps its original name, so that existing queue and routing configuration applies
     @celery_app.task(bind=True, name='execute_query', **task_kwargs)
-    def _execute_query(_self, handle_dict, variables, instance_ref_dict):
-        instance_ref = InstanceRef.from_dict(instance_ref_dict)
-        handle = ExecutionTargetHandle.from_dict(handle_dict)
-
-        events = execute_execute_plan_mutation(
-            handle=handle, variables=variables, instance_ref=instance_ref,
+    def _execute_plan(
+        _self,
+        handle_dict,
+        pipeline_name,
+        environment_dict,
+        mode,
+        run_id,
+        step_keys,
+        instance_ref_dict,
+        tags=None,
+    ):
+        events = execute_steps_in_worker(
+            ExecutionTargetHandle.from_dict(handle_dict),
+            pipeline_name,
+            environment_dict,
+            mode,
+            run_id,
+            step_keys,
+            instance_ref=InstanceRef.from_dict(instance_ref_dict),
+            tags=tags,
         )
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
 
-    return _execute_query
+        # The engine reads the events from the event log of the run as they are written
+        return summarize_step_events(events, step_keys)
+
+    return _execute_plan
 
 
 def make_app(config=None):
     config = check.opt_inst_param(config, 'config', CeleryConfig)
-    app_ = Celery('dagster', **(config._asdict() if config is not None else {}))
+    celery_kwargs = (
+        dict(
+            broker=config.broker,
+            backend=config.backend,
+            include=config.include,
+            config_source=config.config_source,
+        )
+        if config is not None
+        else {}
+    )
+    app_ = Celery('dagster', **celery_kwargs)
     if config is None:
         app_.config_from_object('dagster_celery.defaults', force=True)
 
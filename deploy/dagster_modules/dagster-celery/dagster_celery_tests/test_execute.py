@@ -25,6 +25,7 @@ from dagster import (
     seven,
     solid,
 )
+from dagster.core.execution.worker import StepEventLogTailer
 from dagster.core.instance import DagsterInstance
 from dagster.core.test_utils import nesting_composite_pipeline
 
@@ -167,11 +168,12 @@ def execute_eagerly_on_celery(pipeline_name):
 def test_execute_on_celery(dagster_celery_worker):
     with execute_pipeline_on_celery('test_pipeline') as result:
         assert result.result_for_solid('simple').output_value() == 1
-        assert len(result.step_event_list) == 4
+        assert len(result.step_event_list) == 5
         assert len(events_of_type(result, 'STEP_START')) == 1
         assert len(events_of_type(result, 'STEP_OUTPUT')) == 1
         assert len(events_of_type(result, 'OBJECT_STORE_OPERATION')) == 1
         assert len(events_of_type(result, 'STEP_SUCCESS')) == 1
+        assert len(events_of_type(result, 'STEP_PROFILE')) == 1
 
 
 @skip_ci
@@ -179,12 +181,13 @@ def test_execute_serial_on_celery(dagster_celery_worker):
     with execute_pipeline_on_celery('test_serial_pipeline') as result:
         assert result.result_for_solid('simple').output_value() == 1
         assert result.result_for_solid('add_one').output_value() == 2
-        assert len(result.step_event_list) == 10
+        assert len(result.step_event_list) == 12
         assert len(events_of_type(result, 'STEP_START')) == 2
         assert len(events_of_type(result, 'STEP_INPUT')) == 1
         assert len(events_of_type(result, 'STEP_OUTPUT')) == 2
         assert len(events_of_type(result, 'OBJECT_STORE_OPERATION')) == 3
         assert len(events_of_type(result, 'STEP_SUCCESS')) == 2
+        assert len(events_of_type(result, 'STEP_PROFILE')) == 2
 
 
 @skip_ci
@@ -256,23 +259,25 @@ def test_execute_fails_pipeline_on_celery(dagster_celery_worker):
 def test_execute_eagerly_on_celery():
     with execute_eagerly_on_celery('test_pipeline') as result:
         assert result.result_for_solid('simple').output_value() == 1
-        assert len(result.step_event_list) == 4
+        assert len(result.step_event_list) == 5
         assert len(events_of_type(result, 'STEP_START')) == 1
         assert len(events_of_type(result, 'STEP_OUTPUT')) == 1
         assert len(events_of_type(result, 'OBJECT_STORE_OPERATION')) == 1
         assert len(events_of_type(result, 'STEP_SUCCESS')) == 1
+        assert len(events_of_type(result, 'STEP_PROFILE')) == 1
 
 
 def test_execute_eagerly_serial_on_celery():
     with execute_eagerly_on_celery('test_serial_pipeline') as result:
         assert result.result_for_solid('simple').output_value() == 1
         assert result.result_for_solid('add_one').output_value() == 2
-        assert len(result.step_event_list) == 10
+        assert len(result.step_event_list) == 12
         assert len(events_of_type(result, 'STEP_START')) == 2
         assert len(events_of_type(result, 'STEP_INPUT')) == 1
         assert len(events_of_type(result, 'STEP_OUTPUT')) == 2
         assert len(events_of_type(result, 'OBJECT_STORE_OPERATION')) == 3
         assert len(events_of_type(result, 'STEP_SUCCESS')) == 2
+        assert len(events_of_type(result, 'STEP_PROFILE')) == 2
 
 
 def test_execute_eagerly_diamond_pipeline_on_celery():
@@ -335,6 +340,18 @@ def test_execute_eagerly_fails_pipeline_on_celery():
         assert result.solid_result_list[0].failure_data.error.message == 'Exception: argjhgjh\n'
 
 
+def test_execute_eagerly_fails_pipeline_without_shared_event_log_on_celery(monkeypatch):
+    # As if the workers wrote their events to an event log the engine can't read
+    monkeypatch.setattr(StepEventLogTailer, 'poll', lambda _self: [])
+
+    with execute_eagerly_on_celery('test_fails') as result:
+        assert not result.success
+        assert not result.result_for_solid('fails').success
+        assert (
+            result.result_for_solid('fails').failure_data.error.message == 'Exception: argjhgjh\n'
+        )
+
+
 def test_bad_broker():
     event_stream = execute_pipeline_iterator(
         ExecutionTargetHandle.for_pipeline_python_file(
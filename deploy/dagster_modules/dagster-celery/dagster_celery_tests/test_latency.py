@@ -0,0 +1,118 @@
+import time
+
+import pytest
+from celery.contrib.testing import worker
+from dagster_celery import celery_executor
+from dagster_celery.config import CeleryConfig
+from dagster_celery.tasks import create_task, make_app
+
+from dagster import (
+    DagsterEventType,
+    ExecutionTargetHandle,
+    ModeDefinition,
+    default_executors,
+    execute_pipeline,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.instance import DagsterInstance
+
+celery_mode_defs = [ModeDefinition(executor_defs=default_executors + [celery_executor])]
+
+NUM_LEVELS = 10
+
+# A level used to take up to a second (the engine's polling tick) on top of executing its step
+MAX_SECONDS_PER_LEVEL = 0.5
+
+
+@solid
+def start(_):
+    return 0
+
+
+@solid
+def add_one(_, num):
+    return num + 1
+
+
+@pipeline(mode_defs=celery_mode_defs)
+def chain_pipeline():
+    value = start()
+    for i in range(NUM_LEVELS):
+        value = add_one.alias('add_one_{i}'.format(i=i))(value)
+
+
+@pytest.mark.parametrize('backend', ['rpc://', 'cache+memory://'])
+def test_scheduling_latency_per_level(backend):
+    celery_config = {
+        'broker': 'memory://',
+        'backend': backend,
+        # The in-memory transport polls its queues, once a second by default
+        'config_source': {'broker_transport_options': {'polling_interval': 0.01}},
+    }
+    app = make_app(CeleryConfig(**celery_config))
+    create_task(app)
+
+    with seven.TemporaryDirectory() as tempdir:
+        pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'chain_pipeline'
+        ).build_pipeline_definition()
+        instance = DagsterInstance.local_temp(tempdir=tempdir)
+        with worker.start_worker(app, perform_ping_check=False):
+            start_time = time.time()
+            result = execute_pipeline(
+                pipeline_def,
+                environment_dict={
+                    'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                    'execution': {'celery': {'config': celery_config}},
+                },
+                instance=instance,
+            )
+            elapsed = time.time() - start_time
+
+        assert result.success
+        assert result.result_for_solid('add_one_{i}'.format(i=NUM_LEVELS - 1)).output_value() == (
+            NUM_LEVELS
+        )
+        assert elapsed / (NUM_LEVELS + 1) < MAX_SECONDS_PER_LEVEL
+
+
+def test_step_batching():
+    celery_config = {
+        'broker': 'memory://',
+        'backend': 'rpc://',
+        'config_source': {'broker_transport_options': {'polling_interval': 0.01}},
+        'step_batching': 'chains',
+    }
+    app = make_app(CeleryConfig(**celery_config))
+    create_task(app)
+
+    with seven.TemporaryDirectory() as tempdir:
+        pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'chain_pipeline'
+        ).build_pipeline_definition()
+        instance = DagsterInstance.local_temp(tempdir=tempdir)
+        with worker.start_worker(app, perform_ping_check=False):
+            result = execute_pipeline(
+                pipeline_def,
+                environment_dict={
+                    'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                    'execution': {'celery': {'config': celery_config}},
+                },
+                instance=instance,
+            )
+
+        assert result.success
+        assert result.result_for_solid('add_one_{i}'.format(i=NUM_LEVELS - 1)).output_value() == (
+            NUM_LEVELS
+        )
+
+        # The whole chain executes in one task, which hands every output over in memory
+        assert not [
+            event
+            for event in result.event_list
+            if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+            and event.event_specific_data.op == ObjectStoreOperationType.GET_OBJECT.value
+        ]
@@ -0,0 +1,76 @@
+import time
+
+from celery.contrib.testing import worker
+from dagster_celery import celery_executor
+from dagster_celery.config import CeleryConfig
+from dagster_celery.tasks import create_task, make_app
+
+from dagster import (
+    ExecutionTargetHandle,
+    Materialization,
+    ModeDefinition,
+    Output,
+    default_executors,
+    execute_pipeline_iterator,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.instance import DagsterInstance
+
+celery_mode_defs = [ModeDefinition(executor_defs=default_executors + [celery_executor])]
+
+SLEEP_SECONDS = 3
+
+
+@solid
+def slow(_):
+    yield Materialization(label='started')
+    time.sleep(SLEEP_SECONDS)
+    yield Output(1)
+
+
+@pipeline(mode_defs=celery_mode_defs)
+def slow_pipeline():
+    slow()
+
+
+def test_events_streamed_while_step_executes():
+    celery_config = {
+        'broker': 'memory://',
+        'backend': 'rpc://',
+        'config_source': {'broker_transport_options': {'polling_interval': 0.01}},
+    }
+    app = make_app(CeleryConfig(**celery_config))
+    create_task(app)
+
+    with seven.TemporaryDirectory() as tempdir:
+        pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'slow_pipeline'
+        ).build_pipeline_definition()
+        instance = DagsterInstance.local_temp(tempdir=tempdir)
+        events = []
+        received_at = {}
+        with worker.start_worker(app, perform_ping_check=False):
+            for event in execute_pipeline_iterator(
+                pipeline_def,
+                environment_dict={
+                    'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                    'execution': {'celery': {'config': celery_config}},
+                },
+                instance=instance,
+            ):
+                events.append(event)
+                received_at.setdefault(event.event_type_value, time.time())
+
+        assert 'PIPELINE_SUCCESS' in received_at
+        assert received_at['STEP_SUCCESS'] - received_at['STEP_MATERIALIZATION'] > 1
+
+        # Every event of the step is yielded once
+        (run,) = instance.get_runs()
+        logged_step_events = [
+            record.dagster_event
+            for record in instance.all_logs(run.run_id)
+            if record.is_dagster_event and record.dagster_event.step_key
+        ]
+        assert [event for event in events if event.step_key] == logged_step_events
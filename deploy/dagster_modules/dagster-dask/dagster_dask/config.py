@@ -6,7 +6,11 @@ from dagster.core.execution.config import ExecutorConfig
 
 
 class DaskConfig(
-    namedtuple('DaskConfig', 'address timeout scheduler_file direct_to_workers heartbeat_interval'),
+    namedtuple(
+        'DaskConfig',
+        'address timeout scheduler_file direct_to_workers heartbeat_interval max_concurrent '
+        'step_batching',
+    ),
     ExecutorConfig,
 ):
     '''DaskConfig - configuration for the Dask execution engine
@@ -18,6 +22,10 @@ class DaskConfig(
         direct_to_workers (Optional[bool]): Whether or not to connect directly to the workers, or
             to ask the scheduler to serve as intermediary.
         heartbeat_interval (Optional[int]): Time in milliseconds between heartbeats to scheduler.
+        max_concurrent (Optional[int]): The maximum number of steps submitted to Dask at once. By
+            default, or if set to 0, every step is submitted as soon as its dependencies complete.
+        step_batching (Optional[str]): Execute linear chains ('chains') or levels ('levels') of
+            steps with the same resource requirements and priority in a single task each.
     '''
 
     def __new__(
@@ -27,6 +35,8 @@ class DaskConfig(
         scheduler_file=None,
         direct_to_workers=False,
         heartbeat_interval=None,
+        max_concurrent=None,
+        step_batching=None,
     ):
         return super(DaskConfig, cls).__new__(
             cls,
@@ -35,11 +45,15 @@ class DaskConfig(
             scheduler_file=check.opt_str_param(scheduler_file, 'scheduler_file'),
             direct_to_workers=check.opt_bool_param(direct_to_workers, 'direct_to_workers'),
             heartbeat_interval=check.opt_int_param(heartbeat_interval, 'heartbeat_interval'),
+            max_concurrent=check.opt_int_param(max_concurrent, 'max_concurrent'),
+            step_batching=check.opt_str_param(step_batching, 'step_batching'),
         )
 
     @property
     def is_remote_execution(self):
-        return self.address and not re.match(r'127\.0\.0\.1|0\.0\.0\.0|localhost', self.address)
+        return self.address and not re.match(
+            r'(\w+://)?(127\.0\.0\.1|0\.0\.0\.0|localhost)', self.address
+        )
 
     @staticmethod
     def get_engine():
@@ -1,26 +1,59 @@
+import sys
+import time
+
 import dask
 import dask.distributed
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
 
 from dagster import check
 from dagster.core.engine.engine_base import Engine
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.batch import (
+    ActiveBatchExecution,
+    build_step_batches,
+    in_process_execution_for_batch,
+)
+from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.worker import (
+    STEP_OUTCOME_EVENT_TYPES,
+    StepEventLogTailer,
+    execute_steps_in_worker,
+    is_step_success,
+    summarize_step_events,
+)
+from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .config import DaskConfig
 
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = 'dagster-dask/resource_requirements'
 
+# How often the events of executing steps are read from the event log
+EVENT_POLL_SECONDS = 1
+
+COMPLETION_POLL_SECONDS = 0.05
+
+
+def execute_steps_on_dask_worker(
+    handle, pipeline_name, environment_dict, mode, run_id, step_keys, instance_ref=None, tags=None
+):
+    '''Executes a batch of steps, once the engine has seen the steps they depend on complete.
 
-def query_on_dask_worker(
-    handle, variables, dependencies, instance_ref=None
-):  # pylint: disable=unused-argument
-    '''Note that we need to pass "dependencies" to ensure Dask sequences futures during task
-    scheduling, even though we do not use this argument within the function.
+    The engine reads the events of the steps from the event log of the run as they are written, so
+    only a summary of them is returned (see summarize_step_events).
     '''
-    return execute_execute_plan_mutation(handle, variables, instance_ref=instance_ref)
+    events = execute_steps_in_worker(
+        handle,
+        pipeline_name,
+        environment_dict,
+        mode,
+        run_id,
+        step_keys,
+        instance_ref=instance_ref,
+        tags=tags,
+    )
+    return summarize_step_events(events, step_keys)
 
 
 class DaskEngine(Engine):  # pylint: disable=no-init
@@ -65,57 +98,147 @@ class DaskEngine(Engine):  # pylint: disable=no-init
                 'Cannot use in-memory storage with Dask, use filesystem or S3',
             )
 
-        step_levels = execution_plan.execution_step_levels()
-
         pipeline_name = pipeline_context.pipeline_def.name
 
         instance = pipeline_context.instance
 
+        # Created before any step is submitted, so that no events are written before its cursor
+        tailer = StepEventLogTailer(
+            instance, pipeline_context.pipeline_run.run_id, execution_plan.step_keys_to_execute
+        )
+
         with dask.distributed.Client(**dask_config.build_dict(pipeline_name)) as client:
-            execution_futures = []
-            execution_futures_dict = {}
-
-            for step_level in step_levels:
-                for step in step_level:
-                    # We ensure correctness in sequencing by letting Dask schedule futures and
-                    # awaiting dependencies within each step.
-                    dependencies = []
-                    for step_input in step.step_inputs:
-                        for key in step_input.dependency_keys:
-                            dependencies.append(execution_futures_dict[key])
-
-                    environment_dict = dict(
-                        pipeline_context.environment_dict, execution={'in_process': {}}
-                    )
-                    variables = {
-                        'executionParams': {
-                            'selector': {'name': pipeline_name},
-                            'environmentConfigData': environment_dict,
-                            'mode': pipeline_context.mode_def.name,
-                            'executionMetadata': {'runId': pipeline_context.pipeline_run.run_id},
-                            'stepKeys': [step.key],
-                        }
-                    }
-
-                    dask_task_name = '%s.%s' % (pipeline_name, step.key)
+            # Steps are only submitted once the steps they depend on have completed, so that Dask
+            # never executes a step whose dependencies failed, and at most max_concurrent at once
+            active_execution = ActiveBatchExecution(
+                execution_plan,
+                build_step_batches(
+                    execution_plan, dask_config.step_batching, batch_key_fn=_batch_key_for_step
+                ),
+            )
+            batch_for_future = {}
+            completed_futures = dask.distributed.as_completed()
+            failed_or_skipped_steps = set()
+            finished_steps = set()
+            last_poll = 0
+
+            while not active_execution.is_complete:
+                num_to_submit = (
+                    dask_config.max_concurrent - len(batch_for_future)
+                    if dask_config.max_concurrent
+                    else None
+                )
+                batches = (
+                    active_execution.get_available_batches(limit=num_to_submit)
+                    if num_to_submit is None or num_to_submit > 0
+                    else []
+                )
+
+                for batch in batches:
+                    step_keys = []
+                    for step in batch.steps:
+                        failed_inputs = []
+                        for step_input in step.step_inputs:
+                            failed_inputs.extend(
+                                failed_or_skipped_steps.intersection(step_input.dependency_keys)
+                            )
+
+                        if not failed_inputs:
+                            step_keys.append(step.key)
+                            continue
+
+                        step_context = pipeline_context.for_step(step)
+                        step_context.log.info(
+                            'Dependencies for step {step} failed: {failed_inputs}. '
+                            'Not executing.'.format(step=step.key, failed_inputs=failed_inputs)
+                        )
+                        failed_or_skipped_steps.add(step.key)
+                        tailer.ignore_step(step.key)
+                        yield DagsterEvent.step_skipped_event(step_context)
+
+                    if not step_keys:
+                        active_execution.mark_complete(batch.key)
+                        continue
 
                     future = client.submit(
-                        query_on_dask_worker,
+                        execute_steps_on_dask_worker,
                         pipeline_context.execution_target_handle,
-                        variables,
-                        dependencies,
+                        pipeline_name,
+                        dict(
+                            pipeline_context.environment_dict,
+                            execution=in_process_execution_for_batch(batch),
+                        ),
+                        pipeline_context.mode_def.name,
+                        pipeline_context.pipeline_run.run_id,
+                        step_keys,
                         instance.get_ref(),
-                        key=dask_task_name,
-                        resources=step.metadata.get(DASK_RESOURCE_REQUIREMENTS_KEY, {}),
+                        pipeline_context.pipeline_run.tags,
+                        key='%s.%s' % (pipeline_name, batch.key),
+                        **_submit_kwargs_for_step(batch.first_step)
                     )
-
-                    execution_futures.append(future)
-                    execution_futures_dict[step.key] = future
-
-            # This tells Dask to awaits the step executions and retrieve their results to the
-            # master
-            for future in dask.distributed.as_completed(execution_futures):
-                for step_event in future.result():
-                    check.inst(step_event, DagsterEvent)
-
-                    yield step_event
+                    batch_for_future[future.key] = (batch, step_keys)
+                    completed_futures.add(future)
+
+                done = completed_futures.next_batch(block=False)
+
+                # Workers have written every event of the done steps by the time they are done
+                if done or time.time() - last_poll >= EVENT_POLL_SECONDS:
+                    for step_event in tailer.poll():
+                        if step_event.event_type in STEP_OUTCOME_EVENT_TYPES:
+                            finished_steps.add(step_event.step_key)
+                        yield step_event
+                    last_poll = time.time()
+
+                for future in done:
+                    batch, step_keys = batch_for_future.pop(future.key)
+                    try:
+                        step_summaries = future.result()
+                    except Exception:  # pylint: disable=broad-except
+                        # Steps of the batch that finished before the task failed keep their
+                        # outcome
+                        error = serializable_error_info_from_exc_info(sys.exc_info())
+                        for step_key in [key for key in step_keys if key not in finished_steps]:
+                            failed_or_skipped_steps.add(step_key)
+                            tailer.ignore_step(step_key)
+                            yield DagsterEvent.step_failure_event(
+                                pipeline_context.for_step(execution_plan.get_step_by_key(step_key)),
+                                StepFailureData(error=error, user_failure_data=None),
+                            )
+                    else:
+                        # Skips are propagated from the outcomes reported by the task rather than
+                        # from the events read from the event log, which workers may not share
+                        failed_or_skipped_steps.update(
+                            step_key
+                            for step_key, step_summary in step_summaries.items()
+                            if not is_step_success(step_summary)
+                        )
+                        for step_event in tailer.outcome_events_not_found(
+                            pipeline_context, execution_plan, step_summaries
+                        ):
+                            finished_steps.add(step_event.step_key)
+                            yield step_event
+
+                        missing_events = tailer.check_steps_complete(
+                            pipeline_context, step_summaries
+                        )
+                        if missing_events:
+                            yield missing_events
+                    active_execution.mark_complete(batch.key)
+
+                if not done and not batches:
+                    time.sleep(COMPLETION_POLL_SECONDS)
+
+
+def _batch_key_for_step(step):
+    return (
+        tuple(sorted(step.metadata.get(DASK_RESOURCE_REQUIREMENTS_KEY, {}).items())),
+        step.metadata.get('dagster/priority', 0),
+    )
+
+
+def _submit_kwargs_for_step(step):
+    return {
+        'resources': step.metadata.get(DASK_RESOURCE_REQUIREMENTS_KEY, {}),
+        # Dask executes tasks with higher priorities first, as dagster does
+        'priority': step.metadata.get('dagster/priority', 0),
+    }
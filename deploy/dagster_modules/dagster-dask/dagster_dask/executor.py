@@ -1,5 +1,9 @@
 from dagster import Bool, Field, Int, String
-from dagster.core.definitions.executor import check_cross_process_constraints, executor
+from dagster.core.definitions.executor import (
+    check_cross_process_constraints,
+    executor,
+    step_batching_config,
+)
 
 from .config import DaskConfig
 
@@ -33,6 +37,13 @@ from .config import DaskConfig
             is_optional=True,
             description='Time in milliseconds between heartbeats to scheduler.',
         ),
+        'max_concurrent': Field(
+            Int,
+            is_optional=True,
+            description='The maximum number of steps submitted to Dask at once. By default, or '
+            'if set to 0, every step is submitted as soon as its dependencies complete.',
+        ),
+        'step_batching': step_batching_config(),
     },
 )
 def dask_executor(init_context):
@@ -54,8 +65,21 @@ def dask_executor(init_context):
             # intermediary
             direct_to_workers?: False,
             heartbeat_interval?: 1000,  # Time in milliseconds between heartbeats to scheduler
+            max_concurrent?: 16,  # The maximum number of steps submitted to Dask at once
+            step_batching?: 'chains',  # Or 'levels'
         }
 
+    Steps are submitted to Dask as the steps they depend on complete, and steps whose dependencies
+    failed are skipped without being submitted. The ``dagster-dask/resource_requirements`` solid
+    metadata is passed to Dask as the resources of the solid's steps, and the ``dagster/priority``
+    solid metadata as their priority.
+
+    Setting ``step_batching`` executes linear chains of steps (``chains``) or the steps of each
+    level of the plan (``levels``) in a single task each, which saves most of the overhead of
+    pipelines with many small solids. Outputs are handed between the steps of a task in memory, so
+    those steps must not mutate their inputs. Only steps with the same resource requirements and
+    priority are batched together.
+
     If you'd like to configure a dask executor in addition to the
     :py:class:`~dagster.default_executors`, you should add it to the ``executor_defs`` defined on a
     :py:class:`~dagster.ModeDefinition` as follows:
@@ -1,10 +1,20 @@
+import os
+import time
+from contextlib import contextmanager
+
 import dagster_pandas as dagster_pd
+import dask.distributed
+import pytest
 from dagster_dask import dask_executor
 
 from dagster import (
+    DagsterEventType,
     ExecutionTargetHandle,
+    Field,
     InputDefinition,
     ModeDefinition,
+    RunConfig,
+    String,
     execute_pipeline,
     file_relative_path,
     pipeline,
@@ -12,7 +22,10 @@ from dagster import (
     solid,
 )
 from dagster.core.definitions.executor import default_executors
+from dagster.core.execution.profiling import PROFILE_TAG
+from dagster.core.execution.worker import StepEventLogTailer
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.test_utils import nesting_composite_pipeline
 
 
@@ -41,6 +54,28 @@ def test_execute_on_dask():
         assert result.result_for_solid('simple').output_value() == 1
 
 
+def test_profile_on_dask():
+    instance = DagsterInstance.local_temp()
+    with seven.TemporaryDirectory() as tempdir:
+        result = execute_pipeline(
+            ExecutionTargetHandle.for_pipeline_python_file(
+                __file__, 'dask_engine_pipeline'
+            ).build_pipeline_definition(),
+            environment_dict={
+                'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                'execution': {'dask': {'config': {'timeout': 30}}},
+            },
+            run_config=RunConfig(tags={PROFILE_TAG: 'true'}),
+            instance=instance,
+        )
+        assert result.success
+
+    profile = instance.compute_log_manager.read_logs_file(
+        result.run_id, 'simple.compute', ComputeIOType.PROFILE
+    )
+    assert profile.data.startswith('Profile of step "simple.compute"')
+
+
 def dask_composite_pipeline():
     return nesting_composite_pipeline(
         6, 2, mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])]
@@ -93,3 +128,189 @@ def test_pandas_dask():
     )
 
     assert result.success
+
+
+@solid
+def fails(_):
+    raise Exception('argjhgjh')
+
+
+@solid
+def passes_through(_, num):
+    return num
+
+
+@solid(config={'marker_path': Field(String)})
+def records_execution(context, _num):
+    with open(context.solid_config['marker_path'], 'w') as f:
+        f.write('executed')
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])])
+def dask_failing_pipeline():
+    records_execution(passes_through(fails()))
+
+
+@solid(config={'running_dir': Field(String)})
+def sleeps(context):
+    running_dir = context.solid_config['running_dir']
+    running_path = os.path.join(running_dir, context.solid.name + '.running')
+    with open(running_path, 'w'):
+        pass
+
+    # The number of steps running alongside this one, including itself
+    num_running = len([name for name in os.listdir(running_dir) if name.endswith('.running')])
+    with open(os.path.join(running_dir, context.solid.name + '.count'), 'w') as f:
+        f.write(str(num_running))
+
+    time.sleep(1)
+    os.remove(running_path)
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])])
+def dask_concurrent_pipeline():
+    for i in range(4):
+        sleeps.alias('sleeps_{i}'.format(i=i))()
+
+
+@solid(metadata={'dagster-dask/resource_requirements': {'GPU': 1}})
+def needs_gpu(_):
+    return 1
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])])
+def dask_resources_pipeline():
+    needs_gpu()
+
+
+@pytest.fixture(scope='module')
+def local_cluster():
+    with dask.distributed.LocalCluster(
+        n_workers=2, threads_per_worker=2, resources={'GPU': 1}, dashboard_address=None
+    ) as cluster:
+        yield cluster
+
+
+@contextmanager
+def execute_on_local_cluster(local_cluster, pipeline_name, environment_dict, **dask_config):
+    with seven.TemporaryDirectory() as tempdir:
+        yield execute_pipeline(
+            ExecutionTargetHandle.for_pipeline_python_file(
+                __file__, pipeline_name
+            ).build_pipeline_definition(),
+            environment_dict=dict(
+                environment_dict,
+                storage={'filesystem': {'config': {'base_dir': tempdir}}},
+                execution={
+                    'dask': {'config': dict(dask_config, address=local_cluster.scheduler_address)}
+                },
+            ),
+            instance=DagsterInstance.local_temp(tempdir=tempdir),
+            raise_on_error=False,
+        )
+
+
+def test_failed_dependencies_skipped(local_cluster):  # pylint: disable=redefined-outer-name
+    with seven.TemporaryDirectory() as marker_dir:
+        marker_path = os.path.join(marker_dir, 'marker')
+        with execute_on_local_cluster(
+            local_cluster,
+            'dask_failing_pipeline',
+            {'solids': {'records_execution': {'config': {'marker_path': marker_path}}}},
+        ) as result:
+            assert not result.success
+            assert not result.result_for_solid('fails').success
+            assert result.result_for_solid('passes_through').skipped
+            assert result.result_for_solid('records_execution').skipped
+            assert not os.path.exists(marker_path)
+
+
+def test_failed_dependencies_skipped_without_shared_event_log(
+    local_cluster, monkeypatch
+):  # pylint: disable=redefined-outer-name
+    # As if the workers wrote their events to an event log the engine can't read
+    monkeypatch.setattr(StepEventLogTailer, 'poll', lambda _self: [])
+
+    with seven.TemporaryDirectory() as marker_dir:
+        marker_path = os.path.join(marker_dir, 'marker')
+        with execute_on_local_cluster(
+            local_cluster,
+            'dask_failing_pipeline',
+            {'solids': {'records_execution': {'config': {'marker_path': marker_path}}}},
+        ) as result:
+            # The engine reports the failure from the outcome the task returned
+            assert not result.success
+            assert not result.result_for_solid('fails').success
+            assert result.result_for_solid('fails').failure_data.error.message == (
+                'Exception: argjhgjh\n'
+            )
+
+            # And skips the steps downstream of the failure itself
+            skipped_step_keys = [
+                event.step_key
+                for event in result.event_list
+                if event.event_type == DagsterEventType.STEP_SKIPPED
+            ]
+            assert skipped_step_keys == ['passes_through.compute', 'records_execution.compute']
+            assert not os.path.exists(marker_path)
+
+
+def test_max_concurrent(local_cluster):  # pylint: disable=redefined-outer-name
+    with seven.TemporaryDirectory() as running_dir:
+        with execute_on_local_cluster(
+            local_cluster,
+            'dask_concurrent_pipeline',
+            {
+                'solids': {
+                    'sleeps_{i}'.format(i=i): {'config': {'running_dir': running_dir}}
+                    for i in range(4)
+                }
+            },
+            max_concurrent=1,
+        ) as result:
+            assert result.success
+
+        for i in range(4):
+            with open(os.path.join(running_dir, 'sleeps_{i}.count'.format(i=i))) as f:
+                assert f.read() == '1'
+
+
+def test_resource_requirements(local_cluster):  # pylint: disable=redefined-outer-name
+    with execute_on_local_cluster(local_cluster, 'dask_resources_pipeline', {}) as result:
+        assert result.success
+        assert result.result_for_solid('needs_gpu').output_value() == 1
+
+
+def test_step_batching(local_cluster):  # pylint: disable=redefined-outer-name
+    with seven.TemporaryDirectory() as running_dir:
+        with execute_on_local_cluster(
+            local_cluster,
+            'dask_concurrent_pipeline',
+            {
+                'solids': {
+                    'sleeps_{i}'.format(i=i): {'config': {'running_dir': running_dir}}
+                    for i in range(4)
+                }
+            },
+            step_batching='levels',
+        ) as result:
+            assert result.success
+
+        # The steps of the level execute one after the other in a single task
+        for i in range(4):
+            with open(os.path.join(running_dir, 'sleeps_{i}.count'.format(i=i))) as f:
+                assert f.read() == '1'
+
+    with seven.TemporaryDirectory() as marker_dir:
+        marker_path = os.path.join(marker_dir, 'marker')
+        with execute_on_local_cluster(
+            local_cluster,
+            'dask_failing_pipeline',
+            {'solids': {'records_execution': {'config': {'marker_path': marker_path}}}},
+            step_batching='chains',
+        ) as result:
+            assert not result.success
+            assert not result.result_for_solid('fails').success
+            assert result.result_for_solid('passes_through').skipped
+            assert result.result_for_solid('records_execution').skipped
+            assert not os.path.exists(marker_path)
@@ -95,6 +95,15 @@ fragment stepEventFragment on StepEvent {
       }
     }
   }
+  ... on ExecutionStepProfileEvent {
+    durationMs
+    phaseDurations {
+      phase
+      durationMs
+    }
+    cpuTimeMs
+    processPeakRssBytes
+  }
   ... on ExecutionStepFailureEvent {
     error {
       message
@@ -14,6 +14,7 @@ from dagster.core.execution.plan.objects import (
     StepInputData,
     StepOutputData,
     StepOutputHandle,
+    StepProfileData,
     StepSuccessData,
     TypeCheckData,
     UserFailureData,
@@ -29,6 +30,7 @@ HANDLED_EVENTS = {
     'ExecutionStepFailureEvent': DagsterEventType.STEP_FAILURE,
     'ExecutionStepSkippedEvent': DagsterEventType.STEP_SKIPPED,
     'ExecutionStepSuccessEvent': DagsterEventType.STEP_SUCCESS,
+    'ExecutionStepProfileEvent': DagsterEventType.STEP_PROFILE,
     'StepMaterializationEvent': DagsterEventType.STEP_MATERIALIZATION,
     'StepExpectationResultEvent': DagsterEventType.STEP_EXPECTATION_RESULT,
     'ObjectStoreOperationEvent': DagsterEventType.OBJECT_STORE_OPERATION,
@@ -128,6 +130,19 @@ def dagster_event_from_dict(event_dict, pipeline_name):
     elif event_type == DagsterEventType.STEP_SUCCESS:
         event_specific_data = StepSuccessData(0.0)
 
+    elif event_type == DagsterEventType.STEP_PROFILE:
+        event_specific_data = StepProfileData(
+            duration_ms=event_dict['durationMs'],
+            phase_durations_ms={
+                phase_duration['phase']: phase_duration['durationMs']
+                for phase_duration in event_dict['phaseDurations']
+            },
+            cpu_time_ms=event_dict['cpuTimeMs'],
+            process_peak_rss_bytes=int(event_dict['processPeakRssBytes'])
+            if event_dict.get('processPeakRssBytes') is not None
+            else None,
+        )
+
     elif event_type == DagsterEventType.STEP_MATERIALIZATION:
         materialization = event_dict['materialization']
         event_specific_data = StepMaterializationData(
@@ -1,10 +1,37 @@
-from dagster import ExecutionTargetHandle, check
+import hashlib
+from collections import OrderedDict
+
+from dagster import ExecutionTargetHandle, PipelineDefinition, RunConfig, check, seven
+from dagster.config.validate import validate_config
+from dagster.core.definitions.environment_schema import create_environment_schema
 from dagster.core.definitions.partition import PartitionScheduleDefinition
 from dagster.core.instance import DagsterInstance
+from dagster.core.system_config.objects import EnvironmentConfig
 
 from .pipeline_execution_manager import PipelineExecutionManager
+from .pipeline_index import PipelineIndex
 from .reloader import Reloader
 
+VALIDATED_CONFIG_CACHE_SIZE = 128
+
+PIPELINE_INDEX_CACHE_SIZE = 128
+
+
+def _validated_config_cache_key(pipeline, environment_dict, mode):
+    try:
+        config_hash = hashlib.sha1(seven.json.dumps(environment_dict).encode('utf-8')).hexdigest()
+    except (TypeError, ValueError):
+        # Not JSON serializable, so we can't build a canonical representation of it
+        return None
+
+    return (pipeline.name, tuple(sorted(pipeline.selector.solid_subset)), mode, config_hash)
+
+
+class _ValidatedConfigCacheEntry(object):
+    def __init__(self, validated_config):
+        self.validated_config = validated_config
+        self.environment_config = None
+
 
 class DagsterGraphQLContext(object):
     def __init__(self, handle, execution_manager, instance, reloader=None, version=None):
@@ -21,6 +48,11 @@ class DagsterGraphQLContext(object):
             artifacts_dir=self.instance.schedules_directory()
         )
         self._cached_pipelines = {}
+        self._validated_config_cache = OrderedDict()
+        # Sub-pipelines are rebuilt for every query of a solid subset, so their indexes are keyed by
+        # name and subset rather than by definition, and the least recently used are evicted
+        self._pipeline_indexes = OrderedDict()
+        self._repository_solid_handles = None
 
         self.partitions_handle = self.get_handle().build_partitions_handle()
 
@@ -61,6 +93,101 @@ class DagsterGraphQLContext(object):
     def get_repository(self):
         return self.repository_definition
 
+    def reload(self):
+        '''Drop state derived from the loaded repository and ask the reloader to restart.'''
+        self._validated_config_cache.clear()
+        self._pipeline_indexes.clear()
+        self._repository_solid_handles = None
+        self.execution_manager.recycle()
+        return self.reloader.reload()
+
+    def get_pipeline_index(self, pipeline):
+        '''The lazily built dauphin projections of the given pipeline, shared by every query
+        served by this context.
+
+        Returns:
+            PipelineIndex
+        '''
+        check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+
+        key = (pipeline.name, tuple(sorted(pipeline.selector.solid_subset)))
+        if key in self._pipeline_indexes:
+            index = self._pipeline_indexes.pop(key)
+        else:
+            index = PipelineIndex(pipeline)
+
+        self._pipeline_indexes[key] = index
+        while len(self._pipeline_indexes) > PIPELINE_INDEX_CACHE_SIZE:
+            self._pipeline_indexes.popitem(last=False)
+
+        return index
+
+    def get_repository_solid_handles(self):
+        '''Every solid handle of every pipeline in the repository, built once per repository load.
+
+        Returns:
+            List[Tuple[PipelineDefinition, DauphinSolidHandle]]: Each handle paired with the
+                pipeline that contains it.
+        '''
+        if self._repository_solid_handles is None:
+            self._repository_solid_handles = [
+                (pipeline, handle)
+                for pipeline in self.repository_definition.get_all_pipelines()
+                for handle in self.get_pipeline_index(pipeline).get_solid_handles().values()
+            ]
+        return self._repository_solid_handles
+
+    def _get_validated_config_entry(self, pipeline, environment_dict, mode):
+        key = _validated_config_cache_key(pipeline, environment_dict, mode)
+
+        if key is not None and key in self._validated_config_cache:
+            # Move to the end so the least recently used entries are evicted first
+            entry = self._validated_config_cache.pop(key)
+            self._validated_config_cache[key] = entry
+            return entry
+
+        entry = _ValidatedConfigCacheEntry(
+            validate_config(
+                create_environment_schema(pipeline, mode).environment_type, environment_dict
+            )
+        )
+
+        if key is not None:
+            self._validated_config_cache[key] = entry
+            while len(self._validated_config_cache) > VALIDATED_CONFIG_CACHE_SIZE:
+                self._validated_config_cache.popitem(last=False)
+
+        return entry
+
+    def get_validated_config(self, pipeline, environment_dict, mode):
+        '''Validate environment_dict against the environment schema of the pipeline in the given
+        mode. Results are cached by pipeline, solid subset, mode and the canonical form of the
+        config, since dagit revalidates the same config many times (e.g. on every keystroke in the
+        config editor).
+
+        Returns:
+            EvaluateValueResult
+        '''
+        check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+        check.str_param(mode, 'mode')
+
+        return self._get_validated_config_entry(pipeline, environment_dict, mode).validated_config
+
+    def get_environment_config(self, pipeline, environment_dict, mode):
+        '''The EnvironmentConfig for a config that has already been validated with
+        get_validated_config, built once and cached alongside the validation result.'''
+        check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+        check.dict_param(environment_dict, 'environment_dict', key_type=str)
+        check.str_param(mode, 'mode')
+
+        entry = self._get_validated_config_entry(pipeline, environment_dict, mode)
+        if entry.environment_config is None:
+            entry.environment_config = EnvironmentConfig.build(
+                pipeline, environment_dict, RunConfig(mode=mode)
+            )
+
+        return entry.environment_config
+
     def get_pipeline(self, pipeline_name):
         if not pipeline_name in self._cached_pipelines:
             self._cached_pipelines[pipeline_name] = self._build_pipeline(pipeline_name)
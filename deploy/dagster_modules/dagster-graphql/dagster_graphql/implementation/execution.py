@@ -24,7 +24,7 @@ from .fetch_pipelines import (
     get_dauphin_pipeline_from_selector_or_raise,
     get_dauphin_pipeline_reference_from_selector,
 )
-from .fetch_runs import get_validated_config
+from .fetch_runs import create_execution_plan_for_validated_config, get_validated_config
 from .fetch_schedules import get_dagster_schedule, get_dagster_schedule_def
 from .pipeline_run_storage import PipelineRunObservableSubscribe
 from .utils import ExecutionParams, UserFacingGraphQLError, capture_dauphin_error
@@ -140,7 +140,8 @@ def start_pipeline_execution(graphene_info, execution_params):
     )
 
     pipeline = dauphin_pipeline.get_dagster_pipeline()
-    execution_plan = create_execution_plan(
+    execution_plan = create_execution_plan_for_validated_config(
+        graphene_info,
         pipeline,
         execution_params.environment_dict,
         run_config=RunConfig(
@@ -150,7 +151,9 @@ def start_pipeline_execution(graphene_info, execution_params):
 
     _check_start_pipeline_execution_errors(graphene_info, execution_params, execution_plan)
 
-    run = instance.get_or_create_run(_create_pipeline_run(instance, pipeline, execution_params))
+    run = instance.get_or_create_run(
+        _create_pipeline_run(instance, execution_plan, execution_params)
+    )
 
     graphene_info.context.execution_manager.execute_pipeline(
         graphene_info.context.get_handle(),
@@ -164,16 +167,9 @@ def start_pipeline_execution(graphene_info, execution_params):
     )
 
 
-def _create_pipeline_run(instance, pipeline, execution_params):
+def _create_pipeline_run(instance, execution_plan, execution_params):
     step_keys_to_execute = execution_params.step_keys
     if not execution_params.step_keys and execution_params.previous_run_id:
-        execution_plan = create_execution_plan(
-            pipeline,
-            execution_params.environment_dict,
-            run_config=RunConfig(
-                mode=execution_params.mode, previous_run_id=execution_params.previous_run_id
-            ),
-        )
         step_keys_to_execute = get_retry_steps_from_execution_plan(instance, execution_plan)
     return pipeline_run_from_execution_params(execution_params, step_keys_to_execute)
 
@@ -201,7 +197,8 @@ def launch_pipeline_execution(graphene_info, execution_params):
     )
 
     pipeline = dauphin_pipeline.get_dagster_pipeline()
-    execution_plan = create_execution_plan(
+    execution_plan = create_execution_plan_for_validated_config(
+        graphene_info,
         pipeline,
         execution_params.environment_dict,
         run_config=RunConfig(
@@ -211,7 +208,7 @@ def launch_pipeline_execution(graphene_info, execution_params):
 
     _check_start_pipeline_execution_errors(graphene_info, execution_params, execution_plan)
 
-    run = instance.launch_run(_create_pipeline_run(instance, pipeline, execution_params))
+    run = instance.launch_run(_create_pipeline_run(instance, execution_plan, execution_params))
 
     return graphene_info.schema.type_named('LaunchPipelineExecutionSuccess')(
         run=graphene_info.schema.type_named('PipelineRun')(run)
@@ -1,10 +1,11 @@
 from graphql.execution.base import ResolveInfo
 
 from dagster import RunConfig, check
-from dagster.config.validate import validate_config
-from dagster.core.definitions import create_environment_schema
 from dagster.core.definitions.pipeline import ExecutionSelector, PipelineRunsFilter
-from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.event_log.base import DagsterEventLogInvalidForRun
+from dagster.core.storage.pipeline_run import PipelineRun
 
 from .fetch_pipelines import (
     get_dauphin_pipeline_from_selector_or_raise,
@@ -16,11 +17,9 @@ from .utils import UserFacingGraphQLError, capture_dauphin_error
 def get_validated_config(graphene_info, dauphin_pipeline, environment_dict, mode):
     check.str_param(mode, 'mode')
 
-    pipeline = dauphin_pipeline.get_dagster_pipeline()
-
-    environment_schema = create_environment_schema(pipeline, mode)
-
-    validated_config = validate_config(environment_schema.environment_type, environment_dict)
+    validated_config = graphene_info.context.get_validated_config(
+        dauphin_pipeline.get_dagster_pipeline(), environment_dict, mode
+    )
 
     if not validated_config.success:
         raise UserFacingGraphQLError(
@@ -38,6 +37,18 @@ def get_validated_config(graphene_info, dauphin_pipeline, environment_dict, mode
     return validated_config
 
 
+def create_execution_plan_for_validated_config(
+    graphene_info, pipeline, environment_dict, run_config
+):
+    '''Same as create_execution_plan, but reuses the EnvironmentConfig cached on the context for
+    config that has already been validated with get_validated_config.'''
+    return ExecutionPlan.build(
+        pipeline,
+        graphene_info.context.get_environment_config(pipeline, environment_dict, run_config.mode),
+        run_config,
+    )
+
+
 def get_run(graphene_info, run_id):
     instance = graphene_info.context.instance
     run = instance.get_run_by_id(run_id)
@@ -72,7 +83,42 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     else:
         runs = instance.get_runs(cursor=cursor, limit=limit)
 
-    return [graphene_info.schema.type_named('PipelineRun')(run) for run in runs]
+    return get_dauphin_runs(graphene_info, runs)
+
+
+class RunStatsLoader(object):
+    '''Loads the stats of a page of runs with a single event log storage call, the first time the
+    stats of any of them are resolved, rather than with one call per run.'''
+
+    def __init__(self, instance, run_ids):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._run_ids = check.list_param(run_ids, 'run_ids', of_type=str)
+        self._stats_by_run_id = None
+
+    def get_run_stats(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        if self._stats_by_run_id is None:
+            try:
+                self._stats_by_run_id = self._instance.get_run_stats_for_runs(self._run_ids)
+            except DagsterEventLogInvalidForRun:
+                # Fall back to loading runs one at a time so that a single corrupted event log
+                # only surfaces as an error on its own run
+                self._stats_by_run_id = {}
+
+        if run_id in self._stats_by_run_id:
+            return self._stats_by_run_id[run_id]
+
+        return self._instance.get_run_stats(run_id)
+
+
+def get_dauphin_runs(graphene_info, runs):
+    '''Wrap a list of PipelineRuns, sharing a RunStatsLoader between them.'''
+    check.inst_param(graphene_info, 'graphene_info', ResolveInfo)
+    check.list_param(runs, 'runs', of_type=PipelineRun)
+
+    stats_loader = RunStatsLoader(graphene_info.context.instance, [run.run_id for run in runs])
+    return [graphene_info.schema.type_named('PipelineRun')(run, stats_loader) for run in runs]
 
 
 @capture_dauphin_error
@@ -96,13 +142,21 @@ def get_execution_plan(graphene_info, selector, environment_dict, mode):
     get_validated_config(graphene_info, dauphin_pipeline, environment_dict, mode)
     return graphene_info.schema.type_named('ExecutionPlan')(
         dauphin_pipeline,
-        create_execution_plan(
-            dauphin_pipeline.get_dagster_pipeline(), environment_dict, RunConfig(mode=mode)
+        create_execution_plan_for_validated_config(
+            graphene_info,
+            dauphin_pipeline.get_dagster_pipeline(),
+            environment_dict,
+            RunConfig(mode=mode),
         ),
     )
 
 
 @capture_dauphin_error
-def get_stats(graphene_info, run_id):
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+def get_stats(graphene_info, run_id, stats_loader=None):
+    check.opt_inst_param(stats_loader, 'stats_loader', RunStatsLoader)
+
+    if stats_loader:
+        stats = stats_loader.get_run_stats(run_id)
+    else:
+        stats = graphene_info.context.instance.get_run_stats(run_id)
     return graphene_info.schema.type_named('PipelineRunStatsSnapshot')(stats)
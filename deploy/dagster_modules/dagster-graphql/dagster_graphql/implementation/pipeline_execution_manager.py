@@ -47,6 +47,15 @@ class PipelineExecutionManager(six.with_metaclass(abc.ABCMeta)):
     def is_active(self, run_id):
         '''Whether a given run_id is actively running'''
 
+    def get_queued_run_count(self):
+        '''The number of runs waiting to start executing'''
+        return 0
+
+    def recycle(self):
+        '''Discard any state derived from the currently loaded repository, e.g. before the
+        repository is reloaded. Execution managers that do not hold on to such state can ignore
+        this.'''
+
 
 def build_synthetic_pipeline_error_record(run_id, error_info, pipeline_name):
     check.str_param(run_id, 'run_id')
@@ -180,6 +189,19 @@ class SynchronousExecutionManager(PipelineExecutionManager):
         return run_id in self._active
 
 
+def _generate_synthetic_error_from_crash(instance, run):
+    try:
+        raise Exception(
+            'Pipeline execution process for {run_id} unexpectedly exited'.format(run_id=run.run_id)
+        )
+    except Exception:  # pylint: disable=broad-except
+        instance.handle_new_event(
+            build_synthetic_pipeline_error_record(
+                run.run_id, serializable_error_info_from_exc_info(sys.exc_info()), run.pipeline_name
+            )
+        )
+
+
 SUBPROCESS_TICK = 0.5
 
 
@@ -208,20 +230,7 @@ class SubprocessExecutionManager(PipelineExecutionManager):
         gevent.spawn(self._clock)
 
     def _generate_synthetic_error_from_crash(self, run):
-        try:
-            raise Exception(
-                'Pipeline execution process for {run_id} unexpectedly exited'.format(
-                    run_id=run.run_id
-                )
-            )
-        except Exception:  # pylint: disable=broad-except
-            self._instance.handle_new_event(
-                build_synthetic_pipeline_error_record(
-                    run.run_id,
-                    serializable_error_info_from_exc_info(sys.exc_info()),
-                    run.pipeline_name,
-                )
-            )
+        _generate_synthetic_error_from_crash(self._instance, run)
 
     def _living_process_snapshot(self):
         with self._processes_lock:
@@ -377,6 +386,13 @@ def _in_mp_process(handle, pipeline_run, instance_ref, term_event):
         )
         return
 
+    return _execute_run_in_process(pipeline_def, pipeline_run, instance)
+
+
+def _execute_run_in_process(pipeline_def, pipeline_run, instance):
+    run_id = pipeline_run.run_id
+    pipeline_name = pipeline_run.pipeline_name
+
     try:
         event_list = []
         for event in execute_run_iterator(
@@ -406,13 +422,309 @@ def _in_mp_process(handle, pipeline_run, instance_ref, term_event):
         instance.handle_new_event(build_process_exited_event(run_id, pipeline_name, os.getpid()))
 
 
+WARM_WORKER_TICK = 1
+
+
+class _WarmWorker(object):
+    def __init__(self, worker_id, process, job_queue, term_event):
+        self.worker_id = worker_id
+        self.process = process
+        self.job_queue = job_queue
+        self.term_event = term_event
+        self.run_id = None
+        self.run_count = 0
+        self.retiring = False
+
+    @property
+    def is_idle(self):
+        return self.run_id is None and not self.retiring
+
+    def retire(self):
+        self.retiring = True
+        self.job_queue.put(None)
+
+
+class WarmSubprocessExecutionManager(PipelineExecutionManager):
+    '''
+    This execution manager keeps a pool of worker processes that have already imported dagster,
+    connected to the instance and loaded the repository, and hands each run to an idle worker
+    instead of spawning (and re-importing everything in) a new process per run. For short
+    pipelines this removes most of the per-run startup latency.
+
+    ``num_workers`` idle workers are kept warm at all times. If a run is started while no warm
+    worker is available a new one is spawned for it, so runs are never queued behind each other.
+    Workers are recycled after ``max_runs_per_worker`` runs (if set), whenever a run they execute
+    is terminated, and when ``recycle`` is called (e.g. on repository reload), so that the
+    workers eventually pick up code changes and do not accumulate state indefinitely.
+    '''
+
+    def __init__(self, handle, instance, num_workers, max_runs_per_worker=None):
+        self._handle = check.inst_param(handle, 'handle', ExecutionTargetHandle)
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._num_workers = check.int_param(num_workers, 'num_workers')
+        self._max_runs_per_worker = check.opt_int_param(max_runs_per_worker, 'max_runs_per_worker')
+        self._multiprocessing_context = get_multiprocessing_context()
+        self._done_queue = self._multiprocessing_context.Queue()
+        self._workers = {}
+        self._next_worker_id = 0
+        self._workers_lock = self._multiprocessing_context.Lock()
+
+        self._fill_pool()
+        gevent.spawn(self._clock)
+
+    def _clock(self):
+        while True:
+            self._check_workers()
+            gevent.sleep(SUBPROCESS_TICK)
+
+    def _spawn_worker(self):
+        job_queue = self._multiprocessing_context.Queue()
+        term_event = self._multiprocessing_context.Event()
+        worker_id = self._next_worker_id
+        self._next_worker_id += 1
+
+        mp_process = self._multiprocessing_context.Process(
+            target=_in_warm_worker_process,
+            kwargs={
+                'handle': self._handle,
+                'instance_ref': self._instance.get_ref(),
+                'job_queue': job_queue,
+                'done_queue': self._done_queue,
+                'term_event': term_event,
+                'worker_id': worker_id,
+                'parent_pid': os.getpid(),
+            },
+        )
+        mp_process.start()
+
+        worker = _WarmWorker(worker_id, mp_process, job_queue, term_event)
+        self._workers[worker_id] = worker
+        return worker
+
+    def _fill_pool(self):
+        with self._workers_lock:
+            idle_count = len([worker for worker in self._workers.values() if worker.is_idle])
+            for _ in range(self._num_workers - idle_count):
+                self._spawn_worker()
+
+    def _drain_done_queue(self):
+        while True:
+            try:
+                worker_id, run_id = self._done_queue.get(block=False)
+            except Empty:
+                return
+
+            with self._workers_lock:
+                worker = self._workers.get(worker_id)
+                if not worker or worker.run_id != run_id:
+                    continue
+
+                worker.run_id = None
+                if worker.retiring or (
+                    self._max_runs_per_worker and worker.run_count >= self._max_runs_per_worker
+                ):
+                    worker.retire()
+
+    def _check_workers(self):
+        '''
+        Collects finished runs from the workers, retires workers that have served their quota of
+        runs, cleans up workers that exited (reporting runs that did not reach a terminal state as
+        failed, as SubprocessExecutionManager does for crashed processes) and then tops the pool
+        back up to the requested number of idle workers.
+        '''
+        self._drain_done_queue()
+
+        with self._workers_lock:
+            dead_workers = [
+                worker for worker in self._workers.values() if not worker.process.is_alive()
+            ]
+            for worker in dead_workers:
+                del self._workers[worker.worker_id]
+
+            idle_workers = [worker for worker in self._workers.values() if worker.is_idle]
+            for worker in idle_workers[self._num_workers :]:
+                worker.retire()
+
+        for worker in dead_workers:
+            if not worker.run_id:
+                continue
+
+            run = self._instance.get_run_by_id(worker.run_id)
+            if run and not run.is_finished:
+                _generate_synthetic_error_from_crash(self._instance, run)
+
+        self._fill_pool()
+
+    def check(self):
+        '''
+        Utility method for pytest to manually kick off worker bookkeeping (in absence of gevent)
+        '''
+        self._check_workers()
+
+    def execute_pipeline(self, handle, pipeline, pipeline_run, instance):
+        check.inst_param(handle, 'handle', ExecutionTargetHandle)
+        check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+
+        instance.handle_new_event(build_process_start_event(pipeline_run.run_id, pipeline.name))
+
+        with self._workers_lock:
+            worker = (
+                next((worker for worker in self._workers.values() if worker.is_idle), None)
+                or self._spawn_worker()
+            )
+            worker.run_id = pipeline_run.run_id
+            worker.run_count += 1
+
+        worker.job_queue.put((handle, pipeline_run))
+
+    def recycle(self):
+        '''Retire every worker so that fresh ones, which load the repository anew, take their
+        place. Busy workers are retired once their current run completes.'''
+        with self._workers_lock:
+            for worker in self._workers.values():
+                if worker.is_idle:
+                    worker.retire()
+                else:
+                    worker.retiring = True
+
+        self._fill_pool()
+
+    def join(self):
+        '''Block until all active runs have completed.'''
+        while self.get_active_run_count():
+            self._check_workers()
+            time.sleep(SUBPROCESS_TICK)
+
+    def shutdown(self):
+        '''Retire all workers and wait for them to exit. Active runs are allowed to finish.'''
+        self._num_workers = 0
+        self.recycle()
+        self.join()
+
+        with self._workers_lock:
+            workers = list(self._workers.values())
+
+        for worker in workers:
+            worker.process.join()
+
+        self._check_workers()
+
+    def _get_worker(self, run_id):
+        with self._workers_lock:
+            return next(
+                (worker for worker in self._workers.values() if worker.run_id == run_id), None
+            )
+
+    def can_terminate(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        worker = self._get_worker(run_id)
+
+        if not worker:
+            return False
+
+        return worker.process.is_alive()
+
+    def terminate(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        worker = self._get_worker(run_id)
+
+        if not worker or not worker.process.is_alive():
+            return False
+
+        # The termination signal takes down the whole worker, which is then replaced on the next
+        # tick. This mirrors the behavior of SubprocessExecutionManager.
+        worker.term_event.set()
+        worker.process.join()
+        return True
+
+    def get_active_run_count(self):
+        with self._workers_lock:
+            return len([worker for worker in self._workers.values() if worker.run_id])
+
+    def is_active(self, run_id):
+        with self._workers_lock:
+            return any(worker.run_id == run_id for worker in self._workers.values())
+
+
+def _in_warm_worker_process(
+    handle, instance_ref, job_queue, done_queue, term_event, worker_id, parent_pid
+):
+    """
+    Load the instance and repository up front, then execute runs handed over through job_queue
+    until told to stop (None), terminated, or orphaned by the process that spawned us.
+    """
+    instance = DagsterInstance.from_ref(instance_ref)
+
+    start_termination_thread(term_event)
+
+    try:
+        repository = handle.build_repository_definition()
+    except Exception:  # pylint: disable=broad-except
+        # Reported against the first run that needs the repository
+        repository = None
+
+    try:
+        while True:
+            try:
+                job = job_queue.get(timeout=WARM_WORKER_TICK)
+            except Empty:
+                if os.getppid() != parent_pid:
+                    return
+                continue
+
+            if job is None:
+                return
+
+            run_handle, pipeline_run = job
+            run_id = pipeline_run.run_id
+            pipeline_name = pipeline_run.pipeline_name
+
+            instance.handle_new_event(
+                build_process_started_event(run_id, pipeline_name, os.getpid())
+            )
+
+            try:
+                if run_handle.to_dict() != handle.to_dict():
+                    run_handle.build_repository_definition()
+                    pipeline_def = run_handle.with_pipeline_name(
+                        pipeline_name
+                    ).build_pipeline_definition()
+                else:
+                    if repository is None:
+                        repository = handle.build_repository_definition()
+                    pipeline_def = ExecutionTargetHandle.cache_handle(
+                        repository.get_pipeline(pipeline_name),
+                        handle.with_pipeline_name(pipeline_name),
+                    )
+            except Exception:  # pylint: disable=broad-except
+                instance.handle_new_event(
+                    build_synthetic_pipeline_error_record(
+                        run_id, serializable_error_info_from_exc_info(sys.exc_info()), pipeline_name
+                    )
+                )
+            else:
+                _execute_run_in_process(pipeline_def, pipeline_run, instance)
+
+            done_queue.put((worker_id, run_id))
+
+            if term_event.is_set():
+                return
+    except KeyboardInterrupt:
+        return
+
+
 class QueueingSubprocessExecutionManager(PipelineExecutionManager):
-    def __init__(self, instance, max_concurrent_runs):
+    def __init__(self, instance, max_concurrent_runs, delegate=None):
         check.inst_param(instance, 'instance', DagsterInstance)
-        self._delegate = SubprocessExecutionManager(instance)
+        check.opt_inst_param(delegate, 'delegate', PipelineExecutionManager)
+        self._delegate = delegate if delegate else SubprocessExecutionManager(instance)
         self._max_concurrent_runs = check.int_param(max_concurrent_runs, 'max_concurrent_runs')
         self._multiprocessing_context = get_multiprocessing_context()
         self._queue = self._multiprocessing_context.JoinableQueue(maxsize=0)
+        # Queue.qsize isn't implemented on every platform
+        self._num_queued = 0
         gevent.spawn(self._clock)
 
     def _clock(self):
@@ -428,6 +740,7 @@ class QueueingSubprocessExecutionManager(PipelineExecutionManager):
             except Empty:
                 return
             else:
+                self._num_queued -= 1
                 self._start_pipeline_execution(job_args)
 
     def _start_pipeline_execution(self, job_args):
@@ -446,6 +759,7 @@ class QueueingSubprocessExecutionManager(PipelineExecutionManager):
             'instance_ref': instance.get_ref(),
         }
         self._queue.put(job_args, block=False)
+        self._num_queued += 1
         self._check_queue()
 
     def check(self):
@@ -455,6 +769,9 @@ class QueueingSubprocessExecutionManager(PipelineExecutionManager):
         self._check_queue()
         self._delegate.check()
 
+    def recycle(self):
+        self._delegate.recycle()
+
     def can_terminate(self, run_id):
         # deal with enqueued shit
         return self._delegate.can_terminate(run_id)
@@ -466,5 +783,8 @@ class QueueingSubprocessExecutionManager(PipelineExecutionManager):
     def get_active_run_count(self):
         return self._delegate.get_active_run_count()
 
+    def get_queued_run_count(self):
+        return self._num_queued
+
     def is_active(self, run_id):
         return self._delegate.is_active(run_id)
@@ -0,0 +1,69 @@
+from dagster_graphql.schema.config_types import to_dauphin_config_type
+from dagster_graphql.schema.runtime_types import to_dauphin_runtime_type
+from dagster_graphql.schema.solids import build_dauphin_solid_handles, build_dauphin_solids
+
+from dagster import PipelineDefinition, check
+from dagster.core.definitions.environment_schema import EnvironmentSchema
+
+
+class PipelineIndex(object):
+    '''The dauphin projections of a single pipeline definition (solids, solid handles, runtime
+    types and config types). Pipeline definitions are immutable once the repository is loaded, so
+    each projection is built the first time it is requested and then reused for every query served
+    by the same DagsterGraphQLContext.'''
+
+    def __init__(self, pipeline):
+        self._pipeline = check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+        self._solids = None
+        self._solid_handles = None
+        self._runtime_types = None
+        self._config_types = {}
+
+    @property
+    def pipeline(self):
+        return self._pipeline
+
+    def get_solids(self):
+        if self._solids is None:
+            self._solids = build_dauphin_solids(self._pipeline)
+        return self._solids
+
+    def get_solid_handles(self):
+        '''All solid handles in the pipeline, including those nested inside composites.
+
+        Returns:
+            Dict[str, DauphinSolidHandle]: The solid handles keyed by their string handle id.
+        '''
+        if self._solid_handles is None:
+            self._solid_handles = {
+                str(item.handleID): item for item in build_dauphin_solid_handles(self._pipeline)
+            }
+        return self._solid_handles
+
+    def get_runtime_types(self):
+        if self._runtime_types is None:
+            self._runtime_types = sorted(
+                [to_dauphin_runtime_type(t) for t in self._pipeline.all_runtime_types() if t.name],
+                key=lambda runtime_type: runtime_type.name,
+            )
+        return self._runtime_types
+
+    def get_config_types(self, environment_schema):
+        '''The dauphin config types of one of the pipeline's environment schemas.
+
+        Returns:
+            Tuple[DauphinConfigType, List[DauphinConfigType]]: The root environment type, and all
+                config types of the schema sorted by key.
+        '''
+        check.inst_param(environment_schema, 'environment_schema', EnvironmentSchema)
+
+        key = environment_schema.environment_type.key
+        if key not in self._config_types:
+            self._config_types[key] = (
+                to_dauphin_config_type(environment_schema.environment_type),
+                sorted(
+                    [to_dauphin_config_type(ct) for ct in environment_schema.all_config_types()],
+                    key=lambda ct: ct.key,
+                ),
+            )
+        return self._config_types[key]
@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 from dagster_graphql import dauphin
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
 
 from dagster import (
     LoggerDefinition,
@@ -11,11 +12,10 @@ from dagster import (
     check,
 )
 from dagster.core.definitions.pipeline import PipelineRunsFilter
-from dagster.seven import lru_cache
 
 from .config_types import to_dauphin_config_type
 from .runtime_types import to_dauphin_runtime_type
-from .solids import DauphinSolidContainer, build_dauphin_solid_handles, build_dauphin_solids
+from .solids import DauphinSolidContainer
 
 
 class DauphinPipelineReference(dauphin.Interface):
@@ -61,27 +61,19 @@ class DauphinPipeline(dauphin.ObjectType):
         super(DauphinPipeline, self).__init__(name=pipeline.name, description=pipeline.description)
         self._pipeline = check.inst_param(pipeline, 'pipeline', PipelineDefinition)
 
-    def resolve_solids(self, _graphene_info):
-        return build_dauphin_solids(self._pipeline)
+    def resolve_solids(self, graphene_info):
+        return graphene_info.context.get_pipeline_index(self._pipeline).get_solids()
 
-    def resolve_runtime_types(self, _graphene_info):
-        return sorted(
-            list(
-                map(
-                    to_dauphin_runtime_type,
-                    [t for t in self._pipeline.all_runtime_types() if t.name],
-                )
-            ),
-            key=lambda config_type: config_type.name,
-        )
+    def resolve_runtime_types(self, graphene_info):
+        return graphene_info.context.get_pipeline_index(self._pipeline).get_runtime_types()
 
     def resolve_runs(self, graphene_info):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs(
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(
                 filters=PipelineRunsFilter(pipeline_name=self._pipeline.name)
-            )
-        ]
+            ),
+        )
 
     def get_dagster_pipeline(self):
         return self._pipeline
@@ -103,11 +95,12 @@ class DauphinPipeline(dauphin.ObjectType):
             )
         ]
 
-    def resolve_solid_handle(self, _graphene_info, handleID):
-        return _get_solid_handles(self._pipeline).get(handleID)
+    def resolve_solid_handle(self, graphene_info, handleID):
+        handles = graphene_info.context.get_pipeline_index(self._pipeline).get_solid_handles()
+        return handles.get(handleID)
 
-    def resolve_solid_handles(self, _graphene_info, **kwargs):
-        handles = _get_solid_handles(self._pipeline)
+    def resolve_solid_handles(self, graphene_info, **kwargs):
+        handles = graphene_info.context.get_pipeline_index(self._pipeline).get_solid_handles()
         parentHandleID = kwargs.get('parentHandleID')
 
         if parentHandleID == "":
@@ -128,11 +121,6 @@ class DauphinPipeline(dauphin.ObjectType):
         ]
 
 
-@lru_cache(maxsize=32)
-def _get_solid_handles(pipeline):
-    return {str(item.handleID): item for item in build_dauphin_solid_handles(pipeline)}
-
-
 class DauphinPipelineConnection(dauphin.ObjectType):
     class Meta(object):
         name = 'PipelineConnection'
@@ -48,10 +48,8 @@ from dagster.core.launcher import RunLauncher
 from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 
-from .config_types import to_dauphin_config_type
 from .runs import DauphinPipelineRunStatus
 from .schedules import DauphinStartScheduleMutation, DauphinStopRunningScheduleMutation
-from .solids import build_dauphin_solid_handles
 
 
 class DauphinQuery(dauphin.ObjectType):
@@ -185,34 +183,30 @@ class DauphinQuery(dauphin.ObjectType):
         return get_run_tags(graphene_info)
 
     def resolve_usedSolid(self, graphene_info, name):
-        repository = graphene_info.context.repository_definition
         invocations = []
         definition = None
 
-        for pipeline in repository.get_all_pipelines():
-            for handle in build_dauphin_solid_handles(pipeline):
-                if handle.handleID.definition_name == name:
-                    if definition is None:
-                        definition = handle.solid.resolve_definition(graphene_info)
-                    invocations.append(
-                        DauphinSolidInvocationSite(pipeline=pipeline, solidHandle=handle)
-                    )
+        for pipeline, handle in graphene_info.context.get_repository_solid_handles():
+            if handle.handleID.definition_name == name:
+                if definition is None:
+                    definition = handle.solid.resolve_definition(graphene_info)
+                invocations.append(
+                    DauphinSolidInvocationSite(pipeline=pipeline, solidHandle=handle)
+                )
 
         return DauphinUsedSolid(definition=definition, invocations=invocations)
 
     def resolve_usedSolids(self, graphene_info):
-        repository = graphene_info.context.repository_definition
         inv_by_def_name = defaultdict(list)
         definitions = []
 
-        for pipeline in repository.get_all_pipelines():
-            for handle in build_dauphin_solid_handles(pipeline):
-                definition = handle.solid.resolve_definition(graphene_info)
-                if definition.name not in inv_by_def_name:
-                    definitions.append(definition)
-                inv_by_def_name[definition.name].append(
-                    DauphinSolidInvocationSite(pipeline=pipeline, solidHandle=handle)
-                )
+        for pipeline, handle in graphene_info.context.get_repository_solid_handles():
+            definition = handle.solid.resolve_definition(graphene_info)
+            if definition.name not in inv_by_def_name:
+                definitions.append(definition)
+            inv_by_def_name[definition.name].append(
+                DauphinSolidInvocationSite(pipeline=pipeline, solidHandle=handle)
+            )
 
         return map(
             lambda d: DauphinUsedSolid(
@@ -496,7 +490,7 @@ class DauphinReloadDagit(dauphin.Mutation):
     Output = dauphin.NonNull(dauphin.Boolean)
 
     def mutate(self, graphene_info):
-        return graphene_info.context.reloader.reload()
+        return graphene_info.context.reload()
 
 
 class DauphinMutation(dauphin.ObjectType):
@@ -681,14 +675,17 @@ class DauphinEnvironmentSchema(dauphin.ObjectType):
         so that can be rendered for the user''',
     )
 
-    def resolve_allConfigTypes(self, _graphene_info):
-        return sorted(
-            list(map(to_dauphin_config_type, self._environment_schema.all_config_types())),
-            key=lambda ct: ct.key,
-        )
-
-    def resolve_rootEnvironmentType(self, _graphene_info):
-        return to_dauphin_config_type(self._environment_schema.environment_type)
+    def resolve_allConfigTypes(self, graphene_info):
+        _root_type, all_config_types = graphene_info.context.get_pipeline_index(
+            self._dagster_pipeline
+        ).get_config_types(self._environment_schema)
+        return all_config_types
+
+    def resolve_rootEnvironmentType(self, graphene_info):
+        root_type, _all_config_types = graphene_info.context.get_pipeline_index(
+            self._dagster_pipeline
+        ).get_config_types(self._environment_schema)
+        return root_type
 
     def resolve_isEnvironmentConfigValid(self, graphene_info, **kwargs):
         return resolve_is_environment_config_valid(
@@ -5,7 +5,7 @@ import logging
 import yaml
 from dagster_graphql import dauphin
 from dagster_graphql.implementation.fetch_pipelines import get_pipeline_reference_or_raise
-from dagster_graphql.implementation.fetch_runs import get_stats
+from dagster_graphql.implementation.fetch_runs import RunStatsLoader, get_stats
 
 from dagster import RunConfig, check, seven
 from dagster.core.definitions.events import (
@@ -19,8 +19,9 @@ from dagster.core.definitions.events import (
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.api import create_execution_plan
-from dagster.core.execution.plan.objects import StepFailureData
+from dagster.core.execution.plan.objects import StepFailureData, StepPhase
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.stats import aggregate_step_profiles
 from dagster.core.storage.compute_log_manager import ComputeIOType, ComputeLogFileData
 from dagster.core.storage.pipeline_run import (
     PipelineRun,
@@ -32,6 +33,28 @@ from .pipelines import DauphinPipeline
 
 DauphinPipelineRunStatus = dauphin.Enum.from_enum(PipelineRunStatus)
 
+DauphinStepPhase = dauphin.Enum.from_enum(StepPhase)
+
+
+class DauphinStepPhaseDuration(dauphin.ObjectType):
+    class Meta(object):
+        name = 'StepPhaseDuration'
+
+    phase = dauphin.NonNull('StepPhase')
+    durationMs = dauphin.NonNull(dauphin.Float)
+
+
+def _to_dauphin_phase_durations(graphene_info, phase_durations_ms):
+    # Phases this version doesn't know about are left out
+    known_phases = {phase.value for phase in StepPhase}
+    return [
+        graphene_info.schema.type_named('StepPhaseDuration')(
+            phase=StepPhase(phase), durationMs=duration_ms
+        )
+        for phase, duration_ms in phase_durations_ms.items()
+        if phase in known_phases
+    ]
+
 
 class DauphinPipelineOrError(dauphin.Union):
     class Meta(object):
@@ -50,6 +73,10 @@ class DauphinPipelineRunStatsSnapshot(dauphin.ObjectType):
     expectations = dauphin.NonNull(dauphin.Int)
     startTime = dauphin.Field(dauphin.Float)
     endTime = dauphin.Field(dauphin.Float)
+    stepPhaseDurations = dauphin.non_null_list('StepPhaseDuration')
+    stepCpuTimeMs = dauphin.Field(dauphin.Float)
+    # Floats, since GraphQL Ints are 32 bit
+    processPeakRssBytes = dauphin.Field(dauphin.Float)
 
     def __init__(self, stats):
         super(DauphinPipelineRunStatsSnapshot, self).__init__(
@@ -62,6 +89,34 @@ class DauphinPipelineRunStatsSnapshot(dauphin.ObjectType):
             endTime=stats.end_time,
         )
         self._stats = check.inst_param(stats, 'stats', PipelineRunStatsSnapshot)
+        self._step_profile = None
+        self._step_profile_loaded = False
+
+    def _get_step_profile(self, graphene_info):
+        # The profiles of the steps are only loaded if one of the step* fields is requested, since
+        # they aren't summarized by the event log storage like the rest of the stats
+        if not self._step_profile_loaded:
+            self._step_profile = aggregate_step_profiles(
+                graphene_info.context.instance.get_run_step_profiles(self._stats.run_id)
+            )
+            self._step_profile_loaded = True
+        return self._step_profile
+
+    def resolve_stepPhaseDurations(self, graphene_info):
+        step_profile = self._get_step_profile(graphene_info)
+        return (
+            _to_dauphin_phase_durations(graphene_info, step_profile.phase_durations_ms)
+            if step_profile
+            else []
+        )
+
+    def resolve_stepCpuTimeMs(self, graphene_info):
+        step_profile = self._get_step_profile(graphene_info)
+        return step_profile.cpu_time_ms if step_profile else None
+
+    def resolve_processPeakRssBytes(self, graphene_info):
+        step_profile = self._get_step_profile(graphene_info)
+        return step_profile.process_peak_rss_bytes if step_profile else None
 
 
 class DauphinPipelineRunStatsOrError(dauphin.Union):
@@ -93,11 +148,12 @@ class DauphinPipelineRun(dauphin.ObjectType):
     tags = dauphin.non_null_list('PipelineTag')
     canCancel = dauphin.NonNull(dauphin.Boolean)
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, stats_loader=None):
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._stats_loader = check.opt_inst_param(stats_loader, 'stats_loader', RunStatsLoader)
 
     def resolve_pipeline(self, graphene_info):
         return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
@@ -106,7 +162,7 @@ class DauphinPipelineRun(dauphin.ObjectType):
         return graphene_info.schema.type_named('LogMessageConnection')(self._pipeline_run)
 
     def resolve_stats(self, graphene_info):
-        return get_stats(graphene_info, self.run_id)
+        return get_stats(graphene_info, self.run_id, self._stats_loader)
 
     def resolve_computeLogs(self, graphene_info, stepKey):
         return graphene_info.schema.type_named('ComputeLogs')(runId=self.run_id, stepKey=stepKey)
@@ -178,6 +234,11 @@ class DauphinComputeLogs(dauphin.ObjectType):
     stepKey = dauphin.NonNull(dauphin.String)
     stdout = dauphin.Field('ComputeLogFile')
     stderr = dauphin.Field('ComputeLogFile')
+    profile = dauphin.Field(
+        'ComputeLogFile',
+        description='The report of the profile of the step, if its run is tagged with '
+        'dagster/profile',
+    )
 
     def _resolve_compute_log(self, graphene_info, io_type):
         return graphene_info.context.instance.compute_log_manager.read_logs_file(
@@ -190,6 +251,10 @@ class DauphinComputeLogs(dauphin.ObjectType):
     def resolve_stderr(self, graphene_info):
         return self._resolve_compute_log(graphene_info, ComputeIOType.STDERR)
 
+    def resolve_profile(self, graphene_info):
+        profile = self._resolve_compute_log(graphene_info, ComputeIOType.PROFILE)
+        return profile if profile.data is not None else None
+
 
 class DauphinComputeLogFile(dauphin.ObjectType):
     class Meta(object):
@@ -558,6 +623,17 @@ class DauphinExecutionStepSuccessEvent(dauphin.ObjectType):
         interfaces = (DauphinMessageEvent, DauphinStepEvent)
 
 
+class DauphinExecutionStepProfileEvent(dauphin.ObjectType):
+    class Meta(object):
+        name = 'ExecutionStepProfileEvent'
+        interfaces = (DauphinMessageEvent, DauphinStepEvent)
+
+    durationMs = dauphin.NonNull(dauphin.Float)
+    phaseDurations = dauphin.non_null_list('StepPhaseDuration')
+    cpuTimeMs = dauphin.NonNull(dauphin.Float)
+    processPeakRssBytes = dauphin.Field(dauphin.Float)
+
+
 class DauphinExecutionStepFailureEvent(dauphin.ObjectType):
     class Meta(object):
         name = 'ExecutionStepFailureEvent'
@@ -607,6 +683,7 @@ class DauphinPipelineRunEvent(dauphin.Union):
             DauphinExecutionStepFailureEvent,
             DauphinExecutionStepInputEvent,
             DauphinExecutionStepOutputEvent,
+            DauphinExecutionStepProfileEvent,
             DauphinExecutionStepSkippedEvent,
             DauphinExecutionStepStartEvent,
             DauphinExecutionStepSuccessEvent,
@@ -654,6 +731,17 @@ def from_dagster_event_record(graphene_info, event_record, dauphin_pipeline, exe
         return graphene_info.schema.type_named('ExecutionStepSkippedEvent')(**basic_params)
     elif dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
         return graphene_info.schema.type_named('ExecutionStepSuccessEvent')(**basic_params)
+    elif dagster_event.event_type == DagsterEventType.STEP_PROFILE:
+        profile_data = dagster_event.step_profile_data
+        return graphene_info.schema.type_named('ExecutionStepProfileEvent')(
+            durationMs=profile_data.duration_ms,
+            phaseDurations=_to_dauphin_phase_durations(
+                graphene_info, profile_data.phase_durations_ms
+            ),
+            cpuTimeMs=profile_data.cpu_time_ms,
+            processPeakRssBytes=profile_data.process_peak_rss_bytes,
+            **basic_params
+        )
     elif dagster_event.event_type == DagsterEventType.STEP_INPUT:
         input_data = dagster_event.event_specific_data
         return graphene_info.schema.type_named('ExecutionStepInputEvent')(
@@ -8,6 +8,7 @@ from dagster_graphql.implementation.fetch_schedules import (
     get_dagster_schedule_def,
     get_schedule_attempt_filenames,
 )
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
 from dagster_graphql.schema.errors import (
     DauphinScheduleNotFoundError,
     DauphinSchedulerNotDefinedError,
@@ -175,15 +176,15 @@ class DauphinRunningSchedule(dauphin.ObjectType):
         return scheduler.log_path_for_schedule(self._schedule.name)
 
     def resolve_runs(self, graphene_info, **kwargs):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs(
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(
                 filters=PipelineRunsFilter(
                     tags={'dagster/schedule_id': self._schedule.schedule_id}
                 ),
                 limit=kwargs.get('limit'),
-            )
-        ]
+            ),
+        )
 
     def resolve_runs_count(self, graphene_info):
         return graphene_info.context.instance.get_runs_count(
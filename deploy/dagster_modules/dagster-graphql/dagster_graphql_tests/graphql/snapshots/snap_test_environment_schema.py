@@ -4,18 +4,8 @@ from __future__ import unicode_literals
 
 from snapshottest import Snapshot
 
-snapshots = Snapshot()
 
-snapshots['test_basic_valid_config_on_environment_schema 1'] = {
-    'environmentSchemaOrError': {
-        'isEnvironmentConfigValid': {
-            '__typename': 'PipelineConfigValidationValid',
-            'pipeline': {
-                'name': 'csv_hello_world'
-            }
-        }
-    }
-}
+snapshots = Snapshot()
 
 snapshots['test_basic_invalid_config_on_environment_schema 1'] = {
     'environmentSchemaOrError': {
@@ -25,7 +15,7 @@ snapshots['test_basic_invalid_config_on_environment_schema 1'] = {
                 {
                     '__typename': 'FieldNotDefinedConfigError',
                     'fieldName': 'nope',
-                    'message': 'Field "nope" is not defined at document config root. Expected: "{ execution?: { in_process?: { } multiprocess?: { config?: { max_concurrent?: Int } } } loggers?: { console?: { config?: { log_level?: String name?: String } } } resources?: { } solids: { sum_solid: { inputs: { num: Path } outputs?: [{ result?: Path }] } sum_sq_solid?: { outputs?: [{ result?: Path }] } } storage?: { filesystem?: { config?: { base_dir?: String } } in_memory?: { } } }"',
+                    'message': 'Field "nope" is not defined at document config root. Expected: "{ execution?: { in_process?: { config?: { in_memory_handoff?: Bool } } multiprocess?: { config?: { max_concurrent?: Int step_batching?: StepBatching } } } loggers?: { console?: { config?: { log_level?: String name?: String } } } resources?: { } solids: { sum_solid: { inputs: { num: Path } outputs?: [{ result?: Path }] } sum_sq_solid?: { outputs?: [{ result?: Path }] } } storage?: { filesystem?: { config?: { base_dir?: String } } in_memory?: { } } }"',
                     'reason': 'FIELD_NOT_DEFINED',
                     'stack': {
                         'entries': [
@@ -51,3 +41,14 @@ snapshots['test_basic_invalid_config_on_environment_schema 1'] = {
         }
     }
 }
+
+snapshots['test_basic_valid_config_on_environment_schema 1'] = {
+    'environmentSchemaOrError': {
+        'isEnvironmentConfigValid': {
+            '__typename': 'PipelineConfigValidationValid',
+            'pipeline': {
+                'name': 'csv_hello_world'
+            }
+        }
+    }
+}
@@ -82,6 +82,10 @@ snapshots['test_successful_pipeline_reexecution 1'] = {
                             'key': 'sum_solid.compute'
                         }
                     },
+                    {
+                        '__typename': 'ExecutionStepProfileEvent',
+                        'level': 'DEBUG'
+                    },
                     {
                         '__typename': 'ExecutionStepStartEvent',
                         'level': 'DEBUG',
@@ -161,6 +165,10 @@ snapshots['test_successful_pipeline_reexecution 1'] = {
                             'key': 'sum_sq_solid.compute'
                         }
                     },
+                    {
+                        '__typename': 'ExecutionStepProfileEvent',
+                        'level': 'DEBUG'
+                    },
                     {
                         '__typename': 'EngineEvent',
                         'level': 'DEBUG'
@@ -290,6 +298,10 @@ snapshots['test_successful_pipeline_reexecution 2'] = {
                             'key': 'sum_sq_solid.compute'
                         }
                     },
+                    {
+                        '__typename': 'ExecutionStepProfileEvent',
+                        'level': 'DEBUG'
+                    },
                     {
                         '__typename': 'EngineEvent',
                         'level': 'DEBUG'
@@ -59,6 +59,14 @@ snapshots['test_success_whole_execution_plan 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'ExecutionStepStartEvent',
                 'step': {
@@ -108,6 +116,14 @@ snapshots['test_success_whole_execution_plan 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_sq_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'EngineEvent',
                 'step': None
@@ -169,6 +185,14 @@ snapshots['test_success_whole_execution_plan_with_filesystem_config 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'ExecutionStepStartEvent',
                 'step': {
@@ -218,6 +242,14 @@ snapshots['test_success_whole_execution_plan_with_filesystem_config 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_sq_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'EngineEvent',
                 'step': None
@@ -271,6 +303,14 @@ snapshots['test_success_whole_execution_plan_with_in_memory_config 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'ExecutionStepStartEvent',
                 'step': {
@@ -304,6 +344,14 @@ snapshots['test_success_whole_execution_plan_with_in_memory_config 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_sq_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'EngineEvent',
                 'step': None
@@ -365,6 +413,14 @@ snapshots['test_successful_one_part_execute_plan 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'EngineEvent',
                 'step': None
@@ -426,6 +482,14 @@ snapshots['test_successful_two_part_execute_plan 1'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'EngineEvent',
                 'step': None
@@ -495,6 +559,14 @@ snapshots['test_successful_two_part_execute_plan 2'] = {
                     ]
                 }
             },
+            {
+                '__typename': 'ExecutionStepProfileEvent',
+                'step': {
+                    'key': 'sum_sq_solid.compute',
+                    'metadata': [
+                    ]
+                }
+            },
             {
                 '__typename': 'EngineEvent',
                 'step': None
@@ -94,6 +94,15 @@ snapshots['test_materializations 1'] = [
             'solidHandleID': 'materialize'
         }
     },
+    {
+        '__typename': 'ExecutionStepProfileEvent',
+        'level': 'DEBUG',
+        'message': 'Profiled execution of step "materialize.compute":',
+        'step': {
+            'key': 'materialize.compute',
+            'solidHandleID': 'materialize'
+        }
+    },
     {
         '__typename': 'EngineEvent',
         'level': 'DEBUG',
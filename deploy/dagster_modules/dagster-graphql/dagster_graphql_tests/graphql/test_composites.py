@@ -1,3 +1,5 @@
+import mock
+from dagster_graphql.implementation import pipeline_index
 from dagster_graphql.test.utils import execute_dagster_graphql
 
 from .setup import define_test_context
@@ -153,3 +155,37 @@ def test_solid_id():
 
     result = execute_dagster_graphql(define_test_context(), SOLID_ID_QUERY, {'id': 'bonkahog'})
     assert result.data["pipeline"]["solidHandle"] == None
+
+
+def test_solid_handles_cached():
+    context = define_test_context()
+
+    with mock.patch.object(
+        pipeline_index,
+        'build_dauphin_solid_handles',
+        wraps=pipeline_index.build_dauphin_solid_handles,
+    ) as build_handles:
+        result = execute_dagster_graphql(context, PARENT_ID_QUERY, {})
+        assert len(result.data["pipeline"]["solidHandles"]) == 10
+
+        result = execute_dagster_graphql(context, PARENT_ID_QUERY, {'parentHandleID': 'add_four'})
+        assert len(result.data["pipeline"]["solidHandles"]) == 2
+
+        result = execute_dagster_graphql(context, SOLID_ID_QUERY, {'id': 'add_four'})
+        assert result.data["pipeline"]["solidHandle"]["handleID"] == 'add_four'
+
+        assert build_handles.call_count == 1
+
+
+def test_subset_pipeline_indexes_reused():
+    context = define_test_context()
+    pipeline = context.get_pipeline('composites_pipeline')
+    solid_name = pipeline.solids[0].name
+
+    index = context.get_pipeline_index(pipeline.build_sub_pipeline([solid_name]))
+    for _ in range(5):
+        # Sub-pipelines are rebuilt for every query of the subset
+        assert context.get_pipeline_index(pipeline.build_sub_pipeline([solid_name])) is index
+
+    assert context.get_pipeline_index(pipeline) is not index
+    assert len(context._pipeline_indexes) == 2  # pylint: disable=protected-access
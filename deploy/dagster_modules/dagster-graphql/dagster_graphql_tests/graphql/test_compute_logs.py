@@ -59,3 +59,47 @@ def test_compute_logs_subscription_graphql(snapshot):
     result = results[0]
     assert result['computeLogs']['data'] == 'HELLO WORLD\n'
     snapshot.assert_match(results)
+
+
+COMPUTE_LOGS_PROFILE_QUERY = '''
+  query ComputeLogsProfileQuery($runId: ID!, $stepKey: String!) {
+    pipelineRunOrError(runId: $runId) {
+      ... on PipelineRun {
+        computeLogs(stepKey: $stepKey) {
+          profile {
+            data
+            downloadUrl
+          }
+        }
+      }
+    }
+  }
+'''
+
+
+def test_get_compute_log_profile_over_graphql():
+    context = define_test_context(instance=DagsterInstance.local_temp())
+
+    def _get_profile(tags):
+        payload = sync_execute_get_run_log_data(
+            {
+                'executionParams': {
+                    'selector': {'name': 'spew_pipeline'},
+                    'mode': 'default',
+                    'executionMetadata': {'tags': tags},
+                }
+            },
+            context=context,
+        )
+        result = execute_dagster_graphql(
+            context,
+            COMPUTE_LOGS_PROFILE_QUERY,
+            variables={'runId': payload['run']['runId'], 'stepKey': 'spew.compute'},
+        )
+        return result.data['pipelineRunOrError']['computeLogs']['profile']
+
+    profile = _get_profile([{'key': 'dagster/profile', 'value': 'true'}])
+    assert profile['data'].startswith('Profile of step "spew.compute", sorted by cumulative')
+    assert profile['downloadUrl'].endswith('/spew.compute/profile')
+
+    assert _get_profile([]) is None
@@ -1,3 +1,5 @@
+import mock
+from dagster_graphql.implementation import context as context_module
 from dagster_graphql.test.utils import execute_dagster_graphql
 
 from dagster import check
@@ -110,6 +112,34 @@ def execute_config_graphql(pipeline_name, environment_dict, mode):
     )
 
 
+def test_config_validation_cached():
+    context = define_test_context()
+
+    def _validate(environment_dict):
+        result = execute_dagster_graphql(
+            context,
+            CONFIG_VALIDATION_QUERY,
+            {
+                'environmentConfigData': environment_dict,
+                'pipeline': {'name': 'csv_hello_world'},
+                'mode': 'default',
+            },
+        )
+        assert not result.errors
+        return result.data['isPipelineConfigValid']['__typename']
+
+    with mock.patch.object(
+        context_module, 'validate_config', wraps=context_module.validate_config
+    ) as validate_config:
+        assert _validate(csv_hello_world_solids_config()) == 'PipelineConfigValidationValid'
+        assert _validate(csv_hello_world_solids_config()) == 'PipelineConfigValidationValid'
+        assert validate_config.call_count == 1
+
+        assert _validate({'solids': {'sum_solid': {}}}) == 'PipelineConfigValidationInvalid'
+        assert _validate({'solids': {'sum_solid': {}}}) == 'PipelineConfigValidationInvalid'
+        assert validate_config.call_count == 2
+
+
 def test_pipeline_not_found():
     result = execute_config_graphql(pipeline_name='nope', environment_dict={}, mode='default')
 
@@ -269,6 +269,7 @@ def test_successful_one_part_execute_plan(snapshot):
         'ExecutionStepOutputEvent',
         'ObjectStoreOperationEvent',
         'ExecutionStepSuccessEvent',
+        'ExecutionStepProfileEvent',
         'EngineEvent',
     ]
 
@@ -342,6 +343,7 @@ def test_successful_two_part_execute_plan(snapshot):
         'ExecutionStepOutputEvent',
         'ObjectStoreOperationEvent',
         'ExecutionStepSuccessEvent',
+        'ExecutionStepProfileEvent',
         'EngineEvent',
     ]
     assert step_events[1]['step']['key'] == 'sum_sq_solid.compute'
@@ -29,10 +29,13 @@ def test_materializations(snapshot):
         )
     )
 
-    # Remove execution durations from ExecutionStepSuccessEvent messages
+    # Remove execution durations from ExecutionStepSuccessEvent and ExecutionStepProfileEvent
+    # messages
     for log in logs:
         if log["__typename"] == "ExecutionStepSuccessEvent":
             log["message"] = re.sub(r'in .*', "in", log["message"])
+        if log["__typename"] == "ExecutionStepProfileEvent":
+            log["message"] = re.sub(r': .*', ":", log["message"])
 
     materializations = [log for log in logs if log['__typename'] == 'StepMaterializationEvent']
     assert len(materializations) == 1
@@ -2,9 +2,11 @@ import copy
 
 from dagster_graphql.test.utils import execute_dagster_graphql
 
+from dagster import seven
 from dagster.core.instance import DagsterInstance
+from dagster.seven import mock
 
-from .utils import define_test_context, sync_execute_get_run_log_data
+from .utils import define_test_context, sync_execute_get_payload, sync_execute_get_run_log_data
 
 RUNS_QUERY = '''
 query PipelineRunsRootQuery($name: String!) {
@@ -43,6 +45,46 @@ fragment RunHistoryRunFragment on PipelineRun {
 }
 '''
 
+RUNS_STATS_QUERY = '''
+{
+  pipelineRunsOrError(filter: {}) {
+    ... on PipelineRuns {
+      results {
+        runId
+        stats {
+          ... on PipelineRunStatsSnapshot {
+            stepsSucceeded
+          }
+        }
+      }
+    }
+  }
+}
+'''
+
+RUNS_STEP_PROFILE_STATS_QUERY = '''
+{
+  pipelineRunsOrError(filter: {}) {
+    ... on PipelineRuns {
+      results {
+        runId
+        stats {
+          ... on PipelineRunStatsSnapshot {
+            stepsSucceeded
+            stepPhaseDurations {
+              phase
+              durationMs
+            }
+            stepCpuTimeMs
+            processPeakRssBytes
+          }
+        }
+      }
+    }
+  }
+}
+'''
+
 DELETE_RUN_MUTATION = '''
 mutation DeleteRun($runId: String!) {
   deletePipelineRun(runId: $runId) {
@@ -136,3 +178,76 @@ def test_get_runs_over_graphql():
         read_context, DELETE_RUN_MUTATION, variables={'runId': run_id_two}
     )
     assert result.data['deletePipelineRun']['__typename'] == 'PipelineRunNotFoundError'
+
+
+def test_run_stats_batched():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        context = define_test_context(instance=instance)
+
+        for _ in range(3):
+            sync_execute_get_payload(
+                {
+                    'executionParams': {
+                        'selector': {'name': 'multi_mode_with_resources'},
+                        'mode': 'add_mode',
+                        'environmentConfigData': {'resources': {'op': {'config': 2}}},
+                    }
+                },
+                context=context,
+            )
+
+        with mock.patch.object(
+            instance, 'get_run_stats_for_runs', wraps=instance.get_run_stats_for_runs
+        ) as get_run_stats_for_runs, mock.patch.object(
+            instance, 'get_run_stats', wraps=instance.get_run_stats
+        ) as get_run_stats, mock.patch.object(
+            instance, 'get_run_step_profiles', wraps=instance.get_run_step_profiles
+        ) as get_run_step_profiles:
+            result = execute_dagster_graphql(context, RUNS_STATS_QUERY)
+            assert not result.errors
+
+        runs = result.data['pipelineRunsOrError']['results']
+        assert len(runs) == 3
+        assert all(run['stats']['stepsSucceeded'] == 1 for run in runs)
+        assert get_run_stats_for_runs.call_count == 1
+        assert get_run_stats.call_count == 0
+        # The profiles of steps aren't loaded unless they are requested
+        assert get_run_step_profiles.call_count == 0
+
+
+def test_run_step_profile_stats():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        context = define_test_context(instance=instance)
+
+        for _ in range(2):
+            sync_execute_get_payload(
+                {
+                    'executionParams': {
+                        'selector': {'name': 'multi_mode_with_resources'},
+                        'mode': 'add_mode',
+                        'environmentConfigData': {'resources': {'op': {'config': 2}}},
+                    }
+                },
+                context=context,
+            )
+
+        with mock.patch.object(
+            instance, 'get_run_step_profiles', wraps=instance.get_run_step_profiles
+        ) as get_run_step_profiles:
+            result = execute_dagster_graphql(context, RUNS_STEP_PROFILE_STATS_QUERY)
+            assert not result.errors
+
+        runs = result.data['pipelineRunsOrError']['results']
+        assert len(runs) == 2
+        for run in runs:
+            phase_durations = {
+                phase_duration['phase']: phase_duration['durationMs']
+                for phase_duration in run['stats']['stepPhaseDurations']
+            }
+            assert phase_durations['COMPUTE'] > 0
+            assert run['stats']['stepCpuTimeMs'] is not None
+
+        # Once per run, however many of the step profile fields are requested
+        assert get_run_step_profiles.call_count == 2
@@ -33,8 +33,8 @@ def sync_execute_get_payload(variables, context=None):
     return subscribe_result.data
 
 
-def sync_execute_get_run_log_data(variables,):
-    payload_data = sync_execute_get_payload(variables)
+def sync_execute_get_run_log_data(variables, context=None):
+    payload_data = sync_execute_get_payload(variables, context=context)
     assert payload_data['pipelineRunLogs']
     return payload_data['pipelineRunLogs']
 
@@ -7,6 +7,7 @@ from copy import deepcopy
 from dagster_graphql.implementation.pipeline_execution_manager import (
     QueueingSubprocessExecutionManager,
     SubprocessExecutionManager,
+    WarmSubprocessExecutionManager,
 )
 
 from dagster import (
@@ -486,6 +487,7 @@ def test_max_concurrency_zero():
         )
         execution_manager.execute_pipeline(handle, infinite_loop_pipeline, pipeline_run, instance)
         assert not execution_manager.is_active(run_id)
+        assert execution_manager.get_queued_run_count() == 1
         assert not os.path.exists(filepath)
 
 
@@ -523,6 +525,7 @@ def test_max_concurrency_one():
 
         assert execution_manager.is_active(run_id_one)
         assert not execution_manager.is_active(run_id_two)
+        assert execution_manager.get_queued_run_count() == 1
         assert not os.path.exists(file_two)
 
         assert execution_manager.terminate(run_id_one)
@@ -533,4 +536,113 @@ def test_max_concurrency_one():
 
         assert not execution_manager.is_active(run_id_one)
         assert execution_manager.is_active(run_id_two)
+        assert execution_manager.get_queued_run_count() == 0
         assert execution_manager.terminate(run_id_two)
+
+
+def _started_process_id(instance, run_id):
+    (process_started_event,) = get_events_of_type(
+        instance.all_logs(run_id), DagsterEventType.PIPELINE_PROCESS_STARTED
+    )
+    return process_started_event.dagster_event.event_specific_data.process_id
+
+
+def _create_passing_run(instance):
+    return instance.create_run(
+        PipelineRun.create_empty_run(
+            pipeline_name=passing_pipeline.name,
+            run_id=make_new_run_id(),
+            environment_dict={
+                'solids': {
+                    'sum_solid': {'inputs': {'num': file_relative_path(__file__, 'data/num.csv')}}
+                }
+            },
+        )
+    )
+
+
+def test_warm_workers_reused():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'passing_pipeline')
+    instance = DagsterInstance.local_temp()
+    execution_manager = WarmSubprocessExecutionManager(handle, instance, num_workers=1)
+
+    try:
+        run_one = _create_passing_run(instance)
+        execution_manager.execute_pipeline(handle, passing_pipeline, run_one, instance)
+        execution_manager.join()
+
+        run_two = _create_passing_run(instance)
+        execution_manager.execute_pipeline(handle, passing_pipeline, run_two, instance)
+        execution_manager.join()
+    finally:
+        execution_manager.shutdown()
+
+    for run in [run_one, run_two]:
+        assert instance.get_run_by_id(run.run_id).status == PipelineRunStatus.SUCCESS
+        events = instance.all_logs(run.run_id)
+        assert len(get_events_of_type(events, DagsterEventType.PIPELINE_PROCESS_START)) == 1
+        assert len(get_events_of_type(events, DagsterEventType.PIPELINE_PROCESS_EXITED)) == 1
+
+    assert _started_process_id(instance, run_one.run_id) == _started_process_id(
+        instance, run_two.run_id
+    )
+    assert execution_manager.get_active_run_count() == 0
+
+
+def test_warm_workers_recycled_after_max_runs():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'passing_pipeline')
+    instance = DagsterInstance.local_temp()
+    execution_manager = WarmSubprocessExecutionManager(
+        handle, instance, num_workers=1, max_runs_per_worker=1
+    )
+
+    try:
+        run_one = _create_passing_run(instance)
+        execution_manager.execute_pipeline(handle, passing_pipeline, run_one, instance)
+        execution_manager.join()
+
+        run_two = _create_passing_run(instance)
+        execution_manager.execute_pipeline(handle, passing_pipeline, run_two, instance)
+        execution_manager.join()
+    finally:
+        execution_manager.shutdown()
+
+    assert instance.get_run_by_id(run_one.run_id).status == PipelineRunStatus.SUCCESS
+    assert instance.get_run_by_id(run_two.run_id).status == PipelineRunStatus.SUCCESS
+    assert _started_process_id(instance, run_one.run_id) != _started_process_id(
+        instance, run_two.run_id
+    )
+
+
+def test_warm_worker_terminate():
+    run_id = make_new_run_id()
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'infinite_loop_pipeline')
+    instance = DagsterInstance.local_temp()
+    execution_manager = WarmSubprocessExecutionManager(handle, instance, num_workers=1)
+
+    try:
+        with safe_tempfile_path() as path:
+            pipeline_run = instance.create_run(
+                PipelineRun.create_empty_run(
+                    pipeline_name=infinite_loop_pipeline.name,
+                    run_id=run_id,
+                    environment_dict={'solids': {'loop': {'config': {'file': path}}}},
+                )
+            )
+            execution_manager.execute_pipeline(
+                handle, infinite_loop_pipeline, pipeline_run, instance
+            )
+
+            while not os.path.exists(path):
+                time.sleep(0.1)
+
+            assert execution_manager.is_active(run_id)
+            assert execution_manager.can_terminate(run_id)
+            assert execution_manager.terminate(run_id)
+
+            execution_manager.check()
+            assert instance.get_run_by_id(run_id).is_finished
+            assert not execution_manager.is_active(run_id)
+            assert not execution_manager.terminate(run_id)
+    finally:
+        execution_manager.shutdown()
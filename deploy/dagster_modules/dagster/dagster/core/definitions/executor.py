@@ -1,7 +1,8 @@
 from functools import update_wrapper
 
 from dagster import check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Int
+from dagster.config.config_type import Enum, EnumValue
 from dagster.config.field import Field
 from dagster.config.field_utils import check_user_facing_opt_config_param
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
@@ -113,7 +114,33 @@ class _ExecutorDecoratorCallable(object):
         return executor_def
 
 
-@executor(name='in_process')
+StepBatchingEnum = Enum('StepBatching', [EnumValue('chains'), EnumValue('levels')])
+
+
+def step_batching_config():
+    '''The config of the step batching of an executor executing steps in separate tasks or
+    processes: opt in by setting it at all. See build_step_batches.'''
+    return Field(
+        StepBatchingEnum,
+        is_optional=True,
+        description='Execute batches of steps in a single task each, handing outputs between the '
+        'steps of a batch in memory: either linear chains of steps ("chains") or the steps of each '
+        'level of the plan ("levels"). Steps of a batch must not mutate their inputs.',
+    )
+
+
+@executor(
+    name='in_process',
+    config={
+        'in_memory_handoff': Field(
+            Bool,
+            is_optional=True,
+            default_value=False,
+            description='Keep the outputs of steps in memory for the steps consuming them, as well '
+            'as storing them with the system storage. Consumers must not mutate their inputs.',
+        )
+    },
+)
 def in_process_executor(init_context):
     '''The default in-process executor.
 
@@ -126,6 +153,12 @@ def in_process_executor(init_context):
         execution:
           in_process:
 
+    With persistent system storage, setting ``in_memory_handoff`` to true hands the outputs of
+    steps to the steps consuming them in memory, rather than having each consumer load them back
+    from storage. Consumers are given the very objects their upstream steps output, so they must
+    not mutate their inputs. The engines distributing steps across workers set it when executing
+    batches of steps (see ``step_batching``).
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -134,11 +167,17 @@ def in_process_executor(init_context):
 
     check.inst_param(init_context, 'init_context', InitExecutorContext)
 
-    return InProcessExecutorConfig()
+    return InProcessExecutorConfig(
+        in_memory_handoff=init_context.executor_config.get('in_memory_handoff', False)
+    )
 
 
 @executor(
-    name='multiprocess', config={'max_concurrent': Field(Int, is_optional=True, default_value=0)}
+    name='multiprocess',
+    config={
+        'max_concurrent': Field(Int, is_optional=True, default_value=0),
+        'step_batching': step_batching_config(),
+    },
 )
 def multiprocess_executor(init_context):
     '''The default multiprocess executor.
@@ -157,6 +196,12 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    The optional ``step_batching`` arg executes linear chains of steps (``chains``) or the steps of
+    each level of the plan (``levels``) in a single process each, rather than starting a process
+    for every step. Outputs are handed between the steps of a process in memory, so those steps
+    must not mutate their inputs. Only steps with the same ``dagster/priority`` are batched
+    together.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -170,7 +215,9 @@ def multiprocess_executor(init_context):
 
     handle, _ = ExecutionTargetHandle.get_handle(init_context.pipeline_def)
     return MultiprocessExecutorConfig(
-        handle=handle, max_concurrent=init_context.executor_config['max_concurrent']
+        handle=handle,
+        max_concurrent=init_context.executor_config['max_concurrent'],
+        step_batching=init_context.executor_config.get('step_batching'),
     )
 
 
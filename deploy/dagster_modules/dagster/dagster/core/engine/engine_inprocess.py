@@ -14,7 +14,7 @@ from dagster.core.errors import (
 )
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.compute_logs import mirror_step_io
-from dagster.core.execution.config import ExecutorConfig
+from dagster.core.execution.config import ExecutorConfig, InProcessExecutorConfig
 from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
     SystemStepExecutionContext,
@@ -25,14 +25,21 @@ from dagster.core.execution.plan.objects import (
     StepInputData,
     StepOutputData,
     StepOutputHandle,
+    StepPhase,
+    StepProfileData,
     StepSuccessData,
     TypeCheckData,
     UserFailureData,
 )
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.profiling import profile_step_events
+from dagster.core.storage.intermediates_manager import (
+    HandoffIntermediatesManager,
+    StoredIntermediate,
+)
 from dagster.core.storage.object_store import ObjectStoreOperation
 from dagster.utils.error import serializable_error_info_from_exc_info
-from dagster.utils.timing import format_duration, time_execution_scope
+from dagster.utils.timing import format_duration, process_peak_rss, time_execution_scope
 
 from .engine_base import Engine
 
@@ -65,6 +72,18 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
             ):
                 yield event
 
+            executor_config = pipeline_context.executor_config
+            if (
+                isinstance(executor_config, InProcessExecutorConfig)
+                and executor_config.in_memory_handoff
+                and pipeline_context.intermediates_manager.is_persistent
+            ):
+                pipeline_context = pipeline_context.for_intermediates_manager(
+                    HandoffIntermediatesManager(
+                        pipeline_context.intermediates_manager, execution_plan
+                    )
+                )
+
             failed_or_skipped_steps = set()
 
             # It would be good to implement a reference tracking algorithm here to
@@ -118,8 +137,8 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
                         active_execution.mark_complete(step.key)
                         continue
 
-                    for step_event in check.generator(
-                        dagster_event_sequence_for_step(step_context)
+                    for step_event in profile_step_events(
+                        step_context, check.generator(dagster_event_sequence_for_step(step_context))
                     ):
                         check.inst(step_event, DagsterEvent)
                         if step_event.is_step_failure:
@@ -127,7 +146,11 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
 
                         yield step_event
 
-                    active_execution.mark_complete(step.key)
+                # Emitted once the compute logs of the step are captured, to account for capturing
+                yield DagsterEvent.step_profile_event(
+                    step_context, _step_profile_data(step_context.profiler)
+                )
+                active_execution.mark_complete(step.key)
 
         yield DagsterEvent.engine_event(
             pipeline_context,
@@ -140,6 +163,15 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
         )
 
 
+def _step_profile_data(profiler):
+    return StepProfileData(
+        duration_ms=profiler.elapsed_ms,
+        phase_durations_ms=profiler.durations_ms,
+        cpu_time_ms=profiler.cpu_time_ms,
+        process_peak_rss_bytes=process_peak_rss(),
+    )
+
+
 def _assert_missing_inputs_optional(uncovered_inputs, execution_plan, step_key):
     nonoptionals = [
         handle for handle in uncovered_inputs if not execution_plan.get_step_output(handle).optional
@@ -180,8 +212,9 @@ def _input_values_from_intermediates_manager(step_context):
             ]
             # When we're using an object store-backed intermediate store, we wrap the
             # ObjectStoreOperation[] representing the fan-in values in a MultipleStepOutputsListWrapper
-            # so we can yield the relevant object store events and unpack the values in the caller
-            if all((isinstance(x, ObjectStoreOperation) for x in _input_value)):
+            # so we can yield the relevant object store events and unpack the values in the caller.
+            # With in memory handoff, only some of the values may have been loaded from the store.
+            if any((isinstance(x, ObjectStoreOperation) for x in _input_value)):
                 input_value = MultipleStepOutputsListWrapper(_input_value)
             else:
                 input_value = _input_value
@@ -493,11 +526,15 @@ def _core_dagster_event_sequence_for_step(step_context):
     of the step.
     '''
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    profiler = step_context.profiler
 
     yield DagsterEvent.step_start_event(step_context)
 
+    with profiler.phase(StepPhase.INPUT_LOADING.value):
+        input_values = _input_values_from_intermediates_manager(step_context)
+
     inputs = {}
-    for input_name, input_value in _input_values_from_intermediates_manager(step_context).items():
+    for input_name, input_value in input_values.items():
         if isinstance(input_value, ObjectStoreOperation):
             yield DagsterEvent.object_store_operation(
                 step_context, ObjectStoreOperation.serializable(input_value, value_name=input_name)
@@ -505,22 +542,29 @@ def _core_dagster_event_sequence_for_step(step_context):
             inputs[input_name] = input_value.obj
         elif isinstance(input_value, MultipleStepOutputsListWrapper):
             for op in input_value:
-                yield DagsterEvent.object_store_operation(
-                    step_context, ObjectStoreOperation.serializable(op, value_name=input_name)
-                )
-            inputs[input_name] = [op.obj for op in input_value]
+                if isinstance(op, ObjectStoreOperation):
+                    yield DagsterEvent.object_store_operation(
+                        step_context, ObjectStoreOperation.serializable(op, value_name=input_name)
+                    )
+            inputs[input_name] = [
+                op.obj if isinstance(op, ObjectStoreOperation) else op for op in input_value
+            ]
         else:
             inputs[input_name] = input_value
 
     for input_name, input_value in inputs.items():
-        for evt in check.generator(
-            _type_checked_event_sequence_for_input(step_context, input_name, input_value)
+        for evt in profiler.timed_iter(
+            StepPhase.INPUT_TYPE_CHECK.value,
+            check.generator(
+                _type_checked_event_sequence_for_input(step_context, input_name, input_value)
+            ),
         ):
             yield evt
 
     with time_execution_scope() as timer_result:
-        user_event_sequence = check.generator(
-            _user_event_sequence_for_step_compute_fn(step_context, inputs)
+        user_event_sequence = profiler.timed_iter(
+            StepPhase.COMPUTE.value,
+            check.generator(_user_event_sequence_for_step_compute_fn(step_context, inputs)),
         )
 
         # It is important for this loop to be indented within the
@@ -552,21 +596,74 @@ def _create_step_events_for_output(step_context, output):
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     check.inst_param(output, 'output', Output)
 
+    profiler = step_context.profiler
     step = step_context.step
     step_output = step.step_output_named(output.output_name)
+    step_output_handle = StepOutputHandle.from_step(step=step, output_name=output.output_name)
 
-    for output_event in _type_checked_step_output_event_sequence(step_context, output):
-        yield output_event
+    if isinstance(output.value, StoredIntermediate):
+        # The output was type checked and stored by the compute function
+        for evt in profiler.timed_iter(
+            StepPhase.OUTPUT_STORAGE.value, _stored_step_output_event_sequence(step_context, output)
+        ):
+            yield evt
 
-    step_output_handle = StepOutputHandle.from_step(step=step, output_name=output.output_name)
+        for evt in profiler.timed_iter(
+            StepPhase.MATERIALIZATION.value,
+            _create_output_materializations(
+                step_context,
+                output.output_name,
+                lambda: _get_stored_value(step_context, step_output, step_output_handle),
+            ),
+        ):
+            yield evt
+        return
+
+    for output_event in profiler.timed_iter(
+        StepPhase.OUTPUT_TYPE_CHECK.value,
+        _type_checked_step_output_event_sequence(step_context, output),
+    ):
+        yield output_event
 
-    for evt in _set_intermediates(step_context, step_output, step_output_handle, output):
+    for evt in profiler.timed_iter(
+        StepPhase.OUTPUT_STORAGE.value,
+        _set_intermediates(step_context, step_output, step_output_handle, output),
+    ):
         yield evt
 
-    for evt in _create_output_materializations(step_context, output.output_name, output.value):
+    for evt in profiler.timed_iter(
+        StepPhase.MATERIALIZATION.value,
+        _create_output_materializations(step_context, output.output_name, lambda: output.value),
+    ):
         yield evt
 
 
+def _get_stored_value(step_context, step_output, step_output_handle):
+    value = step_context.intermediates_manager.get_intermediate(
+        step_context, step_output.runtime_type, step_output_handle
+    )
+    return value.obj if isinstance(value, ObjectStoreOperation) else value
+
+
+def _stored_step_output_event_sequence(step_context, output):
+    stored = output.value
+    step_output = step_context.step.step_output_named(output.output_name)
+
+    yield _create_step_output_event(
+        step_context, output, type_check=stored.type_check, success=stored.type_check.success
+    )
+
+    if not stored.type_check.success:
+        raise Failure(
+            'Type check failed for step output {output_name} of type {runtime_type}'.format(
+                output_name=output.output_name, runtime_type=step_output.runtime_type.name
+            )
+        )
+
+    if stored.object_store_operation is not None:
+        yield DagsterEvent.object_store_operation(step_context, stored.object_store_operation)
+
+
 def _set_intermediates(step_context, step_output, step_output_handle, output):
     res = step_context.intermediates_manager.set_intermediate(
         context=step_context,
@@ -580,7 +677,7 @@ def _set_intermediates(step_context, step_output, step_output_handle, output):
         )
 
 
-def _create_output_materializations(step_context, output_name, value):
+def _create_output_materializations(step_context, output_name, get_value):
     step = step_context.step
     current_handle = step.solid_handle
 
@@ -598,7 +695,7 @@ def _create_output_materializations(step_context, output_name, value):
             if config_output_name == output_name:
                 step_output = step.step_output_named(output_name)
                 materialization = step_output.runtime_type.output_materialization_config.materialize_runtime_value(
-                    step_context, output_spec, value
+                    step_context, output_spec, get_value()
                 )
 
                 if not isinstance(materialization, Materialization):
@@ -7,6 +7,11 @@ from dagster.core.execution.api import create_execution_plan, execute_plan_itera
 from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.plan.batch import (
+    ActiveBatchExecution,
+    build_step_batches,
+    in_process_execution_for_batch,
+)
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
@@ -23,43 +28,42 @@ from .engine_base import Engine
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
-        self, environment_dict, pipeline_run, executor_config, step_key, instance_ref, term_event
+        self, environment_dict, pipeline_run, executor_config, step_keys, instance_ref, term_event
     ):
         self.environment_dict = environment_dict
         self.executor_config = executor_config
         self.pipeline_run = pipeline_run
-        self.step_key = step_key
+        self.step_keys = step_keys
         self.instance_ref = instance_ref
         self.term_event = term_event
 
     def execute(self):
         check.inst(self.executor_config, MultiprocessExecutorConfig)
         pipeline_def = self.executor_config.load_pipeline(self.pipeline_run)
-        environment_dict = dict(self.environment_dict, execution={'in_process': {}})
 
         start_termination_thread(self.term_event)
 
         execution_plan = create_execution_plan(
-            pipeline_def, environment_dict, self.pipeline_run
-        ).build_subset_plan([self.step_key])
+            pipeline_def, self.environment_dict, self.pipeline_run
+        ).build_subset_plan(self.step_keys)
 
         for step_event in execute_plan_iterator(
             execution_plan,
             self.pipeline_run,
-            environment_dict=environment_dict,
+            environment_dict=self.environment_dict,
             instance=DagsterInstance.from_ref(self.instance_ref),
         ):
             yield step_event
 
 
-def execute_step_out_of_process(step_context, step, errors, term_events):
+def execute_batch_out_of_process(step_context, batch, errors, term_events):
     command = InProcessExecutorChildProcessCommand(
-        step_context.environment_dict,
+        dict(step_context.environment_dict, execution=in_process_execution_for_batch(batch)),
         step_context.pipeline_run,
         step_context.executor_config,
-        step.key,
+        batch.step_keys,
         step_context.instance.get_ref(),
-        term_events[step.key],
+        term_events[batch.key],
     )
 
     for ret in execute_child_process_command(command):
@@ -110,7 +114,10 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             ):
                 yield event
 
-            active_execution = execution_plan.start()
+            active_execution = ActiveBatchExecution(
+                execution_plan,
+                build_step_batches(execution_plan, pipeline_context.executor_config.step_batching),
+            )
             active_iters = {}
             errors = {}
             term_events = {}
@@ -120,18 +127,18 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                 try:
                     # start iterators
                     while len(active_iters) < limit and not stopping:
-                        steps = active_execution.get_available_steps(
+                        batches = active_execution.get_available_batches(
                             limit=(limit - len(active_iters))
                         )
 
-                        if not steps:
+                        if not batches:
                             break
 
-                        for step in steps:
-                            step_context = pipeline_context.for_step(step)
-                            term_events[step.key] = get_multiprocessing_context().Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                step_context, step, errors, term_events
+                        for batch in batches:
+                            step_context = pipeline_context.for_step(batch.first_step)
+                            term_events[batch.key] = get_multiprocessing_context().Event()
+                            active_iters[batch.key] = execute_batch_out_of_process(
+                                step_context, batch, errors, term_events
                             )
 
                     # process active iterators
@@ -15,7 +15,7 @@ from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
     SystemStepExecutionContext,
 )
-from dagster.core.execution.plan.objects import StepOutputData
+from dagster.core.execution.plan.objects import StepOutputData, StepPhase, StepProfileData
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.serdes import whitelist_for_serdes
 from dagster.utils.error import SerializableErrorInfo
@@ -33,6 +33,7 @@ class DagsterEventType(Enum):
     STEP_SKIPPED = 'STEP_SKIPPED'
     STEP_MATERIALIZATION = 'STEP_MATERIALIZATION'
     STEP_EXPECTATION_RESULT = 'STEP_EXPECTATION_RESULT'
+    STEP_PROFILE = 'STEP_PROFILE'
 
     PIPELINE_INIT_FAILURE = 'PIPELINE_INIT_FAILURE'
 
@@ -58,6 +59,7 @@ STEP_EVENTS = {
     DagsterEventType.STEP_SKIPPED,
     DagsterEventType.STEP_MATERIALIZATION,
     DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_PROFILE,
     DagsterEventType.OBJECT_STORE_OPERATION,
 }
 
@@ -102,6 +104,8 @@ def _validate_event_specific_data(event_type, event_specific_data):
         check.inst_param(event_specific_data, 'event_specific_data', PipelineProcessExitedData)
     elif event_type == DagsterEventType.STEP_INPUT:
         check.inst_param(event_specific_data, 'event_specific_data', StepInputData)
+    elif event_type == DagsterEventType.STEP_PROFILE:
+        check.inst_param(event_specific_data, 'event_specific_data', StepProfileData)
     elif event_type == DagsterEventType.ENGINE_EVENT:
         check.inst_param(event_specific_data, 'event_specific_data', EngineEventData)
 
@@ -115,14 +119,15 @@ def log_step_event(step_context, event):
     event_type = DagsterEventType(event.event_type_value)
     log_fn = step_context.log.error if event_type in FAILURE_EVENTS else step_context.log.debug
 
-    log_fn(
-        event.message
-        or '{event_type} for step {step_key}'.format(
-            event_type=event_type, step_key=step_context.step.key
-        ),
-        dagster_event=event,
-        pipeline_name=step_context.pipeline_def.name,
-    )
+    with step_context.profiler.phase(StepPhase.EVENT_LOGGING.value):
+        log_fn(
+            event.message
+            or '{event_type} for step {step_key}'.format(
+                event_type=event_type, step_key=step_context.step.key
+            ),
+            dagster_event=event,
+            pipeline_name=step_context.pipeline_def.name,
+        )
 
 
 def log_pipeline_event(pipeline_context, event):
@@ -276,6 +281,11 @@ class DagsterEvent(
         _assert_type('step_failure_data', DagsterEventType.STEP_FAILURE, self.event_type)
         return self.event_specific_data
 
+    @property
+    def step_profile_data(self):
+        _assert_type('step_profile_data', DagsterEventType.STEP_PROFILE, self.event_type)
+        return self.event_specific_data
+
     @property
     def pipeline_process_started_data(self):
         _assert_type(
@@ -401,6 +411,20 @@ class DagsterEvent(
             ),
         )
 
+    @staticmethod
+    def step_profile_event(step_context, step_profile_data):
+        check.inst_param(step_profile_data, 'step_profile_data', StepProfileData)
+        return DagsterEvent.from_step(
+            event_type=DagsterEventType.STEP_PROFILE,
+            step_context=step_context,
+            event_specific_data=step_profile_data,
+            message='Profiled execution of step "{step_key}": {duration} ({cpu_time} CPU).'.format(
+                step_key=step_context.step.key,
+                duration=format_duration(step_profile_data.duration_ms),
+                cpu_time=format_duration(step_profile_data.cpu_time_ms),
+            ),
+        )
+
     @staticmethod
     def step_skipped_event(step_context):
         return DagsterEvent.from_step(
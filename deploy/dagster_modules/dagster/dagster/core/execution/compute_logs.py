@@ -10,6 +10,7 @@ from contextlib import contextmanager
 
 from dagster import check
 from dagster.core.execution.context.system import SystemStepExecutionContext
+from dagster.core.execution.plan.objects import StepPhase
 from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.seven import IS_WINDOWS
 from dagster.utils import ensure_file
@@ -32,11 +33,20 @@ def mirror_step_io(step_context):
         step_context.run_id, step_context.step.key, ComputeIOType.STDERR
     )
 
-    manager.on_compute_start(step_context)
-    with mirror_io(outpath, errpath):
-        # compute function executed here
-        yield
-    manager.on_compute_finish(step_context)
+    # Only the time spent setting up and tearing down the capture is counted towards the phase
+    profiler = step_context.profiler
+    with profiler.phase(StepPhase.COMPUTE_LOG_CAPTURE.value):
+        manager.on_compute_start(step_context)
+        with mirror_io(outpath, errpath):
+            with profiler.phase(None):
+                # compute function executed here
+                yield
+        manager.on_compute_finish(step_context)
+
+    metrics = step_context.instance.metrics
+    for io_type, path in [(ComputeIOType.STDOUT, outpath), (ComputeIOType.STDERR, errpath)]:
+        if os.path.exists(path):
+            metrics.record_compute_log_bytes(io_type, os.path.getsize(path))
 
 
 def should_disable_io_stream_redirect():
@@ -112,6 +112,9 @@ class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
 
 
 class InProcessExecutorConfig(ExecutorConfig):
+    def __init__(self, in_memory_handoff=False):
+        self.in_memory_handoff = check.bool_param(in_memory_handoff, 'in_memory_handoff')
+
     def get_engine(self):
         from dagster.core.engine.engine_inprocess import InProcessEngine
 
@@ -119,12 +122,13 @@ class InProcessExecutorConfig(ExecutorConfig):
 
 
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, max_concurrent=None):
+    def __init__(self, handle, max_concurrent=None, step_batching=None):
         from dagster import ExecutionTargetHandle
 
         self._handle = check.inst_param(handle, 'handle', ExecutionTargetHandle,)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.step_batching = check.opt_str_param(step_batching, 'step_batching')
 
     def load_pipeline(self, pipeline_run):
         from dagster.core.storage.pipeline_run import PipelineRun
@@ -15,6 +15,7 @@ from dagster.core.storage.file_manager import FileManager
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.utils import merge_dicts
+from dagster.utils.timing import PhaseTimer
 
 
 class SystemPipelineExecutionContextData(
@@ -110,6 +111,17 @@ class SystemPipelineExecutionContext(object):
             step,
         )
 
+    def for_intermediates_manager(self, intermediates_manager):
+        '''A copy of this context whose steps get and set intermediates with the given manager.'''
+        from dagster.core.storage.intermediates_manager import IntermediatesManager
+
+        check.inst_param(intermediates_manager, 'intermediates_manager', IntermediatesManager)
+
+        return SystemPipelineExecutionContext(
+            self._pipeline_context_data._replace(intermediates_manager=intermediates_manager),
+            self._log_manager,
+        )
+
     @property
     def executor_config(self):
         return self._pipeline_context_data.executor_config
@@ -190,7 +202,7 @@ class SystemPipelineExecutionContext(object):
 
 
 class SystemStepExecutionContext(SystemPipelineExecutionContext):
-    __slots__ = ['_step', '_resources']
+    __slots__ = ['_step', '_resources', '_profiler']
 
     def __init__(self, pipeline_context_data, log_manager, step):
         from dagster.core.execution.plan.objects import ExecutionStep
@@ -201,6 +213,7 @@ class SystemStepExecutionContext(SystemPipelineExecutionContext):
             self.solid.resource_mapper_fn, self.solid_def.required_resource_keys
         )
         self._log_manager = log_manager
+        self._profiler = PhaseTimer()
 
     def for_compute(self):
         return SystemComputeExecutionContext(self._pipeline_context_data, self.log, self.step)
@@ -229,6 +242,11 @@ class SystemStepExecutionContext(SystemPipelineExecutionContext):
     def log(self):
         return self._log_manager
 
+    @property
+    def profiler(self):
+        '''PhaseTimer: Times the phases of the execution of the step (see StepPhase).'''
+        return self._profiler
+
 
 class SystemComputeExecutionContext(SystemStepExecutionContext):
     '''The ``context`` object available to solid compute logic.
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
 from dagster import check
 from dagster.core.errors import DagsterInvariantViolationError, DagsterRunNotFoundError
@@ -10,6 +11,10 @@ from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.object_store import ObjectStoreOperation, ObjectStoreOperationType
 
+# Copies are I/O bound (and server side on remote object stores), so they are issued from a pool
+# of threads rather than one at a time
+MAX_CONCURRENT_COPIES = 16
+
 
 def validate_retry_memoization(pipeline_context, execution_plan):
     check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
@@ -56,20 +61,39 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
     for handle in output_handles_to_copy:
         output_handles_to_copy_by_step[handle.step_key].append(handle)
 
+    handles_to_copy = [
+        (step, handle)
+        for step in execution_plan.topological_steps()
+        for handle in output_handles_to_copy_by_step.get(step.key, [])
+    ]
+    if not handles_to_copy:
+        return
+
     intermediates_manager = pipeline_context.intermediates_manager
-    for step in execution_plan.topological_steps():
-        step_context = pipeline_context.for_step(step)
-        for handle in output_handles_to_copy_by_step.get(step.key, []):
-            if intermediates_manager.has_intermediate(pipeline_context, handle):
+
+    def _copy(step_and_handle):
+        _step, handle = step_and_handle
+        if intermediates_manager.has_intermediate(pipeline_context, handle):
+            return None
+
+        return intermediates_manager.copy_intermediate_from_prev_run(
+            pipeline_context, previous_run_id, handle
+        )
+
+    pool = ThreadPool(min(len(handles_to_copy), MAX_CONCURRENT_COPIES))
+    try:
+        # Events are still yielded in topological order, as each copy completes
+        operations = pool.imap(_copy, handles_to_copy)
+        for (step, handle), operation in zip(handles_to_copy, operations):
+            if operation is None:
                 continue
 
-            operation = intermediates_manager.copy_intermediate_from_prev_run(
-                pipeline_context, previous_run_id, handle
-            )
             yield DagsterEvent.object_store_operation(
-                step_context,
+                pipeline_context.for_step(step),
                 ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
             )
+    finally:
+        pool.terminate()
 
 
 def is_step_failure_event(record):
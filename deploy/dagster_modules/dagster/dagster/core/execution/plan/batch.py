@@ -0,0 +1,233 @@
+'''Groups the steps of an execution plan into batches, for the engines that execute steps in
+separate tasks or processes (such as Celery, Dask and the multiprocess engine) to execute each
+batch in a single one.
+
+Steps of pipelines with many small solids take less time to execute than it takes to submit a
+task and load the pipeline and the instance for it, so executing them together saves most of the
+overhead. The steps of a batch are executed in process, one after the other, with the outputs of
+steps handed to the steps of the batch consuming them in memory (see
+:py:class:`HandoffIntermediatesManager`).
+'''
+from collections import OrderedDict, namedtuple
+
+from dagster import check
+from dagster.core.utils import toposort
+
+from .objects import ExecutionStep
+from .plan import ExecutionPlan, _default_sort_key
+
+CHAINS = 'chains'
+LEVELS = 'levels'
+
+
+class StepBatch(namedtuple('_StepBatch', 'key steps')):
+    '''Steps of an execution plan to execute together in one task, in topological order.
+
+    Args:
+        key (str): The key of the batch. Batches of a single step have the key of the step.
+        steps (List[ExecutionStep]): The steps of the batch.
+    '''
+
+    def __new__(cls, key, steps):
+        return super(StepBatch, cls).__new__(
+            cls,
+            check.str_param(key, 'key'),
+            check.list_param(steps, 'steps', of_type=ExecutionStep),
+        )
+
+    @property
+    def step_keys(self):
+        return [step.key for step in self.steps]
+
+    @property
+    def first_step(self):
+        return self.steps[0]
+
+
+def _batch_for_steps(steps):
+    if len(steps) == 1:
+        return StepBatch(steps[0].key, steps)
+
+    return StepBatch(
+        '{step_key}+{num_steps}'.format(step_key=steps[0].key, num_steps=len(steps) - 1), steps
+    )
+
+
+def _chain_batches(execution_plan, batch_key_fn):
+    deps = execution_plan.execution_deps()
+    downstream = {step_key: set() for step_key in deps}
+    for step_key, upstream in deps.items():
+        for upstream_key in upstream:
+            downstream[upstream_key].add(step_key)
+
+    # Each step joins the chain of its only upstream step if it is that step's only downstream
+    # step, so fused steps never wait on steps outside their batch, or hold up other steps
+    chains = OrderedDict()
+    chain_of_step = {}
+    for step in _sorted_steps(execution_plan, deps):
+        upstream = deps[step.key]
+        if len(upstream) == 1:
+            (upstream_key,) = upstream
+            if len(downstream[upstream_key]) == 1 and batch_key_fn(step) == batch_key_fn(
+                execution_plan.get_step_by_key(upstream_key)
+            ):
+                chain_of_step[step.key] = chain_of_step[upstream_key]
+                chains[chain_of_step[step.key]].append(step)
+                continue
+
+        chain_of_step[step.key] = step.key
+        chains[step.key] = [step]
+
+    return [_batch_for_steps(steps) for steps in chains.values()]
+
+
+def _level_batches(execution_plan, batch_key_fn):
+    batches = []
+    for level in execution_plan.execution_step_levels():
+        steps_by_batch_key = OrderedDict()
+        for step in level:
+            steps_by_batch_key.setdefault(batch_key_fn(step), []).append(step)
+
+        batches.extend(_batch_for_steps(steps) for steps in steps_by_batch_key.values())
+
+    return batches
+
+
+def _sorted_steps(execution_plan, deps):
+    return [
+        execution_plan.get_step_by_key(step_key)
+        for level in toposort(deps)
+        for step_key in sorted(level)
+    ]
+
+
+def build_step_batches(execution_plan, strategy=None, batch_key_fn=None):
+    '''Groups the steps to execute of an execution plan into batches.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan.
+        strategy (Optional[str]): 'chains' fuses linear chains of steps, where each step is the only
+            step depending on the previous one and only depends on it. 'levels' fuses the steps of
+            each level of the plan, that depend only on steps of earlier levels. By default, each
+            step is a batch of its own.
+        batch_key_fn (Optional[Callable[[ExecutionStep], Hashable]]): Only steps with equal batch
+            keys are fused, so engines return the properties of a step that must be the same for
+            every step of a task, such as its queue, priority and resource requirements. Defaults
+            to the ``dagster/priority`` tag of the step.
+
+    Returns:
+        List[StepBatch]
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.opt_str_param(strategy, 'strategy')
+    check.param_invariant(strategy in (None, CHAINS, LEVELS), 'strategy')
+    batch_key_fn = check.opt_callable_param(batch_key_fn, 'batch_key_fn', _default_sort_key)
+
+    if strategy == CHAINS:
+        return _chain_batches(execution_plan, batch_key_fn)
+    if strategy == LEVELS:
+        return _level_batches(execution_plan, batch_key_fn)
+
+    return [
+        _batch_for_steps([step])
+        for step in _sorted_steps(execution_plan, execution_plan.execution_deps())
+    ]
+
+
+class ActiveBatchExecution(object):
+    '''Tracks the execution of batches of steps, like ActiveExecution does for single steps.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan.
+        batches (List[StepBatch]): The batches of the steps to execute, from build_step_batches.
+        sort_key_fn (Optional[Callable[[ExecutionStep], Any]]): Sorts the available batches by
+            their first steps. Defaults to the ``dagster/priority`` tag of the step.
+    '''
+
+    def __init__(self, execution_plan, batches, sort_key_fn=None):
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        self._batches = OrderedDict(
+            (batch.key, batch) for batch in check.list_param(batches, 'batches', of_type=StepBatch)
+        )
+        self._sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', _default_sort_key)
+
+        batch_of_step = {
+            step_key: batch.key for batch in self._batches.values() for step_key in batch.step_keys
+        }
+        check.invariant(
+            set(batch_of_step.keys()) == set(execution_plan.step_keys_to_execute),
+            'Batches must contain each step to execute exactly once',
+        )
+
+        self._pending = OrderedDict((batch_key, set()) for batch_key in self._batches)
+        for step_key, upstream in execution_plan.execution_deps().items():
+            self._pending[batch_of_step[step_key]].update(
+                batch_of_step[upstream_key]
+                for upstream_key in upstream
+                if batch_of_step[upstream_key] != batch_of_step[step_key]
+            )
+
+        self._completed = set()
+        self._in_flight = set()
+        self._available = []
+
+        self._update_available()
+
+    def _update_available(self):
+        now_available = [
+            batch_key
+            for batch_key, requirements in self._pending.items()
+            if requirements.issubset(self._completed)
+        ]
+
+        for batch_key in now_available:
+            self._available.append(batch_key)
+            del self._pending[batch_key]
+
+    def get_available_batches(self, limit=None):
+        check.opt_int_param(limit, 'limit')
+
+        batches = sorted(
+            [self._batches[batch_key] for batch_key in self._available],
+            key=lambda batch: self._sort_key_fn(batch.first_step),
+        )
+
+        if limit:
+            batches = batches[:limit]
+
+        for batch in batches:
+            self._in_flight.add(batch.key)
+            self._available.remove(batch.key)
+
+        return batches
+
+    def mark_complete(self, batch_key):
+        check.invariant(
+            batch_key in self._in_flight,
+            'Attempted to mark batch as complete that was not known to be in flight',
+        )
+        self._in_flight.remove(batch_key)
+        self._completed.add(batch_key)
+        self._update_available()
+
+    @property
+    def is_complete(self):
+        return len(self._pending) == 0 and len(self._in_flight) == 0 and len(self._available) == 0
+
+
+def in_process_execution_for_batch(batch):
+    '''The execution config of the in process executor executing a batch of steps in a worker.'''
+    check.inst_param(batch, 'batch', StepBatch)
+
+    # Only batches with steps consuming the outputs of other steps of the batch, i.e. chains, gain
+    # anything from handing those outputs off in memory
+    step_keys = set(batch.step_keys)
+    if not any(
+        source_handle.step_key in step_keys
+        for step in batch.steps
+        for step_input in step.step_inputs
+        for source_handle in step_input.source_handles
+    ):
+        return {'in_process': {}}
+
+    return {'in_process': {'config': {'in_memory_handoff': True}}}
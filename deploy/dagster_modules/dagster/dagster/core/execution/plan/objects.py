@@ -104,6 +104,60 @@ class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms')):
         )
 
 
+class StepPhase(Enum):
+    '''The phases of the execution of a step that are timed in its StepProfileData.'''
+
+    INPUT_LOADING = 'INPUT_LOADING'
+    INPUT_TYPE_CHECK = 'INPUT_TYPE_CHECK'
+    COMPUTE = 'COMPUTE'
+    OUTPUT_TYPE_CHECK = 'OUTPUT_TYPE_CHECK'
+    OUTPUT_STORAGE = 'OUTPUT_STORAGE'
+    MATERIALIZATION = 'MATERIALIZATION'
+    EVENT_LOGGING = 'EVENT_LOGGING'
+    COMPUTE_LOG_CAPTURE = 'COMPUTE_LOG_CAPTURE'
+
+
+@whitelist_for_serdes
+class StepProfileData(
+    namedtuple(
+        '_StepProfileData', 'duration_ms phase_durations_ms cpu_time_ms process_peak_rss_bytes'
+    )
+):
+    '''Where the time of the execution of a step went.
+
+    Args:
+        duration_ms (float): The wall clock time of the execution of the step, from when its
+            context was created until its compute logs were captured.
+        phase_durations_ms (Dict[str, float]): The wall clock time spent in each StepPhase (keyed
+            by its value) during the execution. Time spent in framework code between phases isn't
+            counted towards any phase.
+        cpu_time_ms (float): The CPU time used by the process executing the step during its
+            execution. Includes the time used by other threads of the process.
+        process_peak_rss_bytes (Optional[int]): The peak resident set size of the process executing
+            the step over its lifetime so far, at the end of the execution of the step. This isn't
+            specific to the step: processes executing many steps (e.g. with the in-process engine,
+            or in long-lived workers) report the peak of the heaviest step they have executed for
+            every step after it. None on platforms where it isn't available.
+    '''
+
+    def __new__(cls, duration_ms, phase_durations_ms, cpu_time_ms, process_peak_rss_bytes=None):
+        return super(StepProfileData, cls).__new__(
+            cls,
+            duration_ms=check.float_param(duration_ms, 'duration_ms'),
+            phase_durations_ms=check.dict_param(
+                phase_durations_ms, 'phase_durations_ms', value_type=float
+            ),
+            cpu_time_ms=check.float_param(cpu_time_ms, 'cpu_time_ms'),
+            process_peak_rss_bytes=check.opt_int_param(
+                process_peak_rss_bytes, 'process_peak_rss_bytes'
+            ),
+        )
+
+    def duration_for_phase(self, phase):
+        check.inst_param(phase, 'phase', StepPhase)
+        return self.phase_durations_ms.get(phase.value, 0.0)
+
+
 class StepKind(Enum):
     COMPUTE = 'COMPUTE'
 
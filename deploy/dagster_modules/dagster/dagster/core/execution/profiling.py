@@ -0,0 +1,162 @@
+'''Profiles the execution of the steps of runs tagged with dagster/profile.
+
+Every engine executes steps with the in process engine, in the process of the run or in the
+processes of its workers, so the profiler wraps the events of each step there. The profile of a
+step is written as a report of pstats next to its compute logs, so it is read, uploaded and
+downloaded through the compute log manager like its stdout and stderr.
+'''
+import cProfile
+import os
+import pstats
+
+from dagster import check
+from dagster.core.execution.context.system import SystemStepExecutionContext
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.utils import ensure_dir
+
+PROFILE_TAG = 'dagster/profile'
+
+DEFAULT_PROFILE_SORT_KEY = 'cumulative'
+
+# The values of the tag that profile with the default sort key, or don't profile
+PROFILE_TAG_TRUE_VALUES = ('true', '1', 'yes')
+PROFILE_TAG_FALSE_VALUES = ('false', '0', 'no', '')
+
+# The keys pstats can sort the functions of a report by
+PROFILE_SORT_KEYS = (
+    'calls',
+    'cumulative',
+    'cumtime',
+    'file',
+    'filename',
+    'module',
+    'ncalls',
+    'pcalls',
+    'line',
+    'name',
+    'nfl',
+    'stdname',
+    'time',
+    'tottime',
+)
+
+
+def profile_sort_key_for_tags(tags):
+    '''The key to sort the profile report of the steps of a run by, or None if the run isn't
+    profiled.
+
+    The dagster/profile tag of the run is either a boolean, or one of the keys pstats can sort
+    the report by (e.g. "tottime") to profile the run with. Other values profile the run with the
+    default sort key.
+    '''
+    check.opt_dict_param(tags, 'tags')
+
+    value = (tags or {}).get(PROFILE_TAG)
+    if value is None:
+        return None
+
+    value = str(value).strip().lower()
+    if value in PROFILE_TAG_FALSE_VALUES:
+        return None
+
+    return value if value in PROFILE_SORT_KEYS else DEFAULT_PROFILE_SORT_KEY
+
+
+def _profiled_iter(profiler, iterable):
+    # Only the time spent computing the events is profiled, not the time spent by the consumer
+    # of the events (e.g. an engine in the same process)
+    iterator = iter(iterable)
+    while True:
+        profiler.enable()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            profiler.disable()
+
+        yield item
+
+
+def _write_profile_report(profiler, path, step_key, sort_key):
+    ensure_dir(os.path.dirname(path))
+    with open(path, 'w') as f:
+        f.write(
+            'Profile of step "{step_key}", sorted by {sort_key}:\n'.format(
+                step_key=step_key, sort_key=sort_key
+            )
+        )
+        pstats.Stats(profiler, stream=f).sort_stats(sort_key).print_stats()
+
+
+def profile_step_events(step_context, step_events):
+    '''Profiles the computation of the events of a step if its run is tagged with dagster/profile,
+    writing the report of the profile to the compute log manager of the instance (see
+    ComputeIOType.PROFILE) once the step completes.
+
+    Args:
+        step_context (SystemStepExecutionContext): The context of the step.
+        step_events (Iterator[DagsterEvent]): The events of the step.
+
+    Returns:
+        Iterator[DagsterEvent]: The events of the step.
+    '''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+
+    tags = step_context.pipeline_run.tags
+    sort_key = profile_sort_key_for_tags(tags)
+    if sort_key is None:
+        for step_event in step_events:
+            yield step_event
+        return
+
+    tag_value = str(tags[PROFILE_TAG]).strip().lower()
+    if tag_value not in PROFILE_TAG_TRUE_VALUES and tag_value != sort_key:
+        step_context.log.warning(
+            'Invalid value "{value}" for tag {tag}, sorting the profile by {sort_key}. Must be a '
+            'boolean or one of: {keys}'.format(
+                value=tags[PROFILE_TAG],
+                tag=PROFILE_TAG,
+                sort_key=sort_key,
+                keys=', '.join(PROFILE_SORT_KEYS),
+            )
+        )
+
+    manager = step_context.instance.compute_log_manager
+    if not manager.enabled(step_context):
+        step_context.log.warning(
+            'Not profiling step "{step_key}": the compute log manager of the instance stores '
+            'no compute logs.'.format(step_key=step_context.step.key)
+        )
+        for step_event in step_events:
+            yield step_event
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        # Raises if another profiler is active, e.g. when the process itself is being profiled
+        profiler.enable()
+        profiler.disable()
+    except ValueError as e:
+        step_context.log.warning(
+            'Not profiling step "{step_key}": {error}'.format(
+                step_key=step_context.step.key, error=e
+            )
+        )
+        for step_event in step_events:
+            yield step_event
+        return
+
+    try:
+        for step_event in _profiled_iter(profiler, step_events):
+            yield step_event
+    finally:
+        path = manager.get_local_path(
+            step_context.run_id, step_context.step.key, ComputeIOType.PROFILE
+        )
+        _write_profile_report(profiler, path, step_context.step.key, sort_key)
+        step_context.log.debug(
+            'Wrote profile of step "{step_key}" to {path}'.format(
+                step_key=step_context.step.key, path=path
+            )
+        )
@@ -1,8 +1,11 @@
+from collections import OrderedDict
+
 import six
 
 from dagster import check
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
+from dagster.core.execution.plan.objects import StepPhase, StepProfileData
 from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster.utils import datetime_as_float
 
@@ -49,3 +52,34 @@ def build_stats_from_events(run_id, records):
     return PipelineRunStatsSnapshot(
         run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
     )
+
+
+def aggregate_step_profiles(step_profiles):
+    '''Totals the StepProfileData of the steps of a run into a single StepProfileData, or returns
+    None if no step has been profiled.
+
+    The durations and CPU times of the steps are summed, with every StepPhase included, and the
+    process peak resident set size is the highest of those of the processes that executed them.
+    '''
+    check.list_param(step_profiles, 'step_profiles', of_type=StepProfileData)
+
+    if not step_profiles:
+        return None
+
+    phase_durations_ms = OrderedDict((phase.value, 0.0) for phase in StepPhase)
+    for step_profile in step_profiles:
+        for phase, duration_ms in step_profile.phase_durations_ms.items():
+            phase_durations_ms[phase] = phase_durations_ms.get(phase, 0.0) + duration_ms
+
+    peak_rss_bytes = [
+        step_profile.process_peak_rss_bytes
+        for step_profile in step_profiles
+        if step_profile.process_peak_rss_bytes is not None
+    ]
+
+    return StepProfileData(
+        duration_ms=sum(step_profile.duration_ms for step_profile in step_profiles),
+        phase_durations_ms=phase_durations_ms,
+        cpu_time_ms=sum(step_profile.cpu_time_ms for step_profile in step_profiles),
+        process_peak_rss_bytes=max(peak_rss_bytes) if peak_rss_bytes else None,
+    )
@@ -0,0 +1,317 @@
+'''Executes the steps of a run in worker processes, for the engines that distribute steps across
+them (such as Celery and Dask) and Airflow.
+
+Each task only carries the handle of the pipeline, the instance ref and the execution params.
+Worker processes execute many tasks, so the pipelines and instances they load are cached for the
+lifetime of the process. The events of the steps are written to the event log of the run as they
+execute, where engines read them with a StepEventLogTailer.
+'''
+import threading
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.definitions.events import EventMetadataEntry
+from dagster.core.definitions.handle import ExecutionTargetHandle
+from dagster.core.errors import DagsterExecutionStepNotFoundError
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData, log_step_event
+from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.instance import DagsterInstance, InstanceRef
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.seven import json
+
+
+def _cache_key(value):
+    return json.dumps(value, sort_keys=True)
+
+
+class WorkerCache(object):
+    '''The pipelines and instances loaded by a worker process, keyed by the dict representations
+    of the handles and instance refs they were loaded from.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pipelines = {}
+        self._instances = {}
+
+    def get_pipeline(self, handle, pipeline_name, solid_subset=None):
+        check.inst_param(handle, 'handle', ExecutionTargetHandle)
+        check.str_param(pipeline_name, 'pipeline_name')
+        check.opt_list_param(solid_subset, 'solid_subset', of_type=str)
+
+        key = _cache_key([handle.to_dict(), pipeline_name, solid_subset])
+        with self._lock:
+            if key not in self._pipelines:
+                self._pipelines[key] = _build_pipeline(handle, pipeline_name, solid_subset)
+            return self._pipelines[key]
+
+    def get_instance(self, instance_ref):
+        check.opt_inst_param(instance_ref, 'instance_ref', InstanceRef)
+
+        if instance_ref is None:
+            return DagsterInstance.ephemeral()
+
+        key = _cache_key(instance_ref.to_dict())
+        with self._lock:
+            if key not in self._instances:
+                self._instances[key] = DagsterInstance.from_ref(instance_ref)
+            return self._instances[key]
+
+    def clear(self):
+        with self._lock:
+            instances = list(self._instances.values())
+            self._pipelines = {}
+            self._instances = {}
+
+        for instance in instances:
+            instance.dispose()
+
+
+def _build_pipeline(handle, pipeline_name, solid_subset):
+    if handle.is_resolved_to_pipeline:
+        pipeline_def = handle.build_pipeline_definition()
+        check.invariant(
+            pipeline_def.name == pipeline_name,
+            'Handle resolved to pipeline {handle_pipeline_name}, couldn\'t resolve '
+            '{pipeline_name}'.format(
+                handle_pipeline_name=pipeline_def.name, pipeline_name=pipeline_name
+            ),
+        )
+    else:
+        pipeline_def = handle.with_pipeline_name(pipeline_name).build_pipeline_definition()
+
+    return pipeline_def.build_sub_pipeline(solid_subset) if solid_subset else pipeline_def
+
+
+WORKER_CACHE = WorkerCache()
+
+
+def execute_steps_in_worker(
+    handle,
+    pipeline_name,
+    environment_dict,
+    mode,
+    run_id,
+    step_keys,
+    instance_ref=None,
+    tags=None,
+    solid_subset=None,
+):
+    '''Executes steps of a run in this process, returning the DagsterEvents they emitted.
+
+    This is equivalent to the executePlan GraphQL mutation, without building a GraphQL context
+    and schema and translating events to and from GraphQL for every task.
+
+    Args:
+        handle (ExecutionTargetHandle): The handle of the pipeline, or of the repository
+            containing it.
+        pipeline_name (str): The name of the pipeline.
+        environment_dict (dict): The environment config of the run.
+        mode (Optional[str]): The mode of the run. Defaults to the pipeline's default mode.
+        run_id (str): The run id. The run is looked up in the instance, and only created (in
+            memory) if it isn't found.
+        step_keys (List[str]): The keys of the steps to execute.
+        instance_ref (Optional[InstanceRef]): The instance of the run. Defaults to an ephemeral
+            instance.
+        tags (Optional[Dict[str, str]]): Tags of the run, if it isn't found in the instance.
+        solid_subset (Optional[List[str]]): The solid subset of the pipeline.
+
+    Returns:
+        List[DagsterEvent]
+    '''
+    check.inst_param(handle, 'handle', ExecutionTargetHandle)
+    check.str_param(pipeline_name, 'pipeline_name')
+    environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
+    check.opt_str_param(mode, 'mode')
+    check.str_param(run_id, 'run_id')
+    check.list_param(step_keys, 'step_keys', of_type=str)
+    check.opt_inst_param(instance_ref, 'instance_ref', InstanceRef)
+    tags = check.opt_dict_param(tags, 'tags')
+
+    pipeline_def = WORKER_CACHE.get_pipeline(handle, pipeline_name, solid_subset)
+    instance = WORKER_CACHE.get_instance(instance_ref)
+
+    pipeline_run = instance.get_run_by_id(run_id)
+    if not pipeline_run:
+        pipeline_run = PipelineRun(
+            pipeline_name=pipeline_def.name,
+            run_id=run_id,
+            environment_dict=environment_dict,
+            mode=mode or pipeline_def.get_default_mode_name(),
+            tags=tags,
+        )
+
+    execution_plan = create_execution_plan(
+        pipeline_def, environment_dict=environment_dict, run_config=pipeline_run
+    )
+
+    for step_key in step_keys:
+        if not execution_plan.has_step(step_key):
+            raise DagsterExecutionStepNotFoundError(
+                'Execution plan does not contain step "{step_key}"'.format(step_key=step_key),
+                step_keys=[step_key],
+            )
+
+    return execute_plan(
+        execution_plan.build_subset_plan(step_keys),
+        instance,
+        pipeline_run,
+        environment_dict=environment_dict,
+    )
+
+
+# The events that end the execution of a step
+STEP_OUTCOME_EVENT_TYPES = (
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+)
+
+
+def summarize_step_events(events, step_keys):
+    '''Summarizes the events of the given steps, which workers return to the engine in place of the
+    events themselves.
+
+    The summaries are plain dicts, so that they can be returned with any task serializer. Engines
+    decide which steps to skip from the outcomes of the steps, and report the outcome events they
+    don't find in the event log of the run themselves, since they can't rely on reading the
+    events of the steps from it (see StepEventLogTailer.outcome_events_not_found).
+
+    Returns:
+        Dict[str, dict]: For each step, the number of its events ("num_events"), the value of the
+            DagsterEventType of its success, failure or skipped event ("outcome") and the event
+            itself, serialized ("outcome_event"), or None for both if it emitted none of them.
+    '''
+    check.list_param(events, 'events', of_type=DagsterEvent)
+    check.list_param(step_keys, 'step_keys', of_type=str)
+
+    summaries = {
+        step_key: {'num_events': 0, 'outcome': None, 'outcome_event': None}
+        for step_key in step_keys
+    }
+    for event in events:
+        if event.step_key not in summaries:
+            continue
+
+        summaries[event.step_key]['num_events'] += 1
+        if event.event_type in STEP_OUTCOME_EVENT_TYPES:
+            summaries[event.step_key]['outcome'] = event.event_type.value
+            summaries[event.step_key]['outcome_event'] = serialize_dagster_namedtuple(event)
+
+    return summaries
+
+
+def is_step_success(step_summary):
+    '''Whether a step succeeded, given its summary (see summarize_step_events).'''
+    check.dict_param(step_summary, 'step_summary', key_type=str)
+    return step_summary['outcome'] == DagsterEventType.STEP_SUCCESS.value
+
+
+class StepEventLogTailer(object):
+    '''Reads the events of steps executing in workers from the event log of their run.
+
+    Workers write their events to the event log storage of the instance they are given a ref to,
+    so engines yield them from there as the steps execute, rather than receiving every event of a
+    step in its task result once it completes.
+
+    Args:
+        instance (DagsterInstance): The instance of the run, shared with the workers.
+        run_id (str): The id of the run.
+        step_keys (List[str]): The keys of the steps executing in workers.
+    '''
+
+    def __init__(self, instance, run_id, step_keys):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._run_id = check.str_param(run_id, 'run_id')
+        self._step_keys = set(check.list_param(step_keys, 'step_keys', of_type=str))
+        self._num_events = defaultdict(int)
+        self._completed_step_keys = set()
+
+        # The engine's own events are already in the event log
+        self._cursor = len(instance.all_logs(run_id)) - 1
+
+    def poll(self):
+        '''Returns the events of the steps written to the event log since the last poll.'''
+        records = self._instance.logs_after(self._run_id, self._cursor)
+        self._cursor += len(records)
+
+        events = []
+        for record in records:
+            if record.is_dagster_event and record.dagster_event.step_key in self._step_keys:
+                self._num_events[record.dagster_event.step_key] += 1
+                if record.dagster_event.event_type in STEP_OUTCOME_EVENT_TYPES:
+                    self._completed_step_keys.add(record.dagster_event.step_key)
+                events.append(record.dagster_event)
+
+        return events
+
+    def ignore_step(self, step_key):
+        '''Stops reading the events of a step, before the engine emits events for it itself.'''
+        check.str_param(step_key, 'step_key')
+
+        self._step_keys.discard(step_key)
+
+    def outcome_events_not_found(self, pipeline_context, execution_plan, step_summaries):
+        '''Returns the success, failure or skipped events of completed steps that haven't been read
+        from the event log, rebuilt from the summaries their task reported (see
+        summarize_step_events).
+
+        The events are logged through the pipeline context, so that the run doesn't e.g. succeed
+        without a record of the failure of a step when workers don't share the event log storage
+        of the instance.
+        '''
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        check.dict_param(step_summaries, 'step_summaries', key_type=str, value_type=dict)
+
+        events = []
+        for step_key in sorted(step_summaries.keys()):
+            outcome_event = step_summaries[step_key].get('outcome_event')
+            if (
+                outcome_event is None
+                or step_key in self._completed_step_keys
+                or step_key not in self._step_keys
+            ):
+                continue
+
+            event = deserialize_json_to_dagster_namedtuple(outcome_event)
+            log_step_event(
+                pipeline_context.for_step(execution_plan.get_step_by_key(step_key)), event
+            )
+            self._completed_step_keys.add(step_key)
+            events.append(event)
+
+        return events
+
+    def check_steps_complete(self, pipeline_context, step_summaries):
+        '''Returns an engine event to yield if fewer events of completed steps than their task
+        reported (see summarize_step_events) have been read from the event log, or None.
+
+        This happens when workers don't share the instance's event log storage, e.g. when remote
+        workers are given a ref to an instance using a local SQLite event log storage.
+        '''
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.dict_param(step_summaries, 'step_summaries', key_type=str, value_type=dict)
+
+        step_keys = sorted(step_summaries.keys())
+        num_events = sum(summary['num_events'] for summary in step_summaries.values())
+        num_found = sum(self._num_events[step_key] for step_key in step_keys)
+        if num_found >= num_events:
+            return None
+
+        return DagsterEvent.engine_event(
+            pipeline_context,
+            'Only found {found} of the {expected} events of step{plural} {step_keys} in the event '
+            'log of the run. Workers must share the event log storage of the instance of the '
+            'run.'.format(
+                found=num_found,
+                expected=num_events,
+                plural='s' if len(step_keys) > 1 else '',
+                step_keys=', '.join(step_keys),
+            ),
+            EngineEventData(
+                [EventMetadataEntry.text(step_key, 'step_key') for step_key in step_keys]
+            ),
+        )
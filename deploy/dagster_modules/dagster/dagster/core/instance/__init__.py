@@ -2,6 +2,7 @@ import logging
 import os
 from abc import ABCMeta
 from collections import defaultdict, namedtuple
+from contextlib import contextmanager
 from enum import Enum
 
 import six
@@ -86,6 +87,7 @@ class DagsterInstance:
             pipeline runs.
         run_storage (RunStorage): Used to store metadata about ongoing and past pipeline runs.
         compute_log_manager (ComputeLogManager): Centralized dispatch for logging from user code.
+        metrics (Optional[MetricsRecorder]): Records metrics of the operation of the instance.
         ref (Optional[InstanceRef]): Used by internal machinery to pass instances across process
             boundaries.
     '''
@@ -102,12 +104,14 @@ class DagsterInstance:
         run_launcher=None,
         dagit_settings=None,
         ref=None,
+        metrics=None,
     ):
         from dagster.core.storage.compute_log_manager import ComputeLogManager
         from dagster.core.storage.event_log import EventLogStorage
         from dagster.core.storage.root import LocalArtifactStorage
         from dagster.core.storage.runs import RunStorage
         from dagster.core.launcher import RunLauncher
+        from dagster.core.metrics import MetricsRecorder
 
         self._instance_type = check.inst_param(instance_type, 'instance_type', InstanceType)
         self._local_artifact_storage = check.inst_param(
@@ -121,6 +125,7 @@ class DagsterInstance:
         self._run_launcher = check.opt_inst_param(run_launcher, 'run_launcher', RunLauncher)
         self._dagit_settings = check.opt_dict_param(dagit_settings, 'dagit_settings')
         self._ref = check.opt_inst_param(ref, 'ref', InstanceRef)
+        self._metrics = check.opt_inst_param(metrics, 'metrics', MetricsRecorder)
 
         self._subscribers = defaultdict(list)
 
@@ -184,6 +189,7 @@ class DagsterInstance:
             run_launcher=instance_ref.run_launcher,
             dagit_settings=instance_ref.dagit_settings,
             ref=instance_ref,
+            metrics=instance_ref.metrics,
         )
 
     # flags
@@ -232,6 +238,7 @@ class DagsterInstance:
             '  Event Log Storage:\n{event}\n'
             '  Compute Log Manager:\n{compute}\n'
             '  Run Launcher:\n{run_launcher}\n'
+            '  Metrics:\n{metrics}\n'
             '  Dagit:\n{dagit}\n'
             ''.format(
                 artifact=_info(self._local_artifact_storage),
@@ -239,6 +246,7 @@ class DagsterInstance:
                 event=_info(self._event_storage),
                 compute=_info(self._compute_log_manager),
                 run_launcher=_info(self._run_launcher),
+                metrics=_info(self._metrics),
                 dagit=_info(dagit_settings),
             )
         )
@@ -255,6 +263,26 @@ class DagsterInstance:
     def compute_log_manager(self):
         return self._compute_log_manager
 
+    # metrics
+
+    @property
+    def metrics(self):
+        from dagster.core.metrics import MetricsRecorder
+
+        return self._metrics if self._metrics else MetricsRecorder()
+
+    @contextmanager
+    def _storage_query(self, storage, operation):
+        if not self._metrics:
+            yield
+            return
+
+        start_time = seven.time_fn()
+        try:
+            yield
+        finally:
+            self._metrics.record_storage_query(storage, operation, seven.time_fn() - start_time)
+
     @property
     def dagit_settings(self):
         if self._dagit_settings:
@@ -271,17 +299,30 @@ class DagsterInstance:
     def dispose(self):
         self._run_storage.dispose()
         self._event_storage.dispose()
+        if self._metrics:
+            self._metrics.dispose()
 
     # run storage
 
     def get_run_by_id(self, run_id):
-        return self._run_storage.get_run_by_id(run_id)
+        with self._storage_query('run_storage', 'get_run_by_id'):
+            return self._run_storage.get_run_by_id(run_id)
 
     def get_run_stats(self, run_id):
-        return self._event_storage.get_stats_for_run(run_id)
+        with self._storage_query('event_log_storage', 'get_stats_for_run'):
+            return self._event_storage.get_stats_for_run(run_id)
+
+    def get_run_stats_for_runs(self, run_ids):
+        with self._storage_query('event_log_storage', 'get_stats_for_runs'):
+            return self._event_storage.get_stats_for_runs(run_ids)
+
+    def get_run_step_profiles(self, run_id):
+        with self._storage_query('event_log_storage', 'get_step_profiles_for_run'):
+            return self._event_storage.get_step_profiles_for_run(run_id)
 
     def get_run_tags(self):
-        return self._run_storage.get_run_tags()
+        with self._storage_query('run_storage', 'get_run_tags'):
+            return self._run_storage.get_run_tags()
 
     def create_empty_run(self, run_id, pipeline_name):
         return self.create_run(PipelineRun.create_empty_run(pipeline_name, run_id))
@@ -296,7 +337,8 @@ class DagsterInstance:
                 )
             )
 
-        run = self._run_storage.add_run(pipeline_run)
+        with self._storage_query('run_storage', 'add_run'):
+            run = self._run_storage.add_run(pipeline_run)
         return run
 
     def get_or_create_run(self, pipeline_run):
@@ -325,19 +367,24 @@ class DagsterInstance:
                 return self.get_run_by_id(pipeline_run.run_id)
 
     def add_run(self, pipeline_run):
-        return self._run_storage.add_run(pipeline_run)
+        with self._storage_query('run_storage', 'add_run'):
+            return self._run_storage.add_run(pipeline_run)
 
     def handle_run_event(self, run_id, event):
-        return self._run_storage.handle_run_event(run_id, event)
+        with self._storage_query('run_storage', 'handle_run_event'):
+            return self._run_storage.handle_run_event(run_id, event)
 
     def has_run(self, run_id):
-        return self._run_storage.has_run(run_id)
+        with self._storage_query('run_storage', 'has_run'):
+            return self._run_storage.has_run(run_id)
 
     def get_runs(self, filters=None, cursor=None, limit=None):
-        return self._run_storage.get_runs(filters, cursor, limit)
+        with self._storage_query('run_storage', 'get_runs'):
+            return self._run_storage.get_runs(filters, cursor, limit)
 
     def get_runs_count(self, filters=None):
-        return self._run_storage.get_runs_count(filters)
+        with self._storage_query('run_storage', 'get_runs_count'):
+            return self._run_storage.get_runs_count(filters)
 
     def wipe(self):
         self._run_storage.wipe()
@@ -350,10 +397,12 @@ class DagsterInstance:
     # event storage
 
     def logs_after(self, run_id, cursor):
-        return self._event_storage.get_logs_for_run(run_id, cursor=cursor)
+        with self._storage_query('event_log_storage', 'get_logs_for_run'):
+            return self._event_storage.get_logs_for_run(run_id, cursor=cursor)
 
     def all_logs(self, run_id):
-        return self._event_storage.get_logs_for_run(run_id)
+        with self._storage_query('event_log_storage', 'get_logs_for_run'):
+            return self._event_storage.get_logs_for_run(run_id)
 
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
@@ -369,10 +418,19 @@ class DagsterInstance:
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self._metrics:
+            start_time = seven.time_fn()
+            self._event_storage.store_event(event)
+            self._metrics.record_event_log_write(seven.time_fn() - start_time)
+        else:
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
-            self._run_storage.handle_run_event(run_id, event.dagster_event)
+            with self._storage_query('run_storage', 'handle_run_event'):
+                self._run_storage.handle_run_event(run_id, event.dagster_event)
+
+        if self._metrics:
+            self._metrics.record_event(event)
 
         for sub in self._subscribers[run_id]:
             sub(event)
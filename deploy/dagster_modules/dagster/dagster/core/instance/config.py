@@ -38,8 +38,25 @@ def define_dagster_config_cls():
         'run_storage': config_field_for_configurable_class(),
         'event_log_storage': config_field_for_configurable_class(),
         'run_launcher': config_field_for_configurable_class(),
+        'metrics': config_field_for_configurable_class(),
         'dagit': Field(
-            {'execution_manager': Field({'max_concurrent_runs': int}, is_optional=True)},
+            {
+                'execution_manager': Field(
+                    {
+                        'max_concurrent_runs': Field(int, is_optional=True),
+                        'warm_workers': Field(int, is_optional=True),
+                        'max_runs_per_worker': Field(int, is_optional=True),
+                    },
+                    is_optional=True,
+                ),
+                'graphql': Field(
+                    {
+                        'max_persisted_queries': Field(int, is_optional=True),
+                        'response_cache_ttl': Field(float, is_optional=True),
+                    },
+                    is_optional=True,
+                ),
+            },
             is_optional=True,
         ),
     }
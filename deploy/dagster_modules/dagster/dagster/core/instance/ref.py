@@ -36,7 +36,7 @@ class InstanceRef(
     namedtuple(
         '_InstanceRef',
         'local_artifact_storage_data run_storage_data event_storage_data compute_logs_data '
-        'run_launcher_data dagit_settings',
+        'run_launcher_data dagit_settings metrics_data',
     )
 ):
     def __new__(
@@ -47,6 +47,7 @@ class InstanceRef(
         compute_logs_data,
         run_launcher_data,
         dagit_settings,
+        metrics_data=None,
     ):
         return super(self, InstanceRef).__new__(
             self,
@@ -66,6 +67,7 @@ class InstanceRef(
                 run_launcher_data, 'run_launcher_data', ConfigurableClassData
             ),
             dagit_settings=check.opt_dict_param(dagit_settings, 'dagit_settings'),
+            metrics_data=check.opt_inst_param(metrics_data, 'metrics_data', ConfigurableClassData),
         )
 
     @staticmethod
@@ -117,6 +119,8 @@ class InstanceRef(
 
         run_launcher_data = configurable_class_data_or_default(config_value, 'run_launcher', None)
 
+        metrics_data = configurable_class_data_or_default(config_value, 'metrics', None)
+
         return InstanceRef(
             local_artifact_storage_data=local_artifact_storage_data,
             run_storage_data=run_storage_data,
@@ -124,6 +128,7 @@ class InstanceRef(
             compute_logs_data=compute_logs_data,
             run_launcher_data=run_launcher_data,
             dagit_settings=config_value.get('dagit'),
+            metrics_data=metrics_data,
         )
 
     @staticmethod
@@ -157,5 +162,9 @@ class InstanceRef(
     def run_launcher(self):
         return self.run_launcher_data.rehydrate() if self.run_launcher_data else None
 
+    @property
+    def metrics(self):
+        return self.metrics_data.rehydrate() if self.metrics_data else None
+
     def to_dict(self):
         return self._asdict()
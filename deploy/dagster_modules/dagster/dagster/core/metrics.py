@@ -0,0 +1,64 @@
+class MetricsRecorder(object):
+    '''Records metrics of the operation of an instance, e.g. to export them to a monitoring
+    system.
+
+    The instance calls the methods of its metrics recorder as it stores events, queries its storage
+    and captures compute logs. Dagit also records the state of its execution manager before
+    exposing the metrics at /metrics. Every method does nothing by default, so implementations
+    only override the ones they record.
+
+    Metrics recorders are configured in the ``metrics`` section of the ``dagster.yaml`` of the
+    instance, and must be ConfigurableClasses.
+    '''
+
+    def record_event(self, event_record):
+        '''Called with every event stored through the instance, e.g. to count the runs that start
+        and finish and observe the durations of steps.
+
+        Args:
+            event_record (EventRecord): The event.
+        '''
+
+    def record_event_log_write(self, duration_seconds):
+        '''Called with how long storing an event in the event log storage took.
+
+        Args:
+            duration_seconds (float)
+        '''
+
+    def record_storage_query(self, storage, operation, duration_seconds):
+        '''Called with how long a query of the run or event log storage took.
+
+        Args:
+            storage (str): Either "run_storage" or "event_log_storage".
+            operation (str): The name of the method of the storage that was called.
+            duration_seconds (float)
+        '''
+
+    def record_compute_log_bytes(self, io_type, num_bytes):
+        '''Called with the size of each compute log captured for a step.
+
+        Args:
+            io_type (ComputeIOType): The compute log.
+            num_bytes (int)
+        '''
+
+    def record_execution_manager_state(self, num_queued_runs, num_active_runs):
+        '''Called with the number of runs queued and executing in the execution manager of Dagit.
+
+        Args:
+            num_queued_runs (int)
+            num_active_runs (int)
+        '''
+
+    def exposition(self):
+        '''The recorded metrics, to expose at the /metrics endpoint of Dagit.
+
+        Returns:
+            Optional[Tuple[bytes, str]]: The metrics and their content type, or None if the
+            metrics aren't exposed.
+        '''
+        return None
+
+    def dispose(self):
+        '''Called when the instance is disposed.'''
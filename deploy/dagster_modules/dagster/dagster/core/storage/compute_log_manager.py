@@ -15,6 +15,8 @@ MAX_BYTES_CHUNK_READ = 4194304  # 4 MB
 class ComputeIOType(Enum):
     STDOUT = 'stdout'
     STDERR = 'stderr'
+    # The report of the profile of a step, for runs tagged with dagster/profile
+    PROFILE = 'profile'
 
 
 ComputeLogFileData = namedtuple('ComputeLogFileData', 'path data cursor size download_url')
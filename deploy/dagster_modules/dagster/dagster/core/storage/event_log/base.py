@@ -5,6 +5,7 @@ import six
 
 from dagster import check
 from dagster.core.errors import DagsterError
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.stats import build_stats_from_events
 
@@ -37,6 +38,40 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
 
         return build_stats_from_events(run_id, self.get_logs_for_run(run_id))
 
+    def get_stats_for_runs(self, run_ids):
+        '''Get summaries of the events that have occurred in each of a set of runs.
+
+        Storages that can answer this in a single round trip should override it.
+
+        Args:
+            run_ids (List[str]): The ids of the runs to summarize.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The stats for each run, keyed by run id.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_profiles_for_run(self, run_id):
+        '''Get the profiles of the steps of a run, from its STEP_PROFILE events.
+
+        These aren't part of the stats of a run, since they can't be summarized without loading
+        every event. Storages that can select the events of a type should override it.
+
+        Args:
+            run_id (str): The id of the run.
+
+        Returns:
+            List[StepProfileData]
+        '''
+        check.str_param(run_id, 'run_id')
+        return [
+            record.dagster_event.step_profile_data
+            for record in self.get_logs_for_run(run_id)
+            if record.is_dagster_event
+            and record.dagster_event.event_type == DagsterEventType.STEP_PROFILE
+        ]
+
     @abstractmethod
     def store_event(self, event):
         '''Store an event corresponding to a pipeline run.
@@ -1,5 +1,6 @@
 import datetime
 from abc import abstractmethod
+from collections import defaultdict
 
 import six
 import sqlalchemy as db
@@ -74,8 +75,9 @@ class SqlEventLogStorage(EventLogStorage):
         query = (
             db.select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.id >= cursor)
             .order_by(SqlEventLogStorageTable.c.id.asc())
+            # Ids are shared by every run in some storages, so they can't be compared to cursors
+            .offset(cursor + 1)
         )
 
         with self.connect(run_id) as conn:
@@ -113,29 +115,63 @@ class SqlEventLogStorage(EventLogStorage):
         with self.connect(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        try:
-            counts = {}
-            times = {}
-            for result in results:
-                if result[0]:
-                    counts[result[0]] = result[1]
-                    times[result[0]] = result[2]
-
-            start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
-            end_time = times.get(
-                DagsterEventType.PIPELINE_SUCCESS.value,
-                times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
+        return _build_stats_from_rows(run_id, results)
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        if not run_ids:
+            return {}
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.count().label('n_events_of_type'),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label('last_event_timestamp'),
+                ]
             )
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .group_by('run_id', 'dagster_event_type')
+        )
 
-            return PipelineRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                start_time=datetime_as_float(start_time) if start_time else None,
-                end_time=datetime_as_float(end_time) if end_time else None,
+        with self.connect() as conn:
+            results = conn.execute(query).fetchall()
+
+        rows_by_run_id = defaultdict(list)
+        for result in results:
+            rows_by_run_id[result[0]].append(result[1:])
+
+        return {
+            run_id: _build_stats_from_rows(run_id, rows_by_run_id[run_id]) for run_id in run_ids
+        }
+
+    def get_step_profiles_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.STEP_PROFILE.value,
+                )
             )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.connect(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            return [
+                check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
+                ).dagster_event.step_profile_data
+                for (json_str,) in results
+            ]
         except (seven.JSONDecodeError, check.CheckError) as err:
             six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
 
@@ -160,3 +196,32 @@ class SqlEventLogStorage(EventLogStorage):
     @property
     def is_persistent(self):
         return True
+
+
+def _build_stats_from_rows(run_id, rows):
+    '''Build a PipelineRunStatsSnapshot from (dagster_event_type, count, last timestamp) rows.'''
+    try:
+        counts = {}
+        times = {}
+        for row in rows:
+            if row[0]:
+                counts[row[0]] = row[1]
+                times[row[0]] = row[2]
+
+        start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
+        end_time = times.get(
+            DagsterEventType.PIPELINE_SUCCESS.value,
+            times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
+        )
+
+        return PipelineRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
+            steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
+            materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
+            expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
+            start_time=datetime_as_float(start_time) if start_time else None,
+            end_time=datetime_as_float(end_time) if end_time else None,
+        )
+    except (seven.JSONDecodeError, check.CheckError) as err:
+        six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
@@ -11,6 +11,7 @@ from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 from dagster import check
+from dagster.core.execution.stats import build_stats_from_events
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
 
@@ -109,6 +110,20 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         finally:
             conn.close()
 
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        # Each run is sharded into its own database, so the runs can't be summarized in a single
+        # query. We can at least avoid creating empty databases for runs with no events yet.
+        stats_by_run_id = {}
+        for run_id in run_ids:
+            if os.path.exists(self.path_for_run_id(run_id)):
+                stats_by_run_id[run_id] = self.get_stats_for_run(run_id)
+            else:
+                stats_by_run_id[run_id] = build_stats_from_events(run_id, [])
+
+        return stats_by_run_id
+
     def wipe(self):
         for filename in (
             glob.glob(os.path.join(self._base_dir, '*.db'))
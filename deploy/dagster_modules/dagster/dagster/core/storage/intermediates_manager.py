@@ -1,8 +1,10 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
+from collections import defaultdict, namedtuple
 
 import six
 
 from dagster import check
+from dagster.core.definitions.events import ObjectStoreOperation, TypeCheck
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.types.runtime_type import RuntimeType
@@ -10,6 +12,29 @@ from dagster.core.types.runtime_type import RuntimeType
 from .intermediate_store import IntermediateStore
 
 
+class StoredIntermediate(namedtuple('_StoredIntermediate', 'type_check object_store_operation')):
+    '''The value of an Output that the compute function has already type checked and set in the
+    intermediates manager itself, typically from another process. The engine records the step
+    output without type checking or storing the value again, and without loading it unless the
+    output is materialized.
+
+    Args:
+        type_check (TypeCheck): The result of type checking the value. If it failed, the value
+            should not have been stored.
+        object_store_operation (Optional[ObjectStoreOperation]): The serializable operation that
+            stored the value, if any.
+    '''
+
+    def __new__(cls, type_check, object_store_operation=None):
+        return super(StoredIntermediate, cls).__new__(
+            cls,
+            check.inst_param(type_check, 'type_check', TypeCheck),
+            check.opt_inst_param(
+                object_store_operation, 'object_store_operation', ObjectStoreOperation
+            ),
+        )
+
+
 class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     @abstractmethod
     def get_intermediate(self, context, runtime_type, step_output_handle):
@@ -96,8 +121,9 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(context, 'context', SystemPipelineExecutionContext)
         check.inst_param(runtime_type, 'runtime_type', RuntimeType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
-        check.invariant(self.has_intermediate(context, step_output_handle))
 
+        # Callers have already checked that the intermediate exists (see uncovered_inputs), and
+        # with remote object stores every extra existence check is another round trip
         return self._intermediate_store.get_value(
             context=context, runtime_type=runtime_type, paths=self._get_paths(step_output_handle)
         )
@@ -107,12 +133,7 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(runtime_type, 'runtime_type', RuntimeType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
 
-        if self.has_intermediate(context, step_output_handle):
-            context.log.warning(
-                'Replacing existing intermediate for %s.%s'
-                % (step_output_handle.step_key, step_output_handle.output_name)
-            )
-
+        # Object stores replace existing objects, so this doesn't check for one first
         return self._intermediate_store.set_value(
             obj=value,
             context=context,
@@ -134,3 +155,74 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
     @property
     def is_persistent(self):
         return True
+
+
+class HandoffIntermediatesManager(IntermediatesManager):
+    '''Keeps the intermediates set in this process in memory, as well as storing them with the
+    wrapped intermediates manager, so that the steps consuming them later in the same execution
+    take them from memory rather than loading them from storage.
+
+    Each value is dropped once every step of the execution plan consuming it has loaded it.
+    Consumers are handed the very object their upstream step output, so they must not mutate their
+    inputs, and storage plugins aren't applied to them (e.g. to project the columns loaded).
+
+    Args:
+        intermediates_manager (IntermediatesManager): The manager storing the intermediates.
+        execution_plan (ExecutionPlan): The plan being executed.
+    '''
+
+    def __init__(self, intermediates_manager, execution_plan):
+        from dagster.core.execution.plan.plan import ExecutionPlan
+
+        self._intermediates_manager = check.inst_param(
+            intermediates_manager, 'intermediates_manager', IntermediatesManager
+        )
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        self._num_consumers = defaultdict(int)
+        for step_key in execution_plan.step_keys_to_execute:
+            for step_input in execution_plan.get_step_by_key(step_key).step_inputs:
+                for source_handle in step_input.source_handles:
+                    self._num_consumers[source_handle] += 1
+
+        self.values = {}
+
+    def get_intermediate(self, context, runtime_type, step_output_handle):
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        if step_output_handle not in self.values:
+            return self._intermediates_manager.get_intermediate(
+                context, runtime_type, step_output_handle
+            )
+
+        value = self.values[step_output_handle]
+        self._num_consumers[step_output_handle] -= 1
+        if self._num_consumers[step_output_handle] <= 0:
+            del self.values[step_output_handle]
+
+        return value
+
+    def set_intermediate(self, context, runtime_type, step_output_handle, value):
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        result = self._intermediates_manager.set_intermediate(
+            context, runtime_type, step_output_handle, value
+        )
+        if self._num_consumers.get(step_output_handle):
+            self.values[step_output_handle] = value
+
+        return result
+
+    def has_intermediate(self, context, step_output_handle):
+        return step_output_handle in self.values or self._intermediates_manager.has_intermediate(
+            context, step_output_handle
+        )
+
+    def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
+        return self._intermediates_manager.copy_intermediate_from_prev_run(
+            context, previous_run_id, step_output_handle
+        )
+
+    @property
+    def is_persistent(self):
+        return self._intermediates_manager.is_persistent
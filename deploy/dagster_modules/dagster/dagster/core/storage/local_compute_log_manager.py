@@ -19,7 +19,11 @@ from .compute_log_manager import (
 
 WATCHDOG_POLLING_TIMEOUT = 2.5
 
-IO_TYPE_EXTENSION = {ComputeIOType.STDOUT: 'out', ComputeIOType.STDERR: 'err'}
+IO_TYPE_EXTENSION = {
+    ComputeIOType.STDOUT: 'out',
+    ComputeIOType.STDERR: 'err',
+    ComputeIOType.PROFILE: 'profile',
+}
 
 MAX_FILENAME_LENGTH = 255
 
@@ -127,8 +131,7 @@ class LocalComputeLogSubscriptionManager(object):
             return
 
         update_paths = [
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT),
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR),
+            self._manager.get_local_path(run_id, step_key, io_type) for io_type in ComputeIOType
         ]
         complete_paths = [self._manager.complete_artifact_path(run_id, step_key)]
         directory = os.path.dirname(
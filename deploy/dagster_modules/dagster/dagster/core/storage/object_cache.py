@@ -0,0 +1,167 @@
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+
+from dagster import check
+from dagster.config import Field
+from dagster.utils import mkdir_p
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
+
+def _hash(*parts):
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _rm_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class LocalObjectCache(object):
+    '''A size bounded cache of serialized remote objects on local disk.
+
+    Entries are content addressed by the key and the ETag (or equivalent version identifier) of
+    the remote object, and an index records the latest known ETag of each key. Callers check the
+    recorded ETag against the remote store (ideally with a conditional request) before using an
+    entry, so a cache shared by every process on a host never serves stale objects.
+
+    Entries are written to a staging directory and moved into place, so concurrent readers and
+    writers never see partial files. The least recently used entries are evicted once the cache
+    grows beyond max_bytes.
+
+    Args:
+        base_dir (str): The directory holding the cache.
+        max_bytes (Optional[int]): The maximum total size of the cached objects.
+    '''
+
+    def __init__(self, base_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.base_dir = check.str_param(base_dir, 'base_dir')
+        self.max_bytes = check.int_param(max_bytes, 'max_bytes')
+
+        self._data_dir = os.path.join(base_dir, 'data')
+        self._index_dir = os.path.join(base_dir, 'index')
+        self._staging_dir = os.path.join(base_dir, 'staging')
+        for directory in [self._data_dir, self._index_dir, self._staging_dir]:
+            mkdir_p(directory)
+
+    def _data_path(self, key, etag):
+        return os.path.join(self._data_dir, _hash(key, etag))
+
+    def _index_path(self, key):
+        return os.path.join(self._index_dir, _hash(key))
+
+    def get_etag(self, key):
+        '''The ETag of the latest cached version of key, or None if it isn't cached.'''
+        check.str_param(key, 'key')
+
+        try:
+            with open(self._index_path(key), 'r') as f:
+                etag = f.read()
+        except (IOError, OSError):
+            return None
+
+        return etag if os.path.exists(self._data_path(key, etag)) else None
+
+    @contextmanager
+    def open_entry(self, key, etag):
+        '''Opens the cached version of key with the given ETag for reading, yielding None if it
+        isn't cached.'''
+        check.str_param(key, 'key')
+        check.str_param(etag, 'etag')
+
+        path = self._data_path(key, etag)
+        try:
+            # Once opened, the entry stays readable even if it is concurrently evicted
+            f = open(path, 'rb')
+        except (IOError, OSError):
+            yield None
+            return
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        try:
+            yield f
+        finally:
+            f.close()
+
+    @contextmanager
+    def staging_file(self):
+        '''Yields the path of a new empty file to write an object to before adding it to the
+        cache. The file is deleted on exit unless it has been added.'''
+        fd, path = tempfile.mkstemp(dir=self._staging_dir)
+        os.close(fd)
+        try:
+            yield path
+        finally:
+            _rm_quietly(path)
+
+    def add(self, key, etag, staged_path):
+        '''Moves a staged file into the cache as the latest version of key.'''
+        check.str_param(key, 'key')
+        check.str_param(etag, 'etag')
+        check.str_param(staged_path, 'staged_path')
+
+        if os.path.getsize(staged_path) > self.max_bytes:
+            return
+
+        os.rename(staged_path, self._data_path(key, etag))
+
+        fd, index_staging_path = tempfile.mkstemp(dir=self._staging_dir)
+        with os.fdopen(fd, 'w') as f:
+            f.write(etag)
+        # Renames are atomic, unlike writes, and replace the destination on POSIX
+        os.rename(index_staging_path, self._index_path(key))
+
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self._data_dir):
+            path = os.path.join(self._data_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            _rm_quietly(path)
+            total_bytes -= size
+
+
+def local_object_cache_config():
+    '''The config of the local cache of a remote system storage: opt in by setting it at all.'''
+    return Field(
+        {
+            'directory': Field(
+                str,
+                is_optional=True,
+                description='Defaults to the object_cache directory of the Dagster instance.',
+            ),
+            'max_bytes': Field(int, is_optional=True, default_value=DEFAULT_MAX_BYTES),
+        },
+        is_optional=True,
+        description='Cache intermediates on local disk, so that steps executing on the same host '
+        'as the step producing their inputs (or an earlier consumer) skip downloading them.',
+    )
+
+
+def local_object_cache_from_config(instance, cache_config):
+    '''Builds the LocalObjectCache configured with local_object_cache_config, if any.'''
+    if cache_config is None:
+        return None
+
+    return LocalObjectCache(
+        cache_config.get('directory') or os.path.join(instance.root_directory, 'object_cache'),
+        max_bytes=cache_config['max_bytes'],
+    )
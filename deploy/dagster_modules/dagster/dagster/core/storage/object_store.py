@@ -71,6 +71,24 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
 DEFAULT_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
 
 
+def _link_or_copy(src, dst):
+    # Objects are never modified in place (set_object unlinks any existing file before writing),
+    # so a hard link is as good as a copy and costs nothing, however large the object
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):
+        # No hard links across filesystems, on some filesystems, or on Windows under Python 2
+        shutil.copy(src, dst)
+
+
+def _link_or_copy_tree(src, dst):
+    for dirpath, _dirnames, filenames in os.walk(src):
+        dst_dirpath = os.path.normpath(os.path.join(dst, os.path.relpath(dirpath, src)))
+        mkdir_p(dst_dirpath)
+        for filename in filenames:
+            _link_or_copy(os.path.join(dirpath, filename), os.path.join(dst_dirpath, filename))
+
+
 class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def __init__(self):
         super(FilesystemObjectStore, self).__init__(name='filesystem', sep=os.sep)
@@ -146,9 +164,9 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         mkdir_p(os.path.dirname(dst))
 
         if os.path.isfile(src):
-            shutil.copy(src, dst)
+            _link_or_copy(src, dst)
         elif os.path.isdir(src):
-            shutil.copytree(src, dst)
+            _link_or_copy_tree(src, dst)
         else:
             check.failed('should not get here')
 
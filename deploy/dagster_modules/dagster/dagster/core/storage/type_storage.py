@@ -26,6 +26,13 @@ class TypeStoragePlugin(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     def get_object(cls, intermediate_store, context, runtime_type, paths):
         raise NotImplementedError()
 
+    @classmethod
+    def serialization_strategy_for_type(cls, runtime_type):  # pylint: disable=unused-argument
+        '''The SerializationStrategy to hand values of the runtime type to other processes with
+        outside of an intermediate store (e.g. to and from the notebooks of dagstermill solids),
+        or None to use the serialization strategy of the type.'''
+        return None
+
 
 class TypeStoragePluginRegistry(object):
     def __init__(self, types_to_register):
@@ -1,7 +1,16 @@
+import os
+import sys
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from dagster import check, seven
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 
 def format_duration(milliseconds):
     '''Given milliseconds, return human readable duration string such as:
@@ -72,3 +81,97 @@ def time_execution_scope():
     timer_result = TimerResult()
     yield timer_result
     timer_result.end_time = seven.time_fn()
+
+
+def process_cpu_time():
+    '''The CPU time (user and system) used by the current process so far, in seconds.'''
+    if hasattr(time, 'process_time'):
+        return time.process_time()
+
+    user_time, system_time = os.times()[:2]
+    return user_time + system_time
+
+
+def process_peak_rss():
+    '''The peak resident set size of the current process so far, in bytes, or None where it isn't
+    available (on Windows).'''
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, and in kilobytes elsewhere
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class PhaseTimer(object):
+    '''Accumulates the wall clock time spent in named phases of an operation, along with the CPU
+    time used since the timer was created.
+
+    Phases nest, and time is only counted towards the innermost phase: entering a phase pauses the
+    phase it is entered in. Time spent outside of any phase, or in the phase ``None``, isn't
+    counted, so a phase can be left open around code whose time is measured elsewhere.
+
+    Usage:
+
+        timer = PhaseTimer()
+        with timer.phase('load'):
+            load()
+        for item in timer.timed_iter('fetch', fetch_items()):
+            # Only the time spent fetching the items is counted
+            process(item)
+    '''
+
+    def __init__(self):
+        self.start_time = seven.time_fn()
+        self.start_cpu_time = process_cpu_time()
+        self._durations = OrderedDict()
+        # [name, time the phase was last entered or resumed]
+        self._stack = []
+
+    def _pause_current(self, now):
+        if self._stack:
+            name, resumed_at = self._stack[-1]
+            if name is not None:
+                self._durations[name] = self._durations.get(name, 0) + (now - resumed_at)
+
+    @contextmanager
+    def phase(self, name):
+        check.opt_str_param(name, 'name')
+
+        self._pause_current(seven.time_fn())
+        self._stack.append([name, seven.time_fn()])
+        try:
+            yield
+        finally:
+            now = seven.time_fn()
+            self._pause_current(now)
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def timed_iter(self, name, iterable):
+        '''Iterates over an iterable, counting only the time spent producing its items (and not the
+        time spent by the caller consuming them) towards the phase.'''
+        check.str_param(name, 'name')
+
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    @property
+    def durations_ms(self):
+        '''OrderedDict[str, float]: The time spent in each phase so far, in milliseconds.'''
+        return OrderedDict((name, seconds * 1000) for name, seconds in self._durations.items())
+
+    @property
+    def elapsed_ms(self):
+        return (seven.time_fn() - self.start_time) * 1000
+
+    @property
+    def cpu_time_ms(self):
+        return (process_cpu_time() - self.start_cpu_time) * 1000
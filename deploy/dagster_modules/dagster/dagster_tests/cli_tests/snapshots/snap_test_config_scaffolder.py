@@ -4,15 +4,20 @@ from __future__ import unicode_literals
 
 from snapshottest import Snapshot
 
+
 snapshots = Snapshot()
 
 snapshots['test_basic_solids_config 1'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'in_memory_handoff': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'step_batching': 'chains|levels'
             }
         }
     },
@@ -57,10 +62,14 @@ snapshots['test_two_modes 1'] = {
 snapshots['test_two_modes 2'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'in_memory_handoff': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'step_batching': 'chains|levels'
             }
         }
     },
@@ -105,10 +114,14 @@ snapshots['test_two_modes 3'] = {
 snapshots['test_two_modes 4'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'in_memory_handoff': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'step_batching': 'chains|levels'
             }
         }
     },
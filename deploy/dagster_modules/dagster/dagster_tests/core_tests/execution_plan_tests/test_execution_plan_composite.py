@@ -64,10 +64,12 @@ def test_execution_plan_for_composite_solid():
         'STEP_START',
         'STEP_OUTPUT',
         'STEP_SUCCESS',
+        'STEP_PROFILE',
         'STEP_START',
         'STEP_INPUT',
         'STEP_OUTPUT',
         'STEP_SUCCESS',
+        'STEP_PROFILE',
         'ENGINE_EVENT',
     ]
 
@@ -99,9 +101,11 @@ def test_execution_plan_for_composite_solid_with_config_mapping():
         'STEP_START',
         'STEP_OUTPUT',
         'STEP_SUCCESS',
+        'STEP_PROFILE',
         'STEP_START',
         'STEP_INPUT',
         'STEP_OUTPUT',
         'STEP_SUCCESS',
+        'STEP_PROFILE',
         'ENGINE_EVENT',
     ]
@@ -51,10 +51,12 @@ def test_execution_plan_simple_two_steps():
         'STEP_START',
         'STEP_OUTPUT',
         'STEP_SUCCESS',
+        'STEP_PROFILE',
         'STEP_START',
         'STEP_INPUT',
         'STEP_OUTPUT',
         'STEP_SUCCESS',
+        'STEP_PROFILE',
         'ENGINE_EVENT',
     ]
 
@@ -109,6 +111,6 @@ def test_reentrant_execute_plan():
     )
 
     assert called['yup']
-    assert len(step_events) == 5
+    assert len(step_events) == 6
 
     assert step_events[1].logging_tags['foo'] == 'bar'
@@ -0,0 +1,259 @@
+import uuid
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    ExecutionTargetHandle,
+    InputDefinition,
+    Int,
+    List,
+    check,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    solid,
+)
+from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.plan.batch import (
+    ActiveBatchExecution,
+    build_step_batches,
+    in_process_execution_for_batch,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.intermediate_store import build_fs_intermediate_store
+from dagster.core.storage.pipeline_run import PipelineRun
+
+
+def define_batching_pipeline():
+    @lambda_solid
+    def start():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def chain_one(num):
+        return num + 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def chain_two(num):
+        return num * 10
+
+    @solid(input_defs=[InputDefinition('num')], metadata={'dagster/priority': 1})
+    def side(_, num):
+        return num - 1
+
+    @lambda_solid(input_defs=[InputDefinition('left'), InputDefinition('right')])
+    def join(left, right):
+        return left + right
+
+    @pipeline
+    def batching_pipeline():
+        num = start()
+        join(chain_two(chain_one(num)), side(num))
+
+    return batching_pipeline
+
+
+def _batch_step_keys(batches):
+    return [batch.step_keys for batch in batches]
+
+
+def test_no_batching():
+    plan = create_execution_plan(define_batching_pipeline())
+
+    batches = build_step_batches(plan)
+    assert _batch_step_keys(batches) == [
+        ['start.compute'],
+        ['chain_one.compute'],
+        ['side.compute'],
+        ['chain_two.compute'],
+        ['join.compute'],
+    ]
+    assert [batch.key for batch in batches] == [
+        step_keys[0] for step_keys in _batch_step_keys(batches)
+    ]
+
+
+def test_chain_batches():
+    plan = create_execution_plan(define_batching_pipeline())
+
+    batches = build_step_batches(plan, 'chains', batch_key_fn=lambda _step: None)
+    assert _batch_step_keys(batches) == [
+        ['start.compute'],
+        ['chain_one.compute', 'chain_two.compute'],
+        ['side.compute'],
+        ['join.compute'],
+    ]
+    assert batches[1].key == 'chain_one.compute+1'
+    assert in_process_execution_for_batch(batches[0]) == {'in_process': {}}
+    assert in_process_execution_for_batch(batches[1]) == {
+        'in_process': {'config': {'in_memory_handoff': True}}
+    }
+
+    # Steps of a subset plan only depend on the steps of the subset
+    batches = build_step_batches(
+        plan.build_subset_plan(['chain_two.compute', 'join.compute']),
+        'chains',
+        batch_key_fn=lambda _step: None,
+    )
+    assert _batch_step_keys(batches) == [['chain_two.compute', 'join.compute']]
+
+
+def test_level_batches():
+    plan = create_execution_plan(define_batching_pipeline())
+
+    batches = build_step_batches(plan, 'levels', batch_key_fn=lambda _step: None)
+    assert _batch_step_keys(batches) == [
+        ['start.compute'],
+        ['chain_one.compute', 'side.compute'],
+        ['chain_two.compute'],
+        ['join.compute'],
+    ]
+    # The steps of a level don't consume each other's outputs, so there is nothing to hand off
+    assert in_process_execution_for_batch(batches[1]) == {'in_process': {}}
+
+    # side has a different priority, the default batch key
+    batches = build_step_batches(plan, 'levels')
+    assert _batch_step_keys(batches) == [
+        ['start.compute'],
+        ['chain_one.compute'],
+        ['side.compute'],
+        ['chain_two.compute'],
+        ['join.compute'],
+    ]
+
+    with pytest.raises(check.ParameterCheckError):
+        build_step_batches(plan, 'solids')
+
+
+def test_active_batch_execution():
+    plan = create_execution_plan(define_batching_pipeline())
+    active_execution = ActiveBatchExecution(
+        plan, build_step_batches(plan, 'chains', batch_key_fn=lambda _step: None)
+    )
+
+    batches = active_execution.get_available_batches()
+    assert _batch_step_keys(batches) == [['start.compute']]
+    assert active_execution.get_available_batches() == []
+    active_execution.mark_complete('start.compute')
+
+    # side has the highest priority
+    batches = active_execution.get_available_batches()
+    assert _batch_step_keys(batches) == [
+        ['side.compute'],
+        ['chain_one.compute', 'chain_two.compute'],
+    ]
+
+    active_execution.mark_complete('side.compute')
+    assert active_execution.get_available_batches() == []
+
+    active_execution.mark_complete('chain_one.compute+1')
+    batches = active_execution.get_available_batches()
+    assert _batch_step_keys(batches) == [['join.compute']]
+
+    assert not active_execution.is_complete
+    active_execution.mark_complete('join.compute')
+    assert active_execution.is_complete
+
+    with pytest.raises(check.CheckError):
+        ActiveBatchExecution(plan, build_step_batches(plan.build_subset_plan(['start.compute'])))
+
+
+def _num_loaded_inputs(result):
+    return len(
+        [
+            event
+            for event in result.event_list
+            if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+            and event.event_specific_data.op == ObjectStoreOperationType.GET_OBJECT.value
+        ]
+    )
+
+
+def test_in_memory_handoff():
+    environment_dict = {'storage': {'filesystem': {}}}
+    result = execute_pipeline(define_batching_pipeline(), environment_dict=environment_dict)
+    assert result.success
+    assert result.result_for_solid('join').output_value() == 20
+    assert _num_loaded_inputs(result) == 5
+
+    result = execute_pipeline(
+        define_batching_pipeline(),
+        environment_dict=dict(
+            environment_dict, execution={'in_process': {'config': {'in_memory_handoff': True}}}
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('join').output_value() == 20
+    assert _num_loaded_inputs(result) == 0
+
+
+def test_in_memory_handoff_fan_in():
+    @lambda_solid
+    def one():
+        return 1
+
+    @lambda_solid
+    def two():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition('nums', List[int])])
+    def total(nums):
+        return sum(nums)
+
+    @pipeline
+    def fan_in_pipeline():
+        total([one(), two()])
+
+    instance = DagsterInstance.local_temp()
+    environment_dict = {
+        'storage': {'filesystem': {}},
+        'execution': {'in_process': {'config': {'in_memory_handoff': True}}},
+    }
+    pipeline_run = PipelineRun(
+        pipeline_name='fan_in_pipeline',
+        run_id=str(uuid.uuid4()),
+        environment_dict=environment_dict,
+        mode='default',
+    )
+    execution_plan = create_execution_plan(fan_in_pipeline, environment_dict)
+    execute_plan(
+        execution_plan.build_subset_plan(['one.compute']),
+        instance,
+        pipeline_run,
+        environment_dict=environment_dict,
+    )
+
+    # The output of one is loaded from storage, while the output of two is handed off in memory
+    events = execute_plan(
+        execution_plan.build_subset_plan(['two.compute', 'total.compute']),
+        instance,
+        pipeline_run,
+        environment_dict=environment_dict,
+    )
+    assert all(not event.is_failure for event in events)
+    store = build_fs_intermediate_store(instance.intermediates_directory, pipeline_run.run_id)
+    assert store.get_intermediate(None, 'total.compute', Int).obj == 3
+    assert [
+        event.step_key
+        for event in events
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.event_specific_data.op == ObjectStoreOperationType.GET_OBJECT.value
+    ] == ['total.compute']
+
+
+def test_multiprocess_step_batching():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'define_batching_pipeline')
+    for step_batching, num_loaded_inputs in [('chains', 4), ('levels', 5)]:
+        result = execute_pipeline(
+            handle.build_pipeline_definition(),
+            environment_dict={
+                'storage': {'filesystem': {}},
+                'execution': {'multiprocess': {'config': {'step_batching': step_batching}}},
+            },
+            instance=DagsterInstance.local_temp(),
+        )
+        assert result.success
+        assert result.result_for_solid('join').output_value() == 20
+        assert _num_loaded_inputs(result) == num_loaded_inputs
@@ -0,0 +1,95 @@
+import os
+
+from dagster import (
+    ExecutionTargetHandle,
+    InputDefinition,
+    RunConfig,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+)
+from dagster.core.execution.profiling import PROFILE_TAG, profile_sort_key_for_tags
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.compute_log_manager import ComputeIOType
+
+
+def profiled_add_one(num):
+    return num + 1
+
+
+@lambda_solid
+def return_one():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num')])
+def add_one(num):
+    return profiled_add_one(num)
+
+
+@pipeline
+def profiled_pipeline():
+    add_one(return_one())
+
+
+def define_profiled_pipeline():
+    return profiled_pipeline
+
+
+def read_profile(instance, run_id, step_key):
+    return instance.compute_log_manager.read_logs_file(run_id, step_key, ComputeIOType.PROFILE)
+
+
+def test_profile_sort_key_for_tags():
+    assert profile_sort_key_for_tags(None) is None
+    assert profile_sort_key_for_tags({'foo': 'bar'}) is None
+    assert profile_sort_key_for_tags({PROFILE_TAG: 'false'}) is None
+    assert profile_sort_key_for_tags({PROFILE_TAG: 'true'}) == 'cumulative'
+    assert profile_sort_key_for_tags({PROFILE_TAG: 'True'}) == 'cumulative'
+    assert profile_sort_key_for_tags({PROFILE_TAG: 'tottime'}) == 'tottime'
+    assert profile_sort_key_for_tags({PROFILE_TAG: 'fastest'}) == 'cumulative'
+
+
+def test_profile_steps():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        profiled_pipeline,
+        run_config=RunConfig(tags={PROFILE_TAG: 'tottime'}),
+        instance=instance,
+    )
+    assert result.success
+
+    for step_key in ['return_one.compute', 'add_one.compute']:
+        profile = read_profile(instance, result.run_id, step_key)
+        assert profile.data.startswith(
+            'Profile of step "{step_key}", sorted by tottime'.format(step_key=step_key)
+        )
+        assert profile.download_url.endswith('/{step_key}/profile'.format(step_key=step_key))
+
+    assert 'profiled_add_one' in read_profile(instance, result.run_id, 'add_one.compute').data
+    assert (
+        'profiled_add_one' not in read_profile(instance, result.run_id, 'return_one.compute').data
+    )
+
+    result = execute_pipeline(profiled_pipeline, instance=instance)
+    assert result.success
+    assert read_profile(instance, result.run_id, 'add_one.compute').data is None
+
+
+def test_profile_steps_multiprocess():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'define_profiled_pipeline'
+        ).build_pipeline_definition(),
+        environment_dict={'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}},
+        run_config=RunConfig(tags={PROFILE_TAG: 'true'}),
+        instance=instance,
+    )
+    assert result.success
+
+    path = instance.compute_log_manager.get_local_path(
+        result.run_id, 'add_one.compute', ComputeIOType.PROFILE
+    )
+    assert os.path.exists(path)
+    assert 'profiled_add_one' in read_profile(instance, result.run_id, 'add_one.compute').data
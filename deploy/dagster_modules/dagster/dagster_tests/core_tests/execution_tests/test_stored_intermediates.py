@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    Failure,
+    InputDefinition,
+    Int,
+    Output,
+    OutputDefinition,
+    TypeCheck,
+    execute_pipeline,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.definitions.events import ObjectStoreOperation
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.intermediates_manager import StoredIntermediate
+from dagster.core.types.runtime_type import resolve_to_runtime_type
+
+
+def _stored_output(context, value, type_check):
+    system_context = context.get_system_context()
+    operation = None
+    if type_check.success:
+        operation = system_context.intermediates_manager.set_intermediate(
+            system_context,
+            resolve_to_runtime_type(Int),
+            StepOutputHandle(system_context.step.key, 'result'),
+            value,
+        )
+    return Output(
+        StoredIntermediate(
+            type_check,
+            ObjectStoreOperation.serializable(operation, value_name='result')
+            if operation
+            else None,
+        )
+    )
+
+
+def _define_pipeline(type_check):
+    @solid(output_defs=[OutputDefinition(Int)])
+    def store_own_output(context):
+        yield _stored_output(context, 2, type_check)
+
+    @solid(input_defs=[InputDefinition('num', Int)], output_defs=[OutputDefinition(Int)])
+    def add_one(_, num):
+        return num + 1
+
+    @pipeline
+    def stored_intermediates_pipeline():
+        add_one(store_own_output())
+
+    return stored_intermediates_pipeline
+
+
+def test_stored_intermediate():
+    with seven.TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            _define_pipeline(TypeCheck(success=True)),
+            environment_dict={
+                'storage': {'filesystem': {}},
+                'solids': {
+                    'store_own_output': {
+                        'outputs': [{'result': {'json': {'path': os.path.join(temp_dir, 'out')}}}]
+                    }
+                },
+            },
+            instance=DagsterInstance.local_temp(temp_dir),
+        )
+        assert result.success
+
+        solid_result = result.result_for_solid('store_own_output')
+        assert solid_result.compute_output_event_dict['result'].is_successful_output
+        assert [
+            event.event_specific_data.value_name
+            for event in solid_result.compute_step_events
+            if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        ] == ['result']
+
+        # The stored value is loaded back to materialize it
+        assert len(solid_result.materializations_during_compute) == 1
+        with open(os.path.join(temp_dir, 'out')) as f:
+            assert seven.json.load(f) == {'value': 2}
+
+        assert result.result_for_solid('add_one').output_value() == 3
+
+
+def test_stored_intermediate_type_check_failure():
+    with seven.TemporaryDirectory() as temp_dir:
+        with pytest.raises(Failure):
+            execute_pipeline(
+                _define_pipeline(TypeCheck(success=False, description='Not a good number')),
+                environment_dict={'storage': {'filesystem': {}}},
+                instance=DagsterInstance.local_temp(temp_dir),
+            )
@@ -3,7 +3,8 @@ import time
 
 import pytest
 
-from dagster import Output, PipelineDefinition, execute_pipeline, solid
+from dagster import DagsterEventType, Output, PipelineDefinition, execute_pipeline, solid
+from dagster.core.execution.plan.objects import StepPhase
 
 
 @pytest.mark.skipif(
@@ -49,3 +50,29 @@ def test_event_timing_direct_return():
     pipeline_result = execute_pipeline(pipeline_def)
     success_event = pipeline_result.result_for_solid('direct_return_solid').get_step_success_event()
     assert success_event.event_specific_data.duration_ms >= 10.0
+
+
+@pytest.mark.skipif(
+    sys.platform == 'win32', reason='https://github.com/dagster-io/dagster/issues/1421'
+)
+def test_step_profile_event():
+    @solid
+    def sleepy_solid(_context):
+        time.sleep(0.01)
+        yield Output(None)
+
+    pipeline_def = PipelineDefinition(solid_defs=[sleepy_solid])
+    pipeline_result = execute_pipeline(pipeline_def)
+    step_events = pipeline_result.result_for_solid('sleepy_solid').compute_step_events
+    assert [event.event_type for event in step_events[-2:]] == [
+        DagsterEventType.STEP_SUCCESS,
+        DagsterEventType.STEP_PROFILE,
+    ]
+
+    profile = step_events[-1].step_profile_data
+    assert profile.duration_for_phase(StepPhase.COMPUTE) >= 10.0
+    assert profile.duration_for_phase(StepPhase.EVENT_LOGGING) > 0.0
+    assert profile.duration_for_phase(StepPhase.INPUT_TYPE_CHECK) == 0.0
+    assert sum(profile.phase_durations_ms.values()) <= profile.duration_ms
+    assert profile.cpu_time_ms >= 0.0
+    assert profile.process_peak_rss_bytes > 0
@@ -0,0 +1,208 @@
+import uuid
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    ExecutionTargetHandle,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    lambda_solid,
+    pipeline,
+    seven,
+)
+from dagster.core.errors import DagsterExecutionStepNotFoundError
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.context_creation_pipeline import scoped_pipeline_context
+from dagster.core.execution.worker import (
+    WORKER_CACHE,
+    StepEventLogTailer,
+    execute_steps_in_worker,
+    is_step_success,
+    summarize_step_events,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.serdes import serialize_dagster_namedtuple
+from dagster.core.storage.pipeline_run import PipelineRun
+
+
+@lambda_solid(output_def=OutputDefinition(Int))
+def return_one():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num', Int)], output_def=OutputDefinition(Int))
+def add_one(num):
+    return num + 1
+
+
+@pipeline
+def worker_pipeline():
+    add_one(return_one())
+
+
+def _execute(handle, instance, run_id, step_key):
+    return execute_steps_in_worker(
+        handle,
+        'worker_pipeline',
+        {'storage': {'filesystem': {}}},
+        None,
+        run_id,
+        [step_key],
+        instance_ref=instance.get_ref(),
+    )
+
+
+def test_execute_steps_in_worker():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'worker_pipeline')
+    run_id = str(uuid.uuid4())
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+
+        events = _execute(handle, instance, run_id, 'return_one.compute')
+        assert events[-3].event_type == DagsterEventType.STEP_SUCCESS
+        assert events[-2].event_type == DagsterEventType.STEP_PROFILE
+        assert events[-2].step_key == 'return_one.compute'
+
+        events = _execute(handle, instance, run_id, 'add_one.compute')
+        assert [event.step_key for event in events if event.is_successful_output] == [
+            'add_one.compute'
+        ]
+
+        # Later tasks reuse the pipeline and instance loaded by the first one
+        assert WORKER_CACHE.get_pipeline(handle, 'worker_pipeline') is WORKER_CACHE.get_pipeline(
+            handle, 'worker_pipeline'
+        )
+        assert WORKER_CACHE.get_instance(instance.get_ref()) is WORKER_CACHE.get_instance(
+            instance.get_ref()
+        )
+
+        with pytest.raises(DagsterExecutionStepNotFoundError):
+            _execute(handle, instance, run_id, 'nope.compute')
+
+        WORKER_CACHE.clear()
+
+
+def test_step_event_log_tailer():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'worker_pipeline')
+    run_id = str(uuid.uuid4())
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        tailer = StepEventLogTailer(instance, run_id, ['return_one.compute', 'add_one.compute'])
+        assert tailer.poll() == []
+
+        events = _execute(handle, instance, run_id, 'return_one.compute')
+        step_summaries = summarize_step_events(events, ['return_one.compute', 'add_one.compute'])
+        num_events = len([event for event in events if event.step_key])
+        success_event = [event for event in events if event.is_step_success][0]
+        assert step_summaries == {
+            'return_one.compute': {
+                'num_events': num_events,
+                'outcome': 'STEP_SUCCESS',
+                'outcome_event': serialize_dagster_namedtuple(success_event),
+            },
+            'add_one.compute': {'num_events': 0, 'outcome': None, 'outcome_event': None},
+        }
+        assert is_step_success(step_summaries['return_one.compute'])
+        assert not is_step_success(step_summaries['add_one.compute'])
+
+        assert tailer.poll() == [event for event in events if event.step_key]
+        assert tailer.poll() == []
+
+        environment_dict = {'storage': {'filesystem': {}}}
+        pipeline_run = PipelineRun(
+            pipeline_name='worker_pipeline',
+            run_id=run_id,
+            environment_dict=environment_dict,
+            mode='default',
+        )
+        with scoped_pipeline_context(
+            worker_pipeline, environment_dict, pipeline_run, instance
+        ) as pipeline_context:
+            assert (
+                tailer.check_steps_complete(
+                    pipeline_context, {'return_one.compute': step_summaries['return_one.compute']}
+                )
+                is None
+            )
+
+            missing_events = tailer.check_steps_complete(
+                pipeline_context, {'add_one.compute': {'num_events': 3, 'outcome': 'STEP_SUCCESS'}}
+            )
+            assert missing_events.is_engine_event
+            assert 'Only found 0 of the 3 events' in missing_events.message
+
+            missing_events = tailer.check_steps_complete(
+                pipeline_context,
+                {
+                    'return_one.compute': step_summaries['return_one.compute'],
+                    'add_one.compute': {'num_events': 1, 'outcome': None},
+                },
+            )
+            assert 'Only found {num_events} of the'.format(num_events=num_events) in (
+                missing_events.message
+            )
+
+            # Outcome events read from the event log aren't reported again
+            execution_plan = create_execution_plan(worker_pipeline, environment_dict)
+            assert (
+                tailer.outcome_events_not_found(pipeline_context, execution_plan, step_summaries)
+                == []
+            )
+
+        tailer.ignore_step('add_one.compute')
+        _execute(handle, instance, run_id, 'add_one.compute')
+        assert tailer.poll() == []
+
+        WORKER_CACHE.clear()
+
+
+def test_step_event_log_tailer_outcome_events_not_found():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'worker_pipeline')
+    run_id = str(uuid.uuid4())
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        environment_dict = {'storage': {'filesystem': {}}}
+        pipeline_run = instance.create_run(
+            PipelineRun(
+                pipeline_name='worker_pipeline',
+                run_id=run_id,
+                environment_dict=environment_dict,
+                mode='default',
+            )
+        )
+
+        # As if the worker wrote its events to an event log storage the engine doesn't read
+        with seven.TemporaryDirectory() as worker_temp_dir:
+            worker_instance = DagsterInstance.local_temp(worker_temp_dir)
+            worker_instance.create_run(pipeline_run)
+            events = _execute(handle, worker_instance, run_id, 'return_one.compute')
+            WORKER_CACHE.clear()
+
+        tailer = StepEventLogTailer(instance, run_id, ['return_one.compute'])
+        step_summaries = summarize_step_events(events, ['return_one.compute'])
+        assert tailer.poll() == []
+
+        with scoped_pipeline_context(
+            worker_pipeline, environment_dict, pipeline_run, instance
+        ) as pipeline_context:
+            execution_plan = create_execution_plan(worker_pipeline, environment_dict)
+            outcome_events = tailer.outcome_events_not_found(
+                pipeline_context, execution_plan, step_summaries
+            )
+            assert outcome_events == [event for event in events if event.is_step_success]
+            assert (
+                tailer.outcome_events_not_found(pipeline_context, execution_plan, step_summaries)
+                == []
+            )
+
+        # The rebuilt events are logged to the event log of the run
+        assert [
+            record.dagster_event
+            for record in instance.all_logs(run_id)
+            if record.is_dagster_event and record.dagster_event.is_step_success
+        ] == outcome_events
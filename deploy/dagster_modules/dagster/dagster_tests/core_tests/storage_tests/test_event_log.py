@@ -8,7 +8,8 @@ import sqlalchemy
 from dagster import seven
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import DagsterEventRecord
-from dagster.core.execution.plan.objects import StepSuccessData
+from dagster.core.execution.stats import aggregate_step_profiles
+from dagster.core.execution.plan.objects import StepProfileData, StepSuccessData
 from dagster.core.storage.event_log import (
     DagsterEventLogInvalidForRun,
     InMemoryEventLogStorage,
@@ -109,6 +110,101 @@ def test_event_log_storage_store_with_multiple_runs(event_storage_factory_cm_fn)
             assert len(storage.get_logs_for_run(run_id)) == 0
 
 
+@event_storage_test
+def test_event_log_storage_cursor(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        for message in ['Message1', 'Message2', 'Message3']:
+            storage.store_event(
+                DagsterEventRecord(None, message, 'debug', message, 'foo', time.time())
+            )
+
+        assert [event.user_message for event in storage.get_logs_for_run('foo', -1)] == [
+            'Message1',
+            'Message2',
+            'Message3',
+        ]
+        assert [event.user_message for event in storage.get_logs_for_run('foo', 0)] == [
+            'Message2',
+            'Message3',
+        ]
+        assert [event.user_message for event in storage.get_logs_for_run('foo', 1)] == ['Message3']
+        assert storage.get_logs_for_run('foo', 2) == []
+
+
+@event_storage_test
+def test_event_log_storage_get_stats_for_runs(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        for run_id in ['foo', 'bar', 'bar']:
+            storage.store_event(
+                DagsterEventRecord(
+                    None,
+                    'Message2',
+                    'debug',
+                    '',
+                    run_id,
+                    time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.STEP_SUCCESS.value,
+                        'nonce',
+                        event_specific_data=StepSuccessData(duration_ms=100.0),
+                    ),
+                )
+            )
+
+        stats = storage.get_stats_for_runs(['foo', 'bar', 'baz'])
+        assert set(stats.keys()) == {'foo', 'bar', 'baz'}
+        assert stats['foo'].steps_succeeded == 1
+        assert stats['bar'].steps_succeeded == 2
+        assert stats['baz'].steps_succeeded == 0
+        assert stats['bar'] == storage.get_stats_for_run('bar')
+
+        assert storage.get_stats_for_runs([]) == {}
+
+
+@event_storage_test
+def test_event_log_storage_get_step_profiles_for_run(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        assert storage.get_step_profiles_for_run('foo') == []
+
+        step_profiles = [
+            StepProfileData(
+                duration_ms=20.0,
+                phase_durations_ms={'COMPUTE': 12.0, 'EVENT_LOGGING': 1.0},
+                cpu_time_ms=cpu_time_ms,
+                process_peak_rss_bytes=peak_rss_bytes,
+            )
+            for cpu_time_ms, peak_rss_bytes in [(10.0, 2048), (5.0, 4096)]
+        ]
+        for step_profile in step_profiles:
+            storage.store_event(
+                DagsterEventRecord(
+                    None,
+                    'Message2',
+                    'debug',
+                    '',
+                    'foo',
+                    time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.STEP_PROFILE.value,
+                        'nonce',
+                        event_specific_data=step_profile,
+                    ),
+                )
+            )
+
+        assert storage.get_step_profiles_for_run('foo') == step_profiles
+        assert storage.get_step_profiles_for_run('bar') == []
+
+        run_profile = aggregate_step_profiles(storage.get_step_profiles_for_run('foo'))
+        assert run_profile.duration_ms == 40.0
+        assert run_profile.phase_durations_ms['COMPUTE'] == 24.0
+        assert run_profile.phase_durations_ms['EVENT_LOGGING'] == 2.0
+        assert run_profile.phase_durations_ms['INPUT_LOADING'] == 0.0
+        assert run_profile.cpu_time_ms == 15.0
+        assert run_profile.process_peak_rss_bytes == 4096
+        assert aggregate_step_profiles([]) is None
+
+
 @event_storage_test
 def test_event_log_storage_watch(event_storage_factory_cm_fn):
     def evt(name):
@@ -0,0 +1,59 @@
+import os
+
+from dagster import seven
+from dagster.core.storage.object_cache import LocalObjectCache
+
+
+def _add(cache, key, etag, data):
+    with cache.staging_file() as staged_path:
+        with open(staged_path, 'wb') as f:
+            f.write(data)
+        cache.add(key, etag, staged_path)
+
+
+def _read(cache, key, etag):
+    with cache.open_entry(key, etag) as f:
+        return f.read() if f else None
+
+
+def test_object_cache_versions():
+    with seven.TemporaryDirectory() as temp_dir:
+        cache = LocalObjectCache(temp_dir)
+        assert cache.get_etag('foo') is None
+        assert _read(cache, 'foo', 'v1') is None
+
+        _add(cache, 'foo', 'v1', b'one')
+        assert cache.get_etag('foo') == 'v1'
+        assert _read(cache, 'foo', 'v1') == b'one'
+
+        _add(cache, 'foo', 'v2', b'two')
+        assert cache.get_etag('foo') == 'v2'
+        assert _read(cache, 'foo', 'v2') == b'two'
+
+        # Another process sharing the directory sees the same entries
+        assert LocalObjectCache(temp_dir).get_etag('foo') == 'v2'
+
+        # Nothing is left behind in the staging directory
+        assert os.listdir(os.path.join(temp_dir, 'staging')) == []
+
+
+def test_object_cache_eviction():
+    with seven.TemporaryDirectory() as temp_dir:
+        cache = LocalObjectCache(temp_dir, max_bytes=10)
+
+        _add(cache, 'foo', 'v1', b'12345')
+        _add(cache, 'bar', 'v1', b'12345')
+        for key in ['foo', 'bar']:
+            # pylint: disable=protected-access
+            os.utime(cache._data_path(key, 'v1'), (0, 0))
+        # Reading an entry marks it as recently used
+        _read(cache, 'foo', 'v1')
+        _add(cache, 'baz', 'v1', b'12345')
+
+        assert cache.get_etag('foo') == 'v1'
+        assert cache.get_etag('bar') is None
+        assert cache.get_etag('baz') == 'v1'
+
+        # Objects larger than the whole cache are never cached
+        _add(cache, 'big', 'v1', b'12345678901')
+        assert cache.get_etag('big') is None
@@ -1,7 +1,14 @@
+from collections import defaultdict
+
 import pytest
 
+from dagster import DagsterEventType, execute_pipeline, lambda_solid, pipeline
 from dagster.core.errors import DagsterRunConflict
-from dagster.core.instance import DagsterInstance
+from dagster.core.execution.compute_logs import should_disable_io_stream_redirect
+from dagster.core.instance import DagsterInstance, InstanceRef
+from dagster.core.metrics import MetricsRecorder
+from dagster.core.serdes import ConfigurableClass
+from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.storage.pipeline_run import PipelineRun
 
 
@@ -22,3 +29,85 @@ def test_get_or_create_run():
 
     with pytest.raises(DagsterRunConflict, match='Found conflicting existing run with same id.'):
         instance.get_or_create_run(conflicting_pipeline_run)
+
+
+class RecordingMetricsRecorder(MetricsRecorder, ConfigurableClass):
+    def __init__(self, inst_data=None):
+        self._inst_data = inst_data
+        self.event_types = []
+        self.num_event_log_writes = 0
+        self.storage_queries = set()
+        self.compute_log_bytes = defaultdict(int)
+
+    @property
+    def inst_data(self):
+        return self._inst_data
+
+    @classmethod
+    def config_type(cls):
+        return {}
+
+    @staticmethod
+    def from_config_value(inst_data, config_value):
+        return RecordingMetricsRecorder(inst_data=inst_data, **config_value)
+
+    def record_event(self, event_record):
+        if event_record.is_dagster_event:
+            self.event_types.append(event_record.dagster_event.event_type)
+
+    def record_event_log_write(self, duration_seconds):
+        assert duration_seconds >= 0
+        self.num_event_log_writes += 1
+
+    def record_storage_query(self, storage, operation, duration_seconds):
+        assert duration_seconds >= 0
+        self.storage_queries.add((storage, operation))
+
+    def record_compute_log_bytes(self, io_type, num_bytes):
+        self.compute_log_bytes[io_type] += num_bytes
+
+
+@lambda_solid
+def spew():
+    print('HELLO')
+
+
+@pipeline
+def spew_pipeline():
+    spew()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_metrics_recorder():
+    instance = DagsterInstance.local_temp(
+        overrides={
+            'metrics': {
+                'module': 'dagster_tests.core_tests.test_instance',
+                'class': 'RecordingMetricsRecorder',
+                'config': {},
+            }
+        }
+    )
+    metrics = instance.metrics
+    assert isinstance(metrics, RecordingMetricsRecorder)
+    assert InstanceRef.from_dict(instance.get_ref().to_dict()) == instance.get_ref()
+
+    result = execute_pipeline(spew_pipeline, instance=instance)
+    assert result.success
+
+    assert metrics.event_types[0] == DagsterEventType.PIPELINE_START
+    assert metrics.event_types[-1] == DagsterEventType.PIPELINE_SUCCESS
+    assert DagsterEventType.STEP_PROFILE in metrics.event_types
+    assert metrics.num_event_log_writes == len(instance.all_logs(result.run_id))
+
+    assert ('run_storage', 'add_run') in metrics.storage_queries
+    assert ('run_storage', 'handle_run_event') in metrics.storage_queries
+    assert ('event_log_storage', 'get_logs_for_run') in metrics.storage_queries
+
+    assert metrics.compute_log_bytes[ComputeIOType.STDOUT] == len('HELLO\n')
+    assert metrics.compute_log_bytes[ComputeIOType.STDERR] > 0
+
+    # Metrics aren't recorded or exposed by default
+    assert DagsterInstance.ephemeral().metrics.exposition() is None
@@ -3,7 +3,7 @@ import uuid
 
 import pytest
 
-from dagster import Bool, List, Optional, String, check
+from dagster import Bool, List, Optional, String, check, seven
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
 from dagster.core.storage.type_storage import TypeStoragePlugin, TypeStoragePluginRegistry
@@ -172,3 +172,37 @@ def test_file_system_intermediate_store_with_composite_type_storage_plugin():
             intermediate_store.set_value(
                 ['hello'], context, resolve_to_runtime_type(Optional[List[String]]), ['obj_name']
             )
+
+
+def test_file_system_intermediate_store_copy_from_prev_run_links():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        prev_run_id = str(uuid.uuid4())
+        run_id = str(uuid.uuid4())
+
+        prev_store = build_fs_intermediate_store(
+            instance.intermediates_directory, run_id=prev_run_id
+        )
+        store = build_fs_intermediate_store(instance.intermediates_directory, run_id=run_id)
+
+        with yield_empty_pipeline_context(run_id=prev_run_id, instance=instance) as context:
+            prev_store.set_object('foo', context, RuntimeString, ['file'])
+            mkdir_p(os.path.join(prev_store.root, 'tree', 'nested'))
+            with open(os.path.join(prev_store.root, 'tree', 'nested', 'part'), 'w') as f:
+                f.write('bar')
+
+            store.copy_object_from_prev_run(context, prev_run_id, ['file'])
+            store.copy_object_from_prev_run(context, prev_run_id, ['tree'])
+
+            prev_path = os.path.join(prev_store.root, 'file')
+            path = os.path.join(store.root, 'file')
+            assert os.path.samefile(prev_path, path)
+            assert os.path.samefile(
+                os.path.join(prev_store.root, 'tree', 'nested', 'part'),
+                os.path.join(store.root, 'tree', 'nested', 'part'),
+            )
+
+            # Overwriting the copy must leave the previous run's object untouched
+            store.set_object('baz', context, RuntimeString, ['file'])
+            assert store.get_object(context, RuntimeString, ['file']).obj == 'baz'
+            assert prev_store.get_object(context, RuntimeString, ['file']).obj == 'foo'
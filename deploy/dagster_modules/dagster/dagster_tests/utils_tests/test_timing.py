@@ -1,6 +1,8 @@
+import time
+
 import pytest
 
-from dagster.utils.timing import TimerResult, format_duration, time_execution_scope
+from dagster.utils.timing import PhaseTimer, TimerResult, format_duration, time_execution_scope
 
 
 def test_format_duration():
@@ -37,3 +39,42 @@ def test_wrong_usage():
     with pytest.raises(Exception):
         timer_result = TimerResult()
         assert timer_result.seconds
+
+
+def test_phase_timer():
+    timer = PhaseTimer()
+
+    with timer.phase('outer'):
+        time.sleep(0.01)
+        with timer.phase('inner'):
+            time.sleep(0.02)
+        with timer.phase(None):
+            time.sleep(0.02)
+
+    def produce():
+        time.sleep(0.01)
+        yield 1
+        time.sleep(0.01)
+        yield 2
+
+    items = []
+    for item in timer.timed_iter('produce', produce()):
+        # Time spent consuming the items isn't counted
+        time.sleep(0.02)
+        items.append(item)
+    assert items == [1, 2]
+
+    durations_ms = timer.durations_ms
+    assert set(durations_ms.keys()) == {'inner', 'outer', 'produce'}
+    assert durations_ms['inner'] >= 20
+    assert durations_ms['outer'] >= 10
+    assert durations_ms['produce'] >= 20
+
+    # Neither the 20ms in the untimed phase nor the 40ms spent consuming the items are counted
+    assert sum(durations_ms.values()) <= timer.elapsed_ms - 60
+    assert isinstance(timer.cpu_time_ms, float)
+
+    with pytest.raises(ValueError):
+        with timer.phase('failing'):
+            raise ValueError()
+    assert 'failing' in timer.durations_ms
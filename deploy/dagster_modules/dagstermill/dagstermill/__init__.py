@@ -1,6 +1,7 @@
 from .context import DagstermillExecutionContext
 from .errors import DagstermillError, DagstermillExecutionError
 from .manager import MANAGER_FOR_NOTEBOOK_INSTANCE as _MANAGER_FOR_NOTEBOOK_INSTANCE
+from .kernel_pool import KernelPool, disable_kernel_pool, enable_kernel_pool
 from .solids import define_dagstermill_solid
 
 get_context = _MANAGER_FOR_NOTEBOOK_INSTANCE.get_context
@@ -14,3 +15,7 @@ _reconstitute_pipeline_context = _MANAGER_FOR_NOTEBOOK_INSTANCE.reconstitute_pip
 _teardown = _MANAGER_FOR_NOTEBOOK_INSTANCE.teardown_resources
 
 _load_parameter = _MANAGER_FOR_NOTEBOOK_INSTANCE.load_parameter
+
+_reset = _MANAGER_FOR_NOTEBOOK_INSTANCE.reset
+
+_enable_definition_cache = _MANAGER_FOR_NOTEBOOK_INSTANCE.enable_definition_cache
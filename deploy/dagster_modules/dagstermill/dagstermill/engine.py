@@ -1,17 +1,35 @@
+import os
+
 import nbformat
 from nbconvert.preprocessors.execute import CellExecutionError
 from papermill.engines import NBConvertEngine
 from papermill.log import logger
 from papermill.preprocess import PapermillExecutePreprocessor
 
+from .kernel_pool import set_kernel_cwd
+
 
 class DagstermillExecutePreprocessor(PapermillExecutePreprocessor):
+    # pylint:disable = attribute-defined-outside-init
+    def preprocess(self, nb_man, resources, km=None):
+        self.given_kernel_client = None
+        self.uses_given_kernel = km is not None
+        try:
+            return super(DagstermillExecutePreprocessor, self).preprocess(nb_man, resources, km=km)
+        finally:
+            # nbconvert only stops the channels of the clients of the kernels it starts itself
+            if self.given_kernel_client is not None:
+                self.given_kernel_client.stop_channels()
+
     # We need to finalize dagster resources here (as opposed to, e.g., in the notebook_complete
     # method on the NotebookExecutionManager), because we need to be inside the scope of the
     # nbconvert.preprocessors.ExecutePreprocessor.setup_preprocessor context manager, which tears
     # the kernel down. Note that atexit doesn't seem to work at all in ipython, and hooking into
     # the ipython post_execute event doesn't work in papermill.
     def papermill_process(self, nb_man, resources):
+        if self.uses_given_kernel:
+            self.given_kernel_client = self.kc
+
         _, resources = super(DagstermillExecutePreprocessor, self).papermill_process(
             nb_man, resources
         )
@@ -58,4 +76,17 @@ class DagstermillNBConvertEngine(NBConvertEngine):
         )
 
         preprocessor.log_output = log_output  # pylint:disable = attribute-defined-outside-init
-        preprocessor.preprocess(nb_man, kwargs)
+
+        # When given a kernel manager, the preprocessor executes the notebook in its (already
+        # started) kernel and leaves it running, rather than starting and shutting down a new one
+        kernel_manager = kwargs.pop('kernel_manager', None)
+        if kernel_manager is not None:
+            # The kernel was started for another notebook, so it is moved to the working directory
+            # a kernel started for this one would have
+            set_kernel_cwd(
+                kernel_manager,
+                kwargs.get('metadata', {}).get('path') or os.getcwd(),
+                timeout=start_timeout,
+            )
+
+        preprocessor.preprocess(nb_man, kwargs, km=kernel_manager)
@@ -0,0 +1,283 @@
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from dagster import check
+
+from .errors import DagstermillError
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_USES = 20
+DEFAULT_STARTUP_TIMEOUT = 60
+RESET_TIMEOUT = 30
+
+# Importing dagster dominates kernel startup, and the modules imported by a notebook stay imported
+# across resets, so warm kernels only pay for it once. Pooled kernels also keep the pipelines and
+# instances they load for the next notebooks they execute.
+WARM_UP_CODE = 'import dagstermill\ndagstermill._enable_definition_cache()\n'
+
+# Clears the notebook's namespace (and dagstermill's references to the last run's context) without
+# unloading any modules
+RESET_CODE = (
+    'import dagstermill as __dm_dagstermill\n'
+    '__dm_dagstermill._reset()\n'
+    'get_ipython().run_line_magic("reset", "-f")\n'
+    'import gc\n'
+    'gc.collect()\n'
+)
+
+
+class _PooledKernel(object):
+    def __init__(self, kernel_manager):
+        self.kernel_manager = kernel_manager
+        self.uses = 0
+
+
+def _execute_code(kernel_manager, code, timeout):
+    kernel_client = kernel_manager.client()
+    kernel_client.start_channels()
+    try:
+        kernel_client.wait_for_ready(timeout=timeout)
+        reply = kernel_client.execute_interactive(
+            code, silent=True, store_history=False, timeout=timeout
+        )
+    finally:
+        kernel_client.stop_channels()
+
+    return reply['content']['status'] == 'ok'
+
+
+def set_kernel_cwd(kernel_manager, path, timeout=RESET_TIMEOUT):
+    '''Changes the working directory of a started kernel, so that relative paths in a notebook
+    resolve as in a kernel started in path.'''
+    check.str_param(path, 'path')
+    check.int_param(timeout, 'timeout')
+
+    if not _execute_code(
+        kernel_manager, 'import os\nos.chdir({path!r})\n'.format(path=path), timeout
+    ):
+        raise DagstermillError(
+            'Failed to change the working directory of Jupyter kernel to {path}'.format(path=path)
+        )
+
+
+def start_kernel(kernel_name, startup_timeout=DEFAULT_STARTUP_TIMEOUT, warm_up_code=None):
+    '''Starts a Jupyter kernel and waits for it to be ready to execute code.'''
+    check.opt_str_param(kernel_name, 'kernel_name')
+    check.int_param(startup_timeout, 'startup_timeout')
+    check.opt_str_param(warm_up_code, 'warm_up_code')
+
+    # deferred import for perf
+    from jupyter_client.manager import KernelManager
+
+    kernel_manager = KernelManager(kernel_name=kernel_name or '')
+    kernel_manager.start_kernel()
+    try:
+        if not _execute_code(kernel_manager, warm_up_code or '', startup_timeout):
+            logging.warning(
+                'Warming up Jupyter kernel {kernel_name} failed'.format(kernel_name=kernel_name)
+            )
+    except Exception:  # pylint: disable=broad-except
+        kernel_manager.shutdown_kernel(now=True)
+        raise
+
+    return kernel_manager
+
+
+class KernelPool(object):
+    '''A pool of pre-started Jupyter kernels for dagstermill solids to execute notebooks in.
+
+    Starting a kernel and importing dagster into it takes seconds, which dominates the execution
+    time of most notebooks. The pool keeps up to size idle kernels of each kernel name started
+    (with dagster and any preload_modules imported) in the background. After executing a notebook,
+    a kernel's namespace is reset and it goes back to the pool, until it has executed max_uses
+    notebooks.
+
+    Resetting a kernel does not unload modules, so notebooks that depend on module level state
+    should not run in pooled kernels.
+
+    Args:
+        size (Optional[int]): The number of idle kernels to keep started for each kernel name.
+        preload_modules (Optional[List[str]]): Modules to import into each kernel before it is
+            used, such as the module defining the repository.
+        max_uses (Optional[int]): The number of notebooks a kernel executes before being shut
+            down, bounding the memory leaked across executions.
+        startup_timeout (Optional[int]): How long to wait for a kernel to start, in seconds.
+    '''
+
+    def __init__(
+        self,
+        size=DEFAULT_POOL_SIZE,
+        preload_modules=None,
+        max_uses=DEFAULT_MAX_USES,
+        startup_timeout=DEFAULT_STARTUP_TIMEOUT,
+    ):
+        self.size = check.int_param(size, 'size')
+        check.param_invariant(size >= 0, 'size')
+        self.preload_modules = check.opt_list_param(preload_modules, 'preload_modules', of_type=str)
+        self.max_uses = check.int_param(max_uses, 'max_uses')
+        check.param_invariant(max_uses > 0, 'max_uses')
+        self.startup_timeout = check.int_param(startup_timeout, 'startup_timeout')
+
+        self._lock = threading.Lock()
+        self._idle = defaultdict(list)
+        self._starting = defaultdict(int)
+        self._closed = False
+
+    @property
+    def warm_up_code(self):
+        return WARM_UP_CODE + ''.join(
+            'import {module}\n'.format(module=module) for module in self.preload_modules
+        )
+
+    def _start_kernel(self, kernel_name):
+        return _PooledKernel(
+            start_kernel(
+                kernel_name, startup_timeout=self.startup_timeout, warm_up_code=self.warm_up_code
+            )
+        )
+
+    def _fill(self, kernel_name):
+        try:
+            kernel = self._start_kernel(kernel_name)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception(
+                'Failed to start pooled Jupyter kernel {kernel_name}'.format(
+                    kernel_name=kernel_name
+                )
+            )
+            kernel = None
+
+        with self._lock:
+            self._starting[kernel_name] -= 1
+            if kernel is not None and not self._closed and len(self._idle[kernel_name]) < self.size:
+                self._idle[kernel_name].append(kernel)
+                return
+
+        if kernel is not None:
+            kernel.kernel_manager.shutdown_kernel(now=True)
+
+    def _top_up(self, kernel_name):
+        with self._lock:
+            if self._closed:
+                return
+            num_to_start = self.size - len(self._idle[kernel_name]) - self._starting[kernel_name]
+            self._starting[kernel_name] += max(num_to_start, 0)
+
+        for _ in range(num_to_start):
+            thread = threading.Thread(target=self._fill, args=(kernel_name,))
+            thread.daemon = True
+            thread.start()
+
+    def _acquire(self, kernel_name):
+        with self._lock:
+            check.invariant(not self._closed, 'Kernel pool has been shut down')
+            kernel = None
+            while self._idle[kernel_name] and kernel is None:
+                kernel = self._idle[kernel_name].pop()
+                if not kernel.kernel_manager.is_alive():
+                    kernel = None
+
+        # Replace the kernel being used before using it
+        self._top_up(kernel_name)
+
+        return kernel or self._start_kernel(kernel_name)
+
+    def _release(self, kernel_name, kernel):
+        kernel.uses += 1
+        reusable = (
+            kernel.uses < self.max_uses
+            and kernel.kernel_manager.is_alive()
+            and _execute_code(kernel.kernel_manager, RESET_CODE, RESET_TIMEOUT)
+        )
+
+        with self._lock:
+            if reusable and not self._closed and len(self._idle[kernel_name]) < self.size:
+                self._idle[kernel_name].append(kernel)
+                return
+
+        kernel.kernel_manager.shutdown_kernel(now=True)
+
+    @contextmanager
+    def kernel(self, kernel_name):
+        '''Yields the KernelManager of a started kernel, returning it to the pool on exit.'''
+        check.opt_str_param(kernel_name, 'kernel_name')
+
+        kernel = self._acquire(kernel_name)
+        try:
+            yield kernel.kernel_manager
+        except Exception:
+            # The kernel may be stuck executing a cell, so don't reuse it
+            kernel.kernel_manager.shutdown_kernel(now=True)
+            raise
+
+        try:
+            self._release(kernel_name, kernel)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception('Failed to return Jupyter kernel to the pool')
+            kernel.kernel_manager.shutdown_kernel(now=True)
+
+    def shutdown(self):
+        '''Shuts down every idle kernel. Kernels in use are shut down when they are released.'''
+        with self._lock:
+            self._closed = True
+            kernels = [kernel for idle in self._idle.values() for kernel in idle]
+            self._idle.clear()
+
+        for kernel in kernels:
+            kernel.kernel_manager.shutdown_kernel(now=True)
+
+
+_KERNEL_POOL = None
+
+
+def enable_kernel_pool(**kwargs):
+    '''Executes the notebooks of dagstermill solids in this process in a :py:class:`KernelPool`
+    constructed with the given arguments, rather than in a new kernel each.
+
+    Pooling only pays off in long lived processes executing many notebooks, such as with the in
+    process engine or in Celery and Dask workers.
+    '''
+    global _KERNEL_POOL  # pylint: disable=global-statement
+
+    disable_kernel_pool()
+    _KERNEL_POOL = KernelPool(**kwargs)
+
+    return _KERNEL_POOL
+
+
+def disable_kernel_pool():
+    '''Shuts down the kernel pool enabled by :py:func:`enable_kernel_pool`, if any.'''
+    global _KERNEL_POOL  # pylint: disable=global-statement
+
+    if _KERNEL_POOL is not None:
+        _KERNEL_POOL.shutdown()
+        _KERNEL_POOL = None
+
+
+def get_kernel_pool():
+    return _KERNEL_POOL
+
+
+atexit.register(disable_kernel_pool)
+
+
+@contextmanager
+def kernel_for_notebook(kernel_name, startup_timeout=DEFAULT_STARTUP_TIMEOUT):
+    '''Yields the KernelManager of a started kernel to execute a notebook in, from the kernel pool
+    if one is enabled, and the time it took to start it.'''
+    start = time.time()
+    pool = get_kernel_pool()
+    if pool is not None:
+        with pool.kernel(kernel_name) as kernel_manager:
+            yield kernel_manager, time.time() - start
+        return
+
+    kernel_manager = start_kernel(kernel_name, startup_timeout=startup_timeout)
+    try:
+        yield kernel_manager, time.time() - start
+    finally:
+        kernel_manager.shutdown_kernel(now=True)
@@ -14,13 +14,17 @@ from dagster import (
     SolidDefinition,
     TypeCheck,
     check,
+    seven,
 )
 from dagster.cli import load_handle
 from dagster.core.definitions.dependency import SolidHandle
+from dagster.core.definitions.events import ObjectStoreOperation
 from dagster.core.execution.api import scoped_pipeline_context
 from dagster.core.execution.context_creation_pipeline import ResourcesStack
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.serdes import unpack_value
+from dagster.core.storage.intermediates_manager import StoredIntermediate
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.loggers import colored_console_logger
 
@@ -36,8 +40,85 @@ class Manager(object):
         self.solid_def = None
         self.in_pipeline = False
         self.marshal_dir = None
+        self.step_key = None
         self.context = None
+        self.pipeline_context = None
         self.resources_stack = None
+        # Kernels from a kernel pool execute many notebooks, so they hold on to the pipelines and
+        # instances they have loaded rather than loading them again for each one. Other kernels
+        # execute a single notebook, so don't keep them around.
+        self._pipeline_def_cache = None
+        self._instance_cache = None
+
+    def enable_definition_cache(self):
+        '''Keeps the pipelines and instances loaded by this manager for later executions, in
+        kernels from a kernel pool.'''
+        if self._pipeline_def_cache is None:
+            self._pipeline_def_cache = {}
+            self._instance_cache = {}
+
+    def reset(self):
+        '''Drops the references to the last execution's context, so that a pooled kernel can
+        execute another notebook.'''
+        self.handle = None
+        self.pipeline_def = None
+        self.solid_def = None
+        self.in_pipeline = False
+        self.marshal_dir = None
+        self.step_key = None
+        self.context = None
+        self.pipeline_context = None
+        self.resources_stack = None
+
+    def _load_pipeline_def(self, handle_kwargs, solid_subset):
+        cache_key = seven.json.dumps([handle_kwargs, solid_subset], sort_keys=True)
+        if self._pipeline_def_cache is not None and cache_key in self._pipeline_def_cache:
+            return self._pipeline_def_cache[cache_key]
+
+        try:
+            handle = load_handle.handle_for_pipeline_cli_args(
+                handle_kwargs, use_default_repository_yaml=False
+            )
+        except (check.CheckError, load_handle.UsageError) as err:
+            six.raise_from(
+                DagstermillError(
+                    'Cannot invoke a dagstermill solid from an in-memory pipeline that was not loaded '
+                    'from an ExecutionTargetHandle. Run this pipeline using dagit, the dagster CLI, '
+                    'through dagster-graphql, or in-memory after loading it through an '
+                    'ExecutionTargetHandle.'
+                ),
+                err,
+            )
+
+        pipeline_def = check.inst_param(
+            handle.build_pipeline_definition(),
+            'pipeline_def (from handle {handle_dict})'.format(handle_dict=handle.data._asdict()),
+            PipelineDefinition,
+        ).build_sub_pipeline(solid_subset)
+
+        if self._pipeline_def_cache is not None:
+            self._pipeline_def_cache[cache_key] = pipeline_def
+        return pipeline_def
+
+    def _load_instance(self, instance_ref_dict):
+        cache_key = seven.json.dumps(instance_ref_dict, sort_keys=True)
+        if self._instance_cache is not None and cache_key in self._instance_cache:
+            return self._instance_cache[cache_key]
+
+        try:
+            instance_ref = unpack_value(instance_ref_dict)
+            instance = DagsterInstance.from_ref(instance_ref)
+        except Exception as err:  # pylint: disable=broad-except
+            six.raise_from(
+                DagstermillError(
+                    'Error when attempting to resolve DagsterInstance from serialized InstanceRef'
+                ),
+                err,
+            )
+
+        if self._instance_cache is not None:
+            self._instance_cache[cache_key] = instance
+        return instance
 
     @contextmanager
     def _setup_resources(self, pipeline_def, environment_config, pipeline_run, log_manager):
@@ -57,6 +138,7 @@ class Manager(object):
         self,
         output_log_path=None,
         marshal_dir=None,
+        step_key=None,
         environment_dict=None,
         handle_kwargs=None,
         pipeline_run_dict=None,
@@ -77,6 +159,7 @@ class Manager(object):
         '''
         check.opt_str_param(output_log_path, 'output_log_path')
         check.opt_str_param(marshal_dir, 'marshal_dir')
+        check.opt_str_param(step_key, 'step_key')
         environment_dict = check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
         check.dict_param(pipeline_run_dict, 'pipeline_run_dict')
         check.dict_param(handle_kwargs, 'handle_kwargs')
@@ -84,37 +167,8 @@ class Manager(object):
         check.dict_param(solid_handle_kwargs, 'solid_handle_kwargs')
         check.dict_param(instance_ref_dict, 'instance_ref_dict')
 
-        try:
-            handle = load_handle.handle_for_pipeline_cli_args(
-                handle_kwargs, use_default_repository_yaml=False
-            )
-        except (check.CheckError, load_handle.UsageError) as err:
-            six.raise_from(
-                DagstermillError(
-                    'Cannot invoke a dagstermill solid from an in-memory pipeline that was not loaded '
-                    'from an ExecutionTargetHandle. Run this pipeline using dagit, the dagster CLI, '
-                    'through dagster-graphql, or in-memory after loading it through an '
-                    'ExecutionTargetHandle.'
-                ),
-                err,
-            )
-
-        try:
-            instance_ref = unpack_value(instance_ref_dict)
-            instance = DagsterInstance.from_ref(instance_ref)
-        except Exception as err:  # pylint: disable=broad-except
-            six.raise_from(
-                DagstermillError(
-                    'Error when attempting to resolve DagsterInstance from serialized InstanceRef'
-                ),
-                err,
-            )
-
-        pipeline_def = check.inst_param(
-            handle.build_pipeline_definition(),
-            'pipeline_def (from handle {handle_dict})'.format(handle_dict=handle.data._asdict()),
-            PipelineDefinition,
-        ).build_sub_pipeline(solid_subset)
+        pipeline_def = self._load_pipeline_def(handle_kwargs, solid_subset)
+        instance = self._load_instance(instance_ref_dict)
 
         solid_handle = SolidHandle.from_dict(solid_handle_kwargs)
         solid_def = pipeline_def.get_solid(solid_handle)
@@ -122,6 +176,7 @@ class Manager(object):
         pipeline_run = unpack_value(pipeline_run_dict)
 
         self.marshal_dir = marshal_dir
+        self.step_key = step_key
         self.in_pipeline = True
         self.solid_def = solid_def
         self.pipeline_def = pipeline_def
@@ -133,6 +188,7 @@ class Manager(object):
             instance=instance,
             scoped_resources_builder_cm=self._setup_resources,
         ) as pipeline_context:
+            self.pipeline_context = pipeline_context
             self.context = DagstermillExecutionContext(pipeline_context)
 
         return self.context
@@ -208,6 +264,12 @@ class Manager(object):
 
         When called interactively or in development, returns its input.
 
+        If the storage of the run is persistent, the value is type checked and stored as an
+        intermediate here, in the notebook kernel. The process executing the solid then only reads
+        a small record of the type check and of the object store operation (a StoredIntermediate),
+        never the value itself. Otherwise the value is serialized for that process to load, type
+        check and store.
+
         Args:
             value (Any): The value to yield.
             output_name (Optional[str]): The name of the result to yield (default: ``'result'``).
@@ -227,9 +289,53 @@ class Manager(object):
 
         runtime_type = self.solid_def.output_def_named(output_name).runtime_type
 
+        if self.step_key and self.pipeline_context.intermediates_manager.is_persistent:
+            stored_intermediate = self._store_output(output_name, runtime_type, value)
+            out_file = os.path.join(self.marshal_dir, 'stored-output-{}'.format(output_name))
+            with open(out_file, 'wb') as fd:
+                fd.write(pickle.dumps(stored_intermediate, PICKLE_PROTOCOL))
+            scrapbook.glue('stored-output-{}'.format(output_name), out_file)
+            return
+
         out_file = os.path.join(self.marshal_dir, 'output-{}'.format(output_name))
         scrapbook.glue(output_name, write_value(runtime_type, value, out_file))
 
+    def _store_output(self, output_name, runtime_type, value):
+        # Type checking and storing the output here means that the (potentially large) value never
+        # has to be serialized for, and loaded by, the process executing the notebook
+        try:
+            type_check = runtime_type.type_check(value)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Type checks that raise fail the output, as when the engine type checks it
+            type_check = (
+                TypeCheck(False, exc.description, exc.metadata_entries)
+                if isinstance(exc, Failure)
+                else TypeCheck(False, str(exc), metadata_entries=[])
+            )
+
+        if not isinstance(type_check, TypeCheck):
+            type_check = TypeCheck(
+                success=False,
+                description=(
+                    'Type checks must return TypeCheck. Type check for type {type_name} returned '
+                    'value of type {return_type}.'
+                ).format(type_name=runtime_type.name, return_type=type(type_check)),
+            )
+
+        if not type_check.success:
+            return StoredIntermediate(type_check)
+
+        operation = self.pipeline_context.intermediates_manager.set_intermediate(
+            self.pipeline_context, runtime_type, StepOutputHandle(self.step_key, output_name), value
+        )
+
+        return StoredIntermediate(
+            type_check,
+            ObjectStoreOperation.serializable(operation, value_name=output_name)
+            if isinstance(operation, ObjectStoreOperation)
+            else None,
+        )
+
     def yield_event(self, dagster_event):
         '''Yield a dagster event directly from notebook code.
 
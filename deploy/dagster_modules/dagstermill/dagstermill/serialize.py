@@ -12,6 +12,17 @@ def is_json_serializable(value):
         return False
 
 
+def _serialization_strategy(runtime_type):
+    # Storage plugins may hand values to and from notebooks in a more efficient format than the
+    # type's own, e.g. DataFrames in the Arrow IPC format rather than pickled
+    for plugin in runtime_type.auto_plugins:
+        serialization_strategy = plugin.serialization_strategy_for_type(runtime_type)
+        if serialization_strategy is not None:
+            return serialization_strategy
+
+    return runtime_type.serialization_strategy
+
+
 def read_value(runtime_type, value):
     check.inst_param(runtime_type, 'runtime_type', RuntimeType)
     if runtime_type.is_scalar:
@@ -19,7 +30,7 @@ def read_value(runtime_type, value):
     elif runtime_type.is_any and is_json_serializable(value):
         return value
     else:
-        return runtime_type.serialization_strategy.deserialize_from_file(value)
+        return _serialization_strategy(runtime_type).deserialize_from_file(value)
 
 
 def write_value(runtime_type, value, target_file):
@@ -29,5 +40,5 @@ def write_value(runtime_type, value, target_file):
     elif runtime_type.is_any and is_json_serializable(value):
         return value
     else:
-        runtime_type.serialization_strategy.serialize_to_file(value, target_file)
+        _serialization_strategy(runtime_type).serialize_to_file(value, target_file)
         return target_file
@@ -1,6 +1,7 @@
 import copy
 import os
 import pickle
+import time
 import uuid
 
 import nbformat
@@ -30,6 +31,7 @@ from dagster.utils import mkdir_p, safe_tempfile_path
 
 from .engine import DagstermillNBConvertEngine
 from .errors import DagstermillError, DagstermillExecutionError
+from .kernel_pool import kernel_for_notebook
 from .serialize import read_value, write_value
 from .translator import RESERVED_INPUT_NAMES, DagsterTranslator
 
@@ -114,6 +116,7 @@ def get_papermill_parameters(compute_context, inputs, output_log_path):
     dm_context_dict = {
         'output_log_path': output_log_path,
         'marshal_dir': marshal_dir,
+        'step_key': compute_context.step.key,
         'environment_dict': compute_context.environment_dict,
     }
 
@@ -188,9 +191,18 @@ def _dm_solid_compute(name, notebook_path):
             ):
                 try:
                     papermill_engines.register('dagstermill', DagstermillNBConvertEngine)
-                    papermill.execute_notebook(
-                        intermediate_path, temp_path, engine_name='dagstermill', log_output=True
-                    )
+                    kernel_name = nb.metadata.get('kernelspec', {}).get('name')
+                    with kernel_for_notebook(kernel_name) as (kernel_manager, startup_time):
+                        start = time.time()
+                        papermill.execute_notebook(
+                            intermediate_path,
+                            temp_path,
+                            engine_name='dagstermill',
+                            log_output=True,
+                            kernel_name=kernel_name,
+                            kernel_manager=kernel_manager,
+                        )
+                        execution_time = time.time() - start
                 except Exception as exc:
                     yield Materialization(
                         label='output_notebook',
@@ -210,15 +222,39 @@ def _dm_solid_compute(name, notebook_path):
                 )
             )
 
+            system_compute_context.log.debug(
+                'Kernel for {name} started in {startup_time:.3f}s, notebook executed in '
+                '{execution_time:.3f}s'.format(
+                    name=name, startup_time=startup_time, execution_time=execution_time
+                )
+            )
+
             yield Materialization(
                 label='output_notebook',
                 description='Location of output notebook on the filesystem',
-                metadata_entries=[EventMetadataEntry.fspath(temp_path)],
+                metadata_entries=[
+                    EventMetadataEntry.fspath(temp_path),
+                    EventMetadataEntry.json(
+                        {
+                            'kernel_startup_seconds': startup_time,
+                            'execution_seconds': execution_time,
+                        },
+                        'timing',
+                        description='Time spent starting (or acquiring a pooled) kernel, and '
+                        'executing the notebook in it',
+                    ),
+                ],
             )
 
             for (output_name, output_def) in system_compute_context.solid_def.output_dict.items():
                 data_dict = output_nb.scraps.data_dict
-                if output_name in data_dict:
+                stored_output_key = 'stored-output-{}'.format(output_name)
+                if stored_output_key in data_dict:
+                    # The notebook has stored the output itself, so this only reads back the record
+                    # of its type check and object store operation, not the value
+                    with open(data_dict[stored_output_key], 'rb') as fd:
+                        yield Output(pickle.loads(fd.read()), output_name)
+                elif output_name in data_dict:
                     value = read_value(output_def.runtime_type, data_dict[output_name])
 
                     yield Output(value, output_name)
@@ -0,0 +1,99 @@
+import os
+import time
+
+import pytest
+from dagstermill.kernel_pool import KernelPool, set_kernel_cwd
+
+from dagster import check, seven
+
+
+def _execute(kernel_manager, code):
+    kernel_client = kernel_manager.client()
+    kernel_client.start_channels()
+    outputs = []
+    try:
+        kernel_client.wait_for_ready(timeout=60)
+        kernel_client.execute_interactive(
+            code, timeout=60, output_hook=lambda msg: outputs.append(msg['content'].get('text', ''))
+        )
+    finally:
+        kernel_client.stop_channels()
+    return ''.join(outputs)
+
+
+def test_kernel_pool_resets_and_recycles_kernels():
+    pool = KernelPool(size=1, max_uses=2)
+    # Only reuse the kernel returned to the pool
+    pool._top_up = lambda kernel_name: None  # pylint: disable=protected-access
+    try:
+        with pool.kernel('python3') as first_kernel_manager:
+            _execute(first_kernel_manager, 'import json\nx = 1')
+
+        with pool.kernel('python3') as kernel_manager:
+            assert kernel_manager is first_kernel_manager
+            # The namespace was reset, but modules stay imported
+            assert (
+                _execute(kernel_manager, 'import sys\nprint("x" in dir(), "json" in sys.modules)')
+                == 'False True\n'
+            )
+
+        # Kernels are shut down after max_uses executions
+        assert not kernel_manager.is_alive()
+    finally:
+        pool.shutdown()
+
+
+def test_kernel_pool_starts_kernels_in_background():
+    pool = KernelPool(size=2, preload_modules=['json'])
+    try:
+        pool._top_up('python3')  # pylint: disable=protected-access
+        for _ in range(600):
+            if len(pool._idle['python3']) == 2:  # pylint: disable=protected-access
+                break
+            time.sleep(0.1)
+        else:
+            check.failed('Kernels were never started')
+
+        with pool.kernel('python3') as kernel_manager:
+            assert _execute(kernel_manager, 'import sys\nprint("json" in sys.modules)') == 'True\n'
+    finally:
+        pool.shutdown()
+
+    assert not kernel_manager.is_alive()
+
+
+def test_kernel_pool_discards_kernels_on_error():
+    pool = KernelPool(size=1)
+    pool._top_up = lambda kernel_name: None  # pylint: disable=protected-access
+    try:
+        with pytest.raises(ValueError):
+            with pool.kernel('python3') as kernel_manager:
+                raise ValueError()
+
+        assert not kernel_manager.is_alive()
+        assert not pool._idle['python3']  # pylint: disable=protected-access
+    finally:
+        pool.shutdown()
+
+
+def test_pooled_kernel_cwd_and_definition_cache():
+    pool = KernelPool(size=0)
+    try:
+        with pool.kernel('python3') as kernel_manager:
+            with seven.TemporaryDirectory() as temp_dir:
+                set_kernel_cwd(kernel_manager, temp_dir)
+                assert _execute(kernel_manager, 'import os\nprint(os.getcwd())') == (
+                    os.path.realpath(temp_dir) + '\n'
+                )
+
+            # Pooled kernels keep the pipelines and instances they load for later notebooks
+            assert (
+                _execute(
+                    kernel_manager,
+                    'import dagstermill\n'
+                    'print(dagstermill._MANAGER_FOR_NOTEBOOK_INSTANCE._instance_cache is not None)',
+                )
+                == 'True\n'
+            )
+    finally:
+        pool.shutdown()
@@ -14,13 +14,16 @@ from dagstermill.manager import Manager
 
 from dagster import (
     DagsterInvariantViolationError,
+    Failure,
     Materialization,
     ModeDefinition,
     ResourceDefinition,
 )
 from dagster.core.definitions.dependency import SolidHandle
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.serdes import pack_value
+from dagster.core.storage.intermediates_manager import StoredIntermediate
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.utils import safe_tempfile_path
 
@@ -125,6 +128,89 @@ def test_yield_unserializable_result():
             manager.yield_result(threading.Lock())
 
 
+def test_in_pipeline_manager_stores_result():
+    with in_pipeline_manager(
+        solid_handle=SolidHandle('hello_world_output', 'hello_world_output', None),
+        handle_kwargs={
+            'module_name': 'dagstermill.examples.repository',
+            'fn_name': 'define_hello_world_with_output_pipeline',
+        },
+        environment_dict={'storage': {'filesystem': {}}},
+        step_key='hello_world_output.compute',
+    ) as manager:
+        manager.yield_result({'foo': 'bar'})
+
+        with open(os.path.join(manager.marshal_dir, 'stored-output-result'), 'rb') as fd:
+            stored_intermediate = pickle.load(fd)
+
+        assert isinstance(stored_intermediate, StoredIntermediate)
+        assert stored_intermediate.type_check.success
+        assert stored_intermediate.object_store_operation.value_name == 'result'
+
+        # The result was stored in the run's intermediates, where the solid's step reads it from
+        pipeline_context = manager.pipeline_context
+        assert pipeline_context.intermediates_manager.get_intermediate(
+            pipeline_context,
+            manager.solid_def.output_def_named('result').runtime_type,
+            StepOutputHandle('hello_world_output.compute', 'result'),
+        ).obj == {'foo': 'bar'}
+
+
+def test_in_pipeline_manager_stores_result_type_check_raises(monkeypatch):
+    with in_pipeline_manager(
+        solid_handle=SolidHandle('hello_world_output', 'hello_world_output', None),
+        handle_kwargs={
+            'module_name': 'dagstermill.examples.repository',
+            'fn_name': 'define_hello_world_with_output_pipeline',
+        },
+        environment_dict={'storage': {'filesystem': {}}},
+        step_key='hello_world_output.compute',
+    ) as manager:
+        runtime_type = manager.solid_def.output_def_named('result').runtime_type
+
+        def _stored_intermediate():
+            with open(os.path.join(manager.marshal_dir, 'stored-output-result'), 'rb') as fd:
+                return pickle.load(fd)
+
+        def _raise_failure(_value):
+            raise Failure('Not a foo')
+
+        # The type check fails the output rather than raising in the notebook, and nothing is stored
+        monkeypatch.setattr(runtime_type, 'type_check', _raise_failure)
+        manager.yield_result({'foo': 'bar'})
+        assert not _stored_intermediate().type_check.success
+        assert _stored_intermediate().type_check.description == 'Not a foo'
+        assert _stored_intermediate().object_store_operation is None
+
+        def _raise_error(_value):
+            raise ValueError('Not a bar')
+
+        monkeypatch.setattr(runtime_type, 'type_check', _raise_error)
+        manager.yield_result({'foo': 'bar'})
+        assert not _stored_intermediate().type_check.success
+        assert _stored_intermediate().type_check.description == 'Not a bar'
+
+
+def test_manager_definition_cache():
+    # pylint: disable=protected-access
+    handle_kwargs = {
+        'pipeline_name': 'hello_world_pipeline',
+        'module_name': 'dagstermill.examples.repository',
+        'fn_name': 'define_hello_world_pipeline',
+    }
+
+    # Kernels outside of a kernel pool execute a single notebook, so nothing is kept
+    manager = Manager()
+    assert manager._load_pipeline_def(handle_kwargs, None) is not manager._load_pipeline_def(
+        handle_kwargs, None
+    )
+
+    manager.enable_definition_cache()
+    assert manager._load_pipeline_def(handle_kwargs, None) is manager._load_pipeline_def(
+        handle_kwargs, None
+    )
+
+
 def test_in_pipeline_manager_bad_solid():
     with pytest.raises(
         DagsterInvariantViolationError,
@@ -0,0 +1,61 @@
+import pickle
+
+from dagstermill.serialize import read_value, write_value
+
+from dagster import RuntimeType, TypeCheck
+from dagster.core.storage.type_storage import TypeStoragePlugin
+from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster.utils import safe_tempfile_path
+
+
+class MarkedPickleSerializationStrategy(PickleSerializationStrategy):
+    def serialize(self, value, write_file_obj):
+        return super(MarkedPickleSerializationStrategy, self).serialize(
+            ('marked', value), write_file_obj
+        )
+
+    def deserialize(self, read_file_obj):
+        marker, value = super(MarkedPickleSerializationStrategy, self).deserialize(read_file_obj)
+        assert marker == 'marked'
+        return value
+
+
+class MarkedStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    @classmethod
+    def compatible_with_storage_def(cls, _system_storage_def):
+        return False
+
+    @classmethod
+    def set_object(cls, intermediate_store, obj, context, runtime_type, paths):
+        raise NotImplementedError()
+
+    @classmethod
+    def get_object(cls, intermediate_store, context, runtime_type, paths):
+        raise NotImplementedError()
+
+    @classmethod
+    def serialization_strategy_for_type(cls, _runtime_type):
+        return MarkedPickleSerializationStrategy()
+
+
+def test_serialization_strategy_from_storage_plugin():
+    marked_type = RuntimeType(
+        key='Marked',
+        name='Marked',
+        type_check_fn=lambda _: TypeCheck(success=True),
+        auto_plugins=[MarkedStoragePlugin],
+    )
+    plain_type = RuntimeType(
+        key='Plain', name='Plain', type_check_fn=lambda _: TypeCheck(success=True)
+    )
+
+    with safe_tempfile_path() as path:
+        write_value(marked_type, {'a': 1}, path)
+        with open(path, 'rb') as f:
+            assert pickle.load(f) == ('marked', {'a': 1})
+        assert read_value(marked_type, path) == {'a': 1}
+
+        write_value(plain_type, {'a': 1}, path)
+        with open(path, 'rb') as f:
+            assert pickle.load(f) == {'a': 1}
+        assert read_value(plain_type, path) == {'a': 1}
@@ -55,6 +55,14 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         self._upload_from_local(step_context.run_id, step_context.step.key, ComputeIOType.STDOUT)
         self._upload_from_local(step_context.run_id, step_context.step.key, ComputeIOType.STDERR)
 
+        # Steps are only profiled in runs tagged with dagster/profile
+        if os.path.exists(
+            self.get_local_path(step_context.run_id, step_context.step.key, ComputeIOType.PROFILE)
+        ):
+            self._upload_from_local(
+                step_context.run_id, step_context.step.key, ComputeIOType.PROFILE
+            )
+
     def is_compute_completed(self, run_id, step_key):
         return self.local_manager.is_compute_completed(run_id, step_key)
 
@@ -1,6 +1,6 @@
 from botocore.exceptions import ClientError
 from dagster_aws.s3.file_manager import S3FileHandle
-from dagster_aws.s3.utils import create_s3_session
+from dagster_aws.s3.utils import create_s3_session, is_s3_not_found_error
 
 from dagster import Field, check, resource
 from dagster.core.storage.file_cache import FileCache
@@ -17,8 +17,10 @@ class S3FileCache(FileCache):
     def has_file_object(self, file_key):
         check.str_param(file_key, 'file_key')
         try:
-            self.s3.get_object(Bucket=self.s3_bucket, Key=self.get_full_key(file_key))
-        except ClientError:
+            self.s3.head_object(Bucket=self.s3_bucket, Key=self.get_full_key(file_key))
+        except ClientError as e:
+            if not is_s3_not_found_error(e):
+                raise
             return False
         return True
 
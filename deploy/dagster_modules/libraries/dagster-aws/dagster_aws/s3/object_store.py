@@ -1,17 +1,58 @@
 import logging
-from io import BytesIO
+import os
+import shutil
+from multiprocessing.pool import ThreadPool
+from tempfile import SpooledTemporaryFile
 
 import boto3
+import six
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 
-from dagster import check
+from dagster import DagsterInvariantViolationError, check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.storage.object_cache import LocalObjectCache
 from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.marshal import SerializationStrategy
 
+from .utils import is_s3_not_found_error, is_s3_not_modified_error
+
+
+# The boto3 defaults
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+
 
 class S3ObjectStore(ObjectStore):
-    def __init__(self, bucket, s3_session=None):
+    '''An object store backed by an S3 bucket.
+
+    Objects are serialized to (and deserialized from) a spooled temporary file: objects smaller
+    than multipart_chunksize stay in memory, larger ones overflow to local disk. Large objects are
+    uploaded as multipart uploads of multipart_chunksize parts, max_concurrency at a time, and
+    downloads are streamed to the spool in multipart_chunksize reads. Either way the serialized
+    bytes never need to be held in memory next to the object itself.
+
+    If a local_cache is given, objects are written through it and read through it with
+    conditional GETs, so that objects written or read earlier on the same host are only
+    transferred again if they have changed since.
+    '''
+
+    def __init__(
+        self,
+        bucket,
+        s3_session=None,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        local_cache=None,
+    ):
         self.bucket = check.str_param(bucket, 'bucket')
+        self.local_cache = check.opt_inst_param(local_cache, 'local_cache', LocalObjectCache)
+        self.multipart_chunksize = check.int_param(multipart_chunksize, 'multipart_chunksize')
+        self.transfer_config = TransferConfig(
+            multipart_threshold=self.multipart_chunksize,
+            multipart_chunksize=self.multipart_chunksize,
+            max_concurrency=check.int_param(max_concurrency, 'max_concurrency'),
+        )
         self.s3 = s3_session or boto3.client('s3')
         self.s3.head_bucket(Bucket=bucket)
         super(S3ObjectStore, self).__init__('s3', sep='/')
@@ -26,14 +67,15 @@ class S3ObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning('Removing existing S3 key: {key}'.format(key=key))
-            self.rm_object(key)
-
-        with BytesIO() as bytes_io:
-            serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+        # Uploads replace any existing object atomically, so there is no need to check for (and
+        # remove) one first
+        if self.local_cache:
+            self._set_object_through_cache(key, obj, serialization_strategy)
+        else:
+            with SpooledTemporaryFile(max_size=self.multipart_chunksize) as spool:
+                serialization_strategy.serialize(obj, spool)
+                spool.seek(0)
+                self.s3.upload_fileobj(spool, self.bucket, key, Config=self.transfer_config)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -48,10 +90,11 @@ class S3ObjectStore(ObjectStore):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read())
-        )
+        if self.local_cache:
+            obj = self._get_object_through_cache(key, serialization_strategy)
+        else:
+            obj = self._get_object_spooled(key, serialization_strategy)
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -61,12 +104,111 @@ class S3ObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def _get(self, key, etag=None):
+        '''GETs an object, or returns None if it still has the given ETag.'''
+        try:
+            if etag is None:
+                return self.s3.get_object(Bucket=self.bucket, Key=key)
+            return self.s3.get_object(Bucket=self.bucket, Key=key, IfNoneMatch=etag)
+        except ClientError as e:
+            if etag is not None and is_s3_not_modified_error(e):
+                return None
+            if not is_s3_not_found_error(e):
+                raise
+            six.raise_from(
+                DagsterInvariantViolationError(
+                    'No object found at {uri}'.format(uri=self.uri_for_key(key))
+                ),
+                e,
+            )
+
+    def _set_object_through_cache(self, key, obj, serialization_strategy):
+        with self.local_cache.staging_file() as staged_path:
+            serialization_strategy.serialize_to_file(obj, staged_path)
+            # The ETag must be the one of the upload itself: reading it back afterwards could
+            # return the ETag of an object written concurrently by someone else, which would then
+            # be served from these stale bytes
+            etag = self._upload_file(key, staged_path)
+            self.local_cache.add(self.uri_for_key(key), etag, staged_path)
+
+    def _upload_file(self, key, path):
+        '''Uploads a file, as a multipart upload if it is larger than multipart_chunksize, and
+        returns the ETag of the object it creates.'''
+        size = os.path.getsize(path)
+        if size <= self.multipart_chunksize:
+            with open(path, 'rb') as f:
+                return self.s3.put_object(Bucket=self.bucket, Key=key, Body=f)['ETag']
+
+        upload_id = self.s3.create_multipart_upload(Bucket=self.bucket, Key=key)['UploadId']
+
+        def _upload_part(part_number):
+            with open(path, 'rb') as f:
+                f.seek((part_number - 1) * self.multipart_chunksize)
+                response = self.s3.upload_part(
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=f.read(self.multipart_chunksize),
+                )
+            return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+        num_parts = (size + self.multipart_chunksize - 1) // self.multipart_chunksize
+        pool = ThreadPool(min(num_parts, self.transfer_config.max_concurrency))
+        try:
+            parts = pool.map(_upload_part, range(1, num_parts + 1))
+        except Exception:  # pylint: disable=broad-except
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            raise
+        finally:
+            pool.close()
+            pool.join()
+
+        return self.s3.complete_multipart_upload(
+            Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={'Parts': parts}
+        )['ETag']
+
+    def _get_object_spooled(self, key, serialization_strategy):
+        with SpooledTemporaryFile(max_size=self.multipart_chunksize) as spool:
+            shutil.copyfileobj(self._get(key)['Body'], spool, self.multipart_chunksize)
+            spool.seek(0)
+            return serialization_strategy.deserialize(spool)
+
+    def _get_object_through_cache(self, key, serialization_strategy):
+        cache_key = self.uri_for_key(key)
+        cached_etag = self.local_cache.get_etag(cache_key)
+
+        response = self._get(key, etag=cached_etag)
+        if response is None:
+            with self.local_cache.open_entry(cache_key, cached_etag) as f:
+                if f is not None:
+                    return serialization_strategy.deserialize(f)
+            # The entry was evicted since its ETag was looked up
+            return self._get_object_spooled(key, serialization_strategy)
+
+        with self.local_cache.staging_file() as staged_path:
+            with open(staged_path, 'wb') as f:
+                shutil.copyfileobj(response['Body'], f, self.multipart_chunksize)
+            obj = serialization_strategy.deserialize_from_file(staged_path)
+            self.local_cache.add(cache_key, response['ETag'], staged_path)
+
+        return obj
+
     def has_object(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)['KeyCount']
-        return bool(key_count > 0)
+        try:
+            self.s3.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as e:
+            if not is_s3_not_found_error(e):
+                raise
+
+        # Type storage plugins may store an object as several keys under a common prefix (e.g.
+        # a directory of parquet files)
+        results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key + self.sep, MaxKeys=1)
+        return bool(results['KeyCount'] > 0)
 
     def rm_object(self, key):
         check.str_param(key, 'key')
@@ -78,8 +220,8 @@ class S3ObjectStore(ObjectStore):
                 Delete={'Objects': [{'Key': result['Key']} for result in results['Contents']]},
             )
 
-        if self.has_object(key):
-            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)
+        results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)
+        if results['KeyCount'] > 0:
             delete_for_results(self, results)
 
             continuation = results['IsTruncated']
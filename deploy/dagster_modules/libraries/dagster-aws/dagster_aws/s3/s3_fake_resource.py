@@ -1,3 +1,4 @@
+import hashlib
 import io
 from collections import defaultdict
 
@@ -15,32 +16,85 @@ class S3FakeSession(object):
 
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
         self.mock_extras = mock.MagicMock()
+        self.multipart_uploads = {}
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
         self.mock_extras.head_bucket(*args, **kwargs)
 
     def head_object(self, Bucket, Key, *args, **kwargs):
         self.mock_extras.head_object(*args, **kwargs)
-        return {'ContentLength': len(self.buckets.get(Bucket, {}).get(Key, b''))}
+        if not self.has_object(Bucket, Key):
+            raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+
+        return {'ContentLength': len(self.buckets[Bucket][Key]), 'ETag': self._etag(Bucket, Key)}
 
     def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
         self.mock_extras.list_objects_v2(*args, **kwargs)
-        key = self.buckets.get(Bucket, {}).get(Prefix)
-        if key:
-            return {'KeyCount': 1, 'Contents': [{'Key': key}], 'IsTruncated': False}
-        else:
-            return {'KeyCount': 0, 'Contents': [], 'IsTruncated': False}
+        keys = sorted(key for key in self.buckets.get(Bucket, {}) if key.startswith(Prefix))
+        if 'MaxKeys' in kwargs:
+            keys = keys[: kwargs['MaxKeys']]
+        return {
+            'KeyCount': len(keys),
+            'Contents': [{'Key': key} for key in keys],
+            'IsTruncated': False,
+        }
+
+    def delete_objects(self, Bucket, Delete, *args, **kwargs):
+        self.mock_extras.delete_objects(*args, **kwargs)
+        for obj in Delete['Objects']:
+            self.buckets[Bucket].pop(obj['Key'], None)
+
+    def copy_object(self, Bucket, Key, CopySource, *args, **kwargs):
+        self.mock_extras.copy_object(*args, **kwargs)
+        self.buckets[Bucket][Key] = self.buckets[CopySource['Bucket']][CopySource['Key']]
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
         self.buckets[Bucket][Key] = Body.read()
+        return {'ETag': self._etag(Bucket, Key)}
+
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = str(len(self.multipart_uploads))
+        self.multipart_uploads[upload_id] = (Bucket, Key, {})
+        return {'UploadId': upload_id}
+
+    def upload_part(
+        self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs
+    ):  # pylint: disable=unused-argument
+        self.mock_extras.upload_part(*args, **kwargs)
+        self.multipart_uploads[UploadId][2][PartNumber] = Body
+        return {'ETag': '"{}"'.format(hashlib.md5(Body).hexdigest())}
+
+    def complete_multipart_upload(
+        self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs
+    ):  # pylint: disable=unused-argument
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        _, _, parts = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b''.join(
+            parts[part['PartNumber']] for part in MultipartUpload['Parts']
+        )
+        return {'ETag': self._etag(Bucket, Key)}
+
+    def abort_multipart_upload(
+        self, Bucket, Key, UploadId, *args, **kwargs
+    ):  # pylint: disable=unused-argument
+        self.mock_extras.abort_multipart_upload(*args, **kwargs)
+        self.multipart_uploads.pop(UploadId, None)
 
     def get_object(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.get_object(*args, **kwargs)
         if not self.has_object(Bucket, Key):
-            raise ClientError({}, None)
+            raise ClientError(
+                {'Error': {'Code': 'NoSuchKey', 'Message': 'The specified key does not exist.'}},
+                'GetObject',
+            )
 
-        self.mock_extras.get_object(*args, **kwargs)
-        return {'Body': self._get_byte_stream(Bucket, Key)}
+        etag = self._etag(Bucket, Key)
+        if kwargs.get('IfNoneMatch') == etag:
+            raise ClientError({'Error': {'Code': '304', 'Message': 'Not Modified'}}, 'GetObject')
+
+        return {'Body': self._get_byte_stream(Bucket, Key), 'ETag': etag}
 
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
@@ -49,6 +103,9 @@ class S3FakeSession(object):
     def has_object(self, bucket, key):
         return bucket in self.buckets and key in self.buckets[bucket]
 
+    def _etag(self, bucket, key):
+        return '"{}"'.format(hashlib.md5(self.buckets[bucket][key]).hexdigest())
+
     def _get_byte_stream(self, bucket, key):
         return io.BytesIO(self.buckets[bucket][key])
 
@@ -1,9 +1,14 @@
-from dagster import Field, String, SystemStorageData, system_storage
+from dagster import Field, Int, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
+from dagster.core.storage.object_cache import (
+    local_object_cache_config,
+    local_object_cache_from_config,
+)
 from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
 
 from .file_manager import S3FileManager
 from .intermediate_store import S3IntermediateStore
+from .object_store import DEFAULT_MAX_CONCURRENCY, DEFAULT_MULTIPART_CHUNKSIZE
 
 
 @system_storage(
@@ -12,6 +17,20 @@ from .intermediate_store import S3IntermediateStore
     config={
         's3_bucket': Field(String),
         's3_prefix': Field(String, is_optional=True, default_value='dagster'),
+        'multipart_chunksize': Field(
+            Int,
+            is_optional=True,
+            default_value=DEFAULT_MULTIPART_CHUNKSIZE,
+            description='The size in bytes of each part of multipart intermediate uploads. '
+            'Intermediates smaller than this are uploaded in a single request.',
+        ),
+        'max_concurrency': Field(
+            Int,
+            is_optional=True,
+            default_value=DEFAULT_MAX_CONCURRENCY,
+            description='The number of parts of an intermediate uploaded concurrently.',
+        ),
+        'local_cache': local_object_cache_config(),
     },
     required_resource_keys={'s3'},
 )
@@ -34,6 +53,11 @@ def s3_system_storage(init_context):
                 s3_prefix=init_context.system_storage_config['s3_prefix'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+                multipart_chunksize=init_context.system_storage_config['multipart_chunksize'],
+                max_concurrency=init_context.system_storage_config['max_concurrency'],
+                local_cache=local_object_cache_from_config(
+                    init_context.instance, init_context.system_storage_config.get('local_cache')
+                ),
             )
         ),
     )
@@ -2,6 +2,20 @@ import boto3
 from botocore.handlers import disable_signing
 
 
+# HEAD requests carry no body, so a missing key is only reported by its status code
+S3_NOT_FOUND_ERROR_CODES = frozenset(['404', 'NoSuchKey', 'NotFound'])
+
+
+def is_s3_not_found_error(error):
+    '''Whether a botocore ClientError reports that the requested key doesn't exist.'''
+    return error.response.get('Error', {}).get('Code') in S3_NOT_FOUND_ERROR_CODES
+
+
+def is_s3_not_modified_error(error):
+    '''Whether a botocore ClientError reports that a conditional GET matched the given ETag.'''
+    return error.response.get('Error', {}).get('Code') in ('304', 'NotModified')
+
+
 def create_s3_session(signed=True, region_name=None, endpoint_url=None):
     s3 = boto3.resource(  # pylint:disable=C0103
         's3', region_name=region_name, endpoint_url=endpoint_url
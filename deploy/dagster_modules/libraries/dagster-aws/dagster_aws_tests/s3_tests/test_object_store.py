@@ -0,0 +1,187 @@
+import pytest
+from dagster_aws.s3.object_store import S3ObjectStore
+from dagster_aws.s3.s3_fake_resource import S3FakeSession, create_s3_fake_resource
+from dagster_aws.s3.system_storage import s3_plus_default_storage_defs
+
+from dagster import (
+    DagsterInvariantViolationError,
+    InputDefinition,
+    Int,
+    ModeDefinition,
+    OutputDefinition,
+    ResourceDefinition,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    seven,
+)
+from dagster.core.storage.object_cache import LocalObjectCache
+from dagster.core.types.marshal import PickleSerializationStrategy
+
+
+def _request_counts(session):
+    return {
+        name: getattr(session.mock_extras, name).call_count
+        for name in [
+            'head_object',
+            'get_object',
+            'upload_fileobj',
+            'list_objects_v2',
+            'delete_objects',
+        ]
+    }
+
+
+def test_s3_object_store_round_trips():
+    session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=session)
+    strategy = PickleSerializationStrategy()
+
+    object_store.set_object('some/key', 1, serialization_strategy=strategy)
+    object_store.set_object('some/key', 2, serialization_strategy=strategy)
+    assert object_store.get_object('some/key', serialization_strategy=strategy).obj == 2
+    assert object_store.has_object('some/key')
+
+    assert _request_counts(session) == {
+        'head_object': 1,
+        'get_object': 1,
+        'upload_fileobj': 2,
+        'list_objects_v2': 0,
+        'delete_objects': 0,
+    }
+
+
+def test_s3_object_store_spooled_round_trip():
+    session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=session, multipart_chunksize=1024)
+    strategy = PickleSerializationStrategy()
+
+    # Larger than the chunk size, so spooled to disk on the way up and down
+    big_obj = list(range(10000))
+    object_store.set_object('some/key', big_obj, serialization_strategy=strategy)
+    assert object_store.get_object('some/key', serialization_strategy=strategy).obj == big_obj
+
+    assert session.mock_extras.upload_fileobj.call_args[1]['Config'].multipart_chunksize == 1024
+
+
+def test_s3_object_store_local_cache():
+    session = S3FakeSession()
+    strategy = PickleSerializationStrategy()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        # Two object stores sharing a cache directory, like two processes on the same host
+        producer = S3ObjectStore(
+            'some-bucket', s3_session=session, local_cache=LocalObjectCache(temp_dir)
+        )
+        consumer = S3ObjectStore(
+            'some-bucket', s3_session=session, local_cache=LocalObjectCache(temp_dir)
+        )
+
+        producer.set_object('some/key', [1, 2, 3], serialization_strategy=strategy)
+        assert consumer.get_object('some/key', serialization_strategy=strategy).obj == [1, 2, 3]
+        assert consumer.get_object('some/key', serialization_strategy=strategy).obj == [1, 2, 3]
+
+        # The GETs were conditional, and answered from the cache
+        get_calls = session.mock_extras.get_object.call_args_list
+        assert len(get_calls) == 2
+        assert all(call[1]['IfNoneMatch'] for call in get_calls)
+
+        # Objects changed behind the cache's back are downloaded again
+        S3ObjectStore('some-bucket', s3_session=session).set_object(
+            'some/key', [4, 5, 6], serialization_strategy=strategy
+        )
+        assert consumer.get_object('some/key', serialization_strategy=strategy).obj == [4, 5, 6]
+        assert consumer.get_object('some/key', serialization_strategy=strategy).obj == [4, 5, 6]
+
+
+def test_s3_object_store_local_cache_records_uploaded_etag():
+    session = S3FakeSession()
+    strategy = PickleSerializationStrategy()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        object_store = S3ObjectStore(
+            'some-bucket',
+            s3_session=session,
+            multipart_chunksize=1024,
+            max_concurrency=2,
+            local_cache=LocalObjectCache(temp_dir),
+        )
+
+        # Small objects are PUT, large ones uploaded in parts
+        big_obj = list(range(10000))
+        object_store.set_object('small', [1, 2, 3], serialization_strategy=strategy)
+        object_store.set_object('big', big_obj, serialization_strategy=strategy)
+        assert session.mock_extras.put_object.call_count == 1
+        assert session.mock_extras.upload_part.call_count > 1
+        assert session.mock_extras.complete_multipart_upload.call_count == 1
+
+        # The ETags come from the uploads, not from reading the objects back
+        assert session.mock_extras.head_object.call_count == 0
+        assert object_store.get_object('big', serialization_strategy=strategy).obj == big_obj
+        assert session.mock_extras.get_object.call_count == 1
+
+        cache = object_store.local_cache
+        assert (
+            cache.get_etag(object_store.uri_for_key('small'))
+            == session.head_object('some-bucket', 'small')['ETag']
+        )
+
+
+def test_s3_object_store_missing_object():
+    session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=session)
+
+    assert not object_store.has_object('some/key')
+    with pytest.raises(DagsterInvariantViolationError, match='No object found'):
+        object_store.get_object('some/key', serialization_strategy=PickleSerializationStrategy())
+
+
+def test_s3_object_store_prefixed_objects():
+    session = S3FakeSession({'some-bucket': {'some/key/part-0': b'', 'some/key_other': b''}})
+    object_store = S3ObjectStore('some-bucket', s3_session=session)
+
+    assert object_store.has_object('some/key')
+    assert not object_store.has_object('some/ke')
+
+    object_store.rm_object('some/key/part-0')
+    assert not object_store.has_object('some/key')
+
+
+def test_s3_pipeline_request_counts():
+    s3_fake_resource = create_s3_fake_resource()
+
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num', Int)], output_def=OutputDefinition(Int))
+    def add_one(num):
+        return num + 1
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(
+                system_storage_defs=s3_plus_default_storage_defs,
+                resource_defs={'s3': ResourceDefinition.hardcoded_resource(s3_fake_resource)},
+            )
+        ]
+    )
+    def inty_pipeline():
+        add_one(return_one())
+
+    result = execute_pipeline(
+        inty_pipeline,
+        environment_dict={'storage': {'s3': {'config': {'s3_bucket': 'some-bucket'}}}},
+    )
+    assert result.success
+
+    # One upload per output, and a HEAD (checking that the input is available) and a GET per input
+    assert _request_counts(s3_fake_resource.session) == {
+        'head_object': 1,
+        'get_object': 1,
+        'upload_fileobj': 2,
+        'list_objects_v2': 0,
+        'delete_objects': 0,
+    }
+
+    assert result.result_for_solid('add_one').output_value() == 2
@@ -2,7 +2,7 @@ from dagster import check
 from dagster.core.storage.intermediate_store import IntermediateStore
 from dagster.core.storage.type_storage import TypeStoragePluginRegistry
 
-from .object_store import GCSObjectStore
+from .object_store import DEFAULT_CHUNK_SIZE, GCSObjectStore
 
 
 class GCSIntermediateStore(IntermediateStore):
@@ -13,12 +13,16 @@ class GCSIntermediateStore(IntermediateStore):
         client=None,
         type_storage_plugin_registry=None,
         gcs_prefix='dagster',
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        local_cache=None,
     ):
         check.str_param(gcs_bucket, 'gcs_bucket')
         check.str_param(gcs_prefix, 'gcs_prefix')
         check.str_param(run_id, 'run_id')
 
-        object_store = GCSObjectStore(gcs_bucket, client=client)
+        object_store = GCSObjectStore(
+            gcs_bucket, client=client, chunk_size=chunk_size, local_cache=local_cache
+        )
 
         def root_for_run_id(r_id):
             return object_store.key_for_paths([gcs_prefix, 'storage', r_id])
@@ -1,17 +1,41 @@
 import logging
-from io import BytesIO
+from tempfile import SpooledTemporaryFile
 
 from google.cloud import storage
 
-from dagster import check
+from dagster import DagsterInvariantViolationError, check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.storage.object_cache import LocalObjectCache
 from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.marshal import SerializationStrategy
 
 
+# GCS requires the chunks of resumable transfers to be a multiple of 256 KB
+CHUNK_SIZE_MULTIPLE = 256 * 1024
+DEFAULT_CHUNK_SIZE = 32 * CHUNK_SIZE_MULTIPLE
+
+
 class GCSObjectStore(ObjectStore):
-    def __init__(self, bucket, client=None):
+    '''An object store backed by a GCS bucket.
+
+    Objects are serialized to (and deserialized from) a spooled temporary file: objects smaller
+    than chunk_size stay in memory, larger ones overflow to local disk. They are uploaded and
+    downloaded chunk_size bytes at a time, so the serialized bytes never need to be held in memory
+    next to the object itself.
+
+    If a local_cache is given, objects are written through it, and read from it whenever the ETag
+    of the remote object still matches the cached copy.
+    '''
+
+    def __init__(self, bucket, client=None, chunk_size=DEFAULT_CHUNK_SIZE, local_cache=None):
         self.bucket = check.str_param(bucket, 'bucket')
+        self.local_cache = check.opt_inst_param(local_cache, 'local_cache', LocalObjectCache)
+        self.chunk_size = check.int_param(chunk_size, 'chunk_size')
+        check.param_invariant(
+            chunk_size > 0 and chunk_size % CHUNK_SIZE_MULTIPLE == 0,
+            'chunk_size',
+            'chunk_size must be a multiple of {}'.format(CHUNK_SIZE_MULTIPLE),
+        )
         self.client = client or storage.Client()
         self.bucket_obj = self.client.get_bucket(bucket)
         assert self.bucket_obj.exists()
@@ -27,14 +51,15 @@ class GCSObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning('Removing existing GCS key: {key}'.format(key=key))
-            self.rm_object(key)
-
-        with BytesIO() as bytes_io:
-            serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.bucket_obj.blob(key).upload_from_file(bytes_io)
+        # Uploads replace any existing object atomically, so there is no need to check for (and
+        # remove) one first
+        if self.local_cache:
+            self._set_object_through_cache(key, obj, serialization_strategy)
+        else:
+            with SpooledTemporaryFile(max_size=self.chunk_size) as spool:
+                serialization_strategy.serialize(obj, spool)
+                spool.seek(0)
+                self.bucket_obj.blob(key, chunk_size=self.chunk_size).upload_from_file(spool)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -49,11 +74,14 @@ class GCSObjectStore(ObjectStore):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        file_obj = BytesIO()
-        self.bucket_obj.blob(key).download_to_file(file_obj)
-        file_obj.seek(0)
+        if self.local_cache:
+            obj = self._get_object_through_cache(key, serialization_strategy)
+        else:
+            with SpooledTemporaryFile(max_size=self.chunk_size) as spool:
+                self.bucket_obj.blob(key, chunk_size=self.chunk_size).download_to_file(spool)
+                spool.seek(0)
+                obj = serialization_strategy.deserialize(spool)
 
-        obj = serialization_strategy.deserialize(file_obj)
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -63,6 +91,37 @@ class GCSObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def _set_object_through_cache(self, key, obj, serialization_strategy):
+        with self.local_cache.staging_file() as staged_path:
+            serialization_strategy.serialize_to_file(obj, staged_path)
+            blob = self.bucket_obj.blob(key, chunk_size=self.chunk_size)
+            with open(staged_path, 'rb') as f:
+                blob.upload_from_file(f)
+
+            # Uploads update the blob's properties, including its ETag, from the response
+            self.local_cache.add(self.uri_for_key(key), blob.etag, staged_path)
+
+    def _get_object_through_cache(self, key, serialization_strategy):
+        cache_key = self.uri_for_key(key)
+
+        blob = self.bucket_obj.get_blob(key)
+        if blob is None:
+            raise DagsterInvariantViolationError('No object found at {uri}'.format(uri=cache_key))
+
+        if self.local_cache.get_etag(cache_key) == blob.etag:
+            with self.local_cache.open_entry(cache_key, blob.etag) as f:
+                if f is not None:
+                    return serialization_strategy.deserialize(f)
+
+        blob.chunk_size = self.chunk_size
+        with self.local_cache.staging_file() as staged_path:
+            with open(staged_path, 'wb') as f:
+                blob.download_to_file(f)
+            obj = serialization_strategy.deserialize_from_file(staged_path)
+            self.local_cache.add(cache_key, blob.etag, staged_path)
+
+        return obj
+
     def has_object(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
@@ -1,9 +1,14 @@
-from dagster import Field, String, SystemStorageData, system_storage
+from dagster import Field, Int, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
+from dagster.core.storage.object_cache import (
+    local_object_cache_config,
+    local_object_cache_from_config,
+)
 from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
 
 from .file_manager import GCSFileManager
 from .intermediate_store import GCSIntermediateStore
+from .object_store import DEFAULT_CHUNK_SIZE
 
 
 @system_storage(
@@ -12,6 +17,14 @@ from .intermediate_store import GCSIntermediateStore
     config={
         'gcs_bucket': Field(String),
         'gcs_prefix': Field(String, is_optional=True, default_value='dagster'),
+        'chunk_size': Field(
+            Int,
+            is_optional=True,
+            default_value=DEFAULT_CHUNK_SIZE,
+            description='The size in bytes of each chunk of intermediate uploads and downloads. '
+            'Must be a multiple of 256 KB.',
+        ),
+        'local_cache': local_object_cache_config(),
     },
     required_resource_keys={'gcs'},
 )
@@ -34,6 +47,10 @@ def gcs_system_storage(init_context):
                 gcs_prefix=init_context.system_storage_config['gcs_prefix'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+                chunk_size=init_context.system_storage_config['chunk_size'],
+                local_cache=local_object_cache_from_config(
+                    init_context.instance, init_context.system_storage_config.get('local_cache')
+                ),
             )
         ),
     )
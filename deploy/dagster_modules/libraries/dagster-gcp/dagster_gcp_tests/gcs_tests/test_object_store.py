@@ -22,6 +22,10 @@ def test_gcs_object_store(gcs_bucket):
     assert s.has_object(key)
     assert s.get_object(key, ss).obj.read() == test_str
 
+    # Setting an existing key replaces its object
+    s.set_object(key, BytesIO(b'replaced'), ss)
+    assert s.get_object(key, ss).obj.read() == b'replaced'
+
     other_key = 'test-file-%s' % uuid.uuid4().hex
     s.cp_object(key, other_key)
     assert s.has_object(other_key)
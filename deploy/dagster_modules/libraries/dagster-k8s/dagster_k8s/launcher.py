@@ -1,18 +1,43 @@
-from kubernetes import client, config
+import atexit
+import logging
+import sys
+import threading
+import time
+
+from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
+from six.moves import queue
 
 from dagster import Field
 from dagster import __version__ as dagster_version
 from dagster import check
+from dagster.core.definitions.events import EventMetadataEntry
+from dagster.core.errors import DagsterLaunchFailedError
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
 from dagster.core.instance import DagsterInstance
 from dagster.core.launcher import RunLauncher
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.core.storage.pipeline_run import PipelineRun
-from dagster.seven import json
+from dagster.seven import json, urljoin
+from dagster.utils.error import serializable_error_info_from_exc_info
 
 BACKOFF_LIMIT = 4
 
 TTL_SECONDS_AFTER_FINISHED = 100
 
+JOB_NAME_PREFIX = 'dagster-job-'
+
+JOB_LABEL_SELECTOR = 'app.kubernetes.io/name=dagster,app.kubernetes.io/instance=dagster'
+
+# Runs tagged with this tag (with the value 'true') are launched in the worker deployment, if the
+# launcher is configured with one
+REUSE_WORKER_TAG = 'dagster-k8s/reuse_worker'
+
+WATCH_TIMEOUT_SECONDS = 300
+
+WATCH_RETRY_INTERVAL = 5
+
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
     '''RunLauncher that starts a per-run Kubernetes Job.
@@ -40,6 +65,22 @@ class K8sRunLauncher(RunLauncher, ConfigurableClass):
         image_pull_policy (Optional[str]): Allows the image pull policy to be overridden, e.g. to
             enable local testing with kind. Default: ``'Always'``.
         job_namespace (Optional[str]): The namespace into which to launch jobs. Default: "default"
+        max_concurrent_launches (Optional[int]): If set, ``launch_run`` returns as soon as the run
+            is created, and up to this many jobs are created concurrently in the background, so
+            launching many runs (e.g. a backfill) doesn't wait on one Kubernetes API call after
+            another. Runs whose job can't be created are marked as failed. By default, jobs are
+            created synchronously.
+        watch_jobs (Optional[bool]): If ``True``, the jobs launched are watched through a single
+            shared watch on the jobs of the namespace, and runs whose job finishes (or is deleted)
+            before the run does, e.g. because its pod was evicted or its config was invalid, are
+            marked as failed. Default: ``False``.
+        worker_address (Optional[str]): The address of a long lived deployment serving the Dagster
+            GraphQL API (such as the dagit deployment of the Helm chart). Runs tagged with
+            ``dagster-k8s/reuse_worker: true`` are executed by it rather than by a job of their
+            own, saving the time it takes to schedule and start a pod for short runs. Requires the
+            ``worker`` extra, i.e. ``pip install dagster-k8s[worker]``.
+        worker_timeout (Optional[float]): The timeout of the requests made to the worker
+            deployment, in seconds. Default: 30.
     '''
 
     def __init__(
@@ -53,6 +94,10 @@ class K8sRunLauncher(RunLauncher, ConfigurableClass):
         kubeconfig_file=None,
         inst_data=None,
         job_namespace="default",
+        max_concurrent_launches=None,
+        watch_jobs=False,
+        worker_address=None,
+        worker_timeout=30.0,
     ):
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
         self.job_image = check.str_param(job_image, 'job_image')
@@ -61,6 +106,22 @@ class K8sRunLauncher(RunLauncher, ConfigurableClass):
         self.image_pull_policy = check.str_param(image_pull_policy, 'image_pull_policy')
         self.service_account_name = check.str_param(service_account_name, 'service_account_name')
         self.job_namespace = check.str_param(job_namespace, 'job_namespace')
+        self.max_concurrent_launches = check.opt_int_param(
+            max_concurrent_launches, 'max_concurrent_launches'
+        )
+        check.param_invariant(
+            max_concurrent_launches is None or max_concurrent_launches > 0,
+            'max_concurrent_launches',
+        )
+        self.watch_jobs = check.bool_param(watch_jobs, 'watch_jobs')
+        self.worker_address = check.opt_str_param(worker_address, 'worker_address')
+        self.worker_timeout = check.numeric_param(worker_timeout, 'worker_timeout')
+        if self.worker_address:
+            check.invariant(
+                _has_worker_dependencies(),
+                '`worker_address` is set but the requests and dagster-graphql packages it requires '
+                'aren\'t installed. Install them with `pip install dagster-k8s[worker]`.',
+            )
         check.bool_param(load_kubeconfig, 'load_kubeconfig')
         if load_kubeconfig:
             check.str_param(kubeconfig_file, 'kubeconfig_file')
@@ -76,6 +137,13 @@ class K8sRunLauncher(RunLauncher, ConfigurableClass):
 
         self._kube_api = client.BatchV1Api()
 
+        self._lock = threading.Lock()
+        # Event log storages such as SQLite's aren't safe to initialize from several threads
+        self._report_lock = threading.Lock()
+        self._launch_queue = None
+        self._watched_runs = {}
+        self._watch_thread = None
+
     @classmethod
     def config_type(cls):
         return {
@@ -85,6 +153,10 @@ class K8sRunLauncher(RunLauncher, ConfigurableClass):
             'image_pull_secrets': Field(list, is_optional=True),
             'image_pull_policy': Field(str, is_optional=True, default_value='Always'),
             'job_namespace': str,
+            'max_concurrent_launches': Field(int, is_optional=True),
+            'watch_jobs': Field(bool, is_optional=True, default_value=False),
+            'worker_address': Field(str, is_optional=True),
+            'worker_timeout': Field(float, is_optional=True, default_value=30.0),
         }
 
     @classmethod
@@ -164,8 +236,240 @@ class K8sRunLauncher(RunLauncher, ConfigurableClass):
         check.inst_param(instance, 'instance', DagsterInstance)
 
         instance.create_run(run)
-        job = self.construct_job(run)
-        api_response = self._kube_api.create_namespaced_job(body=job, namespace=self.job_namespace)
-        # FIXME add an event here
-        print("Job created. status='%s'" % str(api_response.status))
+
+        if self.max_concurrent_launches:
+            self._start_launch_threads()
+            self._launch_queue.put((instance, run))
+        else:
+            self._launch(instance, run)
+
         return run
+
+    def wait_for_launches(self):
+        '''Blocks until the jobs of every run launched so far have been created.'''
+        if self._launch_queue is not None:
+            self._launch_queue.join()
+
+    def _launch(self, instance, run):
+        if self.worker_address and run.tags.get(REUSE_WORKER_TAG) == 'true':
+            self._launch_in_worker(instance, run)
+            return
+
+        job = self.construct_job(run)
+
+        # Watch the run before creating its job, so that no events of the job are missed
+        if self.watch_jobs:
+            self._watch_run(instance, run)
+
+        try:
+            api_response = self._kube_api.create_namespaced_job(
+                body=job, namespace=self.job_namespace
+            )
+        except Exception:  # pylint: disable=broad-except
+            self._unwatch_run(run.run_id)
+            raise
+
+        self._report_engine_event(
+            instance,
+            run,
+            'Created Kubernetes job {job_name}.'.format(job_name=job.metadata.name),
+            [
+                EventMetadataEntry.text(job.metadata.name, 'Job name'),
+                EventMetadataEntry.text(self.job_namespace, 'Job namespace'),
+                EventMetadataEntry.text(str(api_response.status), 'Job status'),
+            ],
+        )
+
+    def _launch_in_worker(self, instance, run):
+        # deferred import, the worker deployment is optional (see _has_worker_dependencies)
+        import requests
+        from dagster_graphql.client.query import START_PIPELINE_EXECUTION_MUTATION
+        from dagster_graphql.client.util import execution_params_from_pipeline_run
+
+        variables = {'executionParams': execution_params_from_pipeline_run(run).to_graphql_input()}
+        response = requests.post(
+            urljoin(self.worker_address, '/graphql'),
+            json={'query': START_PIPELINE_EXECUTION_MUTATION, 'variables': variables},
+            timeout=self.worker_timeout,
+        )
+        response.raise_for_status()
+        result = response.json()['data']['startPipelineExecution']
+
+        if result['__typename'] != 'StartPipelineExecutionSuccess':
+            raise DagsterLaunchFailedError(
+                'Failed to launch run in worker deployment {address}:\n{result}'.format(
+                    address=self.worker_address, result=result
+                )
+            )
+
+        self._report_engine_event(
+            instance,
+            run,
+            'Launched run in worker deployment {address}.'.format(address=self.worker_address),
+            [EventMetadataEntry.text(self.worker_address, 'Worker address')],
+        )
+
+    def _start_launch_threads(self):
+        with self._lock:
+            if self._launch_queue is not None:
+                return
+
+            self._launch_queue = queue.Queue()
+            for _ in range(self.max_concurrent_launches):
+                thread = threading.Thread(target=self._launch_loop)
+                thread.daemon = True
+                thread.start()
+
+        # Processes such as the backfill CLI exit right after launching their runs
+        atexit.register(self.wait_for_launches)
+
+    def _launch_loop(self):
+        while True:
+            instance, run = self._launch_queue.get()
+            try:
+                self._launch(instance, run)
+            except Exception:  # pylint: disable=broad-except
+                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                try:
+                    self._report_run_failure(
+                        instance,
+                        run,
+                        'Failed to launch run {run_id}.'.format(run_id=run.run_id),
+                        error_info=error_info,
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception(
+                        'Failed to mark run {run_id} as failed'.format(run_id=run.run_id)
+                    )
+            finally:
+                self._launch_queue.task_done()
+
+    def _watch_run(self, instance, run):
+        with self._lock:
+            self._watched_runs[run.run_id] = instance
+            if self._watch_thread is None:
+                self._watch_thread = threading.Thread(target=self._watch_loop)
+                self._watch_thread.daemon = True
+                self._watch_thread.start()
+
+    def _unwatch_run(self, run_id):
+        with self._lock:
+            return self._watched_runs.pop(run_id, None)
+
+    def _watch_loop(self):
+        resource_version = None
+        while True:
+            try:
+                for event in watch.Watch().stream(
+                    self._kube_api.list_namespaced_job,
+                    namespace=self.job_namespace,
+                    label_selector=JOB_LABEL_SELECTOR,
+                    resource_version=resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                ):
+                    if event['type'] == 'ERROR':
+                        # The resource version expired, so list the jobs again
+                        resource_version = None
+                        break
+
+                    resource_version = event['object'].metadata.resource_version
+                    self._handle_job_event(event['type'], event['object'])
+            except ApiException as exc:
+                if exc.status == 410:
+                    resource_version = None
+                else:
+                    logging.exception('Failed to watch Kubernetes jobs')
+                    time.sleep(WATCH_RETRY_INTERVAL)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('Failed to watch Kubernetes jobs')
+                time.sleep(WATCH_RETRY_INTERVAL)
+
+    def _handle_job_event(self, event_type, job):
+        job_name = job.metadata.name
+        if not job_name.startswith(JOB_NAME_PREFIX):
+            return
+
+        run_id = job_name[len(JOB_NAME_PREFIX) :]
+        with self._lock:
+            if run_id not in self._watched_runs:
+                return
+
+        if event_type == 'DELETED':
+            outcome = 'was deleted'
+        elif _job_failed(job):
+            outcome = 'failed'
+        elif job.status and job.status.succeeded:
+            outcome = 'succeeded'
+        else:
+            return
+
+        instance = self._unwatch_run(run_id)
+        if instance is None:
+            return
+
+        # Runs finish before their pod exits, so runs that aren't finished by now never will
+        run = instance.get_run_by_id(run_id)
+        if run is None or run.is_finished:
+            return
+
+        self._report_run_failure(
+            instance,
+            run,
+            'Kubernetes job {job_name} {outcome} before run {run_id} finished.'.format(
+                job_name=job_name, outcome=outcome, run_id=run_id
+            ),
+        )
+
+    def _report_engine_event(self, instance, run, message, metadata_entries):
+        with self._report_lock:
+            instance.handle_new_event(
+                DagsterEventRecord(
+                    message=message,
+                    user_message=message,
+                    level=logging.INFO,
+                    run_id=run.run_id,
+                    timestamp=time.time(),
+                    error_info=None,
+                    pipeline_name=run.pipeline_name,
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ENGINE_EVENT.value,
+                        run.pipeline_name,
+                        message=message,
+                        event_specific_data=EngineEventData(metadata_entries),
+                    ),
+                )
+            )
+
+    def _report_run_failure(self, instance, run, message, error_info=None):
+        with self._report_lock:
+            instance.handle_new_event(
+                DagsterEventRecord(
+                    message=message,
+                    user_message=message,
+                    level=logging.ERROR,
+                    run_id=run.run_id,
+                    timestamp=time.time(),
+                    error_info=error_info,
+                    pipeline_name=run.pipeline_name,
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.PIPELINE_FAILURE.value, run.pipeline_name, message=message
+                    ),
+                )
+            )
+
+
+def _job_failed(job):
+    conditions = (job.status.conditions if job.status else None) or []
+    return any(
+        condition.type == 'Failed' and condition.status == 'True' for condition in conditions
+    )
+
+
+def _has_worker_dependencies():
+    # The packages of the worker extra, only needed to launch runs in the worker deployment
+    try:
+        import requests  # pylint: disable=unused-import
+        import dagster_graphql  # pylint: disable=unused-import
+    except ImportError:
+        return False
+    return True
@@ -0,0 +1,237 @@
+import threading
+import time
+import uuid
+
+import pytest
+from dagster_graphql.client.query import START_PIPELINE_EXECUTION_MUTATION
+from dagster_k8s import launcher
+from dagster_k8s.launcher import REUSE_WORKER_TAG, K8sRunLauncher
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from six.moves import queue
+
+from dagster import check
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+
+
+class FakeBatchApi(object):
+    '''Creates jobs in memory, and streams the events of the jobs of the namespace to FakeWatch.'''
+
+    def __init__(self, fail_run_ids=None, create_delay=0):
+        self.fail_run_ids = fail_run_ids or set()
+        self.create_delay = create_delay
+        self.created_jobs = []
+        self.events = queue.Queue()
+        self.num_watches = 0
+        self._lock = threading.Lock()
+        self._num_creating = 0
+        self.max_num_creating = 0
+
+    def create_namespaced_job(self, body, namespace):
+        with self._lock:
+            self._num_creating += 1
+            self.max_num_creating = max(self.max_num_creating, self._num_creating)
+
+        try:
+            time.sleep(self.create_delay)
+            if body.metadata.name[len('dagster-job-') :] in self.fail_run_ids:
+                raise ApiException(status=403, reason='Forbidden')
+
+            with self._lock:
+                self.created_jobs.append(body)
+            return client.V1Job(metadata=body.metadata, status=client.V1JobStatus())
+        finally:
+            with self._lock:
+                self._num_creating -= 1
+
+    def list_namespaced_job(self, namespace, **kwargs):
+        raise NotImplementedError('Jobs are only watched')
+
+    def send_job_event(self, event_type, run_id, succeeded=None, failed=False):
+        self.events.put(
+            {
+                'type': event_type,
+                'object': client.V1Job(
+                    metadata=client.V1ObjectMeta(
+                        name='dagster-job-{run_id}'.format(run_id=run_id),
+                        resource_version=str(self.events.qsize()),
+                    ),
+                    status=client.V1JobStatus(
+                        succeeded=succeeded,
+                        conditions=[client.V1JobCondition(type='Failed', status='True')]
+                        if failed
+                        else None,
+                    ),
+                ),
+            }
+        )
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    api = FakeBatchApi()
+
+    class FakeWatch(object):
+        def stream(self, func, **_kwargs):
+            assert func == api.list_namespaced_job
+            api.num_watches += 1
+            while True:
+                yield api.events.get()
+
+    monkeypatch.setattr(launcher.config, 'load_incluster_config', lambda: None)
+    monkeypatch.setattr(launcher.client, 'BatchV1Api', lambda: api)
+    monkeypatch.setattr(launcher.watch, 'Watch', FakeWatch)
+    return api
+
+
+def make_run_launcher(**kwargs):
+    return K8sRunLauncher(
+        service_account_name='dagit-admin',
+        instance_config_map='dagster-instance',
+        job_image='dagster-docker-buildkite',
+        job_namespace='dagster-test',
+        **kwargs
+    )
+
+
+def make_run(tags=None):
+    return PipelineRun.create_empty_run('demo_pipeline', uuid.uuid4().hex, tags=tags)
+
+
+def wait_for(condition, timeout=10):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, 'Timed out waiting for condition'
+        time.sleep(0.05)
+
+
+def run_status(instance, run):
+    return instance.get_run_by_id(run.run_id).status
+
+
+def test_launch_run(fake_api):  # pylint: disable=redefined-outer-name
+    instance = DagsterInstance.local_temp()
+    run_launcher = make_run_launcher()
+
+    run = make_run()
+    assert run_launcher.launch_run(instance, run) == run
+
+    assert [job.metadata.name for job in fake_api.created_jobs] == [
+        'dagster-job-{run_id}'.format(run_id=run.run_id)
+    ]
+    assert instance.has_run(run.run_id)
+    assert [record.dagster_event.event_type for record in instance.all_logs(run.run_id)] == [
+        DagsterEventType.ENGINE_EVENT
+    ]
+    assert fake_api.num_watches == 0
+
+    fake_api.fail_run_ids.add('bad')
+    with pytest.raises(ApiException):
+        run_launcher.launch_run(
+            instance, PipelineRun.create_empty_run('demo_pipeline', 'bad', tags=None)
+        )
+
+
+def test_concurrent_launches(fake_api):  # pylint: disable=redefined-outer-name
+    fake_api.create_delay = 0.2
+    instance = DagsterInstance.local_temp()
+    run_launcher = make_run_launcher(max_concurrent_launches=4)
+
+    runs = [make_run() for _ in range(12)]
+    fake_api.fail_run_ids.add(runs[-1].run_id)
+
+    start = time.time()
+    for run in runs:
+        run_launcher.launch_run(instance, run)
+        assert instance.has_run(run.run_id)
+
+    # Launching only creates the runs
+    assert time.time() - start < 12 * fake_api.create_delay
+
+    run_launcher.wait_for_launches()
+
+    assert len(fake_api.created_jobs) == 11
+    assert 1 < fake_api.max_num_creating <= 4
+
+    # Runs whose job couldn't be created fail
+    assert run_status(instance, runs[-1]) == PipelineRunStatus.FAILURE
+    assert all(run_status(instance, run) == PipelineRunStatus.NOT_STARTED for run in runs[:-1])
+
+
+def test_watch_jobs(fake_api):  # pylint: disable=redefined-outer-name
+    instance = DagsterInstance.local_temp()
+    run_launcher = make_run_launcher(watch_jobs=True)
+
+    running, finished, failed, deleted = [make_run() for _ in range(4)]
+    for run in [running, finished, failed, deleted]:
+        run_launcher.launch_run(instance, run)
+
+    # Jobs of runs the launcher didn't launch are ignored
+    other = make_run()
+    instance.create_run(other)
+    fake_api.send_job_event('MODIFIED', other.run_id, failed=True)
+
+    instance.handle_run_event(
+        finished.run_id, DagsterEvent(DagsterEventType.PIPELINE_SUCCESS.value, 'demo_pipeline')
+    )
+    fake_api.send_job_event('ADDED', running.run_id)
+    fake_api.send_job_event('MODIFIED', finished.run_id, succeeded=1)
+    fake_api.send_job_event('MODIFIED', failed.run_id, failed=True)
+    fake_api.send_job_event('DELETED', deleted.run_id)
+
+    wait_for(lambda: fake_api.events.empty())
+    wait_for(lambda: run_status(instance, deleted) == PipelineRunStatus.FAILURE)
+
+    assert fake_api.num_watches == 1
+    assert run_status(instance, failed) == PipelineRunStatus.FAILURE
+    assert run_status(instance, finished) == PipelineRunStatus.SUCCESS
+    assert run_status(instance, running) == PipelineRunStatus.NOT_STARTED
+    assert run_status(instance, other) == PipelineRunStatus.NOT_STARTED
+
+
+def test_reuse_worker(fake_api, monkeypatch):  # pylint: disable=redefined-outer-name
+    import requests
+
+    posted = []
+
+    class FakeResponse(object):
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {
+                'data': {'startPipelineExecution': {'__typename': 'StartPipelineExecutionSuccess'}}
+            }
+
+    def _post(url, **kwargs):
+        posted.append((url, kwargs))
+        return FakeResponse()
+
+    monkeypatch.setattr(requests, 'post', _post)
+
+    instance = DagsterInstance.local_temp()
+    run_launcher = make_run_launcher(worker_address='http://dagit:80')
+
+    run = make_run(tags={REUSE_WORKER_TAG: 'true'})
+    run_launcher.launch_run(instance, run)
+    run_launcher.launch_run(instance, make_run())
+
+    assert [url for url, _ in posted] == ['http://dagit:80/graphql']
+    assert 'params' not in posted[0][1]
+    assert posted[0][1]['json']['query'] == START_PIPELINE_EXECUTION_MUTATION
+    assert (
+        posted[0][1]['json']['variables']['executionParams']['executionMetadata']['runId']
+        == run.run_id
+    )
+    assert len(fake_api.created_jobs) == 1
+
+
+def test_worker_address_requires_worker_dependencies(monkeypatch):
+    monkeypatch.setattr(launcher, '_has_worker_dependencies', lambda: False)
+
+    with pytest.raises(check.CheckError, match=r'dagster-k8s\[worker\]'):
+        make_run_launcher(worker_address='http://dagit:80')
+
+    make_run_launcher()
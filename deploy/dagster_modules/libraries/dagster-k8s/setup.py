@@ -38,6 +38,7 @@ def _do_setup(name='dagster-k8s'):
         ],
         packages=find_packages(exclude=['test']),
         install_requires=['dagster', 'kubernetes'],
+        extras_require={'worker': ['dagster-graphql', 'requests']},
         tests_require=[],
         zip_safe=False,
     )
@@ -1,3 +1,4 @@
 from .data_frame import DataFrame
+from .streaming import DataFrameChunks, DataFrameIterator
 
-__all__ = ['DataFrame']
+__all__ = ['DataFrame', 'DataFrameChunks', 'DataFrameIterator']
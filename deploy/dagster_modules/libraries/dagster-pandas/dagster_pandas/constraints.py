@@ -1,7 +1,11 @@
+import numpy as np
 from pandas import DataFrame
 
 from dagster import check
 
+# The number of offending rows included in a column constraint violation
+MAX_OFFENDING_ROWS = 10
+
 
 class ConstraintViolationException(Exception):
     pass
@@ -17,11 +21,19 @@ class DataFrameConstraintViolationException(ConstraintViolationException):
 
 
 class ColumnConstraintViolationException(ConstraintViolationException):
-    def __init__(self, constraint_name, constraint_description, column_name, offending_rows=None):
+    def __init__(
+        self,
+        constraint_name,
+        constraint_description,
+        column_name,
+        offending_rows=None,
+        num_offending_rows=None,
+    ):
         self.constraint_name = constraint_name
         self.constraint_description = constraint_description
         self.column_name = column_name
         self.offending_rows = offending_rows
+        self.num_offending_rows = num_offending_rows
         super(ColumnConstraintViolationException, self).__init__(self.construct_message())
 
     def construct_message(self):
@@ -31,9 +43,12 @@ class ColumnConstraintViolationException(ConstraintViolationException):
             column_name=self.column_name,
         )
         if self.offending_rows is not None:
-            base_message += "The offending (index, row values) are the following: {}".format(
-                self.offending_rows
-            )
+            is_truncated = (self.num_offending_rows or 0) > len(self.offending_rows)
+            if is_truncated:
+                base_message += "{} rows are offending, the first ".format(self.num_offending_rows)
+            else:
+                base_message += "The offending "
+            base_message += "(index, row values) are the following: {}".format(self.offending_rows)
         return base_message
 
 
@@ -125,12 +140,44 @@ class ColumnConstraint(Constraint):
             error_description=error_description, markdown_description=markdown_description
         )
 
+    # Whether a row's validity only depends on its own value, so that the constraint can be
+    # evaluated on chunks of a column independently
+    is_row_wise = True
+
     def validate(self, dataframe, column_name):
-        pass
+        column = dataframe[column_name]
+        mask = self.offending_rows_mask(column)
+        if mask is not None and mask.any():
+            offending_positions = np.flatnonzero(np.asarray(mask))
+            raise self.violation(
+                column,
+                column_name,
+                offending_positions[:MAX_OFFENDING_ROWS],
+                len(offending_positions),
+            )
+
+    def offending_rows_mask(self, column):
+        '''A boolean mask of the values of the column (a pandas Series) that violate the
+        constraint, or None if the constraint isn't checked row by row.'''
+        return None
+
+    def violation(self, column, column_name, offending_positions, num_offending_rows):
+        '''The exception reporting that the rows of the column at the given (integer) positions
+        violate the constraint.'''
+        return ColumnConstraintViolationException(
+            constraint_name=self.name,
+            constraint_description=self.error_description,
+            column_name=column_name,
+            offending_rows=self.get_offending_row_pairs(
+                column.iloc[offending_positions].to_frame(column_name), column_name
+            ),
+            num_offending_rows=num_offending_rows,
+        )
 
     @staticmethod
-    def get_offending_row_pairs(dataframe, column_name):
-        return zip(dataframe.index.tolist(), dataframe[column_name].tolist())
+    def get_offending_row_pairs(dataframe, column_name, limit=MAX_OFFENDING_ROWS):
+        offending_rows = dataframe[column_name].head(limit)
+        return list(zip(offending_rows.index.tolist(), offending_rows.tolist()))
 
 
 class ColumnExistsConstraint(ColumnConstraint):
@@ -180,15 +227,8 @@ class NonNullableColumnConstraint(ColumnConstraint):
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_null_columns = dataframe[dataframe[column_name].isna()]
-        if not rows_with_null_columns.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=self.get_offending_row_pairs(rows_with_null_columns, column_name),
-            )
+    def offending_rows_mask(self, column):
+        return column.isna()
 
 
 class UniqueColumnConstraint(ColumnConstraint):
@@ -198,15 +238,11 @@ class UniqueColumnConstraint(ColumnConstraint):
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_duplicated_values = dataframe[dataframe[column_name].duplicated()]
-        if not rows_with_duplicated_values.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_duplicated_values,
-            )
+    # Whether a value is a duplicate depends on every row that precedes it
+    is_row_wise = False
+
+    def offending_rows_mask(self, column):
+        return column.duplicated()
 
 
 class CategoricalColumnConstraint(ColumnConstraint):
@@ -218,15 +254,8 @@ class CategoricalColumnConstraint(ColumnConstraint):
             markdown_description="Category examples are {}...".format(self.categories[:5]),
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_unexpected_buckets = dataframe[~dataframe[column_name].isin(self.categories)]
-        if not rows_with_unexpected_buckets.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_unexpected_buckets,
-            )
+    def offending_rows_mask(self, column):
+        return ~column.isin(self.categories)
 
 
 class MinValueColumnConstraint(ColumnConstraint):
@@ -237,15 +266,8 @@ class MinValueColumnConstraint(ColumnConstraint):
             error_description="Column must have values > {}".format(self.min_value),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[dataframe[column_name] < self.min_value]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def offending_rows_mask(self, column):
+        return column < self.min_value
 
 
 class MaxValueColumnConstraint(ColumnConstraint):
@@ -256,15 +278,8 @@ class MaxValueColumnConstraint(ColumnConstraint):
             error_description="Column must have values < {}".format(self.max_value),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[dataframe[column_name] > self.max_value]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def offending_rows_mask(self, column):
+        return column > self.max_value
 
 
 class InRangeColumnConstraint(ColumnConstraint):
@@ -278,14 +293,5 @@ class InRangeColumnConstraint(ColumnConstraint):
             ),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[
-            ~dataframe[column_name].between(self.min_value, self.max_value)
-        ]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def offending_rows_mask(self, column):
+        return ~column.between(self.min_value, self.max_value)
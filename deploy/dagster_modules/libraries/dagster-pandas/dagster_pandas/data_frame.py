@@ -1,9 +1,16 @@
+import hashlib
+import json
+import os
+import warnings
+from enum import Enum
+
 import pandas as pd
 from dagster_pandas.constraints import (
     ColumnExistsConstraint,
     ColumnTypeConstraint,
     ConstraintViolationException,
 )
+from dagster_pandas.storage import DataFrameArrowStoragePlugin
 from dagster_pandas.validation import PandasColumn, validate_collection_schema
 
 from dagster import (
@@ -81,19 +88,119 @@ def dataframe_input_schema(_context, file_type, file_options):
         )
 
 
-def df_type_check(value):
-    if not isinstance(value, pd.DataFrame):
-        return TypeCheck(success=False)
-    return TypeCheck(
-        success=True,
-        metadata_entries=[
-            EventMetadataEntry.text(str(len(value)), 'row_count', 'Number of rows in DataFrame'),
-            # string cast columns since they may be things like datetime
-            EventMetadataEntry.json({'columns': list(map(str, value.columns))}, 'metadata'),
-        ],
+class DataFrameSummaryLevel(Enum):
+    '''How much metadata about a DataFrame is attached to the events of its type checks.'''
+
+    NONE = 'none'
+    SHAPE = 'shape'
+    SCHEMA_HASH = 'schema_hash'
+    FULL = 'full'
+
+
+# Overrides the summary level of the PandasDataFrame type check, e.g. for very wide frames
+SUMMARY_LEVEL_ENV_VAR = 'DAGSTER_PANDAS_SUMMARY_LEVEL'
+
+# The number of column names listed by a full summary
+MAX_SUMMARY_COLUMNS = 100
+
+
+_SUMMARY_LEVELS_BY_VALUE = {}
+
+
+def _summary_level_for_value(value):
+    # Parsed once per value, so that an invalid value only warns once
+    if value not in _SUMMARY_LEVELS_BY_VALUE:
+        try:
+            _SUMMARY_LEVELS_BY_VALUE[value] = DataFrameSummaryLevel(value.strip().lower())
+        except ValueError:
+            warnings.warn(
+                'Invalid value "{value}" for {env_var}, using "{default}". Must be one of: '
+                '{levels}'.format(
+                    value=value,
+                    env_var=SUMMARY_LEVEL_ENV_VAR,
+                    default=DataFrameSummaryLevel.FULL.value,
+                    levels=', '.join(level.value for level in DataFrameSummaryLevel),
+                )
+            )
+            _SUMMARY_LEVELS_BY_VALUE[value] = DataFrameSummaryLevel.FULL
+
+    return _SUMMARY_LEVELS_BY_VALUE[value]
+
+
+def get_default_summary_level():
+    '''The summary level set by the DAGSTER_PANDAS_SUMMARY_LEVEL environment variable, or FULL if
+    it is unset or invalid.'''
+    return _summary_level_for_value(
+        os.getenv(SUMMARY_LEVEL_ENV_VAR, DataFrameSummaryLevel.FULL.value)
     )
 
 
+def get_schema_hash(df):
+    '''A stable hash of the column names and dtypes of a DataFrame.'''
+    check.inst_param(df, 'df', pd.DataFrame)
+    return hashlib.sha1(
+        json.dumps([list(map(str, df.columns)), list(map(str, df.dtypes.values))]).encode('utf-8')
+    ).hexdigest()
+
+
+def _summary_metadata_entries(value, summary_level, max_summary_columns):
+    if summary_level == DataFrameSummaryLevel.NONE:
+        return []
+
+    row_count = EventMetadataEntry.text(str(len(value)), 'row_count', 'Number of rows in DataFrame')
+
+    if summary_level == DataFrameSummaryLevel.FULL:
+        # string cast columns since they may be things like datetime
+        metadata = {'columns': list(map(str, value.columns[:max_summary_columns]))}
+        if len(value.columns) > max_summary_columns:
+            metadata['num_columns'] = len(value.columns)
+            metadata['truncated'] = True
+        return [row_count, EventMetadataEntry.json(metadata, 'metadata')]
+
+    entries = [
+        row_count,
+        EventMetadataEntry.text(
+            str(len(value.columns)), 'column_count', 'Number of columns in DataFrame'
+        ),
+    ]
+    if summary_level == DataFrameSummaryLevel.SCHEMA_HASH:
+        entries.append(
+            EventMetadataEntry.text(
+                get_schema_hash(value), 'schema_hash', 'Hash of the column names and dtypes'
+            )
+        )
+    return entries
+
+
+def create_dataframe_type_check(summary_level=None, max_summary_columns=MAX_SUMMARY_COLUMNS):
+    '''Builds a type check for pandas DataFrames that summarizes them at the given level.
+
+    Args:
+        summary_level (Optional[DataFrameSummaryLevel]): The metadata to attach to type checks:
+            nothing, the shape of the frame, its shape and schema hash, or its shape and column
+            names. Defaults to the value of the DAGSTER_PANDAS_SUMMARY_LEVEL environment variable
+            at the time of the type check, or to a full summary.
+        max_summary_columns (Optional[int]): The number of column names listed by a full summary.
+    '''
+    check.opt_inst_param(summary_level, 'summary_level', DataFrameSummaryLevel)
+    check.int_param(max_summary_columns, 'max_summary_columns')
+
+    def _df_type_check(value):
+        if not isinstance(value, pd.DataFrame):
+            return TypeCheck(success=False)
+        return TypeCheck(
+            success=True,
+            metadata_entries=_summary_metadata_entries(
+                value, summary_level or get_default_summary_level(), max_summary_columns
+            ),
+        )
+
+    return _df_type_check
+
+
+df_type_check = create_dataframe_type_check()
+
+
 DataFrame = as_dagster_type(
     pd.DataFrame,
     name='PandasDataFrame',
@@ -102,6 +209,7 @@ DataFrame = as_dagster_type(
     See http://pandas.pydata.org/''',
     input_hydration_config=dataframe_input_schema,
     output_materialization_config=dataframe_output_schema,
+    auto_plugins=[DataFrameArrowStoragePlugin],
     type_check=df_type_check,
 )
 
@@ -149,9 +257,19 @@ def create_dagster_pandas_dataframe_description(description, columns):
 
 
 def create_dagster_pandas_dataframe_type(
-    name=None, description=None, columns=None, event_metadata_fn=None, dataframe_constraints=None
+    name=None,
+    description=None,
+    columns=None,
+    event_metadata_fn=None,
+    dataframe_constraints=None,
+    validation_sample_size=None,
+    validation_chunk_size=None,
+    summary_level=None,
 ):
     event_metadata_fn = check.opt_callable_param(event_metadata_fn, 'event_metadata_fn')
+    check.opt_inst_param(summary_level, 'summary_level', DataFrameSummaryLevel)
+    check.opt_int_param(validation_sample_size, 'validation_sample_size')
+    check.opt_int_param(validation_chunk_size, 'validation_chunk_size')
     description = create_dagster_pandas_dataframe_description(
         check.opt_str_param(description, 'description', default=''),
         check.opt_list_param(columns, 'columns', of_type=PandasColumn),
@@ -169,22 +287,31 @@ def create_dagster_pandas_dataframe_type(
         if columns is not None:
             try:
                 validate_collection_schema(
-                    columns, value, dataframe_constraints=dataframe_constraints
+                    columns,
+                    value,
+                    dataframe_constraints=dataframe_constraints,
+                    sample_size=validation_sample_size,
+                    chunk_size=validation_chunk_size,
                 )
             except ConstraintViolationException as e:
                 return TypeCheck(success=False, description=str(e))
 
-        return TypeCheck(
-            success=True,
-            metadata_entries=_execute_summary_stats(name, value, event_metadata_fn)
-            if event_metadata_fn
-            else None,
-        )
+        metadata_entries = []
+        if summary_level:
+            metadata_entries += _summary_metadata_entries(value, summary_level, MAX_SUMMARY_COLUMNS)
+        if event_metadata_fn:
+            metadata_entries += _execute_summary_stats(name, value, event_metadata_fn)
+
+        return TypeCheck(success=True, metadata_entries=metadata_entries or None)
 
     # add input_hydration_confign and output_materialization_config
     # https://github.com/dagster-io/dagster/issues/2027
     return RuntimeType(
-        name=name, key=name, type_check_fn=_dagster_type_check, description=description
+        name=name,
+        key=name,
+        type_check_fn=_dagster_type_check,
+        description=description,
+        auto_plugins=[DataFrameArrowStoragePlugin],
     )
 
 
@@ -0,0 +1,201 @@
+import pickle
+
+import six
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.context.system import SystemStepExecutionContext
+from dagster.core.storage.intermediate_store import IntermediateStore
+from dagster.core.storage.type_storage import TypeStoragePlugin
+from dagster.core.types.marshal import SerializationStrategy
+from dagster.utils import PICKLE_PROTOCOL
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+# Every file in the Arrow IPC file format (a.k.a. Feather V2) starts with these bytes
+ARROW_MAGIC = b'ARROW1'
+
+# The key of the metadata of a solid mapping the names of its DataFrame inputs to the columns it
+# reads from them
+PROJECTED_COLUMNS_METADATA_KEY = 'dagster_pandas/projected_columns'
+
+
+def _is_arrow_compatible(df):
+    # Arrow coerces column names to strings, so anything else wouldn't round trip
+    return all(isinstance(column, six.string_types) for column in df.columns)
+
+
+class ArrowSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes pandas DataFrames to the Arrow IPC file format.
+
+    Local files are memory mapped when read, so that only the pages backing the requested columns
+    are ever read from disk. Those columns are still copied into the DataFrame that is returned,
+    since pandas can't use the Arrow buffers in place. DataFrames that Arrow can't represent
+    faithfully (non-string column names, object columns holding arbitrary Python objects) are
+    pickled instead.
+
+    Args:
+        columns (Optional[List[str]]): If set, only these columns (and the index) are
+            deserialized. Pickled DataFrames are projected to them once they are unpickled.
+    '''
+
+    def __init__(self, name='arrow', columns=None):
+        check.invariant(pyarrow is not None, 'ArrowSerializationStrategy requires pyarrow')
+        self.columns = check.opt_list_param(columns, 'columns', of_type=str)
+        super(ArrowSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        table = None
+        if _is_arrow_compatible(value):
+            try:
+                table = pyarrow.Table.from_pandas(value)
+            except (pyarrow.ArrowException, TypeError, ValueError):
+                pass
+
+        if table is None:
+            pickle.dump(value, write_file_obj, PICKLE_PROTOCOL)
+            return
+
+        writer = pyarrow.ipc.new_file(write_file_obj, table.schema)
+        try:
+            writer.write_table(table)
+        finally:
+            writer.close()
+
+    def deserialize(self, read_file_obj):
+        magic = read_file_obj.read(len(ARROW_MAGIC))
+        read_file_obj.seek(0)
+
+        if magic != ARROW_MAGIC:
+            return self._project_unpickled(pickle.load(read_file_obj))
+
+        return self._table_to_pandas(pyarrow.ipc.open_file(read_file_obj).read_all())
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        with open(read_path, self.read_mode) as read_obj:
+            if read_obj.read(len(ARROW_MAGIC)) != ARROW_MAGIC:
+                read_obj.seek(0)
+                return self._project_unpickled(pickle.load(read_obj))
+
+        # Reading the table of a memory mapped file doesn't read its buffers, so the pages backing
+        # columns that get projected away are never read from disk
+        with pyarrow.memory_map(read_path) as source:
+            return self._table_to_pandas(pyarrow.ipc.open_file(source).read_all())
+
+    def _check_columns_exist(self, column_names):
+        missing_columns = [column for column in self.columns if column not in column_names]
+        if missing_columns:
+            raise DagsterInvariantViolationError(
+                'Columns {missing_columns} can\'t be projected from a stored DataFrame with columns '
+                '{column_names}.'.format(
+                    missing_columns=missing_columns, column_names=list(column_names)
+                )
+            )
+
+    def _project_unpickled(self, value):
+        if not self.columns:
+            return value
+
+        self._check_columns_exist(value.columns)
+        return value[self.columns]
+
+    def _table_to_pandas(self, table):
+        if self.columns:
+            self._check_columns_exist(table.schema.names)
+            index_columns = [
+                column
+                for column in (table.schema.pandas_metadata or {}).get('index_columns', [])
+                # RangeIndexes are stored as metadata rather than as a column
+                if isinstance(column, six.string_types)
+            ]
+            table = table.select(self.columns + index_columns)
+
+        return table.to_pandas()
+
+
+def _projected_columns_for_step(context, paths):
+    # The columns the solid of the step being executed reads from the intermediate at paths, if
+    # its metadata projects the input the intermediate is loaded into
+    if not isinstance(context, SystemStepExecutionContext):
+        return None
+
+    projected_columns = context.solid_def.metadata.get(PROJECTED_COLUMNS_METADATA_KEY)
+    if not projected_columns:
+        return None
+
+    check.dict_param(
+        projected_columns, PROJECTED_COLUMNS_METADATA_KEY, key_type=str, value_type=list
+    )
+    for step_input in context.step.step_inputs:
+        for handle in step_input.source_handles:
+            source_paths = IntermediateStore.paths_for_intermediate(
+                handle.step_key, handle.output_name
+            )
+            if paths == source_paths:
+                return projected_columns.get(step_input.name)
+
+    return None
+
+
+class DataFrameArrowStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    '''Stores pandas DataFrame intermediates in the Arrow IPC format rather than pickling them,
+    for any persistent system storage backed by an object store. Does nothing if pyarrow isn't
+    installed.
+
+    A solid only loads some columns of its DataFrame inputs if its metadata maps their names to
+    the columns to load under PROJECTED_COLUMNS_METADATA_KEY, e.g.:
+
+    .. code-block:: python
+
+        @solid(
+            input_defs=[InputDefinition('df', DataFrame)],
+            metadata={PROJECTED_COLUMNS_METADATA_KEY: {'df': ['num1']}},
+        )
+        def sum_num1(_, df):
+            return df['num1'].sum()
+    '''
+
+    projected_columns = None
+
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        return pyarrow is not None and system_storage_def.is_persistent
+
+    @classmethod
+    def set_object(cls, intermediate_store, obj, _context, _runtime_type, paths):
+        return intermediate_store.object_store.set_object(
+            intermediate_store.key_for_paths(paths),
+            obj,
+            serialization_strategy=ArrowSerializationStrategy(),
+        )
+
+    @classmethod
+    def serialization_strategy_for_type(cls, _runtime_type):
+        return ArrowSerializationStrategy() if pyarrow is not None else None
+
+    @classmethod
+    def get_object(cls, intermediate_store, context, _runtime_type, paths):
+        columns = _projected_columns_for_step(context, paths) or cls.projected_columns
+        return intermediate_store.object_store.get_object(
+            intermediate_store.key_for_paths(paths),
+            serialization_strategy=ArrowSerializationStrategy(columns=columns),
+        )
+
+
+def projected_arrow_storage_plugin(columns):
+    '''A DataFrameArrowStoragePlugin that only reads the given columns back from storage, for every
+    input of the types it is registered for. Solids project their own inputs with
+    PROJECTED_COLUMNS_METADATA_KEY instead.'''
+    check.list_param(columns, 'columns', of_type=str)
+
+    return type(
+        'ProjectedDataFrameArrowStoragePlugin',
+        (DataFrameArrowStoragePlugin,),
+        {'projected_columns': columns},
+    )
@@ -0,0 +1,188 @@
+import pandas as pd
+
+from dagster import (
+    DagsterInvariantViolationError,
+    Field,
+    Int,
+    Materialization,
+    Path,
+    Permissive,
+    RuntimeType,
+    String,
+    TypeCheck,
+    check,
+)
+from dagster.config.field_utils import Selector
+from dagster.core.types.config_schema import input_selector_schema, output_selector_schema
+from dagster.seven.abc import Iterable, Iterator
+
+DEFAULT_CHUNKSIZE = 100000
+
+
+def _iter_csv(path, sep, chunksize, dtype):
+    reader = pd.read_csv(path, sep=sep, chunksize=chunksize, dtype=dtype)
+    try:
+        for chunk in reader:
+            yield chunk
+    finally:
+        reader.close()
+
+
+def _iter_parquet(path, columns):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    for i in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(i, columns=columns).to_pandas()
+
+
+class DataFrameChunks(object):
+    '''A lazily read sequence of pandas DataFrames backed by a CSV, TSV or Parquet file.
+
+    Nothing is read until the chunks are iterated over, and only one chunk is held in memory at a
+    time. Unlike a bare iterator, DataFrameChunks can be iterated over any number of times (each
+    iteration reopens the file) and can be pickled, so it can be passed between solids with any
+    system storage.
+
+    Args:
+        file_type (str): One of 'csv', 'table' (tab separated) or 'parquet'.
+        path (str): The path of the file to read.
+        sep (Optional[str]): The delimiter of a CSV file.
+        chunksize (Optional[int]): The number of rows of each chunk of a CSV or TSV file. Parquet
+            files are read one row group at a time.
+        dtype (Optional[Dict[str, str]]): The dtypes of the columns of a CSV or TSV file. Giving
+            them avoids inferring them (possibly inconsistently) for every chunk.
+        columns (Optional[List[str]]): The columns to read from a Parquet file.
+    '''
+
+    def __init__(self, file_type, path, sep=',', chunksize=None, dtype=None, columns=None):
+        self.file_type = check.str_param(file_type, 'file_type')
+        check.param_invariant(file_type in ('csv', 'table', 'parquet'), 'file_type')
+        self.path = check.str_param(path, 'path')
+        self.sep = '\t' if file_type == 'table' else check.str_param(sep, 'sep')
+        self.chunksize = check.opt_int_param(chunksize, 'chunksize') or DEFAULT_CHUNKSIZE
+        self.dtype = check.opt_dict_param(dtype, 'dtype', key_type=str) or None
+        self.columns = check.opt_nullable_list_param(columns, 'columns', of_type=str)
+
+    def __iter__(self):
+        if self.file_type == 'parquet':
+            return _iter_parquet(self.path, self.columns)
+        return _iter_csv(self.path, self.sep, self.chunksize, self.dtype)
+
+
+_CSV_INPUT_CONFIG = {
+    'path': Path,
+    'chunksize': Field(Int, is_optional=True, default_value=DEFAULT_CHUNKSIZE),
+    'dtype': Field(
+        Permissive(), is_optional=True, description='The dtype of each column, keyed by its name.'
+    ),
+}
+
+
+@input_selector_schema(
+    Selector(
+        {
+            'csv': dict(_CSV_INPUT_CONFIG, sep=Field(String, is_optional=True, default_value=',')),
+            'parquet': {'path': Path, 'columns': Field([String], is_optional=True)},
+            'table': _CSV_INPUT_CONFIG,
+        },
+    )
+)
+def dataframe_iterator_input_schema(_context, file_type, file_options):
+    check.str_param(file_type, 'file_type')
+    check.dict_param(file_options, 'file_options')
+
+    if file_type not in ('csv', 'table', 'parquet'):
+        raise DagsterInvariantViolationError(
+            'Unsupported file_type {file_type}'.format(file_type=file_type)
+        )
+
+    return DataFrameChunks(file_type, **file_options)
+
+
+def _write_csv_chunks(path, sep, chunks):
+    with open(path, 'w') as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, sep=sep, index=False, header=i == 0)
+
+
+def _write_parquet_chunks(path, chunks):
+    import pyarrow
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            # Each chunk becomes a row group, so the file can be read back chunk by chunk
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        pd.DataFrame().to_parquet(path)
+
+
+@output_selector_schema(
+    Selector(
+        {
+            'csv': {'path': Path, 'sep': Field(String, is_optional=True, default_value=',')},
+            'parquet': {'path': Path},
+            'table': {'path': Path},
+        },
+    )
+)
+def dataframe_iterator_output_schema(_context, file_type, file_options, chunks):
+    check.str_param(file_type, 'file_type')
+    check.dict_param(file_options, 'file_options')
+
+    if file_type == 'csv':
+        _write_csv_chunks(file_options['path'], file_options['sep'], chunks)
+    elif file_type == 'parquet':
+        _write_parquet_chunks(file_options['path'], chunks)
+    elif file_type == 'table':
+        _write_csv_chunks(file_options['path'], '\t', chunks)
+    else:
+        check.failed('Unsupported file_type {file_type}'.format(file_type=file_type))
+
+    return Materialization.file(file_options['path'])
+
+
+def dataframe_iterator_type_check(value):
+    if isinstance(value, pd.DataFrame) or not isinstance(value, Iterable):
+        return TypeCheck(
+            success=False,
+            description='Must be an iterable of pandas.DataFrame. Got value of type {type_name}'.format(
+                type_name=type(value).__name__
+            ),
+        )
+
+    # An output may be iterated over by its materializations and by every solid consuming it, so
+    # a one-shot iterator would silently be exhausted by the first of them
+    if isinstance(value, Iterator):
+        return TypeCheck(
+            success=False,
+            description=(
+                'Must be re-iterable, such as a list or DataFrameChunks, not an iterator. Got '
+                'value of type {type_name}'.format(type_name=type(value).__name__)
+            ),
+        )
+
+    return TypeCheck(success=True)
+
+
+DataFrameIterator = RuntimeType(
+    name='PandasDataFrameIterator',
+    key='PandasDataFrameIterator',
+    description='''An iterable of pandas DataFrames, read and written one chunk at a time so that
+    inputs and outputs larger than memory can be processed. Inputs hydrated from config are
+    DataFrameChunks; outputs may be any iterable of DataFrames that can be iterated over more than
+    once, such as a list or an object whose __iter__ yields the chunks, but not a generator (only
+    DataFrameChunks can be pickled for persistent system storage).''',
+    type_check_fn=dataframe_iterator_type_check,
+    input_hydration_config=dataframe_iterator_input_schema,
+    output_materialization_config=dataframe_iterator_output_schema,
+)
@@ -1,5 +1,9 @@
+import numpy as np
+import six
 from dagster_pandas.constraints import (
+    MAX_OFFENDING_ROWS,
     CategoricalColumnConstraint,
+    ColumnConstraint,
     ColumnExistsConstraint,
     ColumnTypeConstraint,
     Constraint,
@@ -25,6 +29,14 @@ _CONFIGURABLE_CONSTRAINTS = {
 PANDAS_NUMERIC_TYPES = {'int64', 'float'}
 
 
+def _is_mask_constraint(constraint):
+    # Column constraints that don't override validate are fully described by their
+    # offending_rows_mask, so they can be evaluated together with the column's other constraints
+    return isinstance(constraint, ColumnConstraint) and six.get_unbound_function(
+        type(constraint).validate
+    ) is six.get_unbound_function(ColumnConstraint.validate)
+
+
 class PandasColumn:
     def __init__(self, name, constraints=None):
         self.name = check.str_param(name, 'name')
@@ -32,9 +44,49 @@ class PandasColumn:
             constraints, 'constraints', of_type=Constraint
         )
 
-    def validate(self, dataframe):
+    def validate(self, dataframe, chunk_size=None):
+        '''Validates the column of the dataframe against all of its constraints, in order.
+
+        The column is fetched once and every constraint defined by an offending rows mask is
+        evaluated against it. If chunk_size is set, the row-wise constraints are all evaluated on
+        one chunk of the column before moving on to the next, which bounds the size of the
+        intermediate masks.
+
+        Only a bounded sample of the offending rows is ever materialized.
+        '''
+        check.opt_int_param(chunk_size, 'chunk_size')
+
+        column = None
+        chunked_violations = {}
         for constraint in self.constraints:
-            constraint.validate(dataframe, self.name)
+            if not _is_mask_constraint(constraint):
+                constraint.validate(dataframe, self.name)
+                continue
+
+            # Fetched on the first mask constraint, so that the existence of the column is
+            # checked first as before
+            if column is None:
+                column = dataframe[self.name]
+                if chunk_size:
+                    chunked_violations = _find_chunked_violations(
+                        column,
+                        [c for c in self.constraints if _is_mask_constraint(c) and c.is_row_wise],
+                        chunk_size,
+                    )
+
+            if constraint in chunked_violations:
+                offending_positions, num_offending_rows = chunked_violations[constraint]
+            else:
+                mask = constraint.offending_rows_mask(column)
+                if mask is None or not mask.any():
+                    continue
+                offending_positions = np.flatnonzero(np.asarray(mask))
+                num_offending_rows = len(offending_positions)
+
+            if num_offending_rows:
+                raise constraint.violation(
+                    column, self.name, offending_positions[:MAX_OFFENDING_ROWS], num_offending_rows
+                )
 
     @staticmethod
     def add_configurable_constraints(constraints, **kwargs):
@@ -134,7 +186,49 @@ class PandasColumn:
         )
 
 
-def validate_collection_schema(collection_schema, dataframe, dataframe_constraints=None):
+def _find_chunked_violations(column, constraints, chunk_size):
+    offending_positions = {constraint: [] for constraint in constraints}
+    num_offending_rows = {constraint: 0 for constraint in constraints}
+
+    for start in range(0, len(column), chunk_size):
+        chunk = column.iloc[start : start + chunk_size]
+        for constraint in constraints:
+            mask = constraint.offending_rows_mask(chunk)
+            if mask is None or not mask.any():
+                continue
+
+            chunk_positions = np.flatnonzero(np.asarray(mask))
+            num_offending_rows[constraint] += len(chunk_positions)
+            num_missing = MAX_OFFENDING_ROWS - len(offending_positions[constraint])
+            offending_positions[constraint].extend((chunk_positions[:num_missing] + start).tolist())
+
+    return {
+        constraint: (np.array(offending_positions[constraint], dtype=int), num)
+        for constraint, num in num_offending_rows.items()
+    }
+
+
+def validate_collection_schema(
+    collection_schema,
+    dataframe,
+    dataframe_constraints=None,
+    sample_size=None,
+    chunk_size=None,
+    random_state=None,
+):
+    '''Validates a dataframe against the given columns and dataframe constraints.
+
+    Args:
+        collection_schema (List[PandasColumn]): The columns the dataframe must have.
+        dataframe (pandas.DataFrame): The dataframe to validate.
+        dataframe_constraints (Optional[List[DataFrameConstraint]]): Constraints on the dataframe
+            as a whole.
+        sample_size (Optional[int]): If set, column constraints are only evaluated on a random
+            sample of this many rows. Dataframe constraints always see the whole dataframe.
+        chunk_size (Optional[int]): If set, row-wise column constraints are evaluated on chunks of
+            this many rows at a time.
+        random_state (Optional[int]): The seed used to draw the sample.
+    '''
     collection_schema = check.list_param(
         collection_schema, 'collection_schema', of_type=PandasColumn
     )
@@ -142,9 +236,16 @@ def validate_collection_schema(collection_schema, dataframe, dataframe_constrain
     dataframe_constraints = check.opt_list_param(
         dataframe_constraints, 'dataframe_constraints', of_type=DataFrameConstraint
     )
+    check.opt_int_param(sample_size, 'sample_size')
+    check.opt_int_param(chunk_size, 'chunk_size')
+    check.opt_int_param(random_state, 'random_state')
+
+    columns_dataframe = dataframe
+    if sample_size is not None and len(dataframe) > sample_size:
+        columns_dataframe = dataframe.sample(n=sample_size, random_state=random_state)
 
     for column in collection_schema:
-        column.validate(dataframe)
+        column.validate(columns_dataframe, chunk_size=chunk_size)
 
     if dataframe_constraints:
         for dataframe_constraint in dataframe_constraints:
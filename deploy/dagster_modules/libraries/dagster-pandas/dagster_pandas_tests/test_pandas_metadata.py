@@ -1,5 +1,13 @@
 import pandas as pd
+import pytest
 from dagster_pandas import DataFrame
+from dagster_pandas.data_frame import (
+    DataFrameSummaryLevel,
+    create_dagster_pandas_dataframe_type,
+    create_dataframe_type_check,
+    df_type_check,
+    get_schema_hash,
+)
 
 from dagster import InputDefinition, execute_pipeline, file_relative_path, lambda_solid, pipeline
 
@@ -36,3 +44,79 @@ def test_basic_pd_df_input_metadata():
 
     assert metadata_entries[1].label == 'metadata'
     assert metadata_entries[1].entry_data.data['columns'] == ['num1', 'num2']
+
+
+def _type_check_metadata(type_check_fn, df):
+    type_check = type_check_fn(df)
+    assert type_check.success
+    return {entry.label: entry.entry_data for entry in type_check.metadata_entries}
+
+
+def test_dataframe_summary_levels():
+    df = pd.DataFrame({'num1': [1, 3], 'num2': [2.0, 4.0]})
+
+    assert _type_check_metadata(create_dataframe_type_check(DataFrameSummaryLevel.NONE), df) == {}
+
+    shape = _type_check_metadata(create_dataframe_type_check(DataFrameSummaryLevel.SHAPE), df)
+    assert set(shape.keys()) == {'row_count', 'column_count'}
+    assert shape['column_count'].text == '2'
+
+    schema_hash = _type_check_metadata(
+        create_dataframe_type_check(DataFrameSummaryLevel.SCHEMA_HASH), df
+    )
+    assert schema_hash['schema_hash'].text == get_schema_hash(df.copy())
+
+    full = _type_check_metadata(create_dataframe_type_check(DataFrameSummaryLevel.FULL), df)
+    assert full['metadata'].data == {'columns': ['num1', 'num2']}
+
+
+def test_dataframe_summary_level_env_var(monkeypatch):
+    df = pd.DataFrame({'num1': [1, 3]})
+    monkeypatch.setenv('DAGSTER_PANDAS_SUMMARY_LEVEL', 'shape')
+    assert 'metadata' not in _type_check_metadata(df_type_check, df)
+
+
+def test_invalid_summary_level_env_var(monkeypatch):
+    df = pd.DataFrame({'num1': [1, 3]})
+    monkeypatch.setenv('DAGSTER_PANDAS_SUMMARY_LEVEL', 'bogus')
+    with pytest.warns(UserWarning, match='Invalid value "bogus"'):
+        assert 'metadata' in _type_check_metadata(df_type_check, df)
+
+
+def test_dataframe_type_summary_level():
+    df = pd.DataFrame({'num1': [1, 3]})
+    shape_type = create_dagster_pandas_dataframe_type(
+        name='ShapeDataFrame', summary_level=DataFrameSummaryLevel.SHAPE
+    )
+    assert set(_type_check_metadata(shape_type.type_check, df).keys()) == {
+        'row_count',
+        'column_count',
+    }
+
+    assert (
+        create_dagster_pandas_dataframe_type(name='PlainDataFrame').type_check(df).metadata_entries
+        == []
+    )
+
+
+def test_full_summary_truncated():
+    df = pd.DataFrame([list(range(10))], columns=['c{}'.format(i) for i in range(10)])
+    full = _type_check_metadata(create_dataframe_type_check(max_summary_columns=3), df)
+    assert full['metadata'].data == {
+        'columns': ['c0', 'c1', 'c2'],
+        'num_columns': 10,
+        'truncated': True,
+    }
+
+
+def test_schema_hash_tracks_schema_changes():
+    df = pd.DataFrame({'num1': [1, 3], 'num2': [2, 4]})
+    original_hash = get_schema_hash(df)
+    assert get_schema_hash(df) == original_hash
+
+    df['num1'] = df['num1'].astype(float)
+    float_hash = get_schema_hash(df)
+    assert float_hash != original_hash
+
+    df.columns = ['num3', 'num2']
+    assert get_schema_hash(df) not in (original_hash, float_hash)
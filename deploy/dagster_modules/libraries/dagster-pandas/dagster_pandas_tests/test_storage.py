@@ -0,0 +1,166 @@
+import os
+import pickle
+
+import pandas as pd
+import pytest
+from dagster_pandas import DataFrame
+from dagster_pandas.storage import (
+    ARROW_MAGIC,
+    PROJECTED_COLUMNS_METADATA_KEY,
+    ArrowSerializationStrategy,
+    projected_arrow_storage_plugin,
+)
+
+from dagster import (
+    DagsterInvariantViolationError,
+    InputDefinition,
+    OutputDefinition,
+    execute_pipeline,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.instance import DagsterInstance
+
+pytest.importorskip('pyarrow')
+
+
+def _num_df():
+    return pd.DataFrame({'num1': [1, 3], 'num2': [2.0, 4.0], 'label': ['a', 'b']})
+
+
+def test_arrow_round_trip():
+    strategy = ArrowSerializationStrategy()
+    with seven.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'df')
+        strategy.serialize_to_file(_num_df(), path)
+
+        with open(path, 'rb') as f:
+            assert f.read(len(ARROW_MAGIC)) == ARROW_MAGIC
+
+        df = strategy.deserialize_from_file(path)
+        pd.testing.assert_frame_equal(df, _num_df())
+
+        # Frames read from a memory mapped file must still be mutable
+        df.loc[0, 'num1'] = 100
+        assert df['num1'].tolist() == [100, 3]
+
+        with open(path, 'rb') as f:
+            pd.testing.assert_frame_equal(strategy.deserialize(f), _num_df())
+
+
+def test_arrow_column_projection():
+    df = _num_df().set_index('label')
+    with seven.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'df')
+        ArrowSerializationStrategy().serialize_to_file(df, path)
+
+        projected = ArrowSerializationStrategy(columns=['num2']).deserialize_from_file(path)
+        assert list(projected.columns) == ['num2']
+        assert list(projected.index) == ['a', 'b']
+
+        with pytest.raises(DagsterInvariantViolationError, match=r"\['num3'\]"):
+            ArrowSerializationStrategy(columns=['num2', 'num3']).deserialize_from_file(path)
+
+
+def test_arrow_pickle_fallback():
+    df = pd.DataFrame({0: [1, 2], 1: [3, 4]})
+    strategy = ArrowSerializationStrategy()
+    with seven.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'df')
+        strategy.serialize_to_file(df, path)
+
+        with open(path, 'rb') as f:
+            assert f.read(len(ARROW_MAGIC)) != ARROW_MAGIC
+
+        pd.testing.assert_frame_equal(strategy.deserialize_from_file(path), df)
+
+        # Intermediates written before the plugin existed are plain pickles
+        with open(path, 'wb') as f:
+            pickle.dump(_num_df(), f)
+        pd.testing.assert_frame_equal(strategy.deserialize_from_file(path), _num_df())
+
+        # Pickled frames are projected once they are unpickled
+        projected_strategy = ArrowSerializationStrategy(columns=['num2'])
+        pd.testing.assert_frame_equal(
+            projected_strategy.deserialize_from_file(path), _num_df()[['num2']]
+        )
+        with open(path, 'rb') as f:
+            pd.testing.assert_frame_equal(projected_strategy.deserialize(f), _num_df()[['num2']])
+
+        with pytest.raises(DagsterInvariantViolationError, match=r"\['num3'\]"):
+            ArrowSerializationStrategy(columns=['num3']).deserialize_from_file(path)
+
+
+def test_projected_arrow_storage_plugin():
+    plugin = projected_arrow_storage_plugin(['num1'])
+    assert plugin.projected_columns == ['num1']
+
+    with pytest.raises(Exception):
+        projected_arrow_storage_plugin('num1')
+
+
+def test_dataframe_intermediates_stored_as_arrow():
+    @solid(output_defs=[OutputDefinition(DataFrame)])
+    def return_df(_):
+        return _num_df()
+
+    @solid(input_defs=[InputDefinition('df', DataFrame)], output_defs=[OutputDefinition(int)])
+    def sum_df(_, df):
+        return int(df['num1'].sum())
+
+    @pipeline
+    def arrow_pipeline():
+        sum_df(return_df())
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(
+            arrow_pipeline,
+            environment_dict={'storage': {'filesystem': {}}},
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid('sum_df').output_value() == 4
+
+        path = os.path.join(
+            instance.intermediates_directory(result.run_id),
+            'intermediates',
+            'return_df.compute',
+            'result',
+        )
+        with open(path, 'rb') as f:
+            assert f.read(len(ARROW_MAGIC)) == ARROW_MAGIC
+
+
+def test_solids_load_projected_columns():
+    @solid(output_defs=[OutputDefinition(DataFrame)])
+    def return_df(_):
+        return _num_df()
+
+    @solid(
+        input_defs=[InputDefinition('df', DataFrame)],
+        output_defs=[OutputDefinition(list)],
+        metadata={PROJECTED_COLUMNS_METADATA_KEY: {'df': ['num1']}},
+    )
+    def projected_columns(_, df):
+        return list(df.columns)
+
+    @solid(input_defs=[InputDefinition('df', DataFrame)], output_defs=[OutputDefinition(list)])
+    def all_columns(_, df):
+        return list(df.columns)
+
+    @pipeline
+    def projection_pipeline():
+        df = return_df()
+        projected_columns(df)
+        all_columns(df)
+
+    result = execute_pipeline(
+        projection_pipeline,
+        environment_dict={'storage': {'filesystem': {}}},
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('projected_columns').output_value() == ['num1']
+    assert result.result_for_solid('all_columns').output_value() == ['num1', 'num2', 'label']
@@ -0,0 +1,150 @@
+from __future__ import unicode_literals
+
+import pandas as pd
+import pytest
+from dagster_pandas import DataFrameChunks, DataFrameIterator
+
+from dagster import InputDefinition, Output, OutputDefinition, execute_pipeline, pipeline, solid
+from dagster.utils import script_relative_path
+from dagster.utils.test import get_temp_file_name
+
+
+def test_dataframe_chunks_csv():
+    chunks = DataFrameChunks('csv', script_relative_path('num.csv'), chunksize=1)
+    assert [chunk.to_dict('list') for chunk in chunks] == [
+        {'num1': [1], 'num2': [2]},
+        {'num1': [3], 'num2': [4]},
+    ]
+    # Chunks are re-read on every iteration
+    assert len(list(chunks)) == 2
+
+    typed = DataFrameChunks(
+        'table', script_relative_path('num_table.txt'), dtype={'num1': 'float64'}
+    )
+    assert [str(chunk['num1'].dtype) for chunk in typed] == ['float64']
+
+
+def test_dataframe_iterator_pipeline():
+    seen_chunk_sizes = []
+
+    @solid(
+        input_defs=[InputDefinition('chunks', DataFrameIterator)],
+        output_defs=[OutputDefinition(DataFrameIterator)],
+    )
+    def double(_, chunks):
+        class _Doubled(object):
+            def __iter__(self):
+                for chunk in chunks:
+                    seen_chunk_sizes.append(len(chunk))
+                    yield chunk * 2
+
+        return _Doubled()
+
+    @pipeline
+    def streaming_pipeline():
+        double()  # pylint: disable=no-value-for-parameter
+
+    with get_temp_file_name() as temp_file_name:
+        result = execute_pipeline(
+            streaming_pipeline,
+            {
+                'solids': {
+                    'double': {
+                        'inputs': {
+                            'chunks': {
+                                'csv': {'path': script_relative_path('num.csv'), 'chunksize': 1}
+                            }
+                        },
+                        'outputs': [{'result': {'csv': {'path': temp_file_name}}}],
+                    }
+                }
+            },
+        )
+
+        assert result.success
+        assert seen_chunk_sizes == [1, 1]
+        assert pd.read_csv(temp_file_name).to_dict('list') == {'num1': [2, 6], 'num2': [4, 8]}
+
+
+def test_dataframe_iterator_parquet_round_trip():
+    pytest.importorskip('pyarrow')
+
+    @solid(output_defs=[OutputDefinition(DataFrameIterator)])
+    def emit_chunks(_):
+        return [pd.DataFrame({'num1': [i], 'num2': [i * 2]}) for i in range(3)]
+
+    @pipeline
+    def parquet_pipeline():
+        emit_chunks()
+
+    with get_temp_file_name() as temp_file_name:
+        result = execute_pipeline(
+            parquet_pipeline,
+            {
+                'solids': {
+                    'emit_chunks': {'outputs': [{'result': {'parquet': {'path': temp_file_name}}}]}
+                }
+            },
+        )
+        assert result.success
+
+        chunks = DataFrameChunks('parquet', temp_file_name, columns=['num2'])
+        assert [chunk.to_dict('list') for chunk in chunks] == [
+            {'num2': [0]},
+            {'num2': [2]},
+            {'num2': [4]},
+        ]
+
+
+def test_dataframe_iterator_type_check():
+    @solid(output_defs=[OutputDefinition(DataFrameIterator)])
+    def emit_frame(_):
+        return pd.DataFrame({'num1': [1]})
+
+    @pipeline
+    def bad_pipeline():
+        emit_frame()
+
+    assert not execute_pipeline(bad_pipeline, raise_on_error=False).success
+
+
+def test_dataframe_iterator_passed_downstream():
+    @solid(output_defs=[OutputDefinition(DataFrameIterator)])
+    def produce(_):
+        return [pd.DataFrame({'num1': [i]}) for i in range(3)]
+
+    @solid(input_defs=[InputDefinition('chunks', DataFrameIterator)])
+    def consume(_, chunks):
+        return sum(len(chunk) for chunk in chunks)
+
+    @pipeline
+    def chunks_pipeline():
+        consume(produce())
+
+    with get_temp_file_name() as temp_file_name:
+        result = execute_pipeline(
+            chunks_pipeline,
+            {'solids': {'produce': {'outputs': [{'result': {'csv': {'path': temp_file_name}}}]}}},
+        )
+        assert result.success
+        assert result.result_for_solid('consume').output_value() == 3
+        assert pd.read_csv(temp_file_name).to_dict('list') == {'num1': [0, 1, 2]}
+
+
+def test_dataframe_iterator_rejects_generators():
+    @solid(output_defs=[OutputDefinition(DataFrameIterator)])
+    def produce(_):
+        # Returning a generator would make dagster treat it as the solid's event stream
+        yield Output(pd.DataFrame({'num1': [i]}) for i in range(3))
+
+    @pipeline
+    def generator_pipeline():
+        produce()
+
+    result = execute_pipeline(generator_pipeline, raise_on_error=False)
+    assert not result.success
+
+    output_event = result.result_for_solid('produce').output_events_during_compute[0]
+    type_check_data = output_event.event_specific_data.type_check_data
+    assert not type_check_data.success
+    assert type_check_data.description.startswith('Must be re-iterable')
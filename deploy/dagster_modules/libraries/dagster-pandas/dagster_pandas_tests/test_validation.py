@@ -1,6 +1,8 @@
 import pytest
 from dagster_pandas.constraints import (
+    MAX_OFFENDING_ROWS,
     CategoricalColumnConstraint,
+    ColumnConstraintViolationException,
     ColumnTypeConstraint,
     ConstraintViolationException,
     InRangeColumnConstraint,
@@ -100,3 +102,70 @@ def test_datetime_column_composition(composer, composer_args, expected_constrain
     distinct_included_constraints = expected_constraints + [UniqueColumnConstraint]
     distinct_column = composer('foo', *composer_args, unique=True)
     assert has_constraints(distinct_column, distinct_included_constraints)
+
+
+def test_offending_rows_are_bounded():
+    dataframe = DataFrame({'foo': list(range(100))})
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validate_collection_schema([PandasColumn.integer_column('foo', max_value=10)], dataframe)
+
+    assert exc_info.value.num_offending_rows == 89
+    assert exc_info.value.offending_rows == [(i, i) for i in range(11, 11 + MAX_OFFENDING_ROWS)]
+    assert '89 rows are offending' in str(exc_info.value)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 50, 1000])
+def test_chunked_validation(chunk_size):
+    dataframe = DataFrame({'foo': [1, 2, 3, 2] * 10}, index=range(100, 140))
+    assert (
+        validate_collection_schema(
+            [PandasColumn.integer_column('foo', min_value=0, max_value=3)],
+            dataframe,
+            chunk_size=chunk_size,
+        )
+        is None
+    )
+
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validate_collection_schema(
+            [PandasColumn.integer_column('foo', max_value=2)], dataframe, chunk_size=chunk_size
+        )
+    assert exc_info.value.num_offending_rows == 10
+    assert exc_info.value.offending_rows == [(102 + 4 * i, 3) for i in range(MAX_OFFENDING_ROWS)]
+
+    # Duplicates span chunks, so uniqueness is always checked over the whole column
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validate_collection_schema(
+            [PandasColumn.integer_column('foo', unique=True)], dataframe, chunk_size=chunk_size
+        )
+    assert exc_info.value.num_offending_rows == 37
+
+
+def test_sampled_validation():
+    dataframe = DataFrame({'foo': list(range(1000))})
+    schema = [PandasColumn.integer_column('foo', max_value=998)]
+
+    with pytest.raises(ConstraintViolationException):
+        validate_collection_schema(schema, dataframe)
+
+    assert validate_collection_schema(schema, dataframe, sample_size=10, random_state=0) is None
+
+    # Dataframe constraints always see every row
+    with pytest.raises(ConstraintViolationException):
+        validate_collection_schema(
+            [],
+            dataframe,
+            dataframe_constraints=[RowCountConstraint(10)],
+            sample_size=10,
+            random_state=0,
+        )
+
+
+def test_constraints_evaluated_in_order():
+    dataframe = DataFrame({'foo': [1.0, None]})
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validate_collection_schema(
+            [PandasColumn('foo', [NonNullableColumnConstraint(), ColumnTypeConstraint('int64')])],
+            dataframe,
+        )
+    assert exc_info.value.constraint_name == NonNullableColumnConstraint.__name__
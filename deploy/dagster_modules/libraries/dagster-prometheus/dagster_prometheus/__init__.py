@@ -1,2 +1,3 @@
+from .metrics import PrometheusMetricsRecorder
 from .resources import prometheus_resource
 from .version import __version__
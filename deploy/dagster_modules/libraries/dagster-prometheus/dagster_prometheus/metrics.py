@@ -0,0 +1,291 @@
+import os
+import threading
+import warnings
+
+import prometheus_client
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from dagster import Field, Permissive, check
+from dagster.core.events import DagsterEventType
+from dagster.core.metrics import MetricsRecorder
+from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
+from dagster.core.storage.compute_log_manager import ComputeIOType
+
+# Steps take anywhere from milliseconds to hours
+STEP_DURATION_BUCKETS = (
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    600.0,
+    1800.0,
+    3600.0,
+    float('inf'),
+)
+
+RUN_STATUS_FOR_EVENT_TYPE = {
+    DagsterEventType.PIPELINE_SUCCESS: 'success',
+    DagsterEventType.PIPELINE_FAILURE: 'failure',
+}
+
+
+def multiprocess_dir():
+    '''The directory prometheus_client shares the metrics of the processes of a server in, if it
+    is configured to.'''
+    return os.environ.get('PROMETHEUS_MULTIPROC_DIR') or os.environ.get('prometheus_multiproc_dir')
+
+
+class DagsterMetrics(object):
+    '''The metrics recorded by the PrometheusMetricsRecorders of a process.'''
+
+    def __init__(self):
+        self.registry = CollectorRegistry()
+
+        self.runs_started = Counter(
+            'dagster_runs_started',
+            'Runs started',
+            ['pipeline'],
+            registry=self.registry,
+        )
+        self.runs_finished = Counter(
+            'dagster_runs_finished',
+            'Runs finished, by status',
+            ['pipeline', 'status'],
+            registry=self.registry,
+        )
+        self.step_duration = Histogram(
+            'dagster_step_duration_seconds',
+            'Wall clock time of the execution of steps',
+            ['pipeline'],
+            buckets=STEP_DURATION_BUCKETS,
+            registry=self.registry,
+        )
+        self.step_phase_duration = Histogram(
+            'dagster_step_phase_duration_seconds',
+            'Wall clock time spent in each phase of the execution of steps',
+            ['pipeline', 'phase'],
+            buckets=STEP_DURATION_BUCKETS,
+            registry=self.registry,
+        )
+        self.event_log_write_duration = Histogram(
+            'dagster_event_log_write_duration_seconds',
+            'Time taken to store events in the event log storage',
+            registry=self.registry,
+        )
+        self.storage_query_duration = Histogram(
+            'dagster_storage_query_duration_seconds',
+            'Time taken by queries of the run and event log storages',
+            ['storage', 'operation'],
+            registry=self.registry,
+        )
+        self.compute_log_bytes = Counter(
+            'dagster_compute_log_bytes',
+            'Bytes of compute logs captured from steps',
+            ['io_type'],
+            registry=self.registry,
+        )
+        # Only Dagit records the state of its execution manager
+        self.queued_runs = Gauge(
+            'dagster_execution_manager_queued_runs',
+            'Runs waiting to start executing in the execution manager of Dagit',
+            registry=self.registry,
+            multiprocess_mode='livesum',
+        )
+        self.active_runs = Gauge(
+            'dagster_execution_manager_active_runs',
+            'Runs executing in the execution manager of Dagit',
+            registry=self.registry,
+            multiprocess_mode='livesum',
+        )
+
+
+_METRICS_LOCK = threading.Lock()
+_METRICS = None
+
+
+def get_dagster_metrics():
+    '''The metrics of the process, created the first time they are recorded.
+
+    Metrics are shared by the recorders of every instance in the process, so that e.g. the events
+    stored through the instances of the workers of an engine are all counted.
+    '''
+    global _METRICS  # pylint: disable=global-statement
+
+    with _METRICS_LOCK:
+        if _METRICS is None:
+            _METRICS = DagsterMetrics()
+        return _METRICS
+
+
+class PrometheusMetricsRecorder(MetricsRecorder, ConfigurableClass):
+    '''Records metrics of an instance with prometheus_client.
+
+    Dagit exposes the metrics at /metrics, for Prometheus to scrape. Runs execute in subprocesses
+    of Dagit, so to include their metrics set the PROMETHEUS_MULTIPROC_DIR environment variable of
+    Dagit to an empty directory, as for any multi-process server using prometheus_client.
+
+    For runs executed outside of Dagit (e.g. with ``dagster pipeline execute`` or by a scheduler),
+    configure a Prometheus Pushgateway: the process executing a run pushes its metrics to it once
+    the run finishes. Each push replaces the metrics of the same job and grouping key in the
+    gateway. Pushes happen in a background thread, so that a slow gateway doesn't hold up the
+    events of the run; the process waits for them when the instance is disposed, and before it
+    exits.
+
+    Configure the recorder in the ``dagster.yaml`` of the instance:
+
+    .. code-block:: yaml
+
+        metrics:
+          module: dagster_prometheus
+          class: PrometheusMetricsRecorder
+          config:
+            push_gateway: pushgateway.local:9091
+
+    Args:
+        push_gateway (Optional[str]): The url of the Pushgateway to push the metrics of finished
+            runs to.
+        push_job (Optional[str]): The job label of the pushed metrics. Defaults to "dagster".
+        push_grouping_key (Optional[Dict[str, str]]): The grouping key of the pushed metrics.
+        push_timeout (Optional[int]): How long pushes wait for the gateway, in seconds. Defaults to
+            30.
+    '''
+
+    def __init__(
+        self,
+        push_gateway=None,
+        push_job='dagster',
+        push_grouping_key=None,
+        push_timeout=30,
+        inst_data=None,
+    ):
+        self._push_gateway = check.opt_str_param(push_gateway, 'push_gateway')
+        self._push_job = check.str_param(push_job, 'push_job')
+        self._push_grouping_key = check.opt_dict_param(
+            push_grouping_key, 'push_grouping_key', key_type=str, value_type=str
+        )
+        self._push_timeout = check.int_param(push_timeout, 'push_timeout')
+        self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
+        self._metrics = get_dagster_metrics()
+        self._push_threads_lock = threading.Lock()
+        self._push_threads = []
+
+    @property
+    def inst_data(self):
+        return self._inst_data
+
+    @classmethod
+    def config_type(cls):
+        return {
+            'push_gateway': Field(str, is_optional=True),
+            'push_job': Field(str, is_optional=True, default_value='dagster'),
+            'push_grouping_key': Field(Permissive(), is_optional=True),
+            'push_timeout': Field(int, is_optional=True, default_value=30),
+        }
+
+    @staticmethod
+    def from_config_value(inst_data, config_value):
+        return PrometheusMetricsRecorder(inst_data=inst_data, **config_value)
+
+    @property
+    def registry(self):
+        '''CollectorRegistry: The registry of the metrics recorded in this process.'''
+        return self._metrics.registry
+
+    def record_event(self, event_record):
+        if not event_record.is_dagster_event:
+            return
+
+        event = event_record.dagster_event
+        if event.event_type == DagsterEventType.PIPELINE_START:
+            self._metrics.runs_started.labels(event.pipeline_name).inc()
+
+        elif event.event_type in RUN_STATUS_FOR_EVENT_TYPE:
+            self._metrics.runs_finished.labels(
+                event.pipeline_name, RUN_STATUS_FOR_EVENT_TYPE[event.event_type]
+            ).inc()
+            if self._push_gateway:
+                self._push_in_background()
+
+        elif event.event_type == DagsterEventType.STEP_PROFILE:
+            step_profile_data = event.step_profile_data
+            self._metrics.step_duration.labels(event.pipeline_name).observe(
+                step_profile_data.duration_ms / 1000
+            )
+            # Only the phases the step went through, e.g. not materialization for every step
+            for phase, duration_ms in step_profile_data.phase_durations_ms.items():
+                self._metrics.step_phase_duration.labels(event.pipeline_name, phase).observe(
+                    duration_ms / 1000
+                )
+
+    def record_event_log_write(self, duration_seconds):
+        self._metrics.event_log_write_duration.observe(duration_seconds)
+
+    def record_storage_query(self, storage, operation, duration_seconds):
+        self._metrics.storage_query_duration.labels(storage, operation).observe(duration_seconds)
+
+    def record_compute_log_bytes(self, io_type, num_bytes):
+        check.inst_param(io_type, 'io_type', ComputeIOType)
+        self._metrics.compute_log_bytes.labels(io_type.value).inc(num_bytes)
+
+    def record_execution_manager_state(self, num_queued_runs, num_active_runs):
+        self._metrics.queued_runs.set(num_queued_runs)
+        self._metrics.active_runs.set(num_active_runs)
+
+    def _exposition_registry(self):
+        if not multiprocess_dir():
+            return self.registry
+
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        return registry
+
+    def exposition(self):
+        return (
+            prometheus_client.generate_latest(self._exposition_registry()),
+            prometheus_client.CONTENT_TYPE_LATEST,
+        )
+
+    def _push_in_background(self):
+        # Not a daemon thread, so that a process executing a single run still pushes its metrics
+        # before exiting
+        thread = threading.Thread(target=self.push, name='dagster-prometheus-push')
+        with self._push_threads_lock:
+            self._push_threads = [t for t in self._push_threads if t.is_alive()] + [thread]
+        thread.start()
+
+    def push(self):
+        '''Pushes the metrics of the process to the Pushgateway.
+
+        Failing to push only warns, so that an unavailable gateway doesn't fail runs.
+        '''
+        check.invariant(self._push_gateway, 'No Pushgateway is configured to push metrics to')
+
+        try:
+            prometheus_client.pushadd_to_gateway(
+                gateway=self._push_gateway,
+                job=self._push_job,
+                registry=self._exposition_registry(),
+                grouping_key=self._push_grouping_key,
+                timeout=self._push_timeout,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            warnings.warn(
+                'Failed to push metrics to Pushgateway {gateway}: {error}'.format(
+                    gateway=self._push_gateway, error=e
+                )
+            )
+
+    def dispose(self):
+        '''Waits for the metrics of finished runs to be pushed.'''
+        with self._push_threads_lock:
+            push_threads, self._push_threads = self._push_threads, []
+
+        for thread in push_threads:
+            thread.join(self._push_timeout)
@@ -0,0 +1,155 @@
+import threading
+
+import pytest
+from dagster_prometheus import PrometheusMetricsRecorder, metrics
+
+from dagster import execute_pipeline, lambda_solid, pipeline
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.compute_log_manager import ComputeIOType
+
+
+@lambda_solid
+def spew():
+    print('HELLO')
+
+
+@pipeline
+def spew_pipeline():
+    spew()
+
+
+def metrics_instance(config=None):
+    return DagsterInstance.local_temp(
+        overrides={
+            'metrics': {
+                'module': 'dagster_prometheus',
+                'class': 'PrometheusMetricsRecorder',
+                'config': config or {},
+            }
+        }
+    )
+
+
+def sample_value(recorder, name, labels=None):
+    return recorder.registry.get_sample_value(name, labels or {}) or 0
+
+
+def test_record_run_metrics():
+    instance = metrics_instance()
+    recorder = instance.metrics
+    assert isinstance(recorder, PrometheusMetricsRecorder)
+
+    def _sample_values():
+        return {
+            'started': sample_value(
+                recorder, 'dagster_runs_started_total', {'pipeline': 'spew_pipeline'}
+            ),
+            'succeeded': sample_value(
+                recorder,
+                'dagster_runs_finished_total',
+                {'pipeline': 'spew_pipeline', 'status': 'success'},
+            ),
+            'steps': sample_value(
+                recorder, 'dagster_step_duration_seconds_count', {'pipeline': 'spew_pipeline'}
+            ),
+            'compute': sample_value(
+                recorder,
+                'dagster_step_phase_duration_seconds_count',
+                {'pipeline': 'spew_pipeline', 'phase': 'COMPUTE'},
+            ),
+            'event_log_writes': sample_value(
+                recorder, 'dagster_event_log_write_duration_seconds_count'
+            ),
+            'add_run_queries': sample_value(
+                recorder,
+                'dagster_storage_query_duration_seconds_count',
+                {'storage': 'run_storage', 'operation': 'add_run'},
+            ),
+            'stdout_bytes': sample_value(
+                recorder, 'dagster_compute_log_bytes_total', {'io_type': 'stdout'}
+            ),
+        }
+
+    # Metrics are shared by the recorders of the process
+    before = _sample_values()
+    assert execute_pipeline(spew_pipeline, instance=instance).success
+    after = _sample_values()
+
+    assert after['started'] - before['started'] == 1
+    assert after['succeeded'] - before['succeeded'] == 1
+    assert after['steps'] - before['steps'] == 1
+    assert after['compute'] - before['compute'] == 1
+    assert after['event_log_writes'] - before['event_log_writes'] > 0
+    assert after['add_run_queries'] - before['add_run_queries'] == 1
+    assert after['stdout_bytes'] - before['stdout_bytes'] == len('HELLO\n')
+
+
+def test_exposition():
+    recorder = metrics_instance().metrics
+    recorder.record_execution_manager_state(num_queued_runs=3, num_active_runs=2)
+    recorder.record_compute_log_bytes(ComputeIOType.STDERR, 10)
+
+    data, content_type = recorder.exposition()
+    assert content_type.startswith('text/plain')
+    assert b'dagster_execution_manager_queued_runs 3.0' in data
+    assert b'dagster_execution_manager_active_runs 2.0' in data
+    assert b'dagster_compute_log_bytes_total{io_type="stderr"}' in data
+
+
+def test_push_finished_runs(monkeypatch):
+    pushes = []
+
+    def _pushadd_to_gateway(**kwargs):
+        pushes.append(kwargs)
+
+    monkeypatch.setattr(metrics.prometheus_client, 'pushadd_to_gateway', _pushadd_to_gateway)
+
+    instance = metrics_instance(
+        {'push_gateway': 'localhost:9091', 'push_grouping_key': {'host': 'scheduler'}}
+    )
+    assert execute_pipeline(spew_pipeline, instance=instance).success
+
+    # Pushed in the background, and waited for when the instance is disposed
+    instance.dispose()
+    assert len(pushes) == 1
+    assert pushes[0]['gateway'] == 'localhost:9091'
+    assert pushes[0]['job'] == 'dagster'
+    assert pushes[0]['grouping_key'] == {'host': 'scheduler'}
+    assert pushes[0]['registry'] is instance.metrics.registry
+
+    # Runs aren't pushed without a gateway
+    assert execute_pipeline(spew_pipeline, instance=metrics_instance()).success
+    assert len(pushes) == 1
+
+
+def test_push_failure_warns(monkeypatch):
+    def _pushadd_to_gateway(**_kwargs):
+        raise IOError('Connection refused')
+
+    monkeypatch.setattr(metrics.prometheus_client, 'pushadd_to_gateway', _pushadd_to_gateway)
+
+    instance = metrics_instance({'push_gateway': 'localhost:9091'})
+    with pytest.warns(UserWarning, match='Connection refused'):
+        assert execute_pipeline(spew_pipeline, instance=instance).success
+        instance.dispose()
+
+
+def test_push_does_not_block_run(monkeypatch):
+    push_started = threading.Event()
+    unblock_push = threading.Event()
+
+    def _pushadd_to_gateway(**_kwargs):
+        push_started.set()
+        unblock_push.wait(10)
+        raise ValueError('Unexpected response from the gateway')
+
+    monkeypatch.setattr(metrics.prometheus_client, 'pushadd_to_gateway', _pushadd_to_gateway)
+
+    instance = metrics_instance({'push_gateway': 'localhost:9091'})
+    with pytest.warns(UserWarning, match='Unexpected response'):
+        # The run finishes while the push is still in flight, and errors other than IOErrors
+        # only warn too
+        assert execute_pipeline(spew_pipeline, instance=instance).success
+        assert push_started.wait(10)
+        unblock_push.set()
+        instance.dispose()